@@ -0,0 +1,160 @@
+"""Priority-scheduled admission control for the requests served by an Axon."""
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import time
+from typing import AsyncIterator, Optional
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request is not admitted by the :class:`AdmissionScheduler`."""
+
+
+class QueueFullError(AdmissionRejected):
+    """Raised when a request is shed because the admission queue is full of higher priority requests."""
+
+
+class RequestExpiredError(AdmissionRejected):
+    """Raised when a request's deadline elapses before it could be admitted."""
+
+
+class AdmissionScheduler:
+    """
+    Admits requests to the forward handlers under a concurrency limit, in order of priority.
+
+    When all ``max_concurrency`` slots are busy, requests wait in a queue ordered by priority, highest first, and by
+    arrival among equal priorities. Once ``max_queue_size`` requests are waiting, a new request either replaces the
+    lowest priority waiter, which is shed, or is shed itself if its priority is not higher. Waiters whose deadline
+    elapses before a slot frees up are dropped.
+
+    The scheduler is not thread-safe and must only be used from the event loop serving the requests.
+
+    Args:
+        max_concurrency (int): Maximum number of requests admitted at once.
+        max_queue_size (int): Maximum number of requests waiting for admission.
+
+    Example::
+
+        scheduler = AdmissionScheduler(max_concurrency=8, max_queue_size=64)
+        async with scheduler.slot(priority=stake, deadline=time.time() + synapse.timeout):
+            response = await forward(synapse)
+    """
+
+    def __init__(self, max_concurrency: int, max_queue_size: int):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+        if max_queue_size < 0:
+            raise ValueError("max_queue_size must be a non-negative integer.")
+        self.max_concurrency = max_concurrency
+        self.max_queue_size = max_queue_size
+        self.running = 0
+        self.admitted = 0
+        self.shed = 0
+        self.expired = 0
+        # Heap of (-priority, arrival, priority, deadline, future); entries of settled futures are removed lazily.
+        self._queue: list[tuple] = []
+        self._arrivals = itertools.count()
+
+    @property
+    def queued(self) -> int:
+        """Number of requests waiting for admission."""
+        return sum(not entry[-1].done() for entry in self._queue)
+
+    @property
+    def metrics(self) -> dict[str, int]:
+        """Returns the number of running and queued requests, and the admitted, shed and expired totals."""
+        return {
+            "running": self.running,
+            "queued": self.queued,
+            "admitted": self.admitted,
+            "shed": self.shed,
+            "expired": self.expired,
+        }
+
+    def _compact(self):
+        self._queue = [entry for entry in self._queue if not entry[-1].done()]
+        heapq.heapify(self._queue)
+
+    async def acquire(self, priority: float, deadline: Optional[float] = None):
+        """
+        Waits until the request is admitted.
+
+        Args:
+            priority (float): The request priority. Higher priorities are admitted first.
+            deadline (Optional[float]): Unix time after which the request is no longer worth serving. Defaults to
+                ``None``, waiting indefinitely.
+
+        Raises:
+            QueueFullError: If the request was shed.
+            RequestExpiredError: If the deadline elapsed before admission.
+        """
+        if deadline is not None and deadline <= time.time():
+            self.expired += 1
+            raise RequestExpiredError("Request expired before admission.")
+
+        self._compact()
+        if self.running < self.max_concurrency and not self._queue:
+            self.running += 1
+            self.admitted += 1
+            return
+
+        if len(self._queue) >= self.max_queue_size:
+            # The lowest priority waiter, latest arrival first among equal priorities.
+            lowest = max(self._queue) if self._queue else None
+            if lowest is None or lowest[2] >= priority:
+                self.shed += 1
+                raise QueueFullError("Admission queue is full.")
+            self._queue.remove(lowest)
+            heapq.heapify(self._queue)
+            self.shed += 1
+            lowest[-1].set_exception(
+                QueueFullError("Shed for a higher priority request.")
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            self._queue, (-priority, next(self._arrivals), priority, deadline, future)
+        )
+        try:
+            if deadline is None:
+                await future
+            else:
+                await asyncio.wait_for(future, deadline - time.time())
+        except asyncio.TimeoutError:
+            self.expired += 1
+            raise RequestExpiredError("Request expired while queued for admission.")
+        except BaseException:
+            # A slot handed over right before the waiter was cancelled must not leak.
+            if future.done() and not future.cancelled() and not future.exception():
+                self.release()
+            raise
+
+    def release(self):
+        """Releases an admitted request's slot, handing it over to the highest priority live waiter."""
+        while self._queue:
+            *_, deadline, future = heapq.heappop(self._queue)
+            if future.done():
+                continue
+            if deadline is not None and deadline <= time.time():
+                self.expired += 1
+                future.set_exception(
+                    RequestExpiredError("Request expired while queued for admission.")
+                )
+                continue
+            self.admitted += 1
+            future.set_result(None)
+            return
+        self.running -= 1
+
+    @contextlib.asynccontextmanager
+    async def slot(
+        self, priority: float, deadline: Optional[float] = None
+    ) -> AsyncIterator[None]:
+        """Holds an admission slot for the duration of the context. See :func:`acquire` for the arguments."""
+        await self.acquire(priority, deadline)
+        try:
+            yield
+        finally:
+            self.release()
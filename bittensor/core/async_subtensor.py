@@ -14,7 +14,9 @@ from bittensor_drand import get_encrypted_commitment
 from bittensor_wallet.utils import SS58_FORMAT
 from scalecodec import GenericCall
 
+from bittensor.core.block_hub import AsyncBlockHub
 from bittensor.core.chain_data import (
+    ColumnarMetagraphInfo,
     DelegateInfo,
     DynamicInfo,
     MetagraphInfo,
@@ -80,6 +82,7 @@ from bittensor.core.extrinsics.asyncex.mechanism import (
     commit_mechanism_weights_extrinsic,
     commit_timelocked_mechanism_weights_extrinsic,
     reveal_mechanism_weights_extrinsic,
+    set_mechanism_weights_batch_extrinsic,
     set_mechanism_weights_extrinsic,
 )
 from bittensor.core.extrinsics.asyncex.take import (
@@ -93,6 +96,13 @@ from bittensor.core.extrinsics.asyncex.unstaking import (
     unstake_multiple_extrinsic,
 )
 from bittensor.core.metagraph import AsyncMetagraph
+from bittensor.core.query_cache import AsyncCachedSubstrate, QueryCache
+from bittensor.core.rpc_replay import (
+    RecordingAsyncSubstrateInterface,
+    ReplayAsyncSubstrateInterface,
+    RpcRecording,
+    RpcReplay,
+)
 from bittensor.core.settings import version_as_int, TYPE_REGISTRY, DEFAULT_PERIOD
 from bittensor.core.types import (
     ParamWithTypes,
@@ -156,6 +166,9 @@ class AsyncSubtensor(SubtensorMixin):
         _mock: bool = False,
         archive_endpoints: Optional[list[str]] = None,
         websocket_shutdown_timer: Optional[float] = 5.0,
+        query_cache: Optional[QueryCache] = None,
+        rpc_recording: Optional[RpcRecording] = None,
+        rpc_replay: Optional[RpcReplay] = None,
     ):
         """Initializes an AsyncSubtensor instance for blockchain interaction.
 
@@ -174,6 +187,12 @@ class AsyncSubtensor(SubtensorMixin):
             websocket_shutdown_timer: Amount of time, in seconds, to wait after the last response from the chain to
                 close the connection. Passing `None` will disable to automatic shutdown process
                 entirely.
+            query_cache: Cache of the storage, constant, runtime API and block hash reads, scoped to the block they
+                are made at. Disabled by default. See :class:`bittensor.core.query_cache.QueryCache`.
+            rpc_recording: Recording to capture the RPC traffic of the session into, to replay it later. Fallback and
+                archive endpoints are not used while recording.
+            rpc_replay: Replay of a recorded session, answering the RPC requests instead of the network. See
+                :class:`bittensor.core.rpc_replay.RpcReplay`.
 
         Returns:
             None
@@ -213,8 +232,16 @@ class AsyncSubtensor(SubtensorMixin):
             retry_forever=retry_forever,
             _mock=_mock,
             archive_endpoints=archive_endpoints,
+            rpc_recording=rpc_recording,
+            rpc_replay=rpc_replay,
             ws_shutdown_timer=websocket_shutdown_timer,
         )
+        self.query_cache = query_cache
+        self._block_hub: Optional[AsyncBlockHub] = None
+        if query_cache is not None:
+            self.substrate = AsyncCachedSubstrate(self.substrate, query_cache)
+        # Cached per instance, a cache on the method would be shared by all instances and keep them alive.
+        self._get_block_hash = a.lru_cache(maxsize=128)(self._get_block_hash)
         if self.log_verbose:
             logging.info(
                 f"Connected to {self.network} network and {self.chain_endpoint}."
@@ -239,9 +266,23 @@ class AsyncSubtensor(SubtensorMixin):
             # Close when done
             await subtensor.close()
         """
+        if self._block_hub is not None:
+            await self._block_hub.close()
+            self._block_hub = None
         if self.substrate:
             await self.substrate.close()
 
+    @property
+    def block_hub(self) -> AsyncBlockHub:
+        """
+        The block header subscription shared by all the listeners of this instance, over its connection.
+
+        See :class:`bittensor.core.block_hub.AsyncBlockHub`.
+        """
+        if self._block_hub is None:
+            self._block_hub = AsyncBlockHub(self.substrate)
+        return self._block_hub
+
     async def initialize(self):
         """Initializes the connection to the blockchain.
 
@@ -306,7 +347,7 @@ class AsyncSubtensor(SubtensorMixin):
             raise ConnectionError
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.substrate.close()
+        await self.close()
 
     async def determine_block_hash(
         self,
@@ -477,6 +518,8 @@ class AsyncSubtensor(SubtensorMixin):
         _mock: bool = False,
         archive_endpoints: Optional[list[str]] = None,
         ws_shutdown_timer: float = 5.0,
+        rpc_recording: Optional[RpcRecording] = None,
+        rpc_replay: Optional[RpcReplay] = None,
     ) -> Union[AsyncSubstrateInterface, RetryAsyncSubstrate]:
         """Creates the Substrate instance based on provided arguments.
 
@@ -493,10 +536,25 @@ class AsyncSubtensor(SubtensorMixin):
                 to ``None``.
             ws_shutdown_timer: Amount of time, in seconds, to wait after the last response from the chain to close the
                 connection.
+            rpc_recording: Recording to capture the RPC traffic into. Defaults to ``None``.
+            rpc_replay: Replay answering the RPC requests instead of the network. Defaults to ``None``.
 
         Returns:
             Either AsyncSubstrateInterface or RetryAsyncSubstrate.
         """
+        if rpc_replay is not None or rpc_recording is not None:
+            substrate_args = dict(
+                url=self.chain_endpoint,
+                ss58_format=SS58_FORMAT,
+                type_registry=TYPE_REGISTRY,
+                use_remote_preset=True,
+                chain_name="Bittensor",
+                _mock=_mock,
+                ws_shutdown_timer=ws_shutdown_timer,
+            )
+            if rpc_replay is not None:
+                return ReplayAsyncSubstrateInterface(rpc_replay, **substrate_args)
+            return RecordingAsyncSubstrateInterface(rpc_recording, **substrate_args)
         if fallback_endpoints or retry_forever or archive_endpoints:
             return RetryAsyncSubstrate(
                 url=self.chain_endpoint,
@@ -1365,7 +1423,6 @@ class AsyncSubtensor(SubtensorMixin):
         """
         return await self.substrate.get_block_number(None)
 
-    @a.lru_cache(maxsize=128)
     async def _get_block_hash(self, block_id: int):
         return await self.substrate.get_block_hash(block_id)
 
@@ -2135,6 +2192,7 @@ class AsyncSubtensor(SubtensorMixin):
         block_hash: Optional[str] = None,
         reuse_block: bool = False,
         mechid: int = 0,
+        columnar: bool = False,
     ) -> Optional[MetagraphInfo]:
         """
         Retrieves full or partial metagraph information for the specified subnet (netuid).
@@ -2151,6 +2209,8 @@ class AsyncSubtensor(SubtensorMixin):
             block_hash: The hash of the blockchain block number at which to perform the query.
             reuse_block: Whether to reuse the last-used block hash when retrieving info.
             mechid: Subnet mechanism unique identifier.
+            columnar: If True then returns a ColumnarMetagraphInfo, keeping the per-UID vectors as numpy arrays which
+                are only converted to Balance objects and ss58 addresses on access.
 
         Returns:
             MetagraphInfo object with the requested subnet mechanism data, None if the subnet mechanism does not exist.
@@ -2205,7 +2265,8 @@ class AsyncSubtensor(SubtensorMixin):
             )
             return None
 
-        return MetagraphInfo.from_dict(query.value)
+        info_class = ColumnarMetagraphInfo if columnar else MetagraphInfo
+        return info_class.from_dict(query.value)
 
     # TODO: update parameters order in SDKv10
     async def get_all_metagraphs_info(
@@ -2214,6 +2275,7 @@ class AsyncSubtensor(SubtensorMixin):
         block_hash: Optional[str] = None,
         reuse_block: bool = False,
         all_mechanisms: bool = False,
+        columnar: bool = False,
     ) -> Optional[list[MetagraphInfo]]:
         """
         Retrieves a list of MetagraphInfo objects for all subnets
@@ -2223,6 +2285,8 @@ class AsyncSubtensor(SubtensorMixin):
             block_hash: The hash of the blockchain block number at which to perform the query.
             reuse_block: Whether to reuse the last-used block hash when retrieving info.
             all_mechanisms: If True then returns all mechanisms, otherwise only those with index 0 for all subnets.
+            columnar: If True then returns ColumnarMetagraphInfo objects, keeping the per-UID vectors as numpy arrays
+                which are only converted to Balance objects and ss58 addresses on access.
 
         Returns:
             List of MetagraphInfo objects for all existing subnets.
@@ -2242,7 +2306,8 @@ class AsyncSubtensor(SubtensorMixin):
         if query is None or not hasattr(query, "value"):
             return None
 
-        return MetagraphInfo.list_from_dicts(query.value)
+        info_class = ColumnarMetagraphInfo if columnar else MetagraphInfo
+        return info_class.list_from_dicts(query.value)
 
     async def get_netuids_for_hotkey(
         self,
@@ -4259,7 +4324,8 @@ class AsyncSubtensor(SubtensorMixin):
 
     async def wait_for_block(self, block: Optional[int] = None):
         """
-        Waits until a specific block is reached on the chain. If no block is specified, waits for the next block.
+        Waits until a specific block is reached on the chain. If no block is specified, waits for the next block. Waits
+        on the subscription of :attr:`block_hub`, shared with the other listeners.
 
         Arguments:
             block: The block number to wait for. If ``None``, waits for the next block.
@@ -4274,26 +4340,13 @@ class AsyncSubtensor(SubtensorMixin):
             await subtensor.wait_for_block() # Waits for next block
             await subtensor.wait_for_block(block=1234) # Waits for a specific block
         """
-
-        async def handler(block_data: dict):
-            logging.debug(
-                f"reached block {block_data['header']['number']}. Waiting for block {target_block}"
-            )
-            if block_data["header"]["number"] >= target_block:
-                return True
-            return None
-
-        current_block = await self.substrate.get_block()
-        current_block_hash = current_block.get("header", {}).get("hash")
-
         if block is not None:
             target_block = block
         else:
-            target_block = current_block["header"]["number"] + 1
+            target_block = (await self.substrate.get_block())["header"]["number"] + 1
 
-        await self.substrate.get_block_handler(
-            current_block_hash, header_only=True, subscription_handler=handler
-        )
+        logging.debug(f"Waiting for block {target_block}")
+        await self.block_hub.wait_for_block(target_block)
         return True
 
     # TODO: update order in SDKv10
@@ -4640,6 +4693,8 @@ class AsyncSubtensor(SubtensorMixin):
         amounts: Optional[list[Balance]] = None,
         wait_for_inclusion: bool = True,
         wait_for_finalization: bool = False,
+        batch: bool = False,
+        atomic: bool = True,
     ) -> bool:
         """
         Adds stakes to multiple neurons identified by their hotkey SS58 addresses.
@@ -4652,6 +4707,10 @@ class AsyncSubtensor(SubtensorMixin):
             amounts: Corresponding amounts of TAO to stake for each hotkey.
             wait_for_inclusion: Waits for the transaction to be included in a block. Defaults to `True`.
             wait_for_finalization: Waits for the transaction to be finalized on the blockchain. Defaults to `False`.
+            batch: If set, submits all the stakes as a single ``Utility`` batch extrinsic, signed once and waited
+                for once, instead of one extrinsic per hotkey. Defaults to ``False``.
+            atomic: Only used with ``batch``. If set, no stake is added if any of them fails. Otherwise, each stake
+                succeeds or fails on its own. Defaults to ``True``.
 
         Returns:
             bool: ``True`` if the staking is successful for all specified neurons, ``False`` otherwise.
@@ -4667,6 +4726,8 @@ class AsyncSubtensor(SubtensorMixin):
             amounts=amounts,
             wait_for_inclusion=wait_for_inclusion,
             wait_for_finalization=wait_for_finalization,
+            batch=batch,
+            atomic=atomic,
         )
 
     async def burned_register(
@@ -5583,6 +5644,62 @@ class AsyncSubtensor(SubtensorMixin):
 
             return success, message
 
+    async def set_weights_batch(
+        self,
+        wallet: "Wallet",
+        weights: dict[tuple[int, int], tuple[UIDs, Weights]],
+        version_key: int = version_as_int,
+        wait_for_inclusion: bool = False,
+        wait_for_finalization: bool = False,
+        block_time: float = 12.0,
+        period: Optional[int] = DEFAULT_PERIOD,
+        commit_reveal_version: int = 4,
+    ) -> dict[tuple[int, int], tuple[bool, str]]:
+        """
+        Sets the weights of several subnets and subnet mechanisms at once, with a single batch extrinsic.
+
+        Unlike calling :func:`set_weights` per subnet, the registration, commit-reveal and rate limit checks of all the
+            targets are fetched in a single query, and all the weights are submitted in a single extrinsic, waited for
+            once. Weights are committed on the subnets with commit-reveal enabled, and set directly on the others. Targets
+            the hotkey is not registered on, or whose weights rate limit has not elapsed yet, are skipped. Failed targets
+            are not retried.
+
+        Parameters:
+            wallet: The wallet associated with the neuron setting the weights.
+            weights: The ``(uids, weights)`` to set per ``(netuid, mechid)`` target.
+            version_key: Version key for compatibility with the network.
+            wait_for_inclusion: Waits for the transaction to be included in a block.
+            wait_for_finalization: Waits for the transaction to be finalized on the blockchain.
+            block_time: The number of seconds for block duration.
+            period: The number of blocks during which the transaction will remain valid after it's submitted. If the
+                transaction is not included in a block within that number of blocks, it will expire and be rejected. You
+                can think of it as an expiration date for the transaction.
+            commit_reveal_version: The version of the commit-reveal in the chain.
+
+        Returns:
+            dict[tuple[int, int], tuple[bool, str]]: Per ``(netuid, mechid)`` target, `True` if its weights were set, or
+                committed, `False` otherwise, and a message describing the success or the error.
+
+        Example::
+
+            results = await subtensor.set_weights_batch(
+                wallet,
+                weights={(1, 0): (uids_1, weights_1), (1, 1): (uids_1, weights_1b), (2, 0): (uids_2, weights_2)},
+                wait_for_inclusion=True,
+            )
+        """
+        return await set_mechanism_weights_batch_extrinsic(
+            subtensor=self,
+            wallet=wallet,
+            weights=weights,
+            version_key=version_key,
+            block_time=block_time,
+            commit_reveal_version=commit_reveal_version,
+            period=period,
+            wait_for_inclusion=wait_for_inclusion,
+            wait_for_finalization=wait_for_finalization,
+        )
+
     async def serve_axon(
         self,
         netuid: int,
@@ -6000,6 +6117,8 @@ class AsyncSubtensor(SubtensorMixin):
         wait_for_finalization: bool = False,
         period: Optional[int] = DEFAULT_PERIOD,
         unstake_all: bool = False,
+        batch: bool = False,
+        atomic: bool = True,
     ) -> bool:
         """
         Performs batch unstaking from multiple hotkey accounts, allowing a neuron to reduce its staked amounts
@@ -6016,6 +6135,10 @@ class AsyncSubtensor(SubtensorMixin):
                 transaction is not included in a block within that number of blocks, it will expire and be rejected. You
                 can think of it as an expiration date for the transaction.
             unstake_all: If true, unstakes all tokens. Default is `False`. If `True` amounts are ignored.
+            batch: If set, submits all the unstakes as a single ``Utility`` batch extrinsic, signed once and waited
+                for once, instead of one extrinsic per hotkey. Defaults to ``False``.
+            atomic: Only used with ``batch``. If set, no stake is removed if any of them fails. Otherwise, each
+                unstake succeeds or fails on its own. Defaults to ``True``.
 
         Returns:
             bool: `True` if the batch unstaking is successful, False otherwise.
@@ -6033,6 +6156,8 @@ class AsyncSubtensor(SubtensorMixin):
             wait_for_finalization=wait_for_finalization,
             period=period,
             unstake_all=unstake_all,
+            batch=batch,
+            atomic=atomic,
         )
 
 
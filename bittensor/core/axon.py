@@ -5,6 +5,12 @@ import asyncio
 import contextlib
 import copy
 import inspect
+import multiprocessing
+import os
+import shutil
+import signal
+import socket
+import tempfile
 import threading
 import time
 import traceback
@@ -16,7 +22,7 @@ from typing import Any, Awaitable, Callable, Optional, Tuple
 
 from async_substrate_interface.utils import json
 import uvicorn
-from bittensor_wallet import Wallet, Keypair
+from bittensor_wallet import Wallet
 from fastapi import APIRouter, Depends, FastAPI
 from fastapi.responses import JSONResponse
 from fastapi.routing import serialize_response
@@ -24,8 +30,20 @@ from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoin
 from starlette.requests import Request
 from starlette.responses import Response
 
+from bittensor.core.admission import (
+    AdmissionScheduler,
+    QueueFullError,
+    RequestExpiredError,
+)
+from bittensor.core.binary_transport import (
+    BINARY_CONTENT_TYPE,
+    binary_body_hash,
+    decode_synapse,
+    encode_synapse,
+)
 from bittensor.core.chain_data import AxonInfo
 from bittensor.core.config import Config
+from bittensor.core.crypto_pool import CryptoPool
 from bittensor.core.errors import (
     BlacklistedException,
     InvalidRequestNameError,
@@ -40,9 +58,16 @@ from bittensor.core.errors import (
 from bittensor.core.settings import DEFAULTS, version_as_int
 from bittensor.core.stream import StreamingSynapse
 from bittensor.core.synapse import Synapse, TerminalInfo
+from bittensor.core.tensor import elide_buffers
 from bittensor.core.threadpool import PriorityThreadPoolExecutor
 from bittensor.utils import networking, Certificate
-from bittensor.utils.axon_utils import allowed_nonce_window_ns, calculate_diff_seconds
+from bittensor.utils.axon_utils import (
+    MemoryNonceStore,
+    NonceStore,
+    SQLiteNonceStore,
+    allowed_nonce_window_ns,
+    calculate_diff_seconds,
+)
 from bittensor.utils.btlogging import logging
 
 # Just for annotation checker
@@ -52,6 +77,14 @@ if typing.TYPE_CHECKING:
 # Latest version with old style nonce structure (this in not a current SDK version)
 V_7_2_0 = 7002000
 
+# Seconds a worker process is given to finish its in-flight requests on stop before it is killed.
+AXON_WORKER_DRAIN_TIMEOUT = 30.0
+
+
+def _run_axon_worker(fast_config: "uvicorn.Config", sock: "socket.socket"):
+    """Entry point of an axon worker process, serving the app on the listening socket inherited from the parent."""
+    uvicorn.Server(config=fast_config).run(sockets=[sock])
+
 
 class FastAPIThreadedServer(uvicorn.Server):
     """
@@ -322,6 +355,12 @@ class Axon:
         external_ip: Optional[str] = None,
         external_port: Optional[int] = None,
         max_workers: Optional[int] = None,
+        nonce_store: Optional["NonceStore"] = None,
+        max_concurrent_requests: Optional[int] = None,
+        max_queued_requests: Optional[int] = None,
+        workers: Optional[int] = None,
+        crypto_workers: Optional[int] = None,
+        crypto_processes: Optional[bool] = None,
     ):
         """Creates a new bittensor.Axon object from passed arguments.
 
@@ -334,6 +373,21 @@ class Axon:
             external_port (:type:`Optional[int]`): The external port of the server to broadcast to the network.
             max_workers (:type:`Optional[int]`): Used to create the threadpool if not passed, specifies the number of
                 active threads servicing requests.
+            nonce_store (:type:`Optional[bittensor.utils.axon_utils.NonceStore]`): The store of the last nonce
+                accepted per dendrite, used for replay protection. Pass a shared
+                :class:`bittensor.utils.axon_utils.SQLiteNonceStore` to share it between axon processes. Defaults
+                to a bounded in-memory store.
+            max_concurrent_requests (:type:`Optional[int]`): Maximum number of requests served at once. Requests
+                beyond it wait for admission in order of priority. Defaults to ``None``, admitting all requests.
+            max_queued_requests (:type:`Optional[int]`): Maximum number of requests waiting for admission when
+                ``max_concurrent_requests`` is set. Lower priority requests beyond it are shed with a ``503``.
+            workers (:type:`Optional[int]`): Number of processes serving requests. With more than one, the server
+                runs in forked worker processes sharing the listening socket and the nonce store, instead of a thread
+                of the calling process. Defaults to ``1``.
+            crypto_workers (:type:`Optional[int]`): Number of workers verifying the request signatures and signing the
+                responses, off the event loop. Defaults to ``0``, verifying and signing on the event loop.
+            crypto_processes (:type:`Optional[bool]`): Whether the request signatures are verified in worker processes
+                instead of threads, in parallel with the event loop. Defaults to ``False``.
         """
         # Build and check config.
         if config is None:
@@ -344,6 +398,27 @@ class Axon:
         config.axon.external_ip = external_ip or config.axon.external_ip
         config.axon.external_port = external_port or config.axon.external_port
         config.axon.max_workers = max_workers or config.axon.max_workers
+        config.axon.max_concurrent_requests = (
+            max_concurrent_requests or config.axon.get("max_concurrent_requests")
+        )
+        config.axon.max_queued_requests = (
+            max_queued_requests
+            if max_queued_requests is not None
+            else config.axon.get(
+                "max_queued_requests", DEFAULTS.axon.max_queued_requests
+            )
+        )
+        config.axon.workers = workers or config.axon.get("workers") or 1
+        config.axon.crypto_workers = (
+            crypto_workers
+            if crypto_workers is not None
+            else config.axon.get("crypto_workers", DEFAULTS.axon.crypto_workers)
+        )
+        config.axon.crypto_processes = (
+            crypto_processes
+            if crypto_processes is not None
+            else config.axon.get("crypto_processes", DEFAULTS.axon.crypto_processes)
+        )
         Axon.check_config(config)
         self._config = config
 
@@ -373,7 +448,21 @@ class Axon:
         self.thread_pool = PriorityThreadPoolExecutor(
             max_workers=self._config.axon.max_workers
         )
-        self.nonces: dict[str, int] = {}
+        self.nonces: NonceStore = (
+            nonce_store if nonce_store is not None else MemoryNonceStore()
+        )
+        self.admission_scheduler: Optional[AdmissionScheduler] = (
+            AdmissionScheduler(
+                max_concurrency=self._config.axon.max_concurrent_requests,
+                max_queue_size=self._config.axon.max_queued_requests,
+            )
+            if self._config.axon.max_concurrent_requests
+            else None
+        )
+        self.crypto_pool = CryptoPool(
+            max_workers=self._config.axon.crypto_workers,
+            processes=bool(self._config.axon.crypto_processes),
+        )
 
         # Request default functions.
         self.forward_class_types: dict[str, list[Signature]] = {}
@@ -393,6 +482,11 @@ class Axon:
             port=self._config.axon.port,
         )
         self.fast_server = FastAPIThreadedServer(config=self.fast_config)
+        self._worker_processes: list[multiprocessing.Process] = []
+        self._worker_socket: Optional[socket.socket] = None
+        self._workers_owner_pid: Optional[int] = None
+        # The in-memory nonce store replaced while workers run, and the directory of its replacement.
+        self._worker_nonces: Optional[tuple[MemoryNonceStore, str]] = None
         self.router = APIRouter()
         self.app.include_router(self.router)
 
@@ -556,11 +650,28 @@ class Axon:
             parameters=list(forward_sig.parameters.values()),
             return_annotation=return_annotation,
         )
+        route_endpoint = endpoint
+
+        if len(forward_sig.parameters) == 1:
+            # The body is parsed once by `verify_body_integrity`, which caches the synapse on the request state.
+            # Hand that instance to forward_fn rather than letting FastAPI parse and validate the body again.
+            async def cached_synapse_endpoint(request: Request):
+                return await endpoint(request.state.synapse)
+
+            cached_synapse_endpoint.__signature__ = Signature(  # type: ignore
+                parameters=[
+                    Parameter(
+                        "request", Parameter.POSITIONAL_OR_KEYWORD, annotation=Request
+                    )
+                ],
+                return_annotation=return_annotation,
+            )
+            route_endpoint = cached_synapse_endpoint
 
         # Add the endpoint to the router, making it available on both GET and POST methods
         self.router.add_api_route(
             path=f"/{request_name}",
-            endpoint=endpoint,
+            endpoint=route_endpoint,
             methods=["GET", "POST"],
             dependencies=[Depends(self.verify_body_integrity)],
         )
@@ -673,6 +784,43 @@ class Axon:
                         The grpc server distributes new worker threads to service requests up to this number.""",
                 default=DEFAULTS.axon.max_workers,
             )
+            parser.add_argument(
+                "--" + prefix_str + "axon.workers",
+                type=int,
+                help="""The number of processes serving requests on the axon port. With more than one, requests are
+                        served by forked worker processes, so that CPU-bound forward functions do not stall the
+                        other requests.""",
+                default=DEFAULTS.axon.workers,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.max_concurrent_requests",
+                type=int,
+                required=False,
+                help="""The maximum number of requests served at once. Requests beyond it wait for admission in order
+                        of priority. Unlimited if not set.""",
+                default=DEFAULTS.axon.max_concurrent_requests,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.max_queued_requests",
+                type=int,
+                help="""The maximum number of requests waiting for admission when axon.max_concurrent_requests is
+                        set. Lower priority requests beyond it are rejected with a 503.""",
+                default=DEFAULTS.axon.max_queued_requests,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.crypto_workers",
+                type=int,
+                help="""The number of workers verifying the request signatures and signing the responses, off the event
+                        loop. With 0, they are verified and signed on the event loop.""",
+                default=DEFAULTS.axon.crypto_workers,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.crypto_processes",
+                action="store_true",
+                help="""If set, the request signatures are verified in worker processes instead of threads, in
+                        parallel with the event loop.""",
+                default=DEFAULTS.axon.crypto_processes,
+            )
 
         except argparse.ArgumentError:
             # Exception handling for re-parsing arguments
@@ -694,7 +842,8 @@ class Axon:
 
         Returns:
             dict: Returns the parsed body of the request as a dictionary if all the hash comparisons match, indicating
-                that the body is intact and has not been tampered with.
+                that the body is intact and has not been tampered with. ``None`` for binary request bodies, see
+                :mod:`bittensor.core.binary_transport`.
 
         Raises:
             JSONResponse: Raises a JSONResponse with a 400 status code if any of the hash comparisons fail, indicating
@@ -708,6 +857,8 @@ class Axon:
         3. Loading and parsing the request body into a dictionary.
         4. Reconstructing the Synapse object and recomputing the hash for verification and logging.
         5. Comparing the recomputed hash with the hash provided in the request headers for verification.
+        6. Caching the verified Synapse object on ``request.state.synapse``, so the forward endpoint does not parse
+           the body again.
 
         Note:
             The integrity verification is an essential step in ensuring the security of the data exchange within the
@@ -716,16 +867,22 @@ class Axon:
         """
         # Await and load the request body, so we can inspect it
         body = await request.body()
-        request_body = body.decode() if isinstance(body, bytes) else body
-
         request_name = request.url.path.split("/")[1]
 
-        # Load the body dict and check if all required field hashes match
-        body_dict = json.loads(request_body)
+        if request.headers.get("content-type") == BINARY_CONTENT_TYPE:
+            # Decode the synapse, its tensors viewing the body, and hash their raw data
+            syn = decode_synapse(self.forward_class_types[request_name], body)
+            parsed_body_hash = binary_body_hash(syn)
+            body_dict = None
+        else:
+            request_body = body.decode() if isinstance(body, bytes) else body
 
-        # Reconstruct the synapse object from the body dict and recompute the hash
-        syn = self.forward_class_types[request_name](**body_dict)  # type: ignore
-        parsed_body_hash = syn.body_hash  # Rehash the body from request
+            # Load the body dict and check if all required field hashes match
+            body_dict = json.loads(request_body)
+
+            # Reconstruct the synapse object from the body dict and recompute the hash
+            syn = self.forward_class_types[request_name](**body_dict)  # type: ignore
+            parsed_body_hash = syn.body_hash  # Rehash the body from request
 
         body_hash = request.headers.get("computed_body_hash", "")
         if parsed_body_hash != body_hash:
@@ -733,6 +890,9 @@ class Axon:
                 f"Hash mismatch between header body hash {body_hash} and parsed body hash {parsed_body_hash}"
             )
 
+        # Cache the verified synapse for the forward endpoint
+        request.state.synapse = syn
+
         # If body is good, return the parsed body so that it can be passed onto the route function
         return body_dict
 
@@ -755,6 +915,24 @@ class Axon:
             1024 < config.axon.external_port < 65535
         ), "External port must be in range [1024, 65535]"
 
+        assert config.axon.get("workers") is None or config.axon.workers > 0, (
+            "Axon workers must be a positive integer"
+        )
+
+        assert (
+            config.axon.get("max_concurrent_requests") is None
+            or config.axon.max_concurrent_requests > 0
+        ), "Max concurrent requests must be a positive integer"
+
+        assert (
+            config.axon.get("max_queued_requests") is None
+            or config.axon.max_queued_requests >= 0
+        ), "Max queued requests must be a non-negative integer"
+
+        assert (
+            config.axon.get("crypto_workers") is None or config.axon.crypto_workers >= 0
+        ), "Axon crypto workers must be a non-negative integer"
+
     def to_string(self):
         """Provides a human-readable representation of the AxonInfo for this Axon."""
         return self.info().to_string()
@@ -800,12 +978,87 @@ class Axon:
 
         Note:
             After invoking this method, the Axon is ready to handle requests as per its configured endpoints and custom
-                logic.
+                logic. With more than one ``axon.workers``, the forward functions must be attached before starting, as
+                they run in the forked worker processes.
         """
-        self.fast_server.start()
+        if self._config.axon.workers > 1:
+            self._start_workers()
+        else:
+            self.fast_server.start()
         self.started = True
         return self
 
+    def _start_workers(self):
+        """
+        Forks ``axon.workers`` processes serving the attached endpoints on a listening socket bound here, so that a
+        CPU-bound forward function in one process does not stall the requests handled by the others.
+
+        Replay protection is shared by the workers: an in-memory nonce store is replaced by a
+        :class:`bittensor.utils.axon_utils.SQLiteNonceStore` in a temporary directory. Blacklist, priority and verify
+        functions run in each worker with the state they were forked with.
+        """
+        if self._worker_processes:
+            return
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise RuntimeError(
+                "Multiple axon workers require the 'fork' process start method."
+            )
+
+        if isinstance(self.nonces, MemoryNonceStore):
+            nonces_dir = tempfile.mkdtemp(prefix="bittensor-axon-")
+            self._worker_nonces = (self.nonces, nonces_dir)
+            self.nonces = SQLiteNonceStore(
+                os.path.join(nonces_dir, "nonces.db"),
+                max_size=self.nonces.max_size,
+                max_timeout=self.nonces.max_timeout,
+            )
+
+        self._worker_socket = self.fast_config.bind_socket()
+        self._workers_owner_pid = os.getpid()
+        context = multiprocessing.get_context("fork")
+        for _ in range(self._config.axon.workers):
+            process = context.Process(
+                target=_run_axon_worker,
+                args=(self.fast_config, self._worker_socket),
+                daemon=True,
+            )
+            process.start()
+            self._worker_processes.append(process)
+        logging.info(
+            f"Axon serving on port {self.port} with {len(self._worker_processes)} worker processes"
+        )
+
+    def _stop_workers(self, timeout: float = AXON_WORKER_DRAIN_TIMEOUT):
+        """
+        Gracefully stops the worker processes: they stop accepting connections and finish their in-flight requests,
+        and are killed if still running after ``timeout`` seconds. The temporary nonce store of the workers is
+        removed, and the in-memory store it replaced is restored.
+
+        Args:
+            timeout (float): Seconds the workers are given to drain.
+        """
+        for process in self._worker_processes:
+            if process.is_alive():
+                os.kill(process.pid, signal.SIGTERM)
+        deadline = time.time() + timeout
+        for process in self._worker_processes:
+            process.join(max(0.0, deadline - time.time()))
+            if process.is_alive():
+                logging.warning(
+                    f"Axon worker {process.pid} did not drain in {timeout}s, killing it"
+                )
+                process.kill()
+                process.join()
+        self._worker_processes = []
+        if self._worker_socket is not None:
+            self._worker_socket.close()
+            self._worker_socket = None
+        if self._worker_nonces is not None:
+            self.nonces.close()
+            self.nonces, nonces_dir = self._worker_nonces
+            self._worker_nonces = None
+            shutil.rmtree(nonces_dir, ignore_errors=True)
+
     def stop(self) -> "Axon":
         """
         Stops the Axon server and its underlying GRPC server thread, transitioning the state of the Axon
@@ -829,9 +1082,16 @@ class Axon:
 
         Note:
             It is advisable to ensure that all ongoing processes or requests are completed or properly handled before
-            invoking this method.
+            invoking this method. Worker processes finish their in-flight requests, for up to
+            ``AXON_WORKER_DRAIN_TIMEOUT`` seconds, before exiting.
         """
-        self.fast_server.stop()
+        if self._worker_processes:
+            # Worker processes inherit this object; only the process that forked them may stop them.
+            if os.getpid() == self._workers_owner_pid:
+                self._stop_workers()
+        else:
+            self.fast_server.stop()
+        self.crypto_pool.shutdown()
         self.started = False
         return self
 
@@ -924,9 +1184,9 @@ class Axon:
             where the sender signs the message with their private key and the receiver verifies the
             signature using the sender's public key.
         """
-        # Build the keypair from the dendrite_hotkey
+        # Check the dendrite_hotkey, decoding its keypair on the first request
         if synapse.dendrite is not None:
-            keypair = Keypair(ss58_address=synapse.dendrite.hotkey)
+            self.crypto_pool.keypair_cache.get(synapse.dendrite.hotkey)
 
             # Build the signature messages.
             message = f"{synapse.dendrite.nonce}.{synapse.dendrite.hotkey}.{self.wallet.hotkey.ss58_address}.{synapse.dendrite.uuid}.{synapse.computed_body_hash}"
@@ -938,53 +1198,38 @@ class Axon:
             if synapse.dendrite.nonce is None:
                 raise Exception("Missing Nonce")
 
-            # Newer nonce structure post v7.2
-            if (
-                synapse.dendrite.version is not None
-                and synapse.dendrite.version >= V_7_2_0
-            ):
-                # If we don't have a nonce stored, ensure that the nonce falls within
-                # a reasonable delta.
-                current_time_ns = time.time_ns()
-                allowed_window_ns = allowed_nonce_window_ns(
-                    current_time_ns, synapse.timeout
+            # If we don't have a nonce stored, ensure that the nonce falls within
+            # a reasonable delta.
+            # The window is capped so that it never outlives the nonce store entries, and
+            # applies whatever the claimed dendrite version, since the version is not signed.
+            current_time_ns = time.time_ns()
+            window_timeout = self.nonces.window_timeout(synapse.timeout)
+            allowed_window_ns = allowed_nonce_window_ns(current_time_ns, window_timeout)
+            last_nonce = self.nonces.get(endpoint_key)
+
+            if last_nonce is None and synapse.dendrite.nonce <= allowed_window_ns:
+                diff_seconds, allowed_delta_seconds = calculate_diff_seconds(
+                    current_time_ns, window_timeout, synapse.dendrite.nonce
+                )
+                raise Exception(
+                    f"Nonce is too old: acceptable delta is {allowed_delta_seconds:.2f} seconds but request was {diff_seconds:.2f} seconds old"
                 )
 
-                if (
-                    self.nonces.get(endpoint_key) is None
-                    and synapse.dendrite.nonce <= allowed_window_ns
-                ):
-                    diff_seconds, allowed_delta_seconds = calculate_diff_seconds(
-                        current_time_ns, synapse.timeout, synapse.dendrite.nonce
-                    )
-                    raise Exception(
-                        f"Nonce is too old: acceptable delta is {allowed_delta_seconds:.2f} seconds but request was {diff_seconds:.2f} seconds old"
-                    )
+            # If a nonce is stored, ensure the new nonce
+            # is greater than the previous nonce
+            if last_nonce is not None and synapse.dendrite.nonce <= last_nonce:
+                raise Exception("Nonce is too old, a newer one was last processed")
 
-                # If a nonce is stored, ensure the new nonce
-                # is greater than the previous nonce
-                if (
-                    self.nonces.get(endpoint_key) is not None
-                    and synapse.dendrite.nonce <= self.nonces[endpoint_key]
-                ):
-                    raise Exception("Nonce is too old, a newer one was last processed")
-            # Older nonce structure pre v7.2
-            else:
-                if (
-                    self.nonces.get(endpoint_key) is not None
-                    and synapse.dendrite.nonce <= self.nonces[endpoint_key]
-                ):
-                    raise Exception("Nonce is too old, a newer one was last processed")
-
-            if synapse.dendrite.signature and not keypair.verify(
-                message, synapse.dendrite.signature
+            if synapse.dendrite.signature and not await self.crypto_pool.verify(
+                synapse.dendrite.hotkey, message, synapse.dendrite.signature
             ):
                 raise Exception(
                     f"Signature mismatch with {message} and {synapse.dendrite.signature}"
                 )
 
-            # Success
-            self.nonces[endpoint_key] = synapse.dendrite.nonce  # type: ignore
+            # Success, unless a concurrent request with the same nonce was accepted in the meantime
+            if not self.nonces.update_if_newer(endpoint_key, synapse.dendrite.nonce):  # type: ignore
+                raise Exception("Nonce is too old, a newer one was last processed")
         else:
             raise SynapseDendriteNoneException(synapse=synapse)
 
@@ -1137,8 +1382,9 @@ class AxonMiddleware(BaseHTTPMiddleware):
         3. Blacklist Checking: Verifies if the request is blacklisted.
         4. Request Verification: Ensures the authenticity and integrity of the request.
         5. Priority Assessment: Evaluates and assigns priority to the request.
-        6. Request Execution: Calls the next function in the middleware chain to process the request.
-        7. Response Postprocessing: Updates response headers and logs the end of the request processing.
+        6. Admission: Waits, in order of priority, for the axon's admission scheduler to admit the request.
+        7. Request Execution: Calls the next function in the middleware chain to process the request.
+        8. Response Postprocessing: Updates response headers and logs the end of the request processing.
 
         The method also handles exceptions and errors that might occur during each stage, ensuring that
         appropriate responses are returned to the client.
@@ -1174,10 +1420,11 @@ class AxonMiddleware(BaseHTTPMiddleware):
             await self.verify(synapse)
 
             # Call the priority function
-            await self.priority(synapse)
+            priority = await self.priority(synapse)
 
-            # Call the run function
-            response = await self.run(synapse, call_next, request)
+            # Wait for admission, then call the run function
+            async with self.admit(synapse, priority, start_time):
+                response = await self.run(synapse, call_next, request)
 
         # Handle errors related to preprocess.
         except InvalidRequestNameError as e:
@@ -1281,7 +1528,8 @@ class AxonMiddleware(BaseHTTPMiddleware):
 
         # Signs the synapse from the axon side using the wallet hotkey.
         message = f"{synapse.axon.nonce}.{synapse.dendrite.hotkey}.{synapse.axon.hotkey}.{synapse.axon.uuid}"
-        synapse.axon.signature = f"0x{self.axon.wallet.hotkey.sign(message).hex()}"
+        signature = await self.axon.crypto_pool.sign(self.axon.wallet.hotkey, message)
+        synapse.axon.signature = f"0x{signature.hex()}"
 
         # Return the setup synapse.
         return synapse
@@ -1399,7 +1647,7 @@ class AxonMiddleware(BaseHTTPMiddleware):
                     f"Forbidden. Key is blacklisted: {reason}.", synapse=synapse
                 )
 
-    async def priority(self, synapse: "Synapse"):
+    async def priority(self, synapse: "Synapse") -> float:
         """
         Executes the priority function for the request. This method assesses and assigns a priority
         level to the request, determining its urgency and importance in the processing queue.
@@ -1407,6 +1655,9 @@ class AxonMiddleware(BaseHTTPMiddleware):
         Args:
             synapse (bittensor.core.synapse.Synapse): The Synapse object representing the request.
 
+        Returns:
+            float: The priority of the request, ``0.0`` if no priority function is attached for it.
+
         Raises:
             Exception: If the priority assessment process encounters issues, such as timeouts.
 
@@ -1437,6 +1688,8 @@ class AxonMiddleware(BaseHTTPMiddleware):
             result_ = await future
             return priority, result_
 
+        priority = 0.0
+
         # If a priority function exists for the request's name
         if priority_fn:
             try:
@@ -1447,9 +1700,10 @@ class AxonMiddleware(BaseHTTPMiddleware):
                     else priority_fn(synapse)
                 )
 
-                # Submit the task to the thread pool for execution with the given priority.
-                # The submit_task function will handle the execution and return the result.
-                _, result = await submit_task(self.axon.thread_pool, priority)
+                # Without an admission scheduler, submit the task to the thread pool for execution with the given
+                # priority. The submit_task function will handle the execution and return the result.
+                if self.axon.admission_scheduler is None:
+                    _, result = await submit_task(self.axon.thread_pool, priority)
 
             except TimeoutError as e:
                 # If the execution of the priority function exceeds the timeout,
@@ -1465,6 +1719,48 @@ class AxonMiddleware(BaseHTTPMiddleware):
                     f"Response timeout after: {synapse.timeout}s", synapse=synapse
                 )
 
+        return priority
+
+    @contextlib.asynccontextmanager
+    async def admit(self, synapse: "Synapse", priority: float, start_time: float):
+        """
+        Holds an admission slot of the axon's admission scheduler while the request is run. Requests wait for
+        admission in order of priority and are rejected once their timeout, counted from ``start_time``, has elapsed.
+        Without a scheduler, every request is admitted immediately.
+
+        Args:
+            synapse (bittensor.core.synapse.Synapse): The Synapse object representing the request.
+            priority (float): The priority of the request, as returned by :func:`priority`.
+            start_time (float): The time the request was received at.
+
+        Raises:
+            PriorityException: With a ``503`` status code if the request was shed from a full admission queue, or
+                with a ``408`` status code if it expired before admission.
+        """
+        scheduler = self.axon.admission_scheduler
+        if scheduler is None:
+            yield
+            return
+
+        deadline = start_time + synapse.timeout if synapse.timeout else None
+        try:
+            await scheduler.acquire(priority, deadline)
+        except (QueueFullError, RequestExpiredError) as e:
+            logging.trace(f"Admission rejected: {str(e)}")
+            if synapse.axon is not None:
+                synapse.axon.status_code = 503 if isinstance(e, QueueFullError) else 408
+            raise PriorityException(
+                f"Service unavailable: {str(e)}"
+                if isinstance(e, QueueFullError)
+                else f"Response timeout after: {synapse.timeout}s",
+                synapse=synapse,
+            ) from e
+
+        try:
+            yield
+        finally:
+            scheduler.release()
+
     async def run(
         self,
         synapse: "Synapse",
@@ -1511,7 +1807,8 @@ class AxonMiddleware(BaseHTTPMiddleware):
         response_override: Optional["Response"] = None,
     ) -> "Response":
         """
-        Converts the Synapse object into a JSON response with HTTP headers.
+        Converts the Synapse object into a JSON response with HTTP headers, or a binary one for synapses received
+        through the binary transport.
 
         Args:
             synapse (bittensor.core.synapse.Synapse): The Synapse object representing the request.
@@ -1536,8 +1833,16 @@ class AxonMiddleware(BaseHTTPMiddleware):
 
         synapse.axon.process_time = time.time() - start_time
 
+        binary = synapse._binary_transport and response_override is None
         if response_override:
             response = response_override
+        elif binary:
+            # Answer binary requests with a binary body
+            response = Response(
+                status_code=synapse.axon.status_code,
+                content=encode_synapse(synapse),
+                media_type=BINARY_CONTENT_TYPE,
+            )
         else:
             serialized_synapse = await serialize_response(response_content=synapse)
             response = JSONResponse(
@@ -1546,7 +1851,12 @@ class AxonMiddleware(BaseHTTPMiddleware):
             )
 
         try:
-            updated_headers = synapse.to_headers()
+            if binary:
+                with elide_buffers():
+                    updated_headers = synapse.to_headers()
+                updated_headers["computed_body_hash"] = binary_body_hash(synapse)
+            else:
+                updated_headers = synapse.to_headers()
         except Exception as e:
             raise PostProcessException(
                 f"Error while parsing response headers. Postprocess exception: {str(e)}.",
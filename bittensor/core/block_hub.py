@@ -0,0 +1,493 @@
+"""Shared subscriptions to the new block headers of a chain, fanned out to any number of in-process listeners."""
+
+import asyncio
+import concurrent.futures
+import heapq
+import inspect
+import itertools
+import queue
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    Optional,
+    Union,
+)
+
+from bittensor.utils.btlogging import logging
+
+if TYPE_CHECKING:
+    from async_substrate_interface import AsyncSubstrateInterface, SubstrateInterface
+
+HEADERS_MAX_QUEUED = 16
+"""Default maximum number of headers queued for a slow header iterator, the oldest ones being dropped beyond it."""
+
+_STOP = object()
+
+
+class AsyncBlockHub:
+    """
+    Fans the new block headers of an async connection out to any number of listeners, over a single subscription.
+
+    Listeners are callbacks, async iterators over the headers, and futures resolved once the chain reaches a given
+    block. The subscription is opened on the connection with the first listener, and closed after the last one is
+    gone, so that consumers neither hold their own subscription nor poll the current block.
+
+    Args:
+        substrate: The connection to subscribe on.
+
+    Example::
+
+        hub = subtensor.block_hub
+        hub.add_listener(lambda header: print(header["number"]))
+        await hub.wait_for_block(1234)
+        async for header in hub.headers():
+            ...
+    """
+
+    def __init__(self, substrate: "AsyncSubstrateInterface"):
+        self.substrate = substrate
+        self.latest_header: Optional[dict] = None
+        self.headers_received = 0
+        self._callbacks: list[Callable[[dict], Union[None, Awaitable[None]]]] = []
+        self._queues: list[asyncio.Queue] = []
+        # Heap of (block, arrival, future)
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._arrivals = itertools.count()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def latest_block(self) -> Optional[int]:
+        """Number of the latest block received, or ``None`` before the first one."""
+        return None if self.latest_header is None else self.latest_header["number"]
+
+    @property
+    def listeners(self) -> int:
+        """Number of callbacks, header iterators and pending block futures."""
+        return (
+            len(self._callbacks)
+            + len(self._queues)
+            + sum(not future.done() for *_, future in self._waiters)
+        )
+
+    @property
+    def running(self) -> bool:
+        """Whether the subscription is open."""
+        return self._task is not None and not self._task.done()
+
+    def _ensure_running(self):
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        task = asyncio.current_task()
+        try:
+            block_hash = await self.substrate.get_chain_head()
+            await self.substrate.get_block_handler(
+                block_hash, header_only=True, subscription_handler=self._on_header
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            logging.error(f"Block header subscription failed: {error}")
+            if self._task is task:
+                self._fail(error)
+        finally:
+            if self._task is task:
+                self._task = None
+
+    def _fail(self, error: Exception):
+        while self._waiters:
+            *_, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_exception(error)
+        for queue_ in self._queues:
+            _put_latest(queue_, error)
+
+    async def _on_header(self, block_data: dict) -> Optional[bool]:
+        header = block_data["header"]
+        number = header["number"]
+        if self.latest_block is None or number >= self.latest_block:
+            self.latest_header = header
+        self.headers_received += 1
+
+        for callback in list(self._callbacks):
+            try:
+                result = callback(header)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as error:
+                logging.error(f"Block listener {callback} failed: {error}")
+        for queue_ in self._queues:
+            _put_latest(queue_, header)
+        while self._waiters and self._waiters[0][0] <= number:
+            *_, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(header)
+
+        if not self.listeners:
+            # Unsubscribes; a listener added from now on opens a new subscription
+            self._task = None
+            return True
+        return None
+
+    def add_listener(self, callback: Callable[[dict], Union[None, Awaitable[None]]]):
+        """
+        Calls ``callback`` with each new block header, until it is removed with :func:`remove_listener`.
+
+        Args:
+            callback: Function or coroutine function called with the header, whose ``number`` is the block number.
+                Exceptions it raises are logged.
+        """
+        self._callbacks.append(callback)
+        self._ensure_running()
+
+    def remove_listener(self, callback: Callable[[dict], Union[None, Awaitable[None]]]):
+        """Stops calling a callback added with :func:`add_listener`."""
+        self._callbacks.remove(callback)
+
+    async def headers(
+        self, max_queued: int = HEADERS_MAX_QUEUED
+    ) -> AsyncIterator[dict]:
+        """
+        Iterates over the new block headers, until the iteration is stopped.
+
+        Args:
+            max_queued: Maximum number of headers queued while the iteration is busy. The oldest ones are dropped
+                beyond it.
+
+        Yields:
+            dict: The block header, whose ``number`` is the block number.
+        """
+        queue_: asyncio.Queue = asyncio.Queue(maxsize=max_queued)
+        self._queues.append(queue_)
+        self._ensure_running()
+        try:
+            while True:
+                header = await queue_.get()
+                if header is _STOP:
+                    return
+                if isinstance(header, Exception):
+                    raise header
+                yield header
+        finally:
+            self._queues.remove(queue_)
+
+    def at_block(self, block: int) -> asyncio.Future:
+        """
+        Returns a future resolved with the header of the first block whose number is at least ``block``.
+
+        Args:
+            block: The block number to wait for.
+
+        Returns:
+            asyncio.Future: The future header. Cancel it to stop waiting.
+        """
+        future = asyncio.get_running_loop().create_future()
+        if (
+            self.running
+            and self.latest_block is not None
+            and self.latest_block >= block
+        ):
+            future.set_result(self.latest_header)
+            return future
+        heapq.heappush(self._waiters, (block, next(self._arrivals), future))
+        self._ensure_running()
+        return future
+
+    async def wait_for_block(self, block: int, timeout: Optional[float] = None) -> dict:
+        """
+        Waits until the chain reaches ``block``.
+
+        Args:
+            block: The block number to wait for.
+            timeout: Maximum number of seconds to wait for.
+
+        Returns:
+            dict: The header of the first block whose number is at least ``block``.
+
+        Raises:
+            TimeoutError: If the block is not reached within ``timeout`` seconds.
+        """
+        return await asyncio.wait_for(self.at_block(block), timeout)
+
+    async def close(self):
+        """Closes the subscription, cancels the pending block futures and ends the iterations."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        for *_, future in self._waiters:
+            future.cancel()
+        self._waiters.clear()
+        for queue_ in self._queues:
+            _put_latest(queue_, _STOP)
+
+
+class BlockHub:
+    """
+    Fans the new block headers of a chain out to any number of listeners, over a single subscription.
+
+    Listeners are callbacks, iterators over the headers, and futures resolved once the chain reaches a given block. A
+    synchronous connection serves one request at a time, so the subscription runs on its own connection, in a
+    background thread. It is opened with the first listener, and closed after the last one is gone. A new
+    subscription waits for the previous one to unsubscribe before using the connection.
+
+    Args:
+        substrate_factory: Creates the connection to subscribe on. Called when the subscription is first opened, and
+            again after the connection failed.
+
+    Example::
+
+        hub = subtensor.block_hub
+        hub.add_listener(lambda header: print(header["number"]))
+        hub.wait_for_block(1234)
+        for header in hub.headers():
+            ...
+    """
+
+    def __init__(self, substrate_factory: Callable[[], "SubstrateInterface"]):
+        self.substrate_factory = substrate_factory
+        self.latest_header: Optional[dict] = None
+        self.headers_received = 0
+        self._substrate: Optional["SubstrateInterface"] = None
+        self._callbacks: list[Callable[[dict], Any]] = []
+        self._queues: list[queue.Queue] = []
+        # Heap of (block, arrival, future)
+        self._waiters: list[tuple[int, int, concurrent.futures.Future]] = []
+        self._arrivals = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._lock = threading.RLock()
+        # Held by the subscription thread while it uses the connection, until it has unsubscribed
+        self._connection_lock = threading.Lock()
+
+    @property
+    def latest_block(self) -> Optional[int]:
+        """Number of the latest block received, or ``None`` before the first one."""
+        return None if self.latest_header is None else self.latest_header["number"]
+
+    @property
+    def listeners(self) -> int:
+        """Number of callbacks, header iterators and pending block futures."""
+        with self._lock:
+            return (
+                len(self._callbacks)
+                + len(self._queues)
+                + sum(not future.done() for *_, future in self._waiters)
+            )
+
+    @property
+    def running(self) -> bool:
+        """Whether the subscription is open."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _ensure_running(self):
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The block hub is closed.")
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="bittensor-block-hub", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        thread = threading.current_thread()
+        # The previous subscription thread may still be unsubscribing on the connection
+        with self._connection_lock:
+            try:
+                if self._thread is not thread:
+                    # Closed while waiting for the connection
+                    return
+                if self._substrate is None:
+                    self._substrate = self.substrate_factory()
+                block_hash = self._substrate.get_chain_head()
+                self._substrate.get_block_handler(
+                    block_hash, header_only=True, subscription_handler=self._on_header
+                )
+            except Exception as error:
+                with self._lock:
+                    if self._thread is not thread:
+                        # Closed, or stopped and replaced
+                        return
+                    logging.error(f"Block header subscription failed: {error}")
+                    self._substrate = None
+                    self._fail(error)
+            finally:
+                with self._lock:
+                    if self._thread is thread:
+                        self._thread = None
+
+    def _fail(self, error: Exception):
+        while self._waiters:
+            *_, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_exception(error)
+        for queue_ in self._queues:
+            _put_latest(queue_, error)
+
+    def _on_header(self, block_data: dict) -> Optional[bool]:
+        header = block_data["header"]
+        number = header["number"]
+        with self._lock:
+            if self._closed or self._thread is not threading.current_thread():
+                return True
+            if self.latest_block is None or number >= self.latest_block:
+                self.latest_header = header
+            self.headers_received += 1
+            callbacks = list(self._callbacks)
+            for queue_ in self._queues:
+                _put_latest(queue_, header)
+            resolved = []
+            while self._waiters and self._waiters[0][0] <= number:
+                resolved.append(heapq.heappop(self._waiters)[-1])
+
+        for callback in callbacks:
+            try:
+                callback(header)
+            except Exception as error:
+                logging.error(f"Block listener {callback} failed: {error}")
+        for future in resolved:
+            if future.set_running_or_notify_cancel():
+                future.set_result(header)
+
+        with self._lock:
+            if not self.listeners:
+                # Unsubscribes; a listener added from now on opens a new subscription
+                self._thread = None
+                return True
+        return None
+
+    def add_listener(self, callback: Callable[[dict], Any]):
+        """
+        Calls ``callback`` with each new block header, from the subscription thread, until it is removed with
+        :func:`remove_listener`.
+
+        Args:
+            callback: Function called with the header, whose ``number`` is the block number. Exceptions it raises are
+                logged.
+        """
+        with self._lock:
+            self._callbacks.append(callback)
+            self._ensure_running()
+
+    def remove_listener(self, callback: Callable[[dict], Any]):
+        """Stops calling a callback added with :func:`add_listener`."""
+        with self._lock:
+            self._callbacks.remove(callback)
+
+    def headers(
+        self, max_queued: int = HEADERS_MAX_QUEUED, timeout: Optional[float] = None
+    ) -> Iterator[dict]:
+        """
+        Iterates over the new block headers, until the iteration is stopped.
+
+        Args:
+            max_queued: Maximum number of headers queued while the iteration is busy. The oldest ones are dropped
+                beyond it.
+            timeout: Maximum number of seconds to wait for each header.
+
+        Yields:
+            dict: The block header, whose ``number`` is the block number.
+
+        Raises:
+            TimeoutError: If no header is received within ``timeout`` seconds.
+        """
+        queue_: queue.Queue = queue.Queue(maxsize=max_queued)
+        with self._lock:
+            self._queues.append(queue_)
+            self._ensure_running()
+        try:
+            while True:
+                try:
+                    header = queue_.get(timeout=timeout)
+                except queue.Empty:
+                    raise TimeoutError("No block header received in time.")
+                if header is _STOP:
+                    return
+                if isinstance(header, Exception):
+                    raise header
+                yield header
+        finally:
+            with self._lock:
+                self._queues.remove(queue_)
+
+    def at_block(self, block: int) -> concurrent.futures.Future:
+        """
+        Returns a future resolved with the header of the first block whose number is at least ``block``.
+
+        Args:
+            block: The block number to wait for.
+
+        Returns:
+            concurrent.futures.Future: The future header. Cancel it to stop waiting.
+        """
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._lock:
+            if (
+                self.running
+                and self.latest_block is not None
+                and self.latest_block >= block
+            ):
+                future.set_result(self.latest_header)
+                return future
+            heapq.heappush(self._waiters, (block, next(self._arrivals), future))
+            self._ensure_running()
+        return future
+
+    def wait_for_block(self, block: int, timeout: Optional[float] = None) -> dict:
+        """
+        Waits until the chain reaches ``block``.
+
+        Args:
+            block: The block number to wait for.
+            timeout: Maximum number of seconds to wait for.
+
+        Returns:
+            dict: The header of the first block whose number is at least ``block``.
+
+        Raises:
+            TimeoutError: If the block is not reached within ``timeout`` seconds.
+        """
+        future = self.at_block(block)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Block {block} not reached in time.")
+
+    def close(self):
+        """Closes the subscription and its connection, cancels the pending block futures and ends the iterations."""
+        with self._lock:
+            self._closed = True
+            self._thread = None
+            substrate, self._substrate = self._substrate, None
+            for *_, future in self._waiters:
+                future.cancel()
+            self._waiters.clear()
+            for queue_ in self._queues:
+                _put_latest(queue_, _STOP)
+        if substrate is not None:
+            # Interrupts the subscription waiting for the next header
+            substrate.close()
+
+
+def _put_latest(queue_: Union[asyncio.Queue, queue.Queue], item: Any):
+    """Puts an item into a bounded queue, dropping the oldest item if it is full."""
+    while True:
+        try:
+            queue_.put_nowait(item)
+            return
+        except (asyncio.QueueFull, queue.Full):
+            try:
+                queue_.get_nowait()
+            except (asyncio.QueueEmpty, queue.Empty):
+                pass
@@ -12,6 +12,7 @@ from .delegate_info_lite import DelegateInfoLite
 from .dynamic_info import DynamicInfo
 from .ip_info import IPInfo
 from .metagraph_info import (
+    ColumnarMetagraphInfo,
     MetagraphInfo,
     MetagraphInfoEmissions,
     MetagraphInfoPool,
@@ -36,6 +37,7 @@ ProposalCallData = GenericCall
 __all__ = [
     AxonInfo,
     ChainIdentity,
+    ColumnarMetagraphInfo,
     DelegateInfo,
     DelegatedInfo,
     DelegateInfoLite,
@@ -1,6 +1,11 @@
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Union
+from typing import Any, Optional, Union
+
+import numpy as np
+from scalecodec.utils.ss58 import ss58_decode, ss58_encode
+
 from bittensor.core import settings
 from bittensor.core.chain_data.axon_info import AxonInfo
 from bittensor.core.chain_data.chain_identity import ChainIdentity
@@ -8,6 +13,7 @@ from bittensor.core.chain_data.info_base import InfoBase
 from bittensor.core.chain_data.subnet_identity import SubnetIdentity
 from bittensor.core.chain_data.utils import decode_account_id
 from bittensor.utils import (
+    U16_MAX,
     get_netuid_and_mechid_by_storage_index,
     u64_normalized_float as u64tf,
     u16_normalized_float as u16tf,
@@ -406,6 +412,201 @@ class MetagraphInfo(InfoBase):
         )
 
 
+class ColumnView(Sequence):
+    """
+    Read-only sequence over a numpy column of raw chain values, converting an item only when it is accessed.
+
+    Args:
+        raw (np.ndarray): The raw column values, one per UID.
+    """
+
+    def __init__(self, raw: np.ndarray):
+        self.raw = raw
+
+    def _item(self, value):
+        return value.item()
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._item(value) for value in self.raw[index]]
+        return self._item(self.raw[index])
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ColumnView):
+            return type(self) is type(other) and np.array_equal(self.raw, other.raw)
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+
+class NormalizedColumn(ColumnView):
+    """Column of raw integers read as floats normalized by ``max_value``, such as the u16 trust or consensus scores."""
+
+    def __init__(self, raw: np.ndarray, max_value: int = U16_MAX):
+        super().__init__(raw)
+        self.max_value = max_value
+
+    def _item(self, value) -> float:
+        return float(value) / float(self.max_value)
+
+    @property
+    def floats(self) -> np.ndarray:
+        """The whole column as normalized floats."""
+        return self.raw / float(self.max_value)
+
+
+class BalanceColumn(ColumnView):
+    """Column of rao amounts, accessed as :class:`Balance` objects of the ``netuid`` unit."""
+
+    def __init__(self, raw: np.ndarray, netuid: int = 0):
+        super().__init__(raw)
+        self.netuid = netuid
+
+    def _item(self, value) -> Balance:
+        return Balance.from_rao(int(value), self.netuid)
+
+    @property
+    def rao(self) -> np.ndarray:
+        """The whole column in rao."""
+        return self.raw
+
+    @property
+    def tao(self) -> np.ndarray:
+        """The whole column in tao."""
+        return self.raw / 1e9
+
+
+class AccountIdColumn(ColumnView):
+    """Column of 32-byte account ids, shaped ``(n, 32)``, accessed as ss58 addresses."""
+
+    def _item(self, value) -> str:
+        return ss58_encode(value.tobytes().hex(), settings.SS58_FORMAT)
+
+    def index(self, ss58_address: str, start: int = 0, stop: int = None) -> int:
+        """Returns the position of ``ss58_address`` in the column, without encoding the other account ids."""
+        public_key = np.frombuffer(bytes.fromhex(ss58_decode(ss58_address)), np.uint8)
+        matches = np.flatnonzero((self.raw[start:stop] == public_key).all(axis=1))
+        if not len(matches):
+            raise ValueError(f"{ss58_address} is not in the column.")
+        return start + int(matches[0])
+
+    def __contains__(self, ss58_address) -> bool:
+        try:
+            self.index(ss58_address)
+        except (ValueError, TypeError):
+            return False
+        return True
+
+
+class AccountBalanceColumn(ColumnView):
+    """Column of ``(account id, rao)`` pairs, accessed as ``(ss58 address, Balance)`` tuples."""
+
+    def __init__(self, accounts: AccountIdColumn, balances: BalanceColumn):
+        super().__init__(balances.raw)
+        self.accounts = accounts
+        self.balances = balances
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(zip(self.accounts[index], self.balances[index]))
+        return self.accounts[index], self.balances[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, AccountBalanceColumn):
+            return self.accounts == other.accounts and self.balances == other.balances
+        return super().__eq__(other)
+
+
+def _account_ids(values: list) -> np.ndarray:
+    """Returns decoded account ids, optionally wrapped in a 1-tuple, as an ``(n, 32)`` uint8 array."""
+    return np.array(
+        [
+            value[0]
+            if isinstance(value, tuple) and isinstance(value[0], tuple)
+            else value
+            for value in values
+        ],
+        dtype=np.uint8,
+    ).reshape(-1, 32)
+
+
+@dataclass
+class ColumnarMetagraphInfo(MetagraphInfo):
+    """
+    A :class:`MetagraphInfo` whose per-UID vectors are kept as numpy arrays of raw chain values.
+
+    Balances, normalized scores and ss58 addresses are only created for the items which are accessed, through
+    :class:`BalanceColumn`, :class:`NormalizedColumn` and :class:`AccountIdColumn` views behaving as read-only lists.
+    Whole columns can be read without creating any object, e.g. ``info.total_stake.tao`` or ``info.trust.floats``.
+    This keeps decoding many subnets at once, as :meth:`get_all_metagraphs_info` does, cheap in time and memory.
+    """
+
+    @classmethod
+    def _from_dict(cls, decoded: dict) -> "ColumnarMetagraphInfo":
+        """Returns a ColumnarMetagraphInfo object from decoded chain data."""
+        # The columns are blanked in a copy, leaving the caller's decoded data untouched
+        decoded = dict(decoded)
+        _netuid, _ = get_netuid_and_mechid_by_storage_index(decoded["netuid"])
+        columns: dict[str, Any] = {}
+
+        def column(key: str, build):
+            if (values := decoded.get(key)) is not None:
+                columns[key] = build(values)
+                decoded[key] = None
+
+        for key in ("hotkeys", "coldkeys"):
+            column(key, lambda values: AccountIdColumn(_account_ids(values)))
+        for key in ("active", "validator_permit"):
+            column(key, lambda values: np.array(values, dtype=bool))
+        for key in ("last_update", "block_at_registration"):
+            column(key, lambda values: np.array(values, dtype=np.uint64))
+        for key in (
+            "pruning_score",
+            "dividends",
+            "incentives",
+            "consensus",
+            "trust",
+            "rank",
+        ):
+            column(key, lambda values: NormalizedColumn(np.array(values, np.uint16)))
+        for key in ("emission", "alpha_stake", "total_stake"):
+            column(
+                key, lambda values: BalanceColumn(np.array(values, np.uint64), _netuid)
+            )
+        column(
+            "tao_stake",
+            lambda values: BalanceColumn(
+                (np.array(values, np.uint64) * settings.ROOT_TAO_STAKE_WEIGHT).astype(
+                    np.uint64
+                )
+            ),
+        )
+        for key, netuid in (
+            ("tao_dividends_per_hotkey", 0),
+            ("alpha_dividends_per_hotkey", _netuid),
+        ):
+            column(
+                key,
+                lambda values, netuid=netuid: AccountBalanceColumn(
+                    AccountIdColumn(_account_ids([value[0] for value in values])),
+                    BalanceColumn(
+                        np.array([value[1] for value in values], np.uint64), netuid
+                    ),
+                ),
+            )
+
+        info = super()._from_dict(decoded)
+        for key, value in columns.items():
+            setattr(info, key, value)
+        return info
+
+
 @dataclass
 class MetagraphInfoEmissions:
     """Emissions presented in tao values."""
@@ -1,9 +1,10 @@
 """Chain data helper functions and data."""
 
+import threading
 from enum import Enum
 from typing import Optional, Union, TYPE_CHECKING
 
-from scalecodec.base import RuntimeConfiguration, ScaleBytes
+from scalecodec.base import RuntimeConfigurationObject, ScaleBytes
 from async_substrate_interface.types import ScaleObj
 from scalecodec.type_registry import load_type_registry_preset
 from scalecodec.utils.ss58 import ss58_encode
@@ -34,6 +35,79 @@ class ChainDataType(Enum):
     AxonInfo = 16
 
 
+class _CachedRuntimeConfiguration(RuntimeConfigurationObject):
+    """Runtime configuration that memoizes ``get_decoder_class``, so nested types (e.g. the tuple inside a ``Vec``) are
+    resolved once per type string instead of once per decoded element."""
+
+    def __init__(self, *args, **kwargs):
+        self._decoder_classes: dict[str, type] = {}
+        super().__init__(*args, **kwargs)
+
+    def get_decoder_class(self, type_string: Union[str, dict]):
+        if not isinstance(type_string, str):
+            return super().get_decoder_class(type_string)
+        decoder_class = self._decoder_classes.get(type_string)
+        if decoder_class is None:
+            decoder_class = super().get_decoder_class(type_string)
+            if decoder_class is not None:
+                self._decoder_classes[type_string] = decoder_class
+        return decoder_class
+
+    def update_type_registry(self, type_registry: dict):
+        self._decoder_classes.clear()
+        super().update_type_registry(type_registry)
+
+    def clear_type_registry(self):
+        self._decoder_classes.clear()
+        super().clear_type_registry()
+
+
+class ScaleDecoderCache:
+    """
+    Thread-safe cache of scalecodec runtime configurations and decoder classes used by :func:`from_scale_encoding`.
+
+    Building a runtime configuration re-reads and re-parses the type registry preset JSON, and resolving a type string
+    such as ``Vec<AccountId>`` builds decoder classes on the fly. Both are done once per registry preset and type
+    string, instead of on every decode.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._runtime_configs: dict[str, RuntimeConfigurationObject] = {}
+
+    def runtime_config(self, preset: str = "legacy") -> RuntimeConfigurationObject:
+        """Returns the runtime configuration holding the ``preset`` type registry, building it on first use."""
+        runtime_config = self._runtime_configs.get(preset)
+        if runtime_config is None:
+            with self._lock:
+                runtime_config = self._runtime_configs.get(preset)
+                if runtime_config is None:
+                    runtime_config = _CachedRuntimeConfiguration()
+                    runtime_config.update_type_registry(
+                        load_type_registry_preset(preset)
+                    )
+                    self._runtime_configs[preset] = runtime_config
+        return runtime_config
+
+    def decoder_class(self, type_string: str, preset: str = "legacy") -> type:
+        """Returns the decoder class for ``type_string`` in the ``preset`` type registry."""
+        runtime_config = self.runtime_config(preset)
+        with self._lock:
+            decoder_class = runtime_config.get_decoder_class(type_string)
+        if decoder_class is None:
+            raise NotImplementedError(f'Decoder class for "{type_string}" not found')
+        return decoder_class
+
+    def clear(self):
+        """Drops every cached runtime configuration and decoder class."""
+        with self._lock:
+            self._runtime_configs.clear()
+
+
+scale_decoder_cache = ScaleDecoderCache()
+"""Process-wide decoder cache shared by :func:`from_scale_encoding_using_type_string`."""
+
+
 def from_scale_encoding(
     input_: Union[list[int], bytes, "ScaleBytes"],
     type_name: "ChainDataType",
@@ -93,10 +167,10 @@ def from_scale_encoding_using_type_string(
 
         as_scale_bytes = ScaleBytes(as_bytes)
 
-    rpc_runtime_config = RuntimeConfiguration()
-    rpc_runtime_config.update_type_registry(load_type_registry_preset("legacy"))
-
-    obj = rpc_runtime_config.create_scale_object(type_string, data=as_scale_bytes)
+    decoder_class = scale_decoder_cache.decoder_class(type_string)
+    obj = decoder_class(
+        data=as_scale_bytes, runtime_config=scale_decoder_cache.runtime_config()
+    )
 
     return obj.decode()
 
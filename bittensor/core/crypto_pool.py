@@ -0,0 +1,312 @@
+"""Signature verification and signing off the event loop, for the requests served by an Axon."""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import (
+    BrokenExecutor,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import Any, Callable, Optional, Union
+
+from bittensor_wallet import Keypair
+
+KEYPAIR_CACHE_SIZE = 4096
+"""Default maximum number of keypairs kept by a :class:`KeypairCache`."""
+
+CRYPTO_MAX_QUEUE_SIZE = 1024
+"""Default maximum number of jobs waiting for a worker of a :class:`CryptoPool`."""
+
+
+class KeypairCache:
+    """
+    Bounded, least recently used cache of the public keypairs decoded from ss58 addresses.
+
+    Decoding an ss58 address checks its checksum and builds a new keypair, for each request. Requests mostly come from
+    a small set of validators, whose keypairs are kept instead. The cache is thread-safe.
+
+    Args:
+        max_size (int): Maximum number of cached keypairs.
+    """
+
+    def __init__(self, max_size: int = KEYPAIR_CACHE_SIZE):
+        if max_size < 1:
+            raise ValueError("max_size must be a positive integer.")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._keypairs: OrderedDict[str, Keypair] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keypairs)
+
+    @property
+    def metrics(self) -> dict[str, int]:
+        """Returns the number of cached keypairs, and the hit, miss and eviction totals."""
+        return {
+            "size": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evicted": self.evicted,
+        }
+
+    def get(self, ss58_address: str) -> Keypair:
+        """
+        Returns the keypair of an ss58 address, decoding it on a miss.
+
+        Args:
+            ss58_address (str): The ss58 address of the keypair.
+
+        Returns:
+            bittensor_wallet.Keypair: The public keypair.
+
+        Raises:
+            ValueError: If the address is not a valid ss58 address.
+        """
+        with self._lock:
+            keypair = self._keypairs.get(ss58_address)
+            if keypair is not None:
+                self._keypairs.move_to_end(ss58_address)
+                self.hits += 1
+                return keypair
+        # Decoded outside the lock; invalid addresses raise and are not cached
+        keypair = Keypair(ss58_address=ss58_address)
+        with self._lock:
+            self.misses += 1
+            self._keypairs[ss58_address] = keypair
+            self._keypairs.move_to_end(ss58_address)
+            while len(self._keypairs) > self.max_size:
+                self._keypairs.popitem(last=False)
+                self.evicted += 1
+        return keypair
+
+
+# Keypairs of the worker processes of a CryptoPool, created on their first job.
+_process_keypairs: Optional[KeypairCache] = None
+
+
+def _verify_in_process(
+    ss58_address: str, message: str, signature: Union[str, bytes]
+) -> bool:
+    global _process_keypairs
+    if _process_keypairs is None:
+        _process_keypairs = KeypairCache()
+    return _process_keypairs.get(ss58_address).verify(message, signature)
+
+
+class CryptoPool:
+    """
+    Verifies and creates the signatures of the requests served by an Axon, on a pool of workers off the event loop.
+
+    Jobs are submitted to ``max_workers`` workers, and wait for one of them in a queue of at most ``max_queue_size``
+    jobs. Once the queue is full, new jobs run inline on the event loop instead, which slows the intake of new
+    requests down rather than queueing them without bound.
+
+    The sr25519 primitives hold the GIL, so worker threads only let the event loop run between two verifications.
+    With ``processes``, signatures are verified in worker processes, in parallel with the event loop. Signatures are
+    always created in threads, so that the private keys never leave the process. Workers are started on the first job
+    of each process, so a pool created before the axon forks its worker processes is not shared with them. Daemonic
+    processes, like the axon worker processes, cannot start processes, and verify signatures in threads instead.
+
+    Args:
+        max_workers (int): Number of workers. With ``0``, signatures are verified and created inline.
+        max_queue_size (int): Maximum number of jobs waiting for a worker.
+        processes (bool): Whether signatures are verified in worker processes instead of threads.
+        keypair_cache (Optional[KeypairCache]): The cache of the keypairs verifying signatures in this process.
+            Defaults to a new cache.
+
+    Example::
+
+        pool = CryptoPool(max_workers=2)
+        if not await pool.verify(synapse.dendrite.hotkey, message, synapse.dendrite.signature):
+            raise Exception("Signature mismatch")
+        print(pool.metrics)
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 0,
+        max_queue_size: int = CRYPTO_MAX_QUEUE_SIZE,
+        processes: bool = False,
+        keypair_cache: Optional[KeypairCache] = None,
+    ):
+        if max_workers < 0:
+            raise ValueError("max_workers must be a non-negative integer.")
+        if max_queue_size < 0:
+            raise ValueError("max_queue_size must be a non-negative integer.")
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.processes = processes
+        self.keypair_cache = (
+            keypair_cache if keypair_cache is not None else KeypairCache()
+        )
+        self.pending = 0
+        self.inline = 0
+        self.invalid = 0
+        # operation -> [count, total latency, max latency], latencies in seconds
+        self._latencies: dict[str, list] = {
+            "verify": [0, 0.0, 0.0],
+            "sign": [0, 0.0, 0.0],
+        }
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._processes: Optional[ProcessPoolExecutor] = None
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    @property
+    def metrics(self) -> dict[str, float]:
+        """
+        Returns the number of pending jobs, the totals of verified and created signatures, invalid signatures and jobs
+        run inline because the queue was full, and the mean and max latencies of both operations, in seconds.
+        """
+        metrics: dict[str, float] = {
+            "pending": self.pending,
+            "verified": self._latencies["verify"][0],
+            "signed": self._latencies["sign"][0],
+            "invalid": self.invalid,
+            "inline": self.inline,
+        }
+        for operation, (count, total, max_) in self._latencies.items():
+            metrics[f"{operation}_latency_mean"] = total / count if count else 0.0
+            metrics[f"{operation}_latency_max"] = max_
+        return metrics
+
+    def _executor(self, processes: bool) -> Optional[Executor]:
+        """Reserves a place in the queue, returning the executor to submit the job to, or ``None`` to run it inline."""
+        if self.max_workers == 0:
+            return None
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked: the workers and their jobs belong to the parent process
+                self._threads = self._processes = None
+                self.pending = 0
+                self._pid = os.getpid()
+            if self.pending >= self.max_workers + self.max_queue_size:
+                self.inline += 1
+                return None
+            # Daemonic processes, such as the axon worker processes, cannot have children
+            if processes and not multiprocessing.current_process().daemon:
+                if self._processes is None:
+                    self._processes = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("forkserver"),
+                    )
+                executor: Executor = self._processes
+            else:
+                if self._threads is None:
+                    self._threads = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="bittensor-crypto",
+                    )
+                executor = self._threads
+            self.pending += 1
+            return executor
+
+    def _release(self, _future):
+        with self._lock:
+            self.pending -= 1
+
+    def _discard(self, executor: Executor):
+        """Drops a broken executor, so that the next job starts new workers."""
+        with self._lock:
+            if self._processes is executor:
+                self._processes = None
+            elif self._threads is executor:
+                self._threads = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(
+        self, operation: str, executor: Optional[Executor], fn: Callable, *args
+    ) -> Any:
+        start = time.perf_counter()
+        if executor is None:
+            result = fn(*args)
+        else:
+            try:
+                future = executor.submit(fn, *args)
+            except BaseException as error:
+                # Shut down concurrently, or broken by a worker that died
+                self._release(None)
+                if isinstance(error, BrokenExecutor):
+                    self._discard(executor)
+                raise
+            future.add_done_callback(self._release)
+            try:
+                result = await asyncio.wrap_future(future)
+            except BrokenExecutor:
+                self._discard(executor)
+                raise
+        latency = time.perf_counter() - start
+        with self._lock:
+            latencies = self._latencies[operation]
+            latencies[0] += 1
+            latencies[1] += latency
+            latencies[2] = max(latencies[2], latency)
+        return result
+
+    def _verify(
+        self, ss58_address: str, message: str, signature: Union[str, bytes]
+    ) -> bool:
+        return self.keypair_cache.get(ss58_address).verify(message, signature)
+
+    async def verify(
+        self, ss58_address: str, message: str, signature: Union[str, bytes]
+    ) -> bool:
+        """
+        Verifies a signature.
+
+        Args:
+            ss58_address (str): The ss58 address of the signer.
+            message (str): The signed message.
+            signature (Union[str, bytes]): The signature, as bytes or a ``0x`` prefixed hexadecimal string.
+
+        Returns:
+            bool: ``True`` if the signature is valid.
+
+        Raises:
+            ValueError: If the address is not a valid ss58 address.
+        """
+        executor = self._executor(processes=self.processes)
+        fn = (
+            _verify_in_process
+            if isinstance(executor, ProcessPoolExecutor)
+            else self._verify
+        )
+        valid = await self._run(
+            "verify", executor, fn, ss58_address, message, signature
+        )
+        if not valid:
+            with self._lock:
+                self.invalid += 1
+        return valid
+
+    async def sign(self, keypair: Keypair, message: str) -> bytes:
+        """
+        Signs a message.
+
+        Args:
+            keypair (bittensor_wallet.Keypair): The keypair signing the message, with its private key.
+            message (str): The message to sign.
+
+        Returns:
+            bytes: The signature.
+        """
+        return await self._run(
+            "sign", self._executor(processes=False), keypair.sign, message
+        )
+
+    def shutdown(self):
+        """Shuts the workers down, without waiting for the pending jobs. Later jobs start new workers."""
+        with self._lock:
+            executors = [self._threads, self._processes]
+            self._threads = self._processes = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
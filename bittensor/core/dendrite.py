@@ -1,19 +1,30 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import time
 import uuid
 import warnings
-from typing import Any, AsyncGenerator, Optional, Union, Type
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, NamedTuple, Optional, Union, Type
 
 import aiohttp
 from bittensor_wallet import Keypair, Wallet
 
 from bittensor.core.axon import Axon
+from bittensor.core.binary_transport import (
+    BINARY_CONTENT_TYPE,
+    binary_body_hash,
+    decode_synapse,
+    encode_synapse,
+    tensor_fields,
+)
 from bittensor.core.chain_data import AxonInfo
 from bittensor.core.settings import version_as_int
 from bittensor.core.stream import StreamingSynapse
 from bittensor.core.synapse import Synapse, TerminalInfo
+from bittensor.core.tensor import elide_buffers
 from bittensor.utils import networking
 from bittensor.utils.btlogging import logging
 from bittensor.utils.registration import torch, use_torch
@@ -31,6 +42,144 @@ DENDRITE_ERROR_MAPPING: dict[Type[Exception], tuple] = {
 DENDRITE_DEFAULT_ERROR = ("422", "Failed to parse response")
 
 
+@dataclass(frozen=True)
+class ConnectorConfig:
+    """
+    Settings of the `aiohttp.TCPConnector <https://docs.aiohttp.org/en/stable/client_reference.html#tcpconnector>`_
+    backing the dendrite session. The defaults match aiohttp's own.
+
+    Args:
+        limit (int): Maximum number of simultaneous connections. ``0`` means no limit.
+        limit_per_host (int): Maximum number of simultaneous connections to the same endpoint. ``0`` means no limit.
+        ttl_dns_cache (Optional[int]): Seconds to cache resolved DNS entries. ``None`` caches them forever.
+        keepalive_timeout (float): Seconds to keep idle connections open for reuse.
+    """
+
+    limit: int = 100
+    limit_per_host: int = 0
+    ttl_dns_cache: Optional[int] = 10
+    keepalive_timeout: float = 15.0
+
+    def build(self) -> "aiohttp.TCPConnector":
+        """Creates a new connector from these settings. Must be called from a running event loop."""
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.ttl_dns_cache,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+
+
+class SynapseRecord(NamedTuple):
+    """A compact record of a single dendrite request, kept in :attr:`DendriteMixin.synapse_history`."""
+
+    name: Optional[str]
+    axon_hotkey: Optional[str]
+    status_code: Optional[int]
+    process_time: Optional[float]
+    total_size: Optional[int]
+    header_size: Optional[int]
+
+
+@dataclass
+class AxonStats:
+    """
+    Aggregate request statistics of a single axon hotkey, as seen by a dendrite.
+
+    Args:
+        requests (int): Number of requests sent to the axon.
+        successes (int): Number of requests answered with a ``200`` status code.
+        status_codes (dict[Optional[int], int]): Number of responses per status code.
+        total_process_time (float): Sum of the process times of the timed responses.
+        max_process_time (float): Largest process time of the timed responses.
+        timed_requests (int): Number of responses that reported a process time.
+    """
+
+    requests: int = 0
+    successes: int = 0
+    status_codes: dict[Optional[int], int] = field(default_factory=dict)
+    total_process_time: float = 0.0
+    max_process_time: float = 0.0
+    timed_requests: int = 0
+
+    @property
+    def success_rate(self) -> float:
+        """Fraction of requests answered successfully."""
+        return self.successes / self.requests if self.requests else 0.0
+
+    @property
+    def mean_process_time(self) -> Optional[float]:
+        """Mean process time of the timed responses, or ``None`` if none reported one."""
+        if not self.timed_requests:
+            return None
+        return self.total_process_time / self.timed_requests
+
+    def add(self, record: SynapseRecord):
+        """Accounts for the response described by ``record``."""
+        self.requests += 1
+        self.successes += record.status_code == 200
+        self.status_codes[record.status_code] = (
+            self.status_codes.get(record.status_code, 0) + 1
+        )
+        if record.process_time is not None:
+            self.timed_requests += 1
+            self.total_process_time += record.process_time
+            self.max_process_time = max(self.max_process_time, record.process_time)
+
+
+# Headers that differ for every target axon and are therefore never part of a shared broadcast payload.
+_TERMINAL_HEADER_PREFIXES = ("bt_header_axon_", "bt_header_dendrite_")
+
+
+@dataclass(frozen=True)
+class BroadcastPayload:
+    """
+    The parts of a request that are identical for every axon targeted by a single :func:`Dendrite.forward` call.
+
+    The synapse body (without the per-axon ``axon`` and ``dendrite`` terminal information), its body hash and the
+    non-terminal headers are computed once, so that fanning out to many axons only has to serialize and sign the
+    terminal information of each target.
+
+    Args:
+        body (str): JSON encoding of the synapse fields, excluding ``axon`` and ``dendrite``.
+        body_hash (str): The synapse body hash, shared by all requests.
+        headers (dict[str, str]): Headers shared by all requests, excluding the terminal headers.
+    """
+
+    body: str
+    body_hash: str
+    headers: dict[str, str]
+
+    def headers_for(self, synapse: "Synapse") -> dict[str, str]:
+        """Returns the shared headers merged with the terminal headers of the preprocessed ``synapse``."""
+        headers = dict(self.headers)
+        for prefix, terminal in (
+            ("bt_header_axon_", synapse.axon),
+            ("bt_header_dendrite_", synapse.dendrite),
+        ):
+            if terminal is not None:
+                headers.update(
+                    {
+                        f"{prefix}{k}": str(v)
+                        for k, v in terminal.model_dump().items()
+                        if v is not None
+                    }
+                )
+        return headers
+
+    def body_for(self, synapse: "Synapse") -> bytes:
+        """Returns the request body of the preprocessed ``synapse``, splicing its terminals into the shared body."""
+        terminals = json.dumps(
+            {
+                "axon": synapse.axon.model_dump() if synapse.axon else None,
+                "dendrite": synapse.dendrite.model_dump() if synapse.dendrite else None,
+            }
+        )
+        if self.body == "{}":
+            return terminals.encode()
+        return f"{self.body[:-1]}, {terminals[1:]}".encode()
+
+
 def event_loop_is_running():
     try:
         asyncio.get_running_loop()
@@ -55,7 +204,11 @@ class DendriteMixin:
         keypair (Option[Union[bittensor_wallet.Wallet, bittensor_wallet.Keypair]]): The wallet or keypair used for
             signing messages.
         external_ip (str): The external IP address of the local system.
-        synapse_history (list): A list of Synapse objects representing the historical responses.
+        history_size (int): Maximum number of requests kept in ``synapse_history``. ``0`` disables history and
+            per-axon statistics.
+        binary_transport (bool): Whether synapses carrying tensors are sent as binary bodies, see
+            :mod:`bittensor.core.binary_transport`.
+        synapse_history (collections.deque[SynapseRecord]): Compact records of the most recent requests.
 
     Methods:
         __str__(): Returns a string representation of the Dendrite object.
@@ -98,7 +251,13 @@ class DendriteMixin:
         d( bittensor.core.axon.Axon, bittensor.core.synapse.Synapse )
     """
 
-    def __init__(self, wallet: Optional[Union["Wallet", "Keypair"]] = None):
+    def __init__(
+        self,
+        wallet: Optional[Union["Wallet", "Keypair"]] = None,
+        connector_config: Optional[ConnectorConfig] = None,
+        history_size: int = 0,
+        binary_transport: bool = False,
+    ):
         """
         Initializes the Dendrite object, setting up essential properties.
 
@@ -106,6 +265,13 @@ class DendriteMixin:
             wallet (Optional[Union[bittensor_wallet.Wallet, bittensor_wallet.Keypair]]): The user's wallet or keypair
                 used for signing messages. Defaults to ``None``, in which case a new
                 :func:`bittensor_wallet.Wallet().hotkey` is generated and used.
+            connector_config (Optional[ConnectorConfig]): Connection pool settings of the internal client session.
+                Defaults to ``None``, in which case :class:`ConnectorConfig` defaults are used.
+            history_size (int): Maximum number of requests recorded in ``synapse_history``, the oldest being
+                discarded first. Defaults to ``0``, which records neither history nor per-axon statistics.
+            binary_transport (bool): Whether to send synapses carrying tensors as binary bodies, their tensor data as
+                raw frames instead of base64 encoded JSON strings. The target axons must run a version supporting it,
+                and forward functions taking the synapse as their only argument. Defaults to ``False``.
         """
         # Initialize the parent class
         super(DendriteMixin, self).__init__()
@@ -121,8 +287,14 @@ class DendriteMixin:
             wallet.hotkey if isinstance(wallet, Wallet) else wallet
         ) or Wallet().hotkey
 
-        self.synapse_history: list = []
+        if history_size < 0:
+            raise ValueError("history_size must be a non-negative integer.")
+        self.history_size = history_size
+        self.synapse_history: deque[SynapseRecord] = deque(maxlen=history_size)
+        self._axon_stats: dict[str, AxonStats] = {}
 
+        self.binary_transport = binary_transport
+        self.connector_config = connector_config or ConnectorConfig()
         self._session: Optional[aiohttp.ClientSession] = None
 
     @property
@@ -160,7 +332,9 @@ class DendriteMixin:
 
         """
         if self._session is None:
-            self._session = aiohttp.ClientSession()
+            self._session = aiohttp.ClientSession(
+                connector=self.connector_config.build()
+            )
         return self._session
 
     def close_session(self, using_new_loop: bool = False):
@@ -258,7 +432,10 @@ class DendriteMixin:
         """
         error_id = str(uuid.uuid4())
         error_type = exception.__class__.__name__
-        if isinstance(exception, (aiohttp.ClientOSError, asyncio.TimeoutError)):
+        if isinstance(
+            exception,
+            (aiohttp.ClientOSError, asyncio.TimeoutError),
+        ):
             logging.debug(f"{error_type}#{error_id}: {exception}")
         else:
             logging.error(f"{error_type}#{error_id}: {exception}")
@@ -347,6 +524,55 @@ class DendriteMixin:
                 f"dendrite | <-- | {synapse.get_total_size()} B | {synapse.name} | {synapse.axon.hotkey} | {synapse.axon.ip}:{str(synapse.axon.port)} | {synapse.dendrite.status_code} | {synapse.dendrite.status_message}"
             )
 
+    def _record_response(self, synapse: "Synapse", axon_hotkey: Optional[str]):
+        """
+        Records a compact summary of a completed request in ``synapse_history`` and the per-axon statistics.
+
+        Args:
+            synapse (bittensor.core.synapse.Synapse): The synapse of the completed request.
+            axon_hotkey (Optional[str]): The hotkey of the axon the request was sent to.
+        """
+        if not self.history_size:
+            return
+
+        dendrite = synapse.dendrite
+        record = SynapseRecord(
+            name=synapse.name,
+            axon_hotkey=axon_hotkey,
+            status_code=dendrite.status_code if dendrite else None,
+            process_time=dendrite.process_time if dendrite else None,
+            total_size=synapse.total_size,
+            header_size=synapse.header_size,
+        )
+        self.synapse_history.append(record)
+        if record.axon_hotkey is not None:
+            stats = self._axon_stats.get(record.axon_hotkey)
+            if stats is None:
+                stats = self._axon_stats[record.axon_hotkey] = AxonStats()
+            stats.add(record)
+
+    def get_axon_stats(self, hotkey: Optional[str] = None) -> Union[AxonStats, dict]:
+        """
+        Returns the aggregate request statistics recorded per axon hotkey. Statistics are only recorded when the
+        dendrite was created with a non-zero ``history_size``.
+
+        Args:
+            hotkey (Optional[str]): The axon hotkey to get the statistics of. Defaults to ``None``, returning the
+                statistics of all axons.
+
+        Returns:
+            Union[AxonStats, dict[str, AxonStats]]: The statistics of ``hotkey`` (empty if it was never queried), or
+                a mapping of every queried hotkey to its statistics.
+        """
+        if hotkey is None:
+            return dict(self._axon_stats)
+        return self._axon_stats.get(hotkey, AxonStats())
+
+    def clear_history(self):
+        """Discards the recorded ``synapse_history`` and per-axon statistics."""
+        self.synapse_history.clear()
+        self._axon_stats.clear()
+
     async def aquery(self, *args, **kwargs):
         result = await self.forward(*args, **kwargs)
         if self._session:
@@ -404,6 +630,8 @@ class DendriteMixin:
         deserialize: bool = True,
         run_async: bool = True,
         streaming: bool = False,
+        max_concurrency: Optional[int] = None,
+        quorum: Optional[int] = None,
     ) -> list[Union["AsyncGenerator[Any, Any]", "Synapse", "StreamingSynapse"]]:
         """
         Asynchronously sends requests to one or multiple Axons and collates their responses.
@@ -452,11 +680,16 @@ class DendriteMixin:
             run_async (bool): If ``True``, sends requests concurrently. Otherwise, sends requests sequentially.
                 Defaults to ``True``.
             streaming (bool): Indicates if the response is expected to be in streaming format. Defaults to ``False``.
+            max_concurrency (Optional[int]): Maximum number of requests in flight at once when ``run_async`` is
+                ``True``. Defaults to ``None``, which sends all requests at once. Not applicable to streaming.
+            quorum (Optional[int]): If set, stop waiting as soon as this many successful responses have arrived and
+                cancel the outstanding requests, whose responses carry a ``499`` status code. Defaults to ``None``,
+                which waits for every axon. Not applicable to streaming.
 
         Returns:
             Union[AsyncGenerator, bittensor.core.synapse.Synapse, list[bittensor.core.synapse.Synapse]]: If a single
                 `Axon` is targeted, returns its response.
-            If multiple Axons are targeted, returns a list of their responses.
+            If multiple Axons are targeted, returns a list of their responses, in the order of ``axons``.
         """
         is_list = True
         # If a single axon is provided, wrap it in a list for uniform processing
@@ -471,6 +704,21 @@ class DendriteMixin:
                 f"Argument streaming is {streaming} while issubclass(synapse, StreamingSynapse) is {synapse.__class__.__name__}. This may cause unexpected behavior."
             )
         streaming = is_streaming_subclass or streaming
+        if streaming and (max_concurrency is not None or quorum is not None):
+            raise ValueError(
+                "max_concurrency and quorum are not supported for streaming requests."
+            )
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+        if quorum is not None and quorum < 1:
+            raise ValueError("quorum must be a positive integer.")
+
+        # Serialize and hash the body shared by all targets once, instead of once per axon.
+        payload = (
+            None
+            if streaming or self._uses_binary_transport(synapse)
+            else self._prepare_broadcast_payload(synapse, timeout)
+        )
 
         async def query_all_axons(
             is_stream: bool,
@@ -523,22 +771,73 @@ class DendriteMixin:
                     )
                 else:
                     # If not in streaming mode, simply call the axon and get the response.
+                    # Success can only be judged before deserialization, which happens once the quorum is settled.
                     return await self.call(
                         target_axon=target_axon,
                         synapse=synapse.model_copy(),  # type: ignore
                         timeout=timeout,
-                        deserialize=deserialize,
+                        deserialize=deserialize and quorum is None,
+                        payload=payload,
                     )
 
             # If run_async flag is False, get responses one by one.
             if not run_async:
-                return [
-                    await single_axon_response(target_axon) for target_axon in axons
-                ]  # type: ignore
+                if quorum is None:
+                    return [
+                        await single_axon_response(target_axon) for target_axon in axons
+                    ]  # type: ignore
+                responses, successes = [], 0
+                for target_axon in axons:
+                    if successes >= quorum:
+                        response = self._cancelled_response(
+                            target_axon, synapse, timeout
+                        )
+                    else:
+                        response = await single_axon_response(target_axon)
+                        successes += response.is_success
+                    responses.append(response)
+                return self._deserialize_responses(responses, deserialize)
+
+            semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+            async def bounded_axon_response(
+                target_axon: Union["AxonInfo", "Axon"],
+            ) -> Union["AsyncGenerator[Any, Any]", "Synapse", "StreamingSynapse"]:
+                if semaphore is None:
+                    return await single_axon_response(target_axon)
+                async with semaphore:
+                    return await single_axon_response(target_axon)
+
             # If run_async flag is True, get responses concurrently using asyncio.gather().
-            return await asyncio.gather(
-                *(single_axon_response(target_axon) for target_axon in axons)
-            )  # type: ignore
+            if quorum is None:
+                return await asyncio.gather(
+                    *(bounded_axon_response(target_axon) for target_axon in axons)
+                )  # type: ignore
+
+            # Otherwise return as soon as the quorum of successful responses is reached.
+            tasks = [
+                asyncio.ensure_future(bounded_axon_response(target_axon))
+                for target_axon in axons
+            ]
+            successes = 0
+            try:
+                for next_response in asyncio.as_completed(tasks):
+                    successes += (await next_response).is_success
+                    if successes >= quorum:
+                        break
+            finally:
+                for task in tasks:
+                    task.cancel()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            responses = [
+                (
+                    self._cancelled_response(target_axon, synapse, timeout)
+                    if isinstance(result, BaseException)
+                    else result
+                )
+                for target_axon, result in zip(axons, results)
+            ]
+            return self._deserialize_responses(responses, deserialize)
 
         # Get responses for all axons.
         responses = await query_all_axons(streaming)
@@ -551,6 +850,7 @@ class DendriteMixin:
         synapse: "Synapse" = Synapse(),
         timeout: float = 12.0,
         deserialize: bool = True,
+        payload: Optional[BroadcastPayload] = None,
     ) -> "Synapse":
         """
         Asynchronously sends a request to a specified Axon and processes the response.
@@ -565,6 +865,8 @@ class DendriteMixin:
                 :func:`Synapse` instance.
             timeout (float): Maximum duration to wait for a response from the Axon in seconds. Defaults to ``12.0``.
             deserialize (bool): Determines if the received response should be deserialized. Defaults to ``True``.
+            payload (Optional[BroadcastPayload]): The precomputed body and headers shared by all axons of a broadcast,
+                as built by :func:`forward`. When ``None``, the request is serialized from ``synapse``.
 
         Returns:
             bittensor.core.synapse.Synapse: The Synapse object, updated with the response data from the Axon.
@@ -580,24 +882,62 @@ class DendriteMixin:
         request_name = synapse.__class__.__name__
         url = self._get_endpoint_url(target_axon, request_name=request_name)
 
+        binary = self._uses_binary_transport(synapse)
+        if binary:
+            body_hash = binary_body_hash(synapse)
+        else:
+            body_hash = payload.body_hash if payload else None
+
         # Preprocess synapse for making a request
-        synapse = self.preprocess_synapse_for_request(target_axon, synapse, timeout)
+        synapse = self.preprocess_synapse_for_request(
+            target_axon, synapse, timeout, body_hash=body_hash
+        )
 
         try:
             # Log outgoing request
             self._log_outgoing_request(synapse)
 
+            if binary:
+                with elide_buffers():
+                    headers = synapse.to_headers()
+                request_kwargs = {
+                    "headers": {
+                        **headers,
+                        "computed_body_hash": body_hash,
+                        "Content-Type": BINARY_CONTENT_TYPE,
+                    },
+                    "data": encode_synapse(synapse),
+                }
+            elif payload is None:
+                request_kwargs = {
+                    "headers": synapse.to_headers(),
+                    "json": synapse.model_dump(),
+                }
+            else:
+                request_kwargs = {
+                    "headers": {
+                        **payload.headers_for(synapse),
+                        "Content-Type": "application/json",
+                    },
+                    "data": payload.body_for(synapse),
+                }
+
             # Make the HTTP POST request
             async with (await self.session).post(
                 url=url,
-                headers=synapse.to_headers(),
-                json=synapse.model_dump(),
                 timeout=aiohttp.ClientTimeout(total=timeout),
+                **request_kwargs,
             ) as response:
-                # Extract the JSON response from the server
-                json_response = await response.json()
+                # Extract the JSON, or binary, response from the server
+                if response.content_type == BINARY_CONTENT_TYPE:
+                    server_response = decode_synapse(
+                        synapse.__class__, await response.read()
+                    )
+                else:
+                    server_response = await response.json()
                 # Process the server response and fill synapse
-                self.process_server_response(response, json_response, synapse)
+                with elide_buffers():
+                    self.process_server_response(response, server_response, synapse)
 
             # Set process time and log the response
             synapse.dendrite.process_time = str(time.time() - start_time)  # type: ignore
@@ -609,10 +949,10 @@ class DendriteMixin:
             self._log_incoming_response(synapse)
 
             # Log synapse event history
-            self.synapse_history.append(Synapse.from_headers(synapse.to_headers()))
+            self._record_response(synapse, target_axon.hotkey)
 
-            # Return the updated synapse object after deserializing if requested
-            return synapse.deserialize() if deserialize else synapse
+        # Returned outside of `finally`, so that the cancellation of the call propagates
+        return synapse.deserialize() if deserialize else synapse
 
     async def call_stream(
         self,
@@ -690,7 +1030,7 @@ class DendriteMixin:
             self._log_incoming_response(synapse)
 
             # Log synapse event history
-            self.synapse_history.append(Synapse.from_headers(synapse.to_headers()))
+            self._record_response(synapse, target_axon.hotkey)
 
             # Return the updated synapse object after deserializing if requested
             if deserialize:
@@ -698,11 +1038,117 @@ class DendriteMixin:
             else:
                 yield synapse
 
+    def _cancelled_response(
+        self,
+        target_axon: Union["AxonInfo", "Axon"],
+        synapse: "Synapse",
+        timeout: float,
+    ) -> "Synapse":
+        """
+        Builds the response of an axon whose request was cancelled, or never sent, because the quorum of a
+        :func:`forward` call was reached.
+
+        Args:
+            target_axon (Union[bittensor.core.chain_data.axon_info.AxonInfo, bittensor.core.axon.Axon]): The target
+                Axon of the cancelled request.
+            synapse (bittensor.core.synapse.Synapse): The synapse that was broadcast.
+            timeout (float): The request timeout duration in seconds.
+
+        Returns:
+            bittensor.core.synapse.Synapse: A copy of the synapse with the cancellation status set.
+        """
+        target_axon = (
+            target_axon.info() if isinstance(target_axon, Axon) else target_axon
+        )
+        response = synapse.model_copy()
+        response.timeout = timeout
+        response.axon = TerminalInfo(
+            ip=target_axon.ip, port=target_axon.port, hotkey=target_axon.hotkey
+        )
+        response.dendrite = TerminalInfo(
+            ip=self.external_ip,
+            version=version_as_int,
+            uuid=self.uuid,
+            hotkey=self.keypair.ss58_address,
+        )
+        response.dendrite.status_code = "499"  # type: ignore
+        response.dendrite.status_message = "Request cancelled"  # type: ignore
+        return response
+
+    @staticmethod
+    def _deserialize_responses(
+        responses: list["Synapse"], deserialize: bool
+    ) -> list[Any]:
+        """Deserializes the responses of a quorum :func:`forward` call if requested."""
+        if not deserialize:
+            return responses
+        return [response.deserialize() for response in responses]
+
+    def _uses_binary_transport(self, synapse: "Synapse") -> bool:
+        """
+        Whether ``synapse`` is sent through the binary transport, which requires it to carry tensors and, as for
+        broadcast payloads, neither to customize its serialization nor to hash its terminal information.
+        """
+        synapse_class = synapse.__class__
+        return (
+            self.binary_transport
+            and not isinstance(synapse, StreamingSynapse)
+            and synapse_class.to_headers is Synapse.to_headers
+            and synapse_class.model_dump is Synapse.model_dump
+            and not {"axon", "dendrite"}.intersection(
+                synapse_class.required_hash_fields
+            )
+            and bool(tensor_fields(synapse))
+        )
+
+    def _prepare_broadcast_payload(
+        self, synapse: "Synapse", timeout: float
+    ) -> Optional[BroadcastPayload]:
+        """
+        Serializes the parts of a request shared by every axon targeted by a single :func:`forward` call.
+
+        Synapse classes that customize their serialization by overriding :func:`Synapse.to_headers` or
+        :func:`Synapse.model_dump`, or that hash their terminal information, keep being serialized per axon.
+
+        Args:
+            synapse (bittensor.core.synapse.Synapse): The synapse to broadcast.
+            timeout (float): The request timeout duration in seconds.
+
+        Returns:
+            Optional[BroadcastPayload]: The shared payload, or ``None`` if the synapse cannot use the broadcast path.
+        """
+        synapse_class = synapse.__class__
+        if (
+            synapse_class.to_headers is not Synapse.to_headers
+            or synapse_class.model_dump is not Synapse.model_dump
+            or {"axon", "dendrite"}.intersection(synapse_class.required_hash_fields)
+        ):
+            return None
+
+        try:
+            template = synapse.model_copy()
+            template.timeout = timeout
+            headers = {
+                key: value
+                for key, value in template.to_headers().items()
+                if not key.startswith(_TERMINAL_HEADER_PREFIXES)
+            }
+            body = json.dumps(template.model_dump(exclude={"axon", "dendrite"}))
+        except Exception as e:
+            # Leave the error to be reported per axon by the regular request path.
+            logging.debug(f"Unable to prepare broadcast payload: {e}")
+            return None
+
+        return BroadcastPayload(
+            body=body, body_hash=headers["computed_body_hash"], headers=headers
+        )
+
     def preprocess_synapse_for_request(
         self,
         target_axon_info: "AxonInfo",
         synapse: "Synapse",
         timeout: float = 12.0,
+        body_hash: Optional[str] = None,
     ) -> "Synapse":
         """
         Preprocesses the synapse for making a request. This includes building headers for Dendrite and Axon and signing
@@ -712,6 +1158,8 @@ class DendriteMixin:
             target_axon_info (bittensor.core.chain_data.axon_info.AxonInfo): The target axon information.
             synapse (bittensor.core.synapse.Synapse): The synapse object to be preprocessed.
             timeout (float): The request timeout duration in seconds. Defaults to ``12.0`` seconds.
+            body_hash (Optional[str]): The precomputed body hash of ``synapse``. When ``None``, it is computed from
+                the synapse.
 
         Returns:
             bittensor.core.synapse.Synapse: The preprocessed synapse.
@@ -734,7 +1182,9 @@ class DendriteMixin:
         )
 
         # Sign the request using the dendrite, axon info, and the synapse body hash
-        message = f"{synapse.dendrite.nonce}.{synapse.dendrite.hotkey}.{synapse.axon.hotkey}.{synapse.dendrite.uuid}.{synapse.body_hash}"
+        if body_hash is None:
+            body_hash = synapse.body_hash
+        message = f"{synapse.dendrite.nonce}.{synapse.dendrite.hotkey}.{synapse.axon.hotkey}.{synapse.dendrite.uuid}.{body_hash}"
         synapse.dendrite.signature = f"0x{self.keypair.sign(message).hex()}"
 
         return synapse
@@ -742,7 +1192,7 @@ class DendriteMixin:
     def process_server_response(
         self,
         server_response: "aiohttp.ClientResponse",
-        json_response: dict,
+        json_response: Union[dict, "Synapse"],
         local_synapse: "Synapse",
     ):
         """
@@ -751,7 +1201,8 @@ class DendriteMixin:
 
         Args:
             server_response (object): The `aiohttp <https://github.com/aio-libs/aiohttp>`_ response object from the server.
-            json_response (dict): The parsed JSON response from the server.
+            json_response (Union[dict, bittensor.core.synapse.Synapse]): The parsed JSON response from the server, or
+                the synapse decoded from its binary response.
             local_synapse (bittensor.core.synapse.Synapse): The local synapse object to be updated.
 
         Raises:
@@ -762,7 +1213,11 @@ class DendriteMixin:
             # If the response is successful, overwrite local synapse state with
             # server's state only if the protocol allows mutation. To prevent overwrites,
             # the protocol must set Frozen = True
-            server_synapse = local_synapse.__class__(**json_response)
+            server_synapse = (
+                json_response
+                if isinstance(json_response, Synapse)
+                else local_synapse.__class__(**json_response)
+            )
             for key in local_synapse.model_dump().keys():
                 try:
                     # Set the attribute in the local synapse from the corresponding
@@ -776,7 +1231,11 @@ class DendriteMixin:
             if local_synapse.axon is None:
                 local_synapse.axon = TerminalInfo()
             local_synapse.axon.status_code = server_response.status
-            local_synapse.axon.status_message = json_response.get("message")
+            local_synapse.axon.status_message = (
+                json_response.axon.status_message
+                if isinstance(json_response, Synapse)
+                else json_response.get("message")
+            )
 
         # Extract server headers and overwrite None values in local synapse headers
         server_headers = Synapse.from_headers(server_response.headers)  # type: ignore
@@ -892,10 +1351,18 @@ BaseModel: Union["torch.nn.Module", object] = torch.nn.Module if use_torch() els
 
 
 class Dendrite(DendriteMixin, BaseModel):  # type: ignore
-    def __init__(self, wallet: Optional[Union["Wallet", "Keypair"]] = None):
+    def __init__(
+        self,
+        wallet: Optional[Union["Wallet", "Keypair"]] = None,
+        connector_config: Optional[ConnectorConfig] = None,
+        history_size: int = 0,
+        binary_transport: bool = False,
+    ):
         if use_torch():
             torch.nn.Module.__init__(self)
-        DendriteMixin.__init__(self, wallet)
+        DendriteMixin.__init__(
+            self, wallet, connector_config, history_size, binary_transport
+        )
 
 
 if not use_torch():
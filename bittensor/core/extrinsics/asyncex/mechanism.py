@@ -1,7 +1,13 @@
+import asyncio
 from typing import TYPE_CHECKING, Optional, Union
 
 from bittensor_drand import get_encrypted_commit
 
+from bittensor.core.extrinsics.asyncex.utils import (
+    get_weights_eligibility,
+    sign_and_send_batch_extrinsic,
+)
+from bittensor.core.extrinsics.mechanism import plan_mechanism_weights
 from bittensor.core.settings import version_as_int
 from bittensor.core.types import Salt, UIDs, Weights
 from bittensor.utils import unlock_key, get_mechid_storage_index
@@ -391,3 +397,108 @@ async def set_mechanism_weights_extrinsic(
         logging.error(str(error))
 
         return False, str(error)
+
+
+async def set_mechanism_weights_batch_extrinsic(
+    subtensor: "AsyncSubtensor",
+    wallet: "Wallet",
+    weights: dict[tuple[int, int], tuple[UIDs, Weights]],
+    version_key: int = version_as_int,
+    block_time: Union[int, float] = 12.0,
+    commit_reveal_version: int = 4,
+    period: Optional[int] = None,
+    raise_error: bool = False,
+    wait_for_inclusion: bool = True,
+    wait_for_finalization: bool = True,
+) -> dict[tuple[int, int], tuple[bool, str]]:
+    """
+    Sets the weights of several subnets and subnet mechanisms with a single ``Utility`` batch extrinsic.
+
+    The eligibility of every target is fetched with a single ``query_multi``. The weights of the targets the hotkey is
+    registered on, and whose weights rate limit has elapsed, are then committed, on subnets with commit-reveal enabled,
+    or set directly otherwise, in a single ``force_batch`` extrinsic signed by the hotkey, where each target succeeds or
+    fails on its own.
+
+    Parameters:
+        subtensor: AsyncSubtensor instance.
+        wallet: Bittensor Wallet instance.
+        weights: The ``(uids, weights)`` to set per ``(netuid, mechid)`` target.
+        version_key: Version key for compatibility with the network.
+        block_time: The number of seconds for block duration.
+        commit_reveal_version: The version of the commit-reveal in the chain.
+        period: The number of blocks during which the transaction will remain valid after it's submitted. If the
+            transaction is not included in a block within that number of blocks, it will expire and be rejected. You can
+            think of it as an expiration date for the transaction.
+        raise_error: Raises a relevant exception rather than returning `False` if unsuccessful.
+        wait_for_inclusion: Whether to wait for the inclusion of the transaction.
+        wait_for_finalization: Whether to wait for the finalization of the transaction.
+
+    Returns:
+        dict[tuple[int, int], tuple[bool, str]]: Per target, `True` if its weights were set, or committed, `False`
+            otherwise, and a message describing the success or the error. Committed weights have a
+            ``reveal_round:<round>`` message.
+    """
+    try:
+        signing_keypair = "hotkey"
+        unlock = unlock_key(
+            wallet=wallet, raise_error=raise_error, unlock_type=signing_keypair
+        )
+        if not unlock.success:
+            logging.error(unlock.message)
+            return {target: (False, unlock.message) for target in weights}
+
+        current_block, eligibility = await get_weights_eligibility(
+            subtensor=subtensor,
+            hotkey_ss58=wallet.hotkey.ss58_address,
+            targets=list(weights),
+        )
+        planned, results = plan_mechanism_weights(
+            wallet=wallet,
+            weights=weights,
+            current_block=current_block,
+            eligibility=eligibility,
+            version_key=version_key,
+            block_time=block_time,
+            commit_reveal_version=commit_reveal_version,
+        )
+        if not planned:
+            return results
+
+        calls = await asyncio.gather(
+            *[
+                subtensor.substrate.compose_call(
+                    call_module="SubtensorModule",
+                    call_function=call_function,
+                    call_params=call_params,
+                )
+                for _, call_function, call_params, _ in planned
+            ]
+        )
+        _, message, call_results = await sign_and_send_batch_extrinsic(
+            subtensor=subtensor,
+            wallet=wallet,
+            calls=list(calls),
+            atomic=False,
+            wait_for_inclusion=wait_for_inclusion,
+            wait_for_finalization=wait_for_finalization,
+            sign_with=signing_keypair,
+            nonce_key=signing_keypair,
+            period=period,
+        )
+    except Exception as error:
+        if raise_error:
+            raise error
+        logging.error(str(error))
+        return {target: (False, str(error)) for target in weights}
+
+    if not call_results:
+        # Not waited for
+        call_results = [(True, message)] * len(planned)
+    for (target, _, _, success_message), (success, error) in zip(planned, call_results):
+        if success:
+            logging.debug(f"Set weights of subnet {target[0]} mechanism {target[1]}.")
+            results[target] = (True, success_message or error)
+        else:
+            logging.error(error)
+            results[target] = (False, error)
+    return {target: results[target] for target in weights}
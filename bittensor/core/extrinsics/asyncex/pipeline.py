@@ -0,0 +1,143 @@
+"""Pipelined submission of extrinsics, with the account nonces handed out locally."""
+
+import asyncio
+from typing import TYPE_CHECKING, Optional
+
+from async_substrate_interface.errors import SubstrateRequestException
+
+from bittensor.core.extrinsics.pipeline import ExtrinsicOutcome, NonceTracker
+from bittensor.core.settings import DEFAULT_PERIOD
+from bittensor.utils import format_error_message
+from bittensor.utils.btlogging import logging
+
+if TYPE_CHECKING:
+    from bittensor_wallet import Wallet
+    from scalecodec import GenericCall
+    from bittensor.core.async_subtensor import AsyncSubtensor
+
+
+class AsyncExtrinsicPipeline:
+    """
+    Submits extrinsics back-to-back, without waiting for each of them, then waits for all of them at once.
+
+    Each extrinsic is signed with a nonce from a :class:`NonceTracker` and submitted in its own task, which watches it
+    until it is included, or finalized. If the node rejects an extrinsic, the nonce is fetched again for the next
+    submissions from the account.
+
+    Args:
+        subtensor: The AsyncSubtensor instance to submit through.
+        wait_for_inclusion: Whether to wait for the inclusion of the extrinsics.
+        wait_for_finalization: Whether to wait for the finalization of the extrinsics.
+        nonces: The nonce tracker to use. Defaults to a new tracker.
+
+    Example::
+
+        pipeline = AsyncExtrinsicPipeline(subtensor)
+        for call in calls:
+            await pipeline.submit(call, wallet, sign_with="hotkey")
+        outcomes = await pipeline.wait()
+    """
+
+    def __init__(
+        self,
+        subtensor: "AsyncSubtensor",
+        wait_for_inclusion: bool = True,
+        wait_for_finalization: bool = False,
+        nonces: Optional[NonceTracker] = None,
+    ):
+        self.subtensor = subtensor
+        self.wait_for_inclusion = wait_for_inclusion
+        self.wait_for_finalization = wait_for_finalization
+        self.nonces = NonceTracker() if nonces is None else nonces
+        self._tasks: list[asyncio.Task] = []
+
+    async def _next_nonce(self, address: str) -> int:
+        if address not in self.nonces:
+            # Bypasses the substrate nonce cache, which is never refreshed.
+            response = await self.subtensor.substrate.rpc_request(
+                "account_nextIndex", [address]
+            )
+            # Another submission may have fetched it in the meantime.
+            if address not in self.nonces:
+                self.nonces.set(address, response["result"])
+        return self.nonces.take(address)
+
+    async def _send(self, extrinsic, address: str, nonce: int) -> ExtrinsicOutcome:
+        try:
+            receipt = await self.subtensor.substrate.submit_extrinsic(
+                extrinsic,
+                wait_for_inclusion=self.wait_for_inclusion,
+                wait_for_finalization=self.wait_for_finalization,
+            )
+        except SubstrateRequestException as error:
+            # The local nonce is stale, e.g. another client submitted from the same account, or the extrinsic was
+            # dropped and the next nonces may never be used.
+            self.nonces.reset(address)
+            message = format_error_message(error)
+            logging.debug(f"Extrinsic with nonce {nonce} failed: {message}")
+            return ExtrinsicOutcome(False, message, nonce)
+
+        if not self.wait_for_inclusion and not self.wait_for_finalization:
+            return ExtrinsicOutcome(
+                True,
+                "Not waiting for finalization or inclusion.",
+                nonce,
+                receipt.extrinsic_hash,
+            )
+        if await receipt.is_success:
+            return ExtrinsicOutcome(
+                True, "", nonce, receipt.extrinsic_hash, receipt.block_hash
+            )
+        return ExtrinsicOutcome(
+            False,
+            format_error_message(await receipt.error_message),
+            nonce,
+            receipt.extrinsic_hash,
+            receipt.block_hash,
+        )
+
+    async def submit(
+        self,
+        call: "GenericCall",
+        wallet: "Wallet",
+        sign_with: str = "coldkey",
+        nonce_key: Optional[str] = None,
+        period: Optional[int] = DEFAULT_PERIOD,
+    ) -> int:
+        """
+        Signs and submits an extrinsic without waiting for it.
+
+        Args:
+            call: The call of the extrinsic.
+            wallet: The wallet signing the extrinsic.
+            sign_with: The wallet's keypair to sign the extrinsic with. Options are "coldkey", "hotkey" or "coldkeypub".
+            nonce_key: The wallet's keypair whose account nonce is used. Defaults to ``sign_with``.
+            period: The number of blocks during which the transaction will remain valid after it's submitted.
+
+        Returns:
+            int: The index of the extrinsic outcome in the list returned by :func:`wait`.
+        """
+        address = getattr(wallet, nonce_key or sign_with).ss58_address
+        nonce = await self._next_nonce(address)
+        extrinsic_data = {
+            "call": call,
+            "keypair": getattr(wallet, sign_with),
+            "nonce": nonce,
+        }
+        if period is not None:
+            extrinsic_data["era"] = {"period": period}
+        extrinsic = await self.subtensor.substrate.create_signed_extrinsic(
+            **extrinsic_data
+        )
+        self._tasks.append(asyncio.create_task(self._send(extrinsic, address, nonce)))
+        return len(self._tasks) - 1
+
+    async def wait(self) -> list[ExtrinsicOutcome]:
+        """
+        Waits for all the extrinsics submitted since the last call.
+
+        Returns:
+            list[ExtrinsicOutcome]: The outcome of each extrinsic, in the order of submission.
+        """
+        tasks, self._tasks = self._tasks, []
+        return list(await asyncio.gather(*tasks))
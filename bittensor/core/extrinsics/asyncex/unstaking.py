@@ -3,7 +3,11 @@ from typing import Optional, TYPE_CHECKING
 
 from async_substrate_interface.errors import SubstrateRequestException
 
-from bittensor.core.extrinsics.asyncex.utils import get_extrinsic_fee
+from bittensor.core.extrinsics.asyncex.utils import (
+    get_balance_and_stakes,
+    get_extrinsic_fee,
+    sign_and_send_batch_extrinsic,
+)
 from bittensor.core.extrinsics.utils import get_old_stakes
 from bittensor.core.types import UIDs
 from bittensor.utils import unlock_key, format_error_message
@@ -283,6 +287,8 @@ async def unstake_multiple_extrinsic(
     wait_for_finalization: bool = False,
     period: Optional[int] = None,
     unstake_all: bool = False,
+    batch: bool = False,
+    atomic: bool = True,
 ) -> bool:
     """Removes stake from each ``hotkey_ss58`` in the list, using each amount, to a common coldkey.
 
@@ -300,6 +306,11 @@ async def unstake_multiple_extrinsic(
             transaction is not included in a block within that number of blocks, it will expire and be rejected. You can
             think of it as an expiration date for the transaction.
         unstake_all: If true, unstakes all tokens. Default is ``False``.
+        batch: If set, submits all the unstakes as a single ``Utility`` batch extrinsic, signed once and waited for
+            once, instead of one extrinsic per hotkey.
+        atomic: Only used with ``batch``. If set, the batch is dispatched with ``batch_all`` and no stake is removed if
+            any of them fails. Otherwise, it is dispatched with ``force_batch`` and each unstake succeeds or fails on
+            its own.
 
     Returns:
         tuple[bool, str]:
@@ -362,6 +373,18 @@ async def unstake_multiple_extrinsic(
         wallet=wallet, hotkey_ss58s=hotkey_ss58s, netuids=netuids, all_stakes=all_stakes
     )
 
+    if batch:
+        return await _unstake_multiple_batch(
+            subtensor=subtensor,
+            wallet=wallet,
+            unstakes=list(zip(hotkey_ss58s, netuids, amounts, old_stakes)),
+            old_balance=old_balance,
+            atomic=atomic,
+            wait_for_inclusion=wait_for_inclusion,
+            wait_for_finalization=wait_for_finalization,
+            period=period,
+        )
+
     successful_unstakes = 0
     for idx, (hotkey_ss58, amount, old_stake, netuid) in enumerate(
         zip(hotkey_ss58s, amounts, old_stakes, netuids)
@@ -464,3 +487,94 @@ async def unstake_multiple_extrinsic(
         return True
 
     return False
+
+
+async def _unstake_multiple_batch(
+    subtensor: "AsyncSubtensor",
+    wallet: "Wallet",
+    unstakes: list[tuple[str, int, Optional[Balance], Balance]],
+    old_balance: Balance,
+    atomic: bool,
+    wait_for_inclusion: bool,
+    wait_for_finalization: bool,
+    period: Optional[int],
+) -> bool:
+    """Removes the ``(hotkey_ss58, netuid, amount, old_stake)`` stakes with a single batch extrinsic. See
+    :func:`unstake_multiple_extrinsic`."""
+    planned = []
+    for hotkey_ss58, netuid, amount, old_stake in unstakes:
+        unstaking_balance = old_stake if amount is None else amount.set_unit(netuid)
+        if unstaking_balance > old_stake:
+            logging.error(
+                f":cross_mark: [red]Not enough stake[/red]: [green]{old_stake}[/green] to unstake: "
+                f"[blue]{unstaking_balance}[/blue] from hotkey: [blue]{hotkey_ss58}[/blue]."
+            )
+            continue
+        logging.info(
+            f"Unstaking [blue]{unstaking_balance}[/blue] from hotkey: [magenta]{hotkey_ss58}[/magenta] on netuid: "
+            f"[blue]{netuid}[/blue]"
+        )
+        planned.append((hotkey_ss58, netuid, unstaking_balance, old_stake))
+
+    if not planned:
+        return False
+
+    try:
+        calls = await asyncio.gather(
+            *[
+                subtensor.substrate.compose_call(
+                    call_module="SubtensorModule",
+                    call_function="remove_stake",
+                    call_params={
+                        "hotkey": hotkey_ss58,
+                        "amount_unstaked": unstaking_balance.rao,
+                        "netuid": netuid,
+                    },
+                )
+                for hotkey_ss58, netuid, unstaking_balance, _ in planned
+            ]
+        )
+        success, message, results = await sign_and_send_batch_extrinsic(
+            subtensor=subtensor,
+            wallet=wallet,
+            calls=calls,
+            atomic=atomic,
+            wait_for_inclusion=wait_for_inclusion,
+            wait_for_finalization=wait_for_finalization,
+            period=period,
+        )
+    except SubstrateRequestException as error:
+        logging.error(
+            f":cross_mark: [red]Multiple unstake filed with error: {format_error_message(error)}[/red]"
+        )
+        return False
+
+    if not wait_for_finalization and not wait_for_inclusion:
+        return success
+
+    if not any(call_success for call_success, _ in results):
+        logging.error(f":cross_mark: [red]Failed: {message}.[/red]")
+        return False
+
+    logging.info(":white_heavy_check_mark: [green]Finalized[/green]")
+    new_balance, new_stakes = await get_balance_and_stakes(
+        subtensor=subtensor,
+        coldkey_ss58=wallet.coldkeypub.ss58_address,
+        hotkey_ss58s=[hotkey_ss58 for hotkey_ss58, *_ in planned],
+        netuids=[netuid for _, netuid, *_ in planned],
+    )
+    for (hotkey_ss58, netuid, _, old_stake), new_stake, (call_success, error) in zip(
+        planned, new_stakes, results
+    ):
+        if call_success:
+            logging.info(
+                f"Stake ({hotkey_ss58}) on netuid {netuid}: [blue]{old_stake}[/blue] :arrow_right: [green]{new_stake}[/green]"
+            )
+        else:
+            logging.error(
+                f":cross_mark: [red]Failed to unstake from {hotkey_ss58} on netuid {netuid}[/red]: {error}"
+            )
+    logging.info(
+        f"Balance: [blue]{old_balance}[/blue] :arrow_right: [green]{new_balance}[/green]"
+    )
+    return True
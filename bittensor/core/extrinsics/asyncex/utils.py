@@ -1,6 +1,15 @@
-from typing import TYPE_CHECKING, Optional
+import asyncio
+from typing import TYPE_CHECKING, Any, Optional
 
-from bittensor.utils import unlock_key
+from async_substrate_interface.errors import SubstrateRequestException
+
+from bittensor.core.extrinsics.utils import (
+    get_batch_call_results,
+    parse_weights_eligibility,
+    stake_from_alpha_shares,
+    weights_eligibility_queries,
+)
+from bittensor.utils import format_error_message, unlock_key
 from bittensor.utils.balance import Balance
 from bittensor.utils.btlogging import logging
 
@@ -107,3 +116,169 @@ async def sudo_call_extrinsic(
             raise error
 
         return False, str(error)
+
+
+async def sign_and_send_batch_extrinsic(
+    subtensor: "AsyncSubtensor",
+    wallet: "Wallet",
+    calls: list["GenericCall"],
+    atomic: bool = True,
+    wait_for_inclusion: bool = True,
+    wait_for_finalization: bool = False,
+    sign_with: str = "coldkey",
+    nonce_key: str = "coldkeypub",
+    period: Optional[int] = None,
+) -> tuple[bool, str, list[tuple[bool, str]]]:
+    """
+    Submits several calls as a single ``Utility`` batch extrinsic, signed once and waited for once.
+
+    Args:
+        subtensor: AsyncSubtensor instance.
+        wallet: The wallet signing the extrinsic.
+        calls: The calls to batch.
+        atomic: If ``True``, the calls are dispatched with ``batch_all`` and are all reverted if any of them fails.
+            Otherwise, they are dispatched with ``force_batch`` and each call succeeds or fails on its own.
+        wait_for_inclusion: Whether to wait for the inclusion of the extrinsic.
+        wait_for_finalization: Whether to wait for the finalization of the extrinsic.
+        sign_with: The wallet's keypair to sign the extrinsic with.
+        nonce_key: The wallet's keypair whose account nonce is used.
+        period: The number of blocks during which the transaction will remain valid after it's submitted. If the
+            transaction is not included in a block within that number of blocks, it will expire and be rejected.
+
+    Returns:
+        tuple[bool, str, list[tuple[bool, str]]]:
+            `True` if every call succeeded, `False` otherwise, an error message, and the ``(success, error message)``
+            result of each call. The results are empty if neither inclusion nor finalization was waited for.
+    """
+    batch_call, nonce = await asyncio.gather(
+        subtensor.substrate.compose_call(
+            call_module="Utility",
+            call_function="batch_all" if atomic else "force_batch",
+            call_params={"calls": calls},
+        ),
+        subtensor.substrate.get_account_next_index(
+            getattr(wallet, nonce_key).ss58_address
+        ),
+    )
+    extrinsic_data = {
+        "call": batch_call,
+        "keypair": getattr(wallet, sign_with),
+        "nonce": nonce,
+    }
+    if period is not None:
+        extrinsic_data["era"] = {"period": period}
+    extrinsic = await subtensor.substrate.create_signed_extrinsic(**extrinsic_data)
+
+    try:
+        response = await subtensor.substrate.submit_extrinsic(
+            extrinsic,
+            wait_for_inclusion=wait_for_inclusion,
+            wait_for_finalization=wait_for_finalization,
+        )
+    except SubstrateRequestException as error:
+        message = format_error_message(error)
+        return False, message, [(False, message)] * len(calls)
+
+    if not wait_for_finalization and not wait_for_inclusion:
+        return True, "Not waiting for finalization or inclusion.", []
+
+    if not await response.is_success:
+        message = format_error_message(await response.error_message)
+        return False, message, [(False, message)] * len(calls)
+
+    if atomic:
+        return True, "", [(True, "")] * len(calls)
+
+    events, runtime = await asyncio.gather(
+        response.triggered_events,
+        subtensor.substrate.init_runtime(block_hash=response.block_hash),
+    )
+    results = get_batch_call_results(events, runtime.metadata)
+    failures = [message for success, message in results if not success]
+    return not failures, "; ".join(failures), results
+
+
+async def get_balance_and_stakes(
+    subtensor: "AsyncSubtensor",
+    coldkey_ss58: str,
+    hotkey_ss58s: list[str],
+    netuids: list[int],
+) -> tuple[Balance, list[Balance]]:
+    """
+    Fetches the free balance of a coldkey and its stakes to each hotkey on the matching subnet, at the chain head, with
+    a single ``query_multi``.
+
+    Args:
+        subtensor: AsyncSubtensor instance.
+        coldkey_ss58: The SS58 address of the coldkey.
+        hotkey_ss58s: The SS58 addresses of the hotkeys.
+        netuids: The subnets of the stakes, one per hotkey.
+
+    Returns:
+        tuple[Balance, list[Balance]]: The coldkey free balance and the stakes, in the order of ``hotkey_ss58s``.
+    """
+    block_hash = await subtensor.substrate.get_chain_head()
+    storage_queries = [("System", "Account", [coldkey_ss58])]
+    for hotkey_ss58, netuid in zip(hotkey_ss58s, netuids):
+        storage_queries += [
+            ("SubtensorModule", "Alpha", [hotkey_ss58, coldkey_ss58, netuid]),
+            ("SubtensorModule", "TotalHotkeyAlpha", [hotkey_ss58, netuid]),
+            ("SubtensorModule", "TotalHotkeyShares", [hotkey_ss58, netuid]),
+        ]
+    storage_keys = await asyncio.gather(
+        *[
+            subtensor.substrate.create_storage_key(
+                pallet, storage_function, params, block_hash=block_hash
+            )
+            for pallet, storage_function, params in storage_queries
+        ]
+    )
+    values = [
+        value
+        for _, value in await subtensor.substrate.query_multi(
+            storage_keys, block_hash=block_hash
+        )
+    ]
+    account = values[0] or {"data": {"free": 0}}
+    stakes = [
+        stake_from_alpha_shares(*values[i : i + 3], netuid=netuid)
+        for i, netuid in zip(range(1, len(values), 3), netuids)
+    ]
+    return Balance(account["data"]["free"]), stakes
+
+
+async def get_weights_eligibility(
+    subtensor: "AsyncSubtensor", hotkey_ss58: str, targets: list[tuple[int, int]]
+) -> tuple[int, dict[tuple[int, int], dict[str, Any]]]:
+    """
+    Fetches whether, and how, a hotkey can set weights on each ``(netuid, mechid)`` target, at the chain head, with a
+    single ``query_multi``.
+
+    Args:
+        subtensor: AsyncSubtensor instance.
+        hotkey_ss58: The SS58 address of the hotkey setting the weights.
+        targets: The ``(netuid, mechid)`` targets.
+
+    Returns:
+        tuple[int, dict[tuple[int, int], dict[str, Any]]]: The current block, and per target the ``uid`` of the hotkey,
+            or ``None`` if it is not registered, whether ``commit_reveal`` is enabled, the weights ``rate_limit``, the
+            subnet ``tempo`` and ``reveal_period``, and the ``blocks_since_last_update`` of the uid.
+    """
+    block_hash = await subtensor.substrate.get_chain_head()
+    storage_keys = await asyncio.gather(
+        *[
+            subtensor.substrate.create_storage_key(
+                pallet, storage_function, params, block_hash=block_hash
+            )
+            for pallet, storage_function, params in weights_eligibility_queries(
+                hotkey_ss58, targets
+            )
+        ]
+    )
+    values = [
+        value
+        for _, value in await subtensor.substrate.query_multi(
+            storage_keys, block_hash=block_hash
+        )
+    ]
+    return parse_weights_eligibility(values, targets)
@@ -0,0 +1,273 @@
+"""Pipelined submission of extrinsics, with the account nonces handed out locally."""
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from async_substrate_interface.errors import SubstrateRequestException
+from async_substrate_interface.sync_substrate import ExtrinsicReceipt
+
+from bittensor.core.settings import DEFAULT_PERIOD
+from bittensor.utils import format_error_message
+from bittensor.utils.btlogging import logging
+
+if TYPE_CHECKING:
+    from bittensor_wallet import Wallet
+    from scalecodec import GenericCall
+    from bittensor.core.subtensor import Subtensor
+
+
+@dataclass
+class ExtrinsicOutcome:
+    """
+    Outcome of an extrinsic submitted through an extrinsic pipeline.
+
+    Attributes:
+        success: `True` if the extrinsic was included, or finalized, and its call succeeded.
+        message: The error message if it did not, empty otherwise.
+        nonce: The nonce the extrinsic was signed with.
+        extrinsic_hash: The hash of the extrinsic, if it was accepted by the node.
+        block_hash: The hash of the block the extrinsic was included in, if it was waited for.
+    """
+
+    success: bool
+    message: str = ""
+    nonce: Optional[int] = None
+    extrinsic_hash: Optional[str] = None
+    block_hash: Optional[str] = None
+
+
+class NonceTracker:
+    """
+    Hands out the account nonces of the extrinsics submitted from each account, without asking the node each time.
+
+    The next nonce of an account is fetched from the node once, then incremented locally for each extrinsic. It is
+    fetched again after :func:`reset`, which the pipelines call once a nonce may have gone stale: when the node rejects
+    an extrinsic, or when an extrinsic is dropped.
+
+    The tracker is not thread-safe. It can be shared by the pipelines submitting from the same accounts.
+    """
+
+    def __init__(self):
+        self._next_nonces: dict[str, int] = {}
+
+    def __contains__(self, address: str) -> bool:
+        return address in self._next_nonces
+
+    def set(self, address: str, next_nonce: int):
+        """Sets the next nonce of ``address``, as fetched from the node."""
+        self._next_nonces[address] = next_nonce
+
+    def take(self, address: str) -> int:
+        """Returns the next nonce of ``address`` and increments it. The nonce must have been :func:`set`."""
+        nonce = self._next_nonces[address]
+        self._next_nonces[address] = nonce + 1
+        return nonce
+
+    def reset(self, address: str):
+        """Forgets the next nonce of ``address``, to fetch it from the node again."""
+        self._next_nonces.pop(address, None)
+
+
+@dataclass
+class _Submission:
+    address: str
+    nonce: int
+    block: int
+    extrinsic_hash: Optional[str] = None
+    last_valid_block: int = 0
+    outcome: Optional[ExtrinsicOutcome] = None
+
+
+def _era_length(period: Optional[int]) -> int:
+    """Number of blocks an extrinsic signed with ``period`` is valid for, as rounded up by mortal eras. Immortal
+    extrinsics are waited for ``DEFAULT_PERIOD`` blocks."""
+    period = period or DEFAULT_PERIOD
+    return max(4, 1 << (period - 1).bit_length())
+
+
+class ExtrinsicPipeline:
+    """
+    Submits extrinsics back-to-back, without waiting for each of them, then waits for all of them at once.
+
+    Each extrinsic is signed with a nonce from a :class:`NonceTracker`. If the node rejects it, the nonce is fetched
+    again and the extrinsic is signed and submitted once more. :func:`wait` then scans the new blocks for all the
+    submitted extrinsics, until each of them is included, or finalized, or its era expires.
+
+    Args:
+        subtensor: The Subtensor instance to submit through.
+        wait_for_inclusion: Whether to wait for the inclusion of the extrinsics.
+        wait_for_finalization: Whether to wait for the finalization of the extrinsics.
+        nonces: The nonce tracker to use. Defaults to a new tracker.
+        poll_interval: The number of seconds between two checks for new blocks while waiting.
+
+    Example::
+
+        pipeline = ExtrinsicPipeline(subtensor)
+        for call in calls:
+            pipeline.submit(call, wallet, sign_with="hotkey")
+        outcomes = pipeline.wait()
+    """
+
+    def __init__(
+        self,
+        subtensor: "Subtensor",
+        wait_for_inclusion: bool = True,
+        wait_for_finalization: bool = False,
+        nonces: Optional[NonceTracker] = None,
+        poll_interval: float = 1.0,
+    ):
+        self.subtensor = subtensor
+        self.wait_for_inclusion = wait_for_inclusion
+        self.wait_for_finalization = wait_for_finalization
+        self.nonces = NonceTracker() if nonces is None else nonces
+        self.poll_interval = poll_interval
+        self._submissions: list[_Submission] = []
+
+    def _next_nonce(self, address: str) -> int:
+        if address not in self.nonces:
+            response = self.subtensor.substrate.rpc_request(
+                "account_nextIndex", [address]
+            )
+            self.nonces.set(address, response["result"])
+        return self.nonces.take(address)
+
+    def submit(
+        self,
+        call: "GenericCall",
+        wallet: "Wallet",
+        sign_with: str = "coldkey",
+        nonce_key: Optional[str] = None,
+        period: Optional[int] = DEFAULT_PERIOD,
+    ) -> int:
+        """
+        Signs and submits an extrinsic without waiting for it.
+
+        Args:
+            call: The call of the extrinsic.
+            wallet: The wallet signing the extrinsic.
+            sign_with: The wallet's keypair to sign the extrinsic with. Options are "coldkey", "hotkey" or "coldkeypub".
+            nonce_key: The wallet's keypair whose account nonce is used. Defaults to ``sign_with``.
+            period: The number of blocks during which the transaction will remain valid after it's submitted.
+
+        Returns:
+            int: The index of the extrinsic outcome in the list returned by :func:`wait`.
+        """
+        substrate = self.subtensor.substrate
+        keypair = getattr(wallet, sign_with)
+        address = getattr(wallet, nonce_key or sign_with).ss58_address
+        # Mortal eras start at the current block
+        block = substrate.get_block_number(None)
+
+        for _ in range(2):
+            submission = _Submission(address, self._next_nonce(address), block)
+            extrinsic_data = {
+                "call": call,
+                "keypair": keypair,
+                "nonce": submission.nonce,
+            }
+            if period is not None:
+                extrinsic_data["era"] = {"period": period}
+            extrinsic = substrate.create_signed_extrinsic(**extrinsic_data)
+            try:
+                receipt = substrate.submit_extrinsic(extrinsic)
+            except SubstrateRequestException as error:
+                # The local nonce is stale, e.g. another client submitted from the same account.
+                self.nonces.reset(address)
+                message = format_error_message(error)
+                logging.debug(
+                    f"Extrinsic with nonce {submission.nonce} rejected: {message}"
+                )
+                submission.outcome = ExtrinsicOutcome(False, message, submission.nonce)
+                continue
+
+            submission.extrinsic_hash = receipt.extrinsic_hash
+            submission.last_valid_block = block + _era_length(period)
+            if not self.wait_for_inclusion and not self.wait_for_finalization:
+                submission.outcome = ExtrinsicOutcome(
+                    True,
+                    "Not waiting for finalization or inclusion.",
+                    submission.nonce,
+                    submission.extrinsic_hash,
+                )
+            break
+
+        self._submissions.append(submission)
+        return len(self._submissions) - 1
+
+    def _outcome(
+        self, submission: _Submission, block_hash: str, block_number: int
+    ) -> ExtrinsicOutcome:
+        receipt = ExtrinsicReceipt(
+            substrate=self.subtensor.substrate,
+            extrinsic_hash=submission.extrinsic_hash,
+            block_hash=block_hash,
+            block_number=block_number,
+            finalized=self.wait_for_finalization,
+        )
+        if receipt.is_success:
+            message = ""
+        else:
+            message = format_error_message(receipt.error_message)
+        return ExtrinsicOutcome(
+            receipt.is_success,
+            message,
+            submission.nonce,
+            submission.extrinsic_hash,
+            block_hash,
+        )
+
+    def wait(self) -> list[ExtrinsicOutcome]:
+        """
+        Waits for all the extrinsics submitted since the last call.
+
+        Returns:
+            list[ExtrinsicOutcome]: The outcome of each extrinsic, in the order of submission.
+        """
+        submissions, self._submissions = self._submissions, []
+        waiting = {
+            submission.extrinsic_hash: submission
+            for submission in submissions
+            if submission.outcome is None
+        }
+
+        substrate = self.subtensor.substrate
+        next_block = min(
+            (submission.block for submission in waiting.values()), default=0
+        )
+        while waiting:
+            if self.wait_for_finalization:
+                head_hash = substrate.get_chain_finalised_head()
+            else:
+                head_hash = substrate.get_chain_head()
+            head_number = substrate.get_block_number(head_hash)
+
+            for block_number in range(next_block, head_number + 1):
+                block_hash = substrate.get_block_hash(block_number)
+                block = substrate.get_block(block_hash=block_hash)
+                for extrinsic in block["extrinsics"]:
+                    if not extrinsic.extrinsic_hash:
+                        continue
+                    extrinsic_hash = f"0x{extrinsic.extrinsic_hash.hex()}"
+                    if submission := waiting.pop(extrinsic_hash, None):
+                        submission.outcome = self._outcome(
+                            submission, block_hash, block_number
+                        )
+            next_block = max(next_block, head_number + 1)
+
+            for extrinsic_hash, submission in list(waiting.items()):
+                if next_block > submission.last_valid_block:
+                    # Dropped, its nonce and the next ones may never be used.
+                    del waiting[extrinsic_hash]
+                    self.nonces.reset(submission.address)
+                    submission.outcome = ExtrinsicOutcome(
+                        False,
+                        "Extrinsic was not included before its era expired.",
+                        submission.nonce,
+                        extrinsic_hash,
+                    )
+
+            if waiting:
+                time.sleep(self.poll_interval)
+
+        return [submission.outcome for submission in submissions]
@@ -2,7 +2,11 @@ from typing import Optional, TYPE_CHECKING, Sequence
 
 from async_substrate_interface.errors import SubstrateRequestException
 
-from bittensor.core.extrinsics.utils import get_old_stakes
+from bittensor.core.extrinsics.utils import (
+    get_balance_and_stakes,
+    get_old_stakes,
+    sign_and_send_batch_extrinsic,
+)
 from bittensor.core.types import UIDs
 from bittensor.utils import unlock_key, format_error_message
 from bittensor.utils.balance import Balance
@@ -215,6 +219,8 @@ def add_stake_multiple_extrinsic(
     wait_for_inclusion: bool = True,
     wait_for_finalization: bool = False,
     period: Optional[int] = None,
+    batch: bool = False,
+    atomic: bool = True,
 ) -> bool:
     """Adds stake to each ``hotkey_ss58`` in the list, using each amount, from a common coldkey.
 
@@ -231,6 +237,11 @@ def add_stake_multiple_extrinsic(
         period: The number of blocks during which the transaction will remain valid after it's submitted. If
             the transaction is not included in a block within that number of blocks, it will expire and be rejected.
             You can think of it as an expiration date for the transaction.
+        batch: If set, submits all the stakes as a single ``Utility`` batch extrinsic, signed once and waited for once,
+            instead of one extrinsic per hotkey.
+        atomic: Only used with ``batch``. If set, the batch is dispatched with ``batch_all`` and no stake is added if
+            any of them fails. Otherwise, it is dispatched with ``force_batch`` and each stake succeeds or fails on its
+            own.
 
     Returns:
         success: `True` if extrinsic was finalized or included in the block. `True` if any wallet was staked. If we did
@@ -303,6 +314,19 @@ def add_stake_multiple_extrinsic(
             Balance.from_tao(amount.tao * percent_reduction) for amount in new_amounts
         ]
 
+    if batch:
+        return _add_stake_multiple_batch(
+            subtensor=subtensor,
+            wallet=wallet,
+            stakes=list(zip(hotkey_ss58s, netuids, new_amounts, old_stakes)),
+            old_balance=old_balance,
+            initial_balance=initial_balance,
+            atomic=atomic,
+            wait_for_inclusion=wait_for_inclusion,
+            wait_for_finalization=wait_for_finalization,
+            period=period,
+        )
+
     successful_stakes = 0
     for idx, (hotkey_ss58, amount, old_stake, netuid) in enumerate(
         zip(hotkey_ss58s, new_amounts, old_stakes, netuids)
@@ -407,6 +431,102 @@ def add_stake_multiple_extrinsic(
     return False
 
 
+def _add_stake_multiple_batch(
+    subtensor: "Subtensor",
+    wallet: "Wallet",
+    stakes: list[tuple[str, int, Optional[Balance], Balance]],
+    old_balance: Balance,
+    initial_balance: Balance,
+    atomic: bool,
+    wait_for_inclusion: bool,
+    wait_for_finalization: bool,
+    period: Optional[int],
+) -> bool:
+    """Adds the ``(hotkey_ss58, netuid, amount, old_stake)`` stakes with a single batch extrinsic. See
+    :func:`add_stake_multiple_extrinsic`."""
+    planned = []
+    for hotkey_ss58, netuid, amount, old_stake in stakes:
+        staking_balance = (
+            Balance.from_tao(old_balance.tao) if amount is None else amount
+        )
+        if staking_balance > old_balance:
+            logging.error(
+                f":cross_mark: [red]Not enough balance[/red]: [green]{old_balance}[/green] to stake: "
+                f"[blue]{staking_balance}[/blue] from wallet: [white]{wallet.name}[/white]"
+            )
+            continue
+        logging.info(
+            f"Staking [blue]{staking_balance}[/blue] to hotkey: [magenta]{hotkey_ss58}[/magenta] on netuid: "
+            f"[blue]{netuid}[/blue]"
+        )
+        planned.append((hotkey_ss58, netuid, staking_balance, old_stake))
+        old_balance -= staking_balance
+        if amount is None:
+            # Staking all, nothing is left for the next hotkeys
+            break
+
+    if not planned:
+        return False
+
+    try:
+        calls = [
+            subtensor.substrate.compose_call(
+                call_module="SubtensorModule",
+                call_function="add_stake",
+                call_params={
+                    "hotkey": hotkey_ss58,
+                    "amount_staked": staking_balance.rao,
+                    "netuid": netuid,
+                },
+            )
+            for hotkey_ss58, netuid, staking_balance, _ in planned
+        ]
+        success, message, results = sign_and_send_batch_extrinsic(
+            subtensor=subtensor,
+            wallet=wallet,
+            calls=calls,
+            atomic=atomic,
+            wait_for_inclusion=wait_for_inclusion,
+            wait_for_finalization=wait_for_finalization,
+            period=period,
+        )
+    except SubstrateRequestException as error:
+        logging.error(
+            f":cross_mark: [red]Add Stake Multiple error: {format_error_message(error)}[/red]"
+        )
+        return False
+
+    if not wait_for_finalization and not wait_for_inclusion:
+        return success
+
+    if not any(call_success for call_success, _ in results):
+        logging.error(f":cross_mark: [red]Failed: {message}.[/red]")
+        return False
+
+    logging.success(":white_heavy_check_mark: [green]Finalized[/green]")
+    new_balance, new_stakes = get_balance_and_stakes(
+        subtensor=subtensor,
+        coldkey_ss58=wallet.coldkeypub.ss58_address,
+        hotkey_ss58s=[hotkey_ss58 for hotkey_ss58, *_ in planned],
+        netuids=[netuid for _, netuid, *_ in planned],
+    )
+    for (hotkey_ss58, netuid, _, old_stake), new_stake, (call_success, error) in zip(
+        planned, new_stakes, results
+    ):
+        if call_success:
+            logging.info(
+                f"Stake ({hotkey_ss58}) on netuid {netuid}: [blue]{old_stake}[/blue] :arrow_right: [green]{new_stake}[/green]"
+            )
+        else:
+            logging.error(
+                f":cross_mark: [red]Failed to stake to {hotkey_ss58} on netuid {netuid}[/red]: {error}"
+            )
+    logging.info(
+        f"Balance: [blue]{initial_balance}[/blue] :arrow_right: [green]{new_balance}[/green]"
+    )
+    return True
+
+
 def set_auto_stake_extrinsic(
     subtensor: "Subtensor",
     wallet: "Wallet",
@@ -1,9 +1,15 @@
 """Module with helper functions for extrinsics."""
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
-from bittensor.utils import unlock_key
-from bittensor.utils.balance import Balance
+from async_substrate_interface.errors import SubstrateRequestException
+
+from bittensor.utils import (
+    format_error_message,
+    get_mechid_storage_index,
+    unlock_key,
+)
+from bittensor.utils.balance import Balance, fixed_to_float
 from bittensor.utils.btlogging import logging
 
 if TYPE_CHECKING:
@@ -142,3 +148,298 @@ def sudo_call_extrinsic(
             raise error
 
         return False, str(error)
+
+
+def dispatch_error_message(dispatch_error: dict, metadata: Optional[Any] = None) -> str:
+    """
+    Formats the dispatch error of a failed call, resolving module errors to their name and docs through the runtime
+    metadata when it is given.
+
+    Args:
+        dispatch_error: The decoded ``DispatchError``.
+        metadata: The runtime metadata of the block the call was dispatched in.
+
+    Returns:
+        str: The formatted error message.
+    """
+    if "Module" in dispatch_error and metadata is not None:
+        module = dispatch_error["Module"]
+        if isinstance(module, tuple):
+            module_index, error_index = module
+        else:
+            module_index, error_index = module["index"], module["error"]
+        if isinstance(error_index, str):
+            # Actual error index is the first u8 of the [u8; 4] encoding
+            error_index = int(error_index[2:4], 16)
+        module_error = metadata.get_module_error(
+            module_index=module_index, error_index=error_index
+        )
+        error = {"type": "Module", "name": module_error.name, "docs": module_error.docs}
+    else:
+        name = next(iter(dispatch_error), "UnknownError")
+        error = {
+            "type": "System",
+            "name": name,
+            "docs": str(dispatch_error.get(name) or name),
+        }
+    return format_error_message(error)
+
+
+def get_batch_call_results(
+    events: list[dict], metadata: Optional[Any] = None
+) -> list[tuple[bool, str]]:
+    """
+    Returns the result of each call of a ``Utility`` batch extrinsic, in order, from the events it triggered.
+
+    Args:
+        events: The events triggered by the batch extrinsic.
+        metadata: The runtime metadata used to resolve module errors.
+
+    Returns:
+        list[tuple[bool, str]]: A ``(success, error message)`` tuple per dispatched call.
+    """
+    results = []
+    for event in events:
+        if event["event"]["module_id"] != "Utility":
+            continue
+        if event["event"]["event_id"] == "ItemCompleted":
+            results.append((True, ""))
+        elif event["event"]["event_id"] == "ItemFailed":
+            error = event["event"]["attributes"]["error"]
+            results.append((False, dispatch_error_message(error, metadata)))
+    return results
+
+
+def stake_from_alpha_shares(
+    alpha_shares: Optional[dict],
+    hotkey_alpha: Optional[int],
+    hotkey_shares: Optional[dict],
+    netuid: int,
+) -> Balance:
+    """
+    Computes a coldkey's stake to a hotkey on a subnet from the ``Alpha``, ``TotalHotkeyAlpha`` and
+    ``TotalHotkeyShares`` storage values, as ``Subtensor.get_stake`` does.
+    """
+    hotkey_shares_as_float = fixed_to_float(hotkey_shares) if hotkey_shares else 0
+    if not alpha_shares or not hotkey_alpha or hotkey_shares_as_float == 0:
+        return Balance.from_rao(0).set_unit(netuid=netuid)
+    stake = fixed_to_float(alpha_shares) / hotkey_shares_as_float * hotkey_alpha
+    return Balance.from_rao(int(stake)).set_unit(netuid=netuid)
+
+
+def sign_and_send_batch_extrinsic(
+    subtensor: "Subtensor",
+    wallet: "Wallet",
+    calls: list["GenericCall"],
+    atomic: bool = True,
+    wait_for_inclusion: bool = True,
+    wait_for_finalization: bool = False,
+    sign_with: str = "coldkey",
+    nonce_key: str = "coldkeypub",
+    period: Optional[int] = None,
+) -> tuple[bool, str, list[tuple[bool, str]]]:
+    """
+    Submits several calls as a single ``Utility`` batch extrinsic, signed once and waited for once.
+
+    Args:
+        subtensor: The Subtensor instance.
+        wallet: The wallet signing the extrinsic.
+        calls: The calls to batch.
+        atomic: If ``True``, the calls are dispatched with ``batch_all`` and are all reverted if any of them fails.
+            Otherwise, they are dispatched with ``force_batch`` and each call succeeds or fails on its own.
+        wait_for_inclusion: Whether to wait for the inclusion of the extrinsic.
+        wait_for_finalization: Whether to wait for the finalization of the extrinsic.
+        sign_with: The wallet's keypair to sign the extrinsic with.
+        nonce_key: The wallet's keypair whose account nonce is used.
+        period: The number of blocks during which the transaction will remain valid after it's submitted. If the
+            transaction is not included in a block within that number of blocks, it will expire and be rejected.
+
+    Returns:
+        tuple[bool, str, list[tuple[bool, str]]]:
+            `True` if every call succeeded, `False` otherwise, an error message, and the ``(success, error message)``
+            result of each call. The results are empty if neither inclusion nor finalization was waited for.
+    """
+    batch_call = subtensor.substrate.compose_call(
+        call_module="Utility",
+        call_function="batch_all" if atomic else "force_batch",
+        call_params={"calls": calls},
+    )
+    extrinsic_data = {
+        "call": batch_call,
+        "keypair": getattr(wallet, sign_with),
+        "nonce": subtensor.substrate.get_account_next_index(
+            getattr(wallet, nonce_key).ss58_address
+        ),
+    }
+    if period is not None:
+        extrinsic_data["era"] = {"period": period}
+    extrinsic = subtensor.substrate.create_signed_extrinsic(**extrinsic_data)
+
+    try:
+        response = subtensor.substrate.submit_extrinsic(
+            extrinsic,
+            wait_for_inclusion=wait_for_inclusion,
+            wait_for_finalization=wait_for_finalization,
+        )
+    except SubstrateRequestException as error:
+        message = format_error_message(error)
+        return False, message, [(False, message)] * len(calls)
+
+    if not wait_for_finalization and not wait_for_inclusion:
+        return True, "Not waiting for finalization or inclusion.", []
+
+    if not response.is_success:
+        message = format_error_message(response.error_message)
+        return False, message, [(False, message)] * len(calls)
+
+    if atomic:
+        return True, "", [(True, "")] * len(calls)
+
+    runtime = subtensor.substrate.init_runtime(block_hash=response.block_hash)
+    results = get_batch_call_results(response.triggered_events, runtime.metadata)
+    failures = [message for success, message in results if not success]
+    return not failures, "; ".join(failures), results
+
+
+def get_balance_and_stakes(
+    subtensor: "Subtensor",
+    coldkey_ss58: str,
+    hotkey_ss58s: list[str],
+    netuids: list[int],
+) -> tuple[Balance, list[Balance]]:
+    """
+    Fetches the free balance of a coldkey and its stakes to each hotkey on the matching subnet, at the chain head, with
+    a single ``query_multi``.
+
+    Args:
+        subtensor: The Subtensor instance.
+        coldkey_ss58: The SS58 address of the coldkey.
+        hotkey_ss58s: The SS58 addresses of the hotkeys.
+        netuids: The subnets of the stakes, one per hotkey.
+
+    Returns:
+        tuple[Balance, list[Balance]]: The coldkey free balance and the stakes, in the order of ``hotkey_ss58s``.
+    """
+    block_hash = subtensor.substrate.get_chain_head()
+    storage_keys = [
+        subtensor.substrate.create_storage_key(
+            "System", "Account", [coldkey_ss58], block_hash=block_hash
+        )
+    ]
+    for hotkey_ss58, netuid in zip(hotkey_ss58s, netuids):
+        for storage_function, params in (
+            ("Alpha", [hotkey_ss58, coldkey_ss58, netuid]),
+            ("TotalHotkeyAlpha", [hotkey_ss58, netuid]),
+            ("TotalHotkeyShares", [hotkey_ss58, netuid]),
+        ):
+            storage_keys.append(
+                subtensor.substrate.create_storage_key(
+                    "SubtensorModule", storage_function, params, block_hash=block_hash
+                )
+            )
+    values = [
+        value
+        for _, value in subtensor.substrate.query_multi(
+            storage_keys, block_hash=block_hash
+        )
+    ]
+    account = values[0] or {"data": {"free": 0}}
+    stakes = [
+        stake_from_alpha_shares(*values[i : i + 3], netuid=netuid)
+        for i, netuid in zip(range(1, len(values), 3), netuids)
+    ]
+    return Balance(account["data"]["free"]), stakes
+
+
+def weights_eligibility_queries(
+    hotkey_ss58: str, targets: list[tuple[int, int]]
+) -> list[tuple[str, str, list]]:
+    """
+    Returns the ``(pallet, storage function, params)`` storage queries fetched by :func:`get_weights_eligibility`: the
+    current block, then the uid of the hotkey, the commit-reveal flag, the weights rate limit, the tempo and the reveal
+    period of each subnet, in order of netuid, then the ``LastUpdate`` of each ``(netuid, mechid)`` target.
+    """
+    storage_queries: list[tuple[str, str, list]] = [("System", "Number", [])]
+    for netuid in sorted({netuid for netuid, _ in targets}):
+        storage_queries += [
+            ("SubtensorModule", "Uids", [netuid, hotkey_ss58]),
+            ("SubtensorModule", "CommitRevealWeightsEnabled", [netuid]),
+            ("SubtensorModule", "WeightsSetRateLimit", [netuid]),
+            ("SubtensorModule", "Tempo", [netuid]),
+            ("SubtensorModule", "RevealPeriodEpochs", [netuid]),
+        ]
+    for netuid, mechid in targets:
+        storage_queries.append(
+            (
+                "SubtensorModule",
+                "LastUpdate",
+                [get_mechid_storage_index(netuid=netuid, mechid=mechid)],
+            )
+        )
+    return storage_queries
+
+
+def parse_weights_eligibility(
+    values: list, targets: list[tuple[int, int]]
+) -> tuple[int, dict[tuple[int, int], dict[str, Any]]]:
+    """Parses the values of the :func:`weights_eligibility_queries` storage queries. See
+    :func:`get_weights_eligibility`."""
+    current_block = int(values[0])
+    netuids = sorted({netuid for netuid, _ in targets})
+    subnets = {
+        netuid: values[1 + 5 * index : 6 + 5 * index]
+        for index, netuid in enumerate(netuids)
+    }
+    last_updates = values[1 + 5 * len(netuids) :]
+
+    eligibility = {}
+    for (netuid, mechid), last_update in zip(targets, last_updates):
+        uid, commit_reveal, rate_limit, tempo, reveal_period = subnets[netuid]
+        blocks_since_last_update = None
+        if uid is not None and last_update and uid < len(last_update):
+            blocks_since_last_update = current_block - int(last_update[uid])
+        eligibility[(netuid, mechid)] = {
+            "uid": uid,
+            "commit_reveal": commit_reveal is True,
+            "rate_limit": int(rate_limit or 0),
+            "tempo": tempo,
+            "reveal_period": reveal_period,
+            "blocks_since_last_update": blocks_since_last_update,
+        }
+    return current_block, eligibility
+
+
+def get_weights_eligibility(
+    subtensor: "Subtensor", hotkey_ss58: str, targets: list[tuple[int, int]]
+) -> tuple[int, dict[tuple[int, int], dict[str, Any]]]:
+    """
+    Fetches whether, and how, a hotkey can set weights on each ``(netuid, mechid)`` target, at the chain head, with a
+    single ``query_multi``, instead of the ``get_uid_for_hotkey_on_subnet``, ``commit_reveal_enabled``,
+    ``blocks_since_last_update`` and ``weights_rate_limit`` calls made per target by ``Subtensor.set_weights``.
+
+    Args:
+        subtensor: The Subtensor instance.
+        hotkey_ss58: The SS58 address of the hotkey setting the weights.
+        targets: The ``(netuid, mechid)`` targets.
+
+    Returns:
+        tuple[int, dict[tuple[int, int], dict[str, Any]]]: The current block, and per target the ``uid`` of the hotkey,
+            or ``None`` if it is not registered, whether ``commit_reveal`` is enabled, the weights ``rate_limit``, the
+            subnet ``tempo`` and ``reveal_period``, and the ``blocks_since_last_update`` of the uid.
+    """
+    block_hash = subtensor.substrate.get_chain_head()
+    storage_keys = [
+        subtensor.substrate.create_storage_key(
+            pallet, storage_function, params, block_hash=block_hash
+        )
+        for pallet, storage_function, params in weights_eligibility_queries(
+            hotkey_ss58, targets
+        )
+    ]
+    values = [
+        value
+        for _, value in subtensor.substrate.query_multi(
+            storage_keys, block_hash=block_hash
+        )
+    ]
+    return parse_weights_eligibility(values, targets)
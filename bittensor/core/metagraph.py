@@ -1,6 +1,7 @@
 import asyncio
 import contextlib
 import copy
+import json
 import os
 import pickle
 import typing
@@ -17,18 +18,27 @@ from packaging import version
 from bittensor.core import settings
 from bittensor.core.chain_data import (
     AxonInfo,
+    NeuronInfo,
+    NeuronInfoLite,
     SubnetState,
     MetagraphInfoEmissions,
     MetagraphInfoPool,
     MetagraphInfoParams,
 )
-from bittensor.utils import determine_chain_endpoint_and_network
+from bittensor.utils import (
+    determine_chain_endpoint_and_network,
+    get_mechid_storage_index,
+    u16_normalized_float,
+)
 from bittensor.utils.btlogging import logging
 from bittensor.utils.registration import torch, use_torch
 from bittensor.utils.weight_utils import (
-    convert_weight_uids_and_vals_to_tensor,
-    convert_bond_uids_and_vals_to_tensor,
-    convert_root_weight_uids_and_vals_to_tensor,
+    CSRMatrix,
+    convert_weight_uids_and_vals_to_matrix,
+    convert_weight_uids_and_vals_to_csr,
+    convert_bond_uids_and_vals_to_matrix,
+    convert_bond_uids_and_vals_to_csr,
+    convert_root_weight_uids_and_vals_to_matrix,
 )
 
 # For annotation purposes
@@ -38,8 +48,6 @@ if typing.TYPE_CHECKING:
     from bittensor.core.chain_data import (
         ChainIdentity,
         MetagraphInfo,
-        NeuronInfo,
-        NeuronInfoLite,
         SubnetIdentity,
     )
 
@@ -92,6 +100,34 @@ ndarray objects. Each key corresponds to a specific attribute or metric associat
 - **uids** (`ndarray`): Unique identifiers for each node in the metagraph.
 """
 
+INCREMENTAL_SYNC_MAX_BLOCK_GAP = 360
+"""Maximum number of blocks between two syncs for which an incremental sync patches the previous state in place.
+
+Beyond this gap most neuron rows are expected to have changed, so a full rebuild is cheaper than patching row by row.
+"""
+
+NEURON_ATTRIBUTE_FIELDS = [
+    ("uids", "uid", "int64"),
+    ("trust", "trust", "float32"),
+    ("consensus", "consensus", "float32"),
+    ("incentive", "incentive", "float32"),
+    ("dividends", "dividends", "float32"),
+    ("ranks", "rank", "float32"),
+    ("emission", "emission", "float32"),
+    ("active", "active", "int64"),
+    ("last_update", "last_update", "int64"),
+    ("validator_permit", "validator_permit", "bool"),
+    ("validator_trust", "validator_trust", "float32"),
+]
+"""Per-neuron metagraph tensors as (metagraph attribute, neuron field, dtype registry key) triples."""
+
+SELECTIVE_SYNC_STORAGE_FUNCTIONS = [
+    "ValidatorTrust",
+    "MechanismCountCurrent",
+    "MechanismEmissionSplit",
+]
+"""``SubtensorModule`` storage items missing from the selective mechagraph, fetched next to it in a single batch."""
+
 
 def get_save_dir(
     network: str, netuid: int, root_dir: Optional[list[str]] = None
@@ -145,6 +181,198 @@ def latest_block_path(dir_path: str) -> str:
         return latest_file_full_path
 
 
+COLUMNAR_MANIFEST_FILE = "manifest.json"
+"""Name of the manifest file inside a columnar metagraph snapshot directory."""
+
+COLUMNAR_FORMAT_VERSION = 1
+"""Version of the file format written by :func:`save_columnar`."""
+
+AXON_COLUMNS = [
+    ("version", np.int64),
+    ("ip", np.bytes_),
+    ("port", np.int64),
+    ("ip_type", np.int64),
+    ("hotkey", np.bytes_),
+    ("coldkey", np.bytes_),
+    ("protocol", np.int64),
+    ("placeholder1", np.int64),
+    ("placeholder2", np.int64),
+]
+"""AxonInfo fields stored as one packed array each in a columnar snapshot. Strings are stored as fixed-width bytes."""
+
+
+def _to_numpy(value) -> np.ndarray:
+    """Returns a numpy view of a numpy array or (cpu) torch tensor."""
+    if hasattr(value, "detach"):
+        value = value.detach().cpu().numpy()
+    return np.asarray(value)
+
+
+def save_columnar(state_dict: dict, axons: list[AxonInfo], path: str) -> str:
+    """
+    Writes a metagraph state dict as a columnar snapshot: one ``.npy`` file per tensor, one packed array per axon field
+    and a small JSON manifest. Neuron objects are not stored.
+
+    Args:
+        state_dict: The metagraph state dict, as returned by :meth:`MetagraphMixin.state_dict`.
+        axons: The metagraph axons.
+        path: The snapshot directory to create, e.g. ``.../block-123``.
+
+    Returns:
+        str: The snapshot directory.
+    """
+    os.makedirs(path, exist_ok=True)
+    arrays: dict[str, dict] = {}
+
+    def write(name: str, array: np.ndarray):
+        file_name = f"{name}.npy"
+        np.save(os.path.join(path, file_name), array, allow_pickle=False)
+        arrays[name] = {
+            "file": file_name,
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+        }
+
+    sparse = []
+    for key, value in state_dict.items():
+        if key in ("netuid", "network", "axons", "neurons"):
+            continue
+        if isinstance(value, dict):
+            # Sparse (CSR) weights or bonds
+            sparse.append({"name": key, "shape": list(value["shape"])})
+            for part in ("indptr", "indices", "data"):
+                write(f"{key}.{part}", _to_numpy(value[part]))
+        else:
+            write(key, _to_numpy(value))
+
+    for field, dtype in AXON_COLUMNS:
+        values = [getattr(axon, field) for axon in axons]
+        if dtype is np.bytes_:
+            values = [str(v).encode() for v in values]
+        write(f"axons.{field}", np.array(values, dtype=dtype))
+
+    manifest = {
+        "format": "columnar",
+        "format_version": COLUMNAR_FORMAT_VERSION,
+        "bittensor_version": settings.__version__,
+        "netuid": state_dict["netuid"],
+        "network": state_dict["network"],
+        "block": int(_to_numpy(state_dict["block"]).item()),
+        "n": int(_to_numpy(state_dict["n"]).item()),
+        "arrays": arrays,
+        "sparse": sparse,
+    }
+    with open(os.path.join(path, COLUMNAR_MANIFEST_FILE), "w") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    return path
+
+
+class ColumnarSnapshot:
+    """
+    Lazy reader for a columnar metagraph snapshot written by ``MetagraphMixin.save(columnar=True)``.
+
+    Only the JSON manifest is read on construction. Each array is memory-mapped from its ``.npy`` file on first access,
+    so reading a single tensor from thousands of historical snapshots does not deserialize anything else. Arrays are
+    mapped copy-on-write: they can be modified in memory without touching the files.
+
+    Example::
+
+        from bittensor.core.metagraph import ColumnarSnapshot
+
+        snapshot = ColumnarSnapshot("~/.bittensor/metagraphs/network-finney/netuid-1/block-123")
+        stake = snapshot["stake"]
+        hotkeys = snapshot.hotkeys
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+        with open(os.path.join(self.path, COLUMNAR_MANIFEST_FILE)) as manifest_file:
+            self.manifest: dict = json.load(manifest_file)
+        if self.manifest.get("format") != "columnar":
+            raise ValueError(f"Not a columnar metagraph snapshot: {self.path}")
+        self._arrays: dict[str, np.ndarray] = {}
+
+    @staticmethod
+    def is_snapshot(path: str) -> bool:
+        """Returns True if ``path`` is a columnar snapshot directory."""
+        return os.path.isfile(os.path.join(path, COLUMNAR_MANIFEST_FILE))
+
+    @property
+    def block(self) -> int:
+        return self.manifest["block"]
+
+    @property
+    def n(self) -> int:
+        return self.manifest["n"]
+
+    def keys(self) -> list[str]:
+        return list(self.manifest["arrays"])
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.manifest["arrays"]
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        if key not in self._arrays:
+            entry = self.manifest["arrays"][key]
+            self._arrays[key] = np.load(
+                os.path.join(self.path, entry["file"]),
+                mmap_mode="c",
+                allow_pickle=False,
+            )
+        return self._arrays[key]
+
+    def _strings(self, key: str) -> list[str]:
+        return [value.decode() for value in self[key].tolist()]
+
+    @property
+    def hotkeys(self) -> list[str]:
+        return self._strings("axons.hotkey")
+
+    @property
+    def coldkeys(self) -> list[str]:
+        return self._strings("axons.coldkey")
+
+    def axons(self) -> list[AxonInfo]:
+        """Builds the AxonInfo list from the packed axon columns."""
+        columns = {
+            field: self._strings(f"axons.{field}")
+            if dtype is np.bytes_
+            else self[f"axons.{field}"].tolist()
+            for field, dtype in AXON_COLUMNS
+        }
+        return [
+            AxonInfo(**{field: columns[field][i] for field, _ in AXON_COLUMNS})
+            for i in range(self.n)
+        ]
+
+    def state_dict(self) -> dict:
+        """
+        Returns a state dict compatible with :meth:`MetagraphMixin.state_dict`, with memory-mapped arrays (or
+        zero-copy torch tensors when torch is used) and sparse matrices as their CSR component dicts.
+        """
+        state = {
+            "netuid": self.manifest["netuid"],
+            "network": self.manifest["network"],
+            "axons": self.axons(),
+            "neurons": [],
+        }
+        for key in self.keys():
+            if "." not in key:
+                state[key] = self[key]
+        for entry in self.manifest["sparse"]:
+            name = entry["name"]
+            state[name] = {
+                part: self[f"{name}.{part}"] for part in ("indptr", "indices", "data")
+            }
+            state[name]["shape"] = tuple(entry["shape"])
+        if use_torch():
+            for key, value in state.items():
+                if isinstance(value, np.ndarray):
+                    state[key] = torch.from_numpy(value)
+        state.setdefault("total_stake", state.get("stake"))
+        return state
+
+
 def safe_globals():
     """
     Context manager to load torch files for version 2.6+
@@ -161,6 +389,7 @@ def safe_globals():
         np.dtype,
         type(np.dtype(np.uint32)),
         np.dtypes.Float32DType,
+        np.dtypes.Int64DType,
         bytes,
     ]
     return torch.serialization.safe_globals(allow_list)
@@ -250,8 +479,8 @@ class MetagraphMixin(ABC):
     active: Tensor
     last_update: Tensor
     validator_permit: Tensor
-    weights: Tensor
-    bonds: Tensor
+    weights: Union[Tensor, CSRMatrix]
+    bonds: Union[Tensor, CSRMatrix]
     uids: Tensor
     alpha_stake: Tensor
     tao_stake: Tensor
@@ -438,7 +667,12 @@ class MetagraphMixin(ABC):
         Returns:
             Tensor: A tensor representing the bonds held by each neuron, where each value signifies the proportion of
                 bonds owned by one neuron in another.
+
+        Note:
+            For a ``sparse`` metagraph the dense matrix is materialized from :attr:`bonds` on every access.
         """
+        if isinstance(self.bonds, CSRMatrix):
+            return self.bonds.to_dense()
         return self.bonds
 
     @property
@@ -458,7 +692,12 @@ class MetagraphMixin(ABC):
             Tensor: A tensor of inter-peer weights, where each element :math:`w_{ij}` represents the weight assigned by
                 neuron :math:`i` to neuron :math:`j`. This matrix is fundamental to the network's functioning,
                 influencing the distribution of incentives and the inter-neuronal dynamics.
+
+        Note:
+            For a ``sparse`` metagraph the dense matrix is materialized from :attr:`weights` on every access.
         """
+        if isinstance(self.weights, CSRMatrix):
+            return self.weights.to_dense()
         return self.weights
 
     @property
@@ -531,6 +770,7 @@ class MetagraphMixin(ABC):
         sync: bool = True,
         subtensor: Optional[Union["AsyncSubtensor", "Subtensor"]] = None,
         mechid: int = 0,
+        sparse: bool = False,
     ):
         """
         Initializes a new instance of the metagraph object, setting up the basic structure and parameters based on the
@@ -546,6 +786,8 @@ class MetagraphMixin(ABC):
                 detailed information but can be quicker to initialize and sync.
             sync: A flag indicating whether to synchronize the metagraph with the network upon initialization.
                 Synchronization involves updating the metagraph's parameters to reflect the current state of the network.
+            sparse: A flag indicating whether weights and bonds are stored as :class:`CSRMatrix` instead of dense
+                ``n x n`` tensors. The ``W`` and ``B`` properties still return dense matrices, materialized on access.
 
         Example:
             Initializing a metagraph object for the Bittensor network with a specific network UID:
@@ -553,6 +795,7 @@ class MetagraphMixin(ABC):
                 metagraph = Metagraph(netuid=123, network="finney", lite=True, sync=True)
         """
         self.lite = lite
+        self.sparse = sparse
         self.subtensor = subtensor
         self.should_sync = sync
         self.netuid = netuid
@@ -643,8 +886,8 @@ class MetagraphMixin(ABC):
             "active": self.active,
             "last_update": self.last_update,
             "validator_permit": self.validator_permit,
-            "weights": self.weights,
-            "bonds": self.bonds,
+            "weights": self._weights_or_bonds_state(self.weights),
+            "bonds": self._weights_or_bonds_state(self.bonds),
             "uids": self.uids,
             "axons": self.axons,
             "neurons": self.neurons,
@@ -653,6 +896,18 @@ class MetagraphMixin(ABC):
             "stake": self.stake,
         }
 
+    @staticmethod
+    def _weights_or_bonds_state(value: Union[Tensor, CSRMatrix]):
+        """Returns weights or bonds in saveable form: sparse matrices are stored as their CSR components, converted to
+        torch tensors when torch is used so that ``torch.load`` can read them back with ``weights_only``."""
+        if not isinstance(value, CSRMatrix):
+            return value
+        state = value.state_dict()
+        if use_torch():
+            for key in ("indptr", "indices", "data"):
+                state[key] = torch.from_numpy(state[key])
+        return state
+
     @staticmethod
     def _create_tensor(data, dtype) -> Tensor:
         """
@@ -678,12 +933,90 @@ class MetagraphMixin(ABC):
             else np.array(data, dtype=dtype)
         )
 
+    def _weights_or_bonds_row(self, item: list[tuple[int, int]], attribute: str):
+        """
+        Converts a single neuron's ``(uid, value)`` pairs into a dense row of length ``len(self.neurons)``.
+
+        Args:
+            item: The raw weights or bonds of one neuron.
+            attribute: A string indicating whether the data is ``weights`` or ``bonds``.
+
+        Returns:
+            The dense row as a numpy array or torch tensor, depending on the backend in use.
+        """
+        if attribute == "weights":
+            return convert_weight_uids_and_vals_to_matrix(len(self.neurons), [item])[0]
+        return convert_bond_uids_and_vals_to_matrix(
+            len(self.neurons), [item], dtype=np.float32
+        )[0]
+
+    def _load_weights_or_bonds(self, value) -> Union[Tensor, CSRMatrix]:
+        """
+        Converts saved weights or bonds into the representation used by this metagraph, so that dense and sparse saves
+        can be loaded into either kind of metagraph.
+
+        Args:
+            value: The saved matrix: a dense array or tensor, or the :meth:`CSRMatrix.state_dict` of a sparse one.
+
+        Returns:
+            A :class:`CSRMatrix` for a ``sparse`` metagraph, otherwise a dense tensor.
+        """
+        if isinstance(value, dict):
+            value = CSRMatrix.from_state_dict(value)
+        if self.sparse:
+            return (
+                value if isinstance(value, CSRMatrix) else CSRMatrix.from_dense(value)
+            )
+        if isinstance(value, CSRMatrix):
+            value = value.to_dense()
+        return (
+            torch.nn.Parameter(torch.as_tensor(value), requires_grad=False)
+            if use_torch()
+            else value
+        )
+
+    def _weights_matrix_to_tensor(
+        self, matrix, attribute: str
+    ) -> Union[Tensor, CSRMatrix]:
+        """
+        Wraps a weights or bonds matrix into the metagraph's tensor type (a :class:`CSRMatrix` for a ``sparse``
+        metagraph), warning when the matrix has no rows.
+
+        Args:
+            matrix: The dense matrix built from the raw weights or bonds data.
+            attribute: A string indicating the attribute type, used in the warning message.
+
+        Returns:
+            Tensor: A tensor parameter encapsulating the matrix.
+        """
+        if len(matrix) == 0:
+            logging.warning(
+                f"Empty {attribute}_array on metagraph.sync(). The '{attribute}' tensor is empty."
+            )
+        if self.sparse:
+            return (
+                matrix
+                if isinstance(matrix, CSRMatrix)
+                else CSRMatrix.from_dense(matrix)
+            )
+        if len(matrix) == 0:
+            return (
+                torch.nn.Parameter() if use_torch() else np.array([], dtype=np.float32)
+            )
+        return (
+            torch.nn.Parameter(matrix, requires_grad=False) if use_torch() else matrix
+        )
+
     def _process_weights_or_bonds(self, data, attribute: str) -> Tensor:
         """
         Processes the raw weights or bonds data and converts it into a structured tensor format. This method handles the
         transformation of neuron connection data (``weights`` or ``bonds``) from a list or other unstructured format
         into a tensor that can be utilized within the metagraph model.
 
+        All ``(uid, value)`` pairs are flattened into COO arrays once and scattered into the matrix in a single pass, and
+        weight rows are normalized in a single vectorized operation. For a ``sparse`` metagraph the result is a
+        :class:`CSRMatrix` holding only the non-zero entries.
+
         Args:
             data: The raw weights or bonds data to be processed. This data typically comes from the subtensor.
             attribute: A string indicating whether the data is ``weights`` or ``bonds``, which determines the specific
@@ -697,48 +1030,21 @@ class MetagraphMixin(ABC):
 
                 self.weights = self._process_weights_or_bonds(raw_weights_data, "weights")
         """
-        data_array = []
-        for item in data:
-            if len(item) == 0:
-                if use_torch():
-                    data_array.append(torch.zeros(len(self.neurons)))
-                else:
-                    data_array.append(np.zeros(len(self.neurons), dtype=np.float32))
-            else:
-                uids, values = zip(*item)
-                # TODO: Validate and test the conversion of uids and values to tensor
-                if attribute == "weights":
-                    data_array.append(
-                        convert_weight_uids_and_vals_to_tensor(
-                            len(self.neurons),
-                            list(uids),
-                            list(values),
-                        )
-                    )
-                else:
-                    data_array.append(
-                        convert_bond_uids_and_vals_to_tensor(
-                            len(self.neurons), list(uids), list(values)
-                        ).astype(np.float32)
-                    )
-        tensor_param: Tensor = (
-            (
-                torch.nn.Parameter(torch.stack(data_array), requires_grad=False)
-                if len(data_array)
-                else torch.nn.Parameter()
-            )
-            if use_torch()
-            else (
-                np.stack(data_array)
-                if len(data_array)
-                else np.array([], dtype=np.float32)
+        if attribute == "weights":
+            converter = (
+                convert_weight_uids_and_vals_to_csr
+                if self.sparse
+                else convert_weight_uids_and_vals_to_matrix
             )
-        )
-        if len(data_array) == 0:
-            logging.warning(
-                f"Empty {attribute}_array on metagraph.sync(). The '{attribute}' tensor is empty."
+            matrix = converter(len(self.neurons), data)
+        else:
+            converter = (
+                convert_bond_uids_and_vals_to_csr
+                if self.sparse
+                else convert_bond_uids_and_vals_to_matrix
             )
-        return tensor_param
+            matrix = converter(len(self.neurons), data, dtype=np.float32)
+        return self._weights_matrix_to_tensor(matrix, attribute)
 
     def _set_metagraph_attributes(self, block: int):
         """
@@ -805,7 +1111,135 @@ class MetagraphMixin(ABC):
         )
         self.axons = [n.axon_info for n in self.neurons]
 
-    def save(self, root_dir: Optional[list[str]] = None) -> "MetagraphMixin":
+    def _can_sync_incrementally(
+        self,
+        previous_neurons: list[Union["NeuronInfo", "NeuronInfoLite"]],
+        previous_lite: bool,
+        lite: bool,
+        block: int,
+    ) -> bool:
+        """
+        Checks whether the neurons fetched for ``block`` can be patched into the previously synced state instead of
+        rebuilding every tensor.
+
+        An incremental sync is possible only when the previous state has the same number of neurons, was synced in the
+        same ``lite`` mode, is at most :data:`INCREMENTAL_SYNC_MAX_BLOCK_GAP` blocks away, and (for non-lite syncs) holds
+        weights and bonds matrices of the right shape. Root weights (``netuid == 0``) are always rebuilt.
+
+        Args:
+            previous_neurons: The neurons of the previously synced state.
+            previous_lite: The ``lite`` flag used by the previous sync.
+            lite: The ``lite`` flag used by the current sync.
+            block: The block number the metagraph is being synced to.
+
+        Returns:
+            bool: ``True`` if the previous state can be patched in place, ``False`` if a full sync is required.
+        """
+        n = len(self.neurons)
+        if n == 0 or len(previous_neurons) != n or previous_lite != lite:
+            return False
+        if int(self.n.item()) != n or len(self.axons) != n:
+            return False
+        if abs(block - int(self.block.item())) > INCREMENTAL_SYNC_MAX_BLOCK_GAP:
+            return False
+        if not lite:
+            if self.netuid == 0:
+                return False
+            if tuple(self.weights.shape) != (n, n) or tuple(self.bonds.shape) != (
+                n,
+                n,
+            ):
+                return False
+        return True
+
+    def _patch_metagraph_attributes(
+        self,
+        previous_neurons: list[Union["NeuronInfo", "NeuronInfoLite"]],
+        block: int,
+        lite: bool,
+    ) -> list[int]:
+        """
+        Updates the metagraph tensors in place for the neurons which differ from the previously synced state, leaving
+        every other row untouched. Weights and bonds rows are only rebuilt when the neuron's raw weights or bonds changed.
+
+        Because tensors are modified in place, references obtained before the sync (including shallow copies of the
+        metagraph) observe the new values.
+
+        Args:
+            previous_neurons: The neurons of the previously synced state, aligned by position with ``self.neurons``.
+            block: The block number the metagraph is being synced to.
+            lite: Whether the current sync is a lite sync (no weights or bonds).
+
+        Returns:
+            list[int]: The positions of the neurons which were patched.
+        """
+        changed = [
+            index
+            for index, (previous, current) in enumerate(
+                zip(previous_neurons, self.neurons)
+            )
+            if previous != current
+        ]
+        self.version = self._create_tensor(
+            [settings.version_as_int], dtype=self._dtype_registry["int64"]
+        )
+        self.block = self._create_tensor(block, dtype=self._dtype_registry["int64"])
+        if not changed:
+            return changed
+
+        for attribute, field, dtype in NEURON_ATTRIBUTE_FIELDS:
+            values = [getattr(self.neurons[index], field) for index in changed]
+            self._assign_rows(
+                getattr(self, attribute),
+                changed,
+                self._create_tensor(values, dtype=self._dtype_registry[dtype]),
+            )
+        for index in changed:
+            self.axons[index] = self.neurons[index].axon_info
+
+        if not lite:
+            for attribute in ("weights", "bonds"):
+                changed_rows = [
+                    index
+                    for index in changed
+                    if getattr(self.neurons[index], attribute)
+                    != getattr(previous_neurons[index], attribute)
+                ]
+                if changed_rows and self.sparse:
+                    # CSR matrices can't be patched in place, rebuild them in one vectorized pass
+                    setattr(
+                        self,
+                        attribute,
+                        self._process_weights_or_bonds(
+                            [getattr(n, attribute) for n in self.neurons], attribute
+                        ),
+                    )
+                    continue
+                for index in changed_rows:
+                    self._assign_rows(
+                        getattr(self, attribute),
+                        index,
+                        self._weights_or_bonds_row(
+                            getattr(self.neurons[index], attribute), attribute
+                        ),
+                    )
+
+        logging.debug(
+            f"Incremental metagraph sync patched {len(changed)} of {len(self.neurons)} neurons at block {block}."
+        )
+        return changed
+
+    @staticmethod
+    def _assign_rows(tensor: Tensor, rows: Union[int, list[int]], values) -> None:
+        """Writes ``values`` into ``tensor[rows]`` in place, for both numpy arrays and torch parameters."""
+        if use_torch():
+            tensor.data[rows] = torch.as_tensor(values, dtype=tensor.dtype)
+        else:
+            tensor[rows] = values
+
+    def save(
+        self, root_dir: Optional[list[str]] = None, columnar: bool = False
+    ) -> "MetagraphMixin":
         """
         Saves the current state of the metagraph to a file on disk. This function is crucial for persisting the current
             state of the network's metagraph, which can later be reloaded or analyzed. The save operation includes all
@@ -814,6 +1248,9 @@ class MetagraphMixin(ABC):
         Args:
             root_dir: list to the file path for the root directory of your metagraph saves
                 (i.e. ['/', 'tmp', 'metagraphs'], defaults to ["~", ".bittensor", "metagraphs"]
+            columnar: If True, writes a ``block-N`` directory holding one ``.npy`` file per tensor, packed axon columns
+                and a JSON manifest instead of a single pickled ``block-N.pt`` file. Neuron objects are not stored.
+                Columnar snapshots are memory-mapped on load, see :class:`ColumnarSnapshot`.
 
         Returns:
             metagraph (bittensor.core.metagraph.Metagraph): The metagraph instance after saving its state.
@@ -835,7 +1272,13 @@ class MetagraphMixin(ABC):
         """
         save_directory = get_save_dir(self.network, self.netuid, root_dir=root_dir)
         os.makedirs(save_directory, exist_ok=True)
-        if use_torch():
+        if columnar:
+            save_columnar(
+                self.state_dict(),
+                self.axons,
+                os.path.join(save_directory, f"block-{self.block.item()}"),
+            )
+        elif use_torch():
             graph_filename = f"{save_directory}/block-{self.block.item()}.pt"
             state_dict = self.state_dict()
             state_dict["axons"] = self.axons
@@ -1022,6 +1465,132 @@ class MetagraphMixin(ABC):
             pending_root_emission=metagraph_info.pending_root_emission.tao,
         )
 
+    def _neurons_from_metagraph_info(
+        self,
+        metagraph_info: "MetagraphInfo",
+        validator_trust: list[int],
+        weights: Optional[list[tuple[int, list[tuple[int, int]]]]] = None,
+        bonds: Optional[list[tuple[int, list[tuple[int, int]]]]] = None,
+    ) -> list[Union["NeuronInfo", "NeuronInfoLite"]]:
+        """
+        Builds the neurons of the metagraph from the per-UID columns of a selective mechagraph response.
+
+        Args:
+            metagraph_info: The selective mechagraph response of the subnet mechanism.
+            validator_trust: The raw ``ValidatorTrust`` storage value of the subnet, missing from the mechagraph.
+            weights: The ``(uid, weights)`` pairs of the subnet mechanism. Lite neurons are built when ``None``.
+            bonds: The ``(uid, bonds)`` pairs of the subnet mechanism, used along ``weights``.
+
+        Returns:
+            list: :class:`NeuronInfoLite` instances, or :class:`NeuronInfo` instances if ``weights`` are given. The
+                ``stake_dict`` and ``prometheus_info`` of the neurons are not part of the mechagraph and left empty.
+        """
+        neurons = []
+        for uid, (hotkey, coldkey) in enumerate(
+            zip(metagraph_info.hotkeys, metagraph_info.coldkeys)
+        ):
+            total_stake = metagraph_info.total_stake[uid]
+            neurons.append(
+                NeuronInfoLite(
+                    hotkey=hotkey,
+                    coldkey=coldkey,
+                    uid=uid,
+                    netuid=self.netuid,
+                    active=metagraph_info.active[uid],
+                    stake=total_stake,
+                    stake_dict={},
+                    total_stake=total_stake,
+                    rank=metagraph_info.rank[uid],
+                    emission=metagraph_info.emission[uid].tao,
+                    incentive=metagraph_info.incentives[uid],
+                    consensus=metagraph_info.consensus[uid],
+                    trust=metagraph_info.trust[uid],
+                    validator_trust=(
+                        u16_normalized_float(validator_trust[uid])
+                        if uid < len(validator_trust)
+                        else 0.0
+                    ),
+                    dividends=metagraph_info.dividends[uid],
+                    last_update=metagraph_info.last_update[uid],
+                    validator_permit=metagraph_info.validator_permit[uid],
+                    prometheus_info=None,
+                    axon_info=AxonInfo.from_dict(
+                        metagraph_info.axons[uid]
+                        | {"hotkey": hotkey, "coldkey": coldkey}
+                    ),
+                    pruning_score=round(metagraph_info.pruning_score[uid] * 65535),
+                )
+            )
+        if weights is None:
+            return neurons
+
+        weights_as_dict, bonds_as_dict = dict(weights), dict(bonds or [])
+        return [
+            NeuronInfo.from_weights_bonds_and_neuron_lite(
+                neuron, weights_as_dict, bonds_as_dict
+            )
+            for neuron in neurons
+        ]
+
+    def _apply_mechagraph(
+        self,
+        metagraph_info: "MetagraphInfo",
+        storage: dict[str, typing.Any],
+        lite: bool,
+        weights: Optional[list[tuple[int, list[tuple[int, int]]]]] = None,
+        bonds: Optional[list[tuple[int, list[tuple[int, int]]]]] = None,
+    ):
+        """
+        Assigns the neurons, stakes, subnet information and mechanism split from a selective mechagraph response and
+        the :data:`SELECTIVE_SYNC_STORAGE_FUNCTIONS` batch fetched at the same block.
+
+        Args:
+            metagraph_info: The selective mechagraph response of the subnet mechanism.
+            storage: The values of the :data:`SELECTIVE_SYNC_STORAGE_FUNCTIONS` storage items, by storage function.
+            lite: Whether the sync is a lite sync (no weights or bonds).
+            weights: The ``(uid, weights)`` pairs of the subnet mechanism, for non-lite syncs.
+            bonds: The ``(uid, bonds)`` pairs of the subnet mechanism, for non-lite syncs.
+        """
+        self.neurons = self._neurons_from_metagraph_info(
+            metagraph_info,
+            storage.get("ValidatorTrust") or [],
+            weights=None if lite else weights or [],
+            bonds=bonds,
+        )
+        self.lite = lite
+
+        if self.netuid == 0:
+            # The mechagraph weights the root stake, unlike the subnet state used by the regular sync
+            self.total_stake = self.stake = self.tao_stake = self.alpha_stake = (
+                self._create_tensor(
+                    [
+                        stake.tao / settings.ROOT_TAO_STAKE_WEIGHT
+                        for stake in metagraph_info.tao_stake
+                    ],
+                    dtype=self._dtype_registry["float32"],
+                )
+            )
+        else:
+            self.alpha_stake = self._create_tensor(
+                [stake.tao for stake in metagraph_info.alpha_stake],
+                dtype=self._dtype_registry["float32"],
+            )
+            self.tao_stake = self._create_tensor(
+                [stake.tao for stake in metagraph_info.tao_stake],
+                dtype=self._dtype_registry["float32"],
+            )
+            self.total_stake = self.stake = self._create_tensor(
+                [stake.tao for stake in metagraph_info.total_stake],
+                dtype=self._dtype_registry["float32"],
+            )
+
+        self._apply_metagraph_info_mixin(metagraph_info=metagraph_info)
+        self.mechanism_count = storage.get("MechanismCountCurrent") or 1
+        split = storage.get("MechanismEmissionSplit")
+        self.emissions_split = (
+            [round(i / sum(split) * 100) for i in split] if split else None
+        )
+
 
 if use_torch():
     BaseClass = torch.nn.Module
@@ -1041,6 +1610,7 @@ class TorchMetagraph(MetagraphMixin, BaseClass):
         sync: bool = True,
         subtensor: Optional[Union["AsyncSubtensor", "Subtensor"]] = None,
         mechid: int = 0,
+        sparse: bool = False,
     ):
         """
         Initializes a new instance of the metagraph object, setting up the basic structure and parameters based on the
@@ -1056,6 +1626,7 @@ class TorchMetagraph(MetagraphMixin, BaseClass):
             sync: A flag indicating whether to synchronize the metagraph with the network upon initialization.
                 Synchronization involves updating the metagraph's parameters to reflect the current state of the network.
             mechid: Subnet mechanism unique identifier.
+            sparse: If True, weights and bonds are stored as :class:`CSRMatrix` instead of dense tensors.
 
         Example:
             Initializing a metagraph object for the Bittensor network with a specific network UID:
@@ -1065,7 +1636,9 @@ class TorchMetagraph(MetagraphMixin, BaseClass):
                 metagraph = Metagraph(netuid=123, network="finney", lite=True, sync=True)
         """
         BaseClass.__init__(self)
-        MetagraphMixin.__init__(self, netuid, network, lite, sync, subtensor, mechid)
+        MetagraphMixin.__init__(
+            self, netuid, network, lite, sync, subtensor, mechid, sparse
+        )
         self._dtype_registry = {
             "int64": torch.int64,
             "float32": torch.float32,
@@ -1117,12 +1690,16 @@ class TorchMetagraph(MetagraphMixin, BaseClass):
         self.validator_permit = torch.nn.Parameter(
             torch.tensor([], dtype=torch.bool), requires_grad=False
         )
-        self.weights: torch.nn.Parameter = torch.nn.Parameter(
-            torch.tensor([], dtype=torch.float32), requires_grad=False
-        )
-        self.bonds: torch.nn.Parameter = torch.nn.Parameter(
-            torch.tensor([], dtype=torch.int64), requires_grad=False
-        )
+        if sparse:
+            self.weights = CSRMatrix.from_dense(np.zeros((0, 0), dtype=np.float32))
+            self.bonds = CSRMatrix.from_dense(np.zeros((0, 0), dtype=np.float32))
+        else:
+            self.weights: torch.nn.Parameter = torch.nn.Parameter(
+                torch.tensor([], dtype=torch.float32), requires_grad=False
+            )
+            self.bonds: torch.nn.Parameter = torch.nn.Parameter(
+                torch.tensor([], dtype=torch.int64), requires_grad=False
+            )
         self.uids = torch.nn.Parameter(
             torch.tensor([], dtype=torch.int64), requires_grad=False
         )
@@ -1155,8 +1732,11 @@ class TorchMetagraph(MetagraphMixin, BaseClass):
         """
 
         graph_file = latest_block_path(dir_path)
-        with safe_globals():
-            state_dict = torch.load(graph_file)
+        if ColumnarSnapshot.is_snapshot(graph_file):
+            state_dict = ColumnarSnapshot(graph_file).state_dict()
+        else:
+            with safe_globals():
+                state_dict = torch.load(graph_file)
         self.n = torch.nn.Parameter(state_dict["n"], requires_grad=False)
         self.block = torch.nn.Parameter(state_dict["block"], requires_grad=False)
         self.uids = torch.nn.Parameter(state_dict["uids"], requires_grad=False)
@@ -1190,11 +1770,9 @@ class TorchMetagraph(MetagraphMixin, BaseClass):
         self.axons = state_dict["axons"]
         self.neurons = state_dict["neurons"]
         if "weights" in state_dict:
-            self.weights = torch.nn.Parameter(
-                state_dict["weights"], requires_grad=False
-            )
+            self.weights = self._load_weights_or_bonds(state_dict["weights"])
         if "bonds" in state_dict:
-            self.bonds = torch.nn.Parameter(state_dict["bonds"], requires_grad=False)
+            self.bonds = self._load_weights_or_bonds(state_dict["bonds"])
         return self
 
 
@@ -1207,6 +1785,7 @@ class NonTorchMetagraph(MetagraphMixin):
         sync: bool = True,
         subtensor: Optional[Union["AsyncSubtensor", "Subtensor"]] = None,
         mechid: int = 0,
+        sparse: bool = False,
     ):
         """
         Initializes a new instance of the metagraph object, setting up the basic structure and parameters based on the
@@ -1222,6 +1801,7 @@ class NonTorchMetagraph(MetagraphMixin):
             sync: A flag indicating whether to synchronize the metagraph with the network upon initialization.
                 Synchronization involves updating the metagraph's parameters to reflect the current state of the network.
             mechid: Subnet mechanism unique identifier.
+            sparse: If True, weights and bonds are stored as :class:`CSRMatrix` instead of dense tensors.
 
         Example:
             Initializing a metagraph object for the Bittensor network with a specific network UID::
@@ -1230,7 +1810,9 @@ class NonTorchMetagraph(MetagraphMixin):
 
                 metagraph = Metagraph(netuid=123, network="finney", lite=True, sync=True)
         """
-        MetagraphMixin.__init__(self, netuid, network, lite, sync, subtensor, mechid)
+        MetagraphMixin.__init__(
+            self, netuid, network, lite, sync, subtensor, mechid, sparse
+        )
 
         self.netuid = netuid
         self.network, self.chain_endpoint = determine_chain_endpoint_and_network(
@@ -1249,8 +1831,12 @@ class NonTorchMetagraph(MetagraphMixin):
         self.active = np.array([], dtype=np.int64)
         self.last_update = np.array([], dtype=np.int64)
         self.validator_permit = np.array([], dtype=bool)
-        self.weights = np.array([], dtype=np.float32)
-        self.bonds = np.array([], dtype=np.int64)
+        if sparse:
+            self.weights = CSRMatrix.from_dense(np.zeros((0, 0), dtype=np.float32))
+            self.bonds = CSRMatrix.from_dense(np.zeros((0, 0), dtype=np.float32))
+        else:
+            self.weights = np.array([], dtype=np.float32)
+            self.bonds = np.array([], dtype=np.int64)
         self.uids = np.array([], dtype=np.int64)
         self.alpha_stake: Tensor = np.array([], dtype=np.int64)
         self.tao_stake: Tensor = np.array([], dtype=np.int64)
@@ -1277,8 +1863,11 @@ class NonTorchMetagraph(MetagraphMixin):
         """
         graph_filename = latest_block_path(dir_path)
         try:
-            with open(graph_filename, "rb") as graph_file:
-                state_dict = pickle.load(graph_file)
+            if ColumnarSnapshot.is_snapshot(graph_filename):
+                state_dict = ColumnarSnapshot(graph_filename).state_dict()
+            else:
+                with open(graph_filename, "rb") as graph_file:
+                    state_dict = pickle.load(graph_file)
         except pickle.UnpicklingError:
             logging.info(
                 "Unable to load file. Attempting to restore metagraph using torch."
@@ -1292,7 +1881,8 @@ class NonTorchMetagraph(MetagraphMixin):
                 with safe_globals():
                     state_dict = real_torch.load(graph_filename)
                 for key in METAGRAPH_STATE_DICT_NDARRAY_KEYS:
-                    state_dict[key] = state_dict[key].detach().numpy()
+                    if hasattr(state_dict.get(key), "detach"):
+                        state_dict[key] = state_dict[key].detach().numpy()
                 del real_torch
             except (RuntimeError, ImportError):
                 logging.error("Unable to load file. It may be corrupted.")
@@ -1315,9 +1905,9 @@ class NonTorchMetagraph(MetagraphMixin):
         self.axons = state_dict["axons"]
         self.neurons = state_dict["neurons"]
         if "weights" in state_dict:
-            self.weights = state_dict["weights"]
+            self.weights = self._load_weights_or_bonds(state_dict["weights"])
         if "bonds" in state_dict:
-            self.bonds = state_dict["bonds"]
+            self.bonds = self._load_weights_or_bonds(state_dict["bonds"])
         return self
 
 
@@ -1345,8 +1935,9 @@ class AsyncMetagraph(NumpyOrTorch):
         sync: bool = True,
         subtensor: Optional["AsyncSubtensor"] = None,
         mechid: int = 0,
+        sparse: bool = False,
     ):
-        super().__init__(netuid, network, lite, sync, subtensor, mechid)
+        super().__init__(netuid, network, lite, sync, subtensor, mechid, sparse)
 
     async def __aenter__(self):
         if self.should_sync:
@@ -1361,6 +1952,8 @@ class AsyncMetagraph(NumpyOrTorch):
         block: Optional[int] = None,
         lite: Optional[bool] = None,
         subtensor: Optional["AsyncSubtensor"] = None,
+        incremental: bool = False,
+        selective: bool = False,
     ):
         """
         Synchronizes the metagraph with the Bittensor network's current state. It updates the metagraph's attributes to
@@ -1376,6 +1969,14 @@ class AsyncMetagraph(NumpyOrTorch):
             subtensor (Optional[bittensor.core.subtensor.Subtensor]): An instance of the subtensor class from Bittensor,
                 providing an interface to the underlying blockchain data. If provided, this instance is used for data
                 retrieval during synchronization.
+            incremental (bool): If True, the previously synced state is kept and only the rows of neurons which changed
+                since the last sync are patched in place. Falls back to a full sync when the number of neurons or the
+                ``lite`` mode changed, or when the previous sync is more than ``INCREMENTAL_SYNC_MAX_BLOCK_GAP`` blocks
+                away. Defaults to `False`.
+            selective (bool): If True, the neurons, stakes and subnet information are built from a single
+                ``get_selective_mechagraph`` runtime call, plus one batched storage query for the validator trust and
+                mechanism split (and the weights and bonds maps of a non-lite sync), instead of a query per data set.
+                Defaults to `False`.
 
         Example:
             Sync the metagraph with the latest block from the subtensor, using the lite version for efficiency::
@@ -1392,6 +1993,14 @@ class AsyncMetagraph(NumpyOrTorch):
                 subtensor = Subtensor()
                 metagraph.sync(block=12345, lite=False, subtensor=subtensor)
 
+            Resync every block, patching only the neurons which changed since the previous sync::
+
+                metagraph.sync(subtensor=subtensor, incremental=True)
+
+            Sync in a single round trip from the selective mechagraph::
+
+                metagraph.sync(subtensor=subtensor, selective=True)
+
         NOTE:
             If attempting to access data beyond the previous 300 blocks, you **must** use the ``archive`` network for
                 subtensor. Light nodes are configured only to store the previous 300 blocks if connecting to finney or
@@ -1412,34 +2021,43 @@ class AsyncMetagraph(NumpyOrTorch):
 
         subtensor = await self._initialize_subtensor(subtensor)
 
-        if (
+        if block and (
             subtensor.chain_endpoint != settings.ARCHIVE_ENTRYPOINT
             or subtensor.network != "archive"
         ):
             cur_block = await subtensor.get_current_block()
-            if block and block < (cur_block - 300):
+            if block < (cur_block - 300):
                 logging.warning(
                     "Attempting to sync longer than 300 blocks ago on a non-archive node. Please use the 'archive' "
                     "network for subtensor and retry."
                 )
-        if block is None:
-            block = await subtensor.get_current_block()
-
-        # Assign neurons based on 'lite' flag
-        await self._assign_neurons(block, lite, subtensor)
 
-        # Set attributes for metagraph
-        self._set_metagraph_attributes(block)
+        previous_neurons, previous_lite = self.neurons, self.lite
 
-        # If not a 'lite' version, compute and set weights and bonds for each neuron
-        if not lite:
-            await self._set_weights_and_bonds(subtensor=subtensor, block=block)
+        if selective:
+            block = await self._assign_mechagraph(block, lite, subtensor)
+        else:
+            if block is None:
+                block = await subtensor.get_current_block()
+            # The neurons, stakes and subnet information are independent queries of the same block
+            await asyncio.gather(
+                self._assign_neurons(block, lite, subtensor),
+                self._get_all_stakes_from_chain(block=block),
+                self._apply_extra_info(block=block),
+            )
 
-        # Fills in the stake associated attributes of a class instance from a chain response.
-        await self._get_all_stakes_from_chain(block=block)
+        if incremental and self._can_sync_incrementally(
+            previous_neurons, previous_lite, lite, block
+        ):
+            # Patch only the rows of neurons which changed since the previous sync
+            self._patch_metagraph_attributes(previous_neurons, block, lite)
+        else:
+            # Set attributes for metagraph
+            self._set_metagraph_attributes(block)
 
-        # apply MetagraphInfo data to instance
-        await self._apply_extra_info(block=block)
+            # If not a 'lite' version, compute and set weights and bonds for each neuron
+            if not lite:
+                await self._set_weights_and_bonds(subtensor=subtensor, block=block)
 
     async def _initialize_subtensor(
         self, subtensor: "AsyncSubtensor"
@@ -1564,44 +2182,12 @@ class AsyncMetagraph(NumpyOrTorch):
 
                 self.root_weights = self._process_root_weights(raw_root_weights_data, "weights", subtensor)
         """
-        data_array = []
         n_subnets_, subnets = await asyncio.gather(
             subtensor.get_total_subnets(block=block), subtensor.get_subnets(block=block)
         )
         n_subnets = n_subnets_ or 0
-        for item in data:
-            if len(item) == 0:
-                if use_torch():
-                    data_array.append(torch.zeros(n_subnets))
-                else:
-                    data_array.append(np.zeros(n_subnets, dtype=np.float32))
-            else:
-                uids, values = zip(*item)
-                # TODO: Validate and test the conversion of uids and values to tensor
-                data_array.append(
-                    convert_root_weight_uids_and_vals_to_tensor(
-                        n_subnets, list(uids), list(values), subnets
-                    )
-                )
-
-        tensor_param: Union[NDArray, "torch.nn.Parameter"] = (
-            (
-                torch.nn.Parameter(torch.stack(data_array), requires_grad=False)
-                if len(data_array)
-                else torch.nn.Parameter()
-            )
-            if use_torch()
-            else (
-                np.stack(data_array)
-                if len(data_array)
-                else np.array([], dtype=np.float32)
-            )
-        )
-        if len(data_array) == 0:
-            logging.warning(
-                f"Empty {attribute}_array on metagraph.sync(). The '{attribute}' tensor is empty."
-            )
-        return tensor_param
+        matrix = convert_root_weight_uids_and_vals_to_matrix(n_subnets, data, subnets)
+        return self._weights_matrix_to_tensor(matrix, attribute)
 
     async def _get_all_stakes_from_chain(self, block: int):
         """Fills in the stake associated attributes of a class instance from a chain response."""
@@ -1651,17 +2237,82 @@ class AsyncMetagraph(NumpyOrTorch):
 
     async def _apply_extra_info(self, block: int):
         """Retrieves metagraph information for a specific subnet and applies it using a mixin."""
-        metagraph_info = await self.subtensor.get_metagraph_info(
-            netuid=self.netuid, mechid=self.mechid, block=block
+        (
+            metagraph_info,
+            self.mechanism_count,
+            self.emissions_split,
+        ) = await asyncio.gather(
+            self.subtensor.get_metagraph_info(
+                netuid=self.netuid, mechid=self.mechid, block=block
+            ),
+            self.subtensor.get_mechanism_count(netuid=self.netuid, block=block),
+            self.subtensor.get_mechanism_emission_split(
+                netuid=self.netuid, block=block
+            ),
         )
         if metagraph_info:
             self._apply_metagraph_info_mixin(metagraph_info=metagraph_info)
-        self.mechanism_count = await self.subtensor.get_mechanism_count(
-            netuid=self.netuid, block=block
+
+    async def _assign_mechagraph(
+        self, block: Optional[int], lite: bool, subtensor: "AsyncSubtensor"
+    ) -> int:
+        """
+        Assigns the neurons, stakes and subnet information from the selective mechagraph, fetched concurrently with the
+        :data:`SELECTIVE_SYNC_STORAGE_FUNCTIONS` batch and, for a non-lite sync, the weights and bonds maps. Every query
+        is pinned to the same block hash.
+
+        Args:
+            block (Optional[int]): The block number to sync to, or ``None`` for the chain head.
+            lite (bool): Whether to skip the weights and bonds.
+            subtensor (bittensor.core.async_subtensor.AsyncSubtensor): The subtensor instance used for the queries.
+
+        Returns:
+            int: The block number the metagraph was synced to.
+        """
+        if block is None:
+            block_hash = await subtensor.substrate.get_chain_head()
+        else:
+            block_hash = await subtensor.determine_block_hash(block)
+
+        storage_keys = await asyncio.gather(
+            *[
+                subtensor.substrate.create_storage_key(
+                    "SubtensorModule",
+                    storage_function,
+                    [self.netuid],
+                    block_hash=block_hash,
+                )
+                for storage_function in SELECTIVE_SYNC_STORAGE_FUNCTIONS
+            ]
         )
-        self.emissions_split = await self.subtensor.get_mechanism_emission_split(
-            netuid=self.netuid, block=block
+        requests = [
+            subtensor.get_metagraph_info(
+                netuid=self.netuid, mechid=self.mechid, block_hash=block_hash
+            ),
+            subtensor.substrate.query_multi(storage_keys, block_hash=block_hash),
+        ]
+        if not lite:
+            requests += [
+                subtensor.weights(
+                    netuid=self.netuid, block_hash=block_hash, mechid=self.mechid
+                ),
+                subtensor.bonds(
+                    netuid=self.netuid, block_hash=block_hash, mechid=self.mechid
+                ),
+            ]
+        metagraph_info, storage, *weights_and_bonds = await asyncio.gather(*requests)
+
+        if metagraph_info is None:
+            self.neurons, self.lite = [], lite
+            return block if block is not None else await subtensor.get_current_block()
+
+        self._apply_mechagraph(
+            metagraph_info,
+            {key.storage_function: value for key, value in storage},
+            lite,
+            *weights_and_bonds,
         )
+        return metagraph_info.block
 
 
 class Metagraph(NumpyOrTorch):
@@ -1673,8 +2324,9 @@ class Metagraph(NumpyOrTorch):
         sync: bool = True,
         subtensor: Optional["Subtensor"] = None,
         mechid: int = 0,
+        sparse: bool = False,
     ):
-        super().__init__(netuid, network, lite, sync, subtensor, mechid)
+        super().__init__(netuid, network, lite, sync, subtensor, mechid, sparse)
         if self.should_sync:
             self.sync()
 
@@ -1683,6 +2335,8 @@ class Metagraph(NumpyOrTorch):
         block: Optional[int] = None,
         lite: Optional[bool] = None,
         subtensor: Optional["Subtensor"] = None,
+        incremental: bool = False,
+        selective: bool = False,
     ):
         """
         Synchronizes the metagraph with the Bittensor network's current state. It updates the metagraph's attributes to
@@ -1698,6 +2352,14 @@ class Metagraph(NumpyOrTorch):
             subtensor (Optional[bittensor.core.subtensor.Subtensor]): An instance of the subtensor class from Bittensor,
                 providing an interface to the underlying blockchain data. If provided, this instance is used for data
                 retrieval during synchronization.
+            incremental (bool): If True, the previously synced state is kept and only the rows of neurons which changed
+                since the last sync are patched in place. Falls back to a full sync when the number of neurons or the
+                ``lite`` mode changed, or when the previous sync is more than ``INCREMENTAL_SYNC_MAX_BLOCK_GAP`` blocks
+                away. Defaults to `False`.
+            selective (bool): If True, the neurons, stakes and subnet information are built from a single
+                ``get_selective_mechagraph`` runtime call, plus one batched storage query for the validator trust and
+                mechanism split (and the weights and bonds maps of a non-lite sync), instead of a query per data set.
+                Defaults to `False`.
 
         Example:
             Sync the metagraph with the latest block from the subtensor, using the lite version for efficiency::
@@ -1714,6 +2376,14 @@ class Metagraph(NumpyOrTorch):
                 subtensor = Subtensor()
                 metagraph.sync(block=12345, lite=False, subtensor=subtensor)
 
+            Resync every block, patching only the neurons which changed since the previous sync::
+
+                metagraph.sync(subtensor=subtensor, incremental=True)
+
+            Sync in a single round trip from the selective mechagraph::
+
+                metagraph.sync(subtensor=subtensor, selective=True)
+
         NOTE:
             If attempting to access data beyond the previous 300 blocks, you **must** use the ``archive`` network for
                 subtensor. Light nodes are configured only to store the previous 300 blocks if connecting to finney or
@@ -1735,35 +2405,46 @@ class Metagraph(NumpyOrTorch):
         # Initialize subtensor
         subtensor = self._initialize_subtensor(subtensor=subtensor)
 
-        if (
+        if block and (
             subtensor.chain_endpoint != settings.ARCHIVE_ENTRYPOINT
             or subtensor.network != "archive"
         ):
             cur_block = subtensor.get_current_block()
-            if block and block < (cur_block - 300):
+            if block < (cur_block - 300):
                 logging.warning(
                     "Attempting to sync longer than 300 blocks ago on a non-archive node. Please use the 'archive' "
                     "network for subtensor and retry."
                 )
 
-        if block is None:
-            block = subtensor.get_current_block()
+        previous_neurons, previous_lite = self.neurons, self.lite
 
-        # Assign neurons based on 'lite' flag
-        self._assign_neurons(block, lite, subtensor)
+        if selective:
+            block = self._assign_mechagraph(block, lite, subtensor)
+        else:
+            if block is None:
+                block = subtensor.get_current_block()
+            # Assign neurons based on 'lite' flag
+            self._assign_neurons(block, lite, subtensor)
 
-        # Set attributes for metagraph
-        self._set_metagraph_attributes(block)
+        if incremental and self._can_sync_incrementally(
+            previous_neurons, previous_lite, lite, block
+        ):
+            # Patch only the rows of neurons which changed since the previous sync
+            self._patch_metagraph_attributes(previous_neurons, block, lite)
+        else:
+            # Set attributes for metagraph
+            self._set_metagraph_attributes(block)
 
-        # If not a 'lite' version, compute and set weights and bonds for each neuron
-        if not lite:
-            self._set_weights_and_bonds(subtensor=subtensor, block=block)
+            # If not a 'lite' version, compute and set weights and bonds for each neuron
+            if not lite:
+                self._set_weights_and_bonds(subtensor=subtensor, block=block)
 
-        # Fills in the stake associated attributes of a class instance from a chain response.
-        self._get_all_stakes_from_chain(block=block)
+        if not selective:
+            # Fills in the stake associated attributes of a class instance from a chain response.
+            self._get_all_stakes_from_chain(block=block)
 
-        # apply MetagraphInfo data to instance
-        self._apply_extra_info(block=block)
+            # apply MetagraphInfo data to instance
+            self._apply_extra_info(block=block)
 
     def _initialize_subtensor(self, subtensor: "Subtensor") -> "Subtensor":
         """
@@ -1881,42 +2562,10 @@ class Metagraph(NumpyOrTorch):
 
                 self.root_weights = self._process_root_weights(raw_root_weights_data, "weights", subtensor)
         """
-        data_array = []
         n_subnets = subtensor.get_total_subnets(block=block) or 0
         subnets = subtensor.get_subnets(block=block)
-        for item in data:
-            if len(item) == 0:
-                if use_torch():
-                    data_array.append(torch.zeros(n_subnets))
-                else:
-                    data_array.append(np.zeros(n_subnets, dtype=np.float32))
-            else:
-                uids, values = zip(*item)
-                # TODO: Validate and test the conversion of uids and values to tensor
-                data_array.append(
-                    convert_root_weight_uids_and_vals_to_tensor(
-                        n_subnets, list(uids), list(values), subnets
-                    )
-                )
-
-        tensor_param: Union[NDArray, "torch.nn.Parameter"] = (
-            (
-                torch.nn.Parameter(torch.stack(data_array), requires_grad=False)
-                if len(data_array)
-                else torch.nn.Parameter()
-            )
-            if use_torch()
-            else (
-                np.stack(data_array)
-                if len(data_array)
-                else np.array([], dtype=np.float32)
-            )
-        )
-        if len(data_array) == 0:
-            logging.warning(
-                f"Empty {attribute}_array on metagraph.sync(). The '{attribute}' tensor is empty."
-            )
-        return tensor_param
+        matrix = convert_root_weight_uids_and_vals_to_matrix(n_subnets, data, subnets)
+        return self._weights_matrix_to_tensor(matrix, attribute)
 
     def _get_all_stakes_from_chain(self, block: int):
         """Fills in the stake associated attributes of a class instance from a chain response."""
@@ -1978,6 +2627,72 @@ class Metagraph(NumpyOrTorch):
             netuid=self.netuid, block=block
         )
 
+    def _assign_mechagraph(
+        self, block: Optional[int], lite: bool, subtensor: "Subtensor"
+    ) -> int:
+        """
+        Assigns the neurons, stakes and subnet information from the selective mechagraph, completed by a single batch
+        of the :data:`SELECTIVE_SYNC_STORAGE_FUNCTIONS` items and, for a non-lite sync, the weights and bonds of each
+        UID, queried at the block of the mechagraph.
+
+        The mechagraph carries its block number but not its hash, and the queries of the synchronous client are keyed
+        by block number, so the hash is looked up in between. For an explicit ``block``, the lookup is answered by
+        the block hash cache filled by the mechagraph query; at the chain head, it costs one more round trip.
+
+        Args:
+            block (Optional[int]): The block number to sync to, or ``None`` for the chain head.
+            lite (bool): Whether to skip the weights and bonds.
+            subtensor (bittensor.core.subtensor.Subtensor): The subtensor instance used for the queries.
+
+        Returns:
+            int: The block number the metagraph was synced to.
+        """
+        metagraph_info = subtensor.get_metagraph_info(
+            netuid=self.netuid, mechid=self.mechid, block=block
+        )
+        if metagraph_info is None:
+            self.neurons, self.lite = [], lite
+            return block if block is not None else subtensor.get_current_block()
+
+        block = metagraph_info.block
+        block_hash = subtensor.determine_block_hash(block)
+        queries = [
+            ("SubtensorModule", storage_function, [self.netuid])
+            for storage_function in SELECTIVE_SYNC_STORAGE_FUNCTIONS
+        ]
+        if not lite:
+            storage_index = get_mechid_storage_index(self.netuid, self.mechid)
+            queries += [
+                ("SubtensorModule", storage_function, [storage_index, uid])
+                for storage_function in ("Weights", "Bonds")
+                for uid in range(len(metagraph_info.hotkeys))
+            ]
+        results = subtensor.substrate.query_multi(
+            [
+                subtensor.substrate.create_storage_key(*query, block_hash=block_hash)
+                for query in queries
+            ],
+            block_hash=block_hash,
+        )
+
+        storage, weights, bonds = {}, [], []
+        for key, value in results:
+            if key.storage_function == "Weights":
+                weights.append((key.params[1], value or []))
+            elif key.storage_function == "Bonds":
+                if value:
+                    bonds.append((key.params[1], value))
+            else:
+                storage[key.storage_function] = value
+
+        self._apply_mechagraph(
+            metagraph_info,
+            storage,
+            lite,
+            *([] if lite else [weights, bonds]),
+        )
+        return block
+
 
 async def async_metagraph(
     netuid: int,
@@ -0,0 +1,303 @@
+"""Block-scoped cache of the chain reads made by `Subtensor` and `AsyncSubtensor`."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from bittensor.core.settings import BLOCKTIME
+
+QUERY_CACHE_MAX_SIZE = 4096
+"""Default maximum number of reads kept by a :class:`QueryCache`."""
+
+_MISSING = object()
+
+
+def _freeze(value: Any) -> Hashable:
+    """Returns a hashable equivalent of query params made of lists, tuples and dicts."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+
+class QueryCache:
+    """
+    Bounded, least recently used cache of chain reads, scoped to the block they were made at.
+
+    Reads at a given block hash never change, so they are kept until evicted. Reads at the chain head, made without a
+    block hash, expire once the chain has advanced by ``latest_ttl_blocks`` blocks since they were made. The chain head
+    is tracked from the current block numbers fetched through the cache, and estimated from ``block_time`` in between,
+    so head reads may lag the chain by up to ``latest_ttl_blocks`` blocks.
+
+    A cache can be shared by several Subtensor instances connected to the same chain. It is thread-safe.
+
+    Args:
+        max_size (int): Maximum number of cached reads.
+        latest_ttl_blocks (int): Number of blocks a read at the chain head is kept for.
+        block_time (float): The chain block time, in seconds.
+
+    Example::
+
+        subtensor = Subtensor(network="finney", query_cache=QueryCache())
+        subtensor.tempo(netuid=1)
+        subtensor.tempo(netuid=1)  # served from the cache
+        print(subtensor.query_cache.metrics)
+    """
+
+    def __init__(
+        self,
+        max_size: int = QUERY_CACHE_MAX_SIZE,
+        latest_ttl_blocks: int = 1,
+        block_time: float = BLOCKTIME,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be a positive integer.")
+        if latest_ttl_blocks < 1:
+            raise ValueError("latest_ttl_blocks must be a positive integer.")
+        self.max_size = max_size
+        self.latest_ttl_blocks = latest_ttl_blocks
+        self.block_time = block_time
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self.expired = 0
+        # (block hash, *read) -> (value, head block number, monotonic time) of the read, the last two for head reads
+        self._entries: OrderedDict[tuple, tuple[Any, Optional[int], float]] = (
+            OrderedDict()
+        )
+        self._head: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def metrics(self) -> dict[str, int]:
+        """Returns the number of cached reads, and the hit, miss, eviction and expiration totals."""
+        return {
+            "size": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evicted": self.evicted,
+            "expired": self.expired,
+        }
+
+    @staticmethod
+    def key(block_hash: Optional[str], *read: Any) -> Optional[tuple]:
+        """
+        Returns the cache key of a read, or ``None`` if the read cannot be cached.
+
+        Args:
+            block_hash: The hash of the block the read is made at, ``None`` for the chain head.
+            read: The read method, and the module, storage function and params of the read.
+        """
+        key = (block_hash, *_freeze(read))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def observe_head(self, block_number: int):
+        """Records the chain head block number, expiring the reads made at older heads."""
+        with self._lock:
+            if self._head is None or block_number > self._head:
+                self._head = block_number
+
+    def _is_expired(self, head: Optional[int], stored_at: float) -> bool:
+        if self._head is not None and head is not None:
+            if self._head - head >= self.latest_ttl_blocks:
+                return True
+        return time.monotonic() - stored_at >= self.latest_ttl_blocks * self.block_time
+
+    def get(self, key: tuple, default: Any = None) -> Any:
+        """Returns the cached value of a read, or ``default`` on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and key[0] is None and self._is_expired(*entry[1:]):
+                del self._entries[key]
+                self.expired += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: tuple, value: Any):
+        """Caches the value of a read, evicting the least recently used reads beyond ``max_size``."""
+        with self._lock:
+            self._entries[key] = (value, self._head, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evicted += 1
+
+    def clear(self):
+        """Drops every cached read."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class CachedSubstrate:
+    """
+    Wraps a substrate interface, serving its storage, constant, runtime API and block hash reads from a
+    :class:`QueryCache`. Every other attribute is the wrapped interface's.
+    """
+
+    def __init__(self, substrate, cache: QueryCache):
+        self.substrate = substrate
+        self.cache = cache
+
+    def __getattr__(self, name: str):
+        return getattr(self.substrate, name)
+
+    # Special methods are looked up on the type, bypassing `__getattr__`
+    def __enter__(self) -> "CachedSubstrate":
+        self.substrate.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return self.substrate.__exit__(exc_type, exc_val, exc_tb)
+
+    def _read(self, key: Optional[tuple], fetch: Callable[[], Any]) -> Any:
+        if key is None:
+            return fetch()
+        value = self.cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = fetch()
+            self.cache.set(key, value)
+        return value
+
+    def query(self, module, storage_function, params=None, block_hash=None, **kwargs):
+        def fetch():
+            return self.substrate.query(
+                module, storage_function, params, block_hash, **kwargs
+            )
+
+        if any(kwargs.values()):
+            # Raw storage keys, subscriptions and reused block hashes are not cached
+            return fetch()
+        return self._read(
+            self.cache.key(block_hash, "query", module, storage_function, params),
+            fetch,
+        )
+
+    def get_constant(self, module_name, constant_name, block_hash=None, **kwargs):
+        def fetch():
+            return self.substrate.get_constant(
+                module_name, constant_name, block_hash, **kwargs
+            )
+
+        if any(kwargs.values()):
+            return fetch()
+        return self._read(
+            self.cache.key(block_hash, "constant", module_name, constant_name), fetch
+        )
+
+    def runtime_call(self, api, method, params=None, block_hash=None):
+        return self._read(
+            self.cache.key(block_hash, "runtime_call", api, method, params),
+            lambda: self.substrate.runtime_call(api, method, params, block_hash),
+        )
+
+    def get_block_hash(self, block_id: int) -> str:
+        # Block numbers are assumed final, so their hashes are not scoped to a block
+        return self._read(
+            self.cache.key("", "block_hash", block_id),
+            lambda: self.substrate.get_block_hash(block_id),
+        )
+
+    def get_block_number(self, block_hash: Optional[str] = None) -> int:
+        if block_hash is not None:
+            return self._read(
+                self.cache.key(block_hash, "block_number"),
+                lambda: self.substrate.get_block_number(block_hash),
+            )
+        block_number = self.substrate.get_block_number(None)
+        self.cache.observe_head(block_number)
+        return block_number
+
+
+class AsyncCachedSubstrate:
+    """The :class:`CachedSubstrate` counterpart wrapping an async substrate interface."""
+
+    def __init__(self, substrate, cache: QueryCache):
+        self.substrate = substrate
+        self.cache = cache
+
+    def __getattr__(self, name: str):
+        return getattr(self.substrate, name)
+
+    # Special methods are looked up on the type, bypassing `__getattr__`
+    async def __aenter__(self) -> "AsyncCachedSubstrate":
+        await self.substrate.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return await self.substrate.__aexit__(exc_type, exc_val, exc_tb)
+
+    async def _read(
+        self, key: Optional[tuple], fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        if key is None:
+            return await fetch()
+        value = self.cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = await fetch()
+            self.cache.set(key, value)
+        return value
+
+    async def query(
+        self, module, storage_function, params=None, block_hash=None, **kwargs
+    ):
+        def fetch():
+            return self.substrate.query(
+                module, storage_function, params, block_hash, **kwargs
+            )
+
+        if any(kwargs.values()):
+            # Raw storage keys, subscriptions and reused block hashes are not cached
+            return await fetch()
+        return await self._read(
+            self.cache.key(block_hash, "query", module, storage_function, params),
+            fetch,
+        )
+
+    async def get_constant(self, module_name, constant_name, block_hash=None, **kwargs):
+        def fetch():
+            return self.substrate.get_constant(
+                module_name, constant_name, block_hash, **kwargs
+            )
+
+        if any(kwargs.values()):
+            return await fetch()
+        return await self._read(
+            self.cache.key(block_hash, "constant", module_name, constant_name), fetch
+        )
+
+    async def runtime_call(self, api, method, params=None, block_hash=None):
+        return await self._read(
+            self.cache.key(block_hash, "runtime_call", api, method, params),
+            lambda: self.substrate.runtime_call(api, method, params, block_hash),
+        )
+
+    async def get_block_hash(self, block_id: int) -> str:
+        # Block numbers are assumed final, so their hashes are not scoped to a block
+        return await self._read(
+            self.cache.key("", "block_hash", block_id),
+            lambda: self.substrate.get_block_hash(block_id),
+        )
+
+    async def get_block_number(self, block_hash: Optional[str] = None) -> int:
+        if block_hash is not None:
+            return await self._read(
+                self.cache.key(block_hash, "block_number"),
+                lambda: self.substrate.get_block_number(block_hash),
+            )
+        block_number = await self.substrate.get_block_number(None)
+        self.cache.observe_head(block_number)
+        return block_number
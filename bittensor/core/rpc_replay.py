@@ -0,0 +1,333 @@
+"""Recording of the RPC traffic of a chain session, and replay of it in place of a node."""
+
+import asyncio
+import gzip
+import itertools
+import json
+import time
+from collections import deque
+from typing import Any, Optional
+
+from async_substrate_interface import AsyncSubstrateInterface, SubstrateInterface
+from websockets.protocol import State
+
+RPC_RECORDING_VERSION = 1
+"""Version of the file format written by :func:`RpcRecording.save`."""
+
+# Extrinsics are never signed twice the same, sr25519 signatures being randomized, so their submissions are replayed
+# in the recorded order, whatever their params.
+_UNKEYED_METHODS = frozenset(
+    {"author_submitExtrinsic", "author_submitAndWatchExtrinsic"}
+)
+
+
+def _params_key(params: Any) -> str:
+    return json.dumps(params)
+
+
+class RpcRecording:
+    """
+    The RPC responses of a chain session, by method and params, and the notifications of its subscriptions.
+
+    Example::
+
+        recording = RpcRecording()
+        with Subtensor(network="finney", rpc_recording=recording) as subtensor:
+            subtensor.metagraph(netuid=1)
+        recording.save("finney.json.gz")
+    """
+
+    def __init__(self):
+        # method -> params -> responses, in the order they were received
+        self.responses: dict[str, dict[str, list[dict]]] = {}
+        # subscription id -> notifications, in the order they were received
+        self.notifications: dict[str, list[dict]] = {}
+        self._pending: dict[str, tuple[str, str]] = {}
+
+    def __len__(self) -> int:
+        return sum(
+            len(responses)
+            for by_params in self.responses.values()
+            for responses in by_params.values()
+        )
+
+    def request(self, payload: dict):
+        """Records a request sent to the node, to match it with its response."""
+        self._pending[payload["id"]] = (
+            payload["method"],
+            _params_key(payload.get("params", [])),
+        )
+
+    def receive(self, message: dict):
+        """Records a response, or subscription notification, received from the node."""
+        message = {key: value for key, value in message.items() if key != "jsonrpc"}
+        if "id" in message:
+            request = self._pending.pop(message.pop("id"), None)
+            if request is not None:
+                method, params = request
+                self.responses.setdefault(method, {}).setdefault(params, []).append(
+                    message
+                )
+        elif "params" in message:
+            subscription = message["params"]["subscription"]
+            self.notifications.setdefault(subscription, []).append(message)
+
+    def save(self, path: str):
+        """Writes the recording to a gzip-compressed JSON file."""
+        data = {
+            "version": RPC_RECORDING_VERSION,
+            "responses": self.responses,
+            "notifications": self.notifications,
+        }
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            json.dump(data, file, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str) -> "RpcRecording":
+        """Reads a recording written by :func:`save`."""
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            data = json.load(file)
+        if data.get("version") != RPC_RECORDING_VERSION:
+            raise ValueError(
+                f"Unsupported RPC recording version {data.get('version')} in {path}."
+            )
+        recording = cls()
+        recording.responses = data["responses"]
+        recording.notifications = data["notifications"]
+        return recording
+
+
+class RpcReplay:
+    """
+    Answers RPC requests from an :class:`RpcRecording`, as the recorded node did.
+
+    Each request gets the next recorded response to its method and params, or the last one once they are all served, so
+    a session replays as it was recorded, then keeps seeing the final state of the chain. Extrinsic submissions get the
+    next recorded submission response, whatever their params. Requests that were not recorded get a JSON-RPC error.
+
+    Args:
+        recording: The recording to answer from.
+        latency: Number of seconds between a request and its response, and the notifications of the subscription it
+            opens.
+
+    Example::
+
+        replay = RpcReplay(RpcRecording.load("finney.json.gz"), latency=0.05)
+        subtensor = Subtensor(network="finney", rpc_replay=replay)
+        subtensor.metagraph(netuid=1)
+    """
+
+    def __init__(self, recording: RpcRecording, latency: float = 0.0):
+        self.recording = recording
+        self.latency = latency
+        self._served: dict[tuple[str, Optional[str]], int] = {}
+
+    def respond(self, payload: dict) -> list[dict]:
+        """Returns the response to a request, followed by the notifications of the subscription it opens."""
+        method = payload["method"]
+        params = _params_key(payload.get("params", []))
+        by_params = self.recording.responses.get(method, {})
+        if method in _UNKEYED_METHODS:
+            key = (method, None)
+            responses = list(itertools.chain.from_iterable(by_params.values()))
+        else:
+            key = (method, params)
+            responses = by_params.get(params)
+
+        if not responses:
+            return [
+                {
+                    "jsonrpc": "2.0",
+                    "id": payload["id"],
+                    "error": {
+                        "code": -32601,
+                        "message": f"No recorded response to {method} {params}.",
+                    },
+                }
+            ]
+        served = self._served.get(key, 0)
+        self._served[key] = served + 1
+        response = responses[min(served, len(responses) - 1)]
+
+        messages = [{"jsonrpc": "2.0", **response, "id": payload["id"]}]
+        subscription = response.get("result")
+        if isinstance(subscription, str):
+            messages.extend(
+                {"jsonrpc": "2.0", **notification}
+                for notification in self.recording.notifications.get(subscription, [])
+            )
+        return messages
+
+
+class _RecordingConnection:
+    """Websocket connection recording the messages it sends and receives."""
+
+    def __init__(self, ws, recording: RpcRecording):
+        self._ws = ws
+        self.recording = recording
+
+    def __getattr__(self, name: str):
+        return getattr(self._ws, name)
+
+    def send(self, message: str, *args, **kwargs):
+        self.recording.request(json.loads(message))
+        return self._ws.send(message, *args, **kwargs)
+
+    def recv(self, *args, **kwargs):
+        message = self._ws.recv(*args, **kwargs)
+        self.recording.receive(json.loads(message))
+        return message
+
+
+class _ReplayConnection:
+    """Websocket connection answering the messages it sends from an :class:`RpcReplay`."""
+
+    close_code = None
+
+    def __init__(self, replay: RpcReplay):
+        self.replay = replay
+        self._messages: deque[tuple[float, bytes]] = deque()
+
+    def send(self, message: str, *args, **kwargs):
+        ready_at = time.monotonic() + self.replay.latency
+        for response in self.replay.respond(json.loads(message)):
+            self._messages.append((ready_at, json.dumps(response).encode()))
+
+    def recv(self, *args, **kwargs) -> bytes:
+        if not self._messages:
+            # Like a node that stopped answering, e.g. a subscription waiting for more notifications than recorded
+            raise TimeoutError("No recorded message left to replay.")
+        ready_at, message = self._messages.popleft()
+        if (delay := ready_at - time.monotonic()) > 0:
+            time.sleep(delay)
+        return message
+
+    def close(self, *args, **kwargs):
+        pass
+
+
+class _RecordingWebsocket:
+    """Async websocket manager recording the requests it sends and the messages it retrieves."""
+
+    def __init__(self, ws, recording: RpcRecording):
+        self._ws = ws
+        self.recording = recording
+
+    def __getattr__(self, name: str):
+        return getattr(self._ws, name)
+
+    async def __aenter__(self):
+        await self._ws.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self._ws.__aexit__(exc_type, exc_val, exc_tb)
+
+    async def send(self, payload: dict) -> str:
+        item_id = await self._ws.send(payload)
+        self.recording.request({**payload, "id": item_id})
+        return item_id
+
+    async def retrieve(self, item_id: str) -> Optional[dict]:
+        message = await self._ws.retrieve(item_id)
+        if message is not None:
+            self.recording.receive(message)
+        return message
+
+
+class _ReplayWebsocket:
+    """Async websocket manager answering the requests it sends from an :class:`RpcReplay`."""
+
+    state = State.OPEN
+
+    def __init__(self, replay: RpcReplay):
+        self.replay = replay
+        self._ids = itertools.count()
+        # request or subscription id -> (time it is ready at, message)
+        self._messages: dict[str, deque[tuple[float, dict]]] = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def connect(self, force: bool = False):
+        pass
+
+    async def shutdown(self):
+        pass
+
+    async def mark_waiting_for_response(self):
+        pass
+
+    async def mark_response_received(self):
+        pass
+
+    async def send(self, payload: dict) -> str:
+        item_id = f"replay{next(self._ids)}"
+        ready_at = asyncio.get_running_loop().time() + self.replay.latency
+        response, *notifications = self.replay.respond({**payload, "id": item_id})
+        self._messages.setdefault(item_id, deque()).append((ready_at, response))
+        for notification in notifications:
+            subscription = notification["params"]["subscription"]
+            self._messages.setdefault(subscription, deque()).append(
+                (ready_at, notification)
+            )
+        return item_id
+
+    async def retrieve(self, item_id: str) -> Optional[dict]:
+        messages = self._messages.get(item_id)
+        if not messages or messages[0][0] > asyncio.get_running_loop().time():
+            return None
+        _, message = messages.popleft()
+        if not messages:
+            del self._messages[item_id]
+        return message
+
+    async def unsubscribe(self, subscription_id: str, method: Optional[str] = None):
+        self._messages.pop(subscription_id, None)
+
+
+class RecordingSubstrateInterface(SubstrateInterface):
+    """SubstrateInterface recording its RPC traffic into an :class:`RpcRecording`."""
+
+    def __init__(self, recording: RpcRecording, *args, **kwargs):
+        self.recording = recording
+        super().__init__(*args, **kwargs)
+
+    def connect(self, init=False):
+        ws = super().connect(init)
+        if isinstance(ws, _RecordingConnection):
+            return ws
+        return _RecordingConnection(ws, self.recording)
+
+
+class ReplaySubstrateInterface(SubstrateInterface):
+    """SubstrateInterface answered by an :class:`RpcReplay` instead of a node."""
+
+    def __init__(self, replay: RpcReplay, *args, **kwargs):
+        self.replay = replay
+        self._connection = _ReplayConnection(replay)
+        super().__init__(*args, **kwargs)
+
+    def connect(self, init=False):
+        return self._connection
+
+
+class RecordingAsyncSubstrateInterface(AsyncSubstrateInterface):
+    """AsyncSubstrateInterface recording its RPC traffic into an :class:`RpcRecording`."""
+
+    def __init__(self, recording: RpcRecording, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.recording = recording
+        self.ws = _RecordingWebsocket(self.ws, recording)
+
+
+class ReplayAsyncSubstrateInterface(AsyncSubstrateInterface):
+    """AsyncSubstrateInterface answered by an :class:`RpcReplay` instead of a node."""
+
+    def __init__(self, replay: RpcReplay, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replay = replay
+        self.ws = _ReplayWebsocket(replay)
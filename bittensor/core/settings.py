@@ -98,6 +98,10 @@ TYPE_REGISTRY: dict[str, dict] = {
 
 _BT_AXON_PORT = os.getenv("BT_AXON_PORT")
 _BT_AXON_MAX_WORKERS = os.getenv("BT_AXON_MAX_WORKERS")
+_BT_AXON_MAX_CONCURRENT_REQUESTS = os.getenv("BT_AXON_MAX_CONCURRENT_REQUESTS")
+_BT_AXON_MAX_QUEUED_REQUESTS = os.getenv("BT_AXON_MAX_QUEUED_REQUESTS")
+_BT_AXON_WORKERS = os.getenv("BT_AXON_WORKERS")
+_BT_AXON_CRYPTO_WORKERS = os.getenv("BT_AXON_CRYPTO_WORKERS")
 _BT_PRIORITY_MAX_WORKERS = os.getenv("BT_PRIORITY_MAX_WORKERS")
 _BT_PRIORITY_MAXSIZE = os.getenv("BT_PRIORITY_MAXSIZE")
 
@@ -109,6 +113,17 @@ DEFAULTS = munchify(
             "external_port": os.getenv("BT_AXON_EXTERNAL_PORT") or None,
             "external_ip": os.getenv("BT_AXON_EXTERNAL_IP") or None,
             "max_workers": int(_BT_AXON_MAX_WORKERS) if _BT_AXON_MAX_WORKERS else 10,
+            "max_concurrent_requests": int(_BT_AXON_MAX_CONCURRENT_REQUESTS)
+            if _BT_AXON_MAX_CONCURRENT_REQUESTS
+            else None,
+            "max_queued_requests": int(_BT_AXON_MAX_QUEUED_REQUESTS)
+            if _BT_AXON_MAX_QUEUED_REQUESTS
+            else 256,
+            "workers": int(_BT_AXON_WORKERS) if _BT_AXON_WORKERS else 1,
+            "crypto_workers": int(_BT_AXON_CRYPTO_WORKERS)
+            if _BT_AXON_CRYPTO_WORKERS
+            else 0,
+            "crypto_processes": os.getenv("BT_AXON_CRYPTO_PROCESSES") or False,
         },
         "logging": {
             "debug": os.getenv("BT_LOGGING_DEBUG") or False,
@@ -13,7 +13,9 @@ from bittensor_drand import get_encrypted_commitment
 
 from bittensor.core.async_subtensor import ProposalVoteData
 from bittensor.core.axon import Axon
+from bittensor.core.block_hub import BlockHub
 from bittensor.core.chain_data import (
+    ColumnarMetagraphInfo,
     DelegatedInfo,
     DelegateInfo,
     DynamicInfo,
@@ -51,6 +53,7 @@ from bittensor.core.extrinsics.mechanism import (
     commit_mechanism_weights_extrinsic,
     commit_timelocked_mechanism_weights_extrinsic,
     reveal_mechanism_weights_extrinsic,
+    set_mechanism_weights_batch_extrinsic,
     set_mechanism_weights_extrinsic,
 )
 from bittensor.core.extrinsics.move_stake import (
@@ -91,6 +94,13 @@ from bittensor.core.extrinsics.unstaking import (
     unstake_multiple_extrinsic,
 )
 from bittensor.core.metagraph import Metagraph
+from bittensor.core.query_cache import CachedSubstrate, QueryCache
+from bittensor.core.rpc_replay import (
+    RecordingSubstrateInterface,
+    ReplaySubstrateInterface,
+    RpcRecording,
+    RpcReplay,
+)
 from bittensor.core.settings import (
     version_as_int,
     DEFAULT_PERIOD,
@@ -152,6 +162,9 @@ class Subtensor(SubtensorMixin):
         retry_forever: bool = False,
         _mock: bool = False,
         archive_endpoints: Optional[list[str]] = None,
+        query_cache: Optional[QueryCache] = None,
+        rpc_recording: Optional[RpcRecording] = None,
+        rpc_replay: Optional[RpcReplay] = None,
     ):
         """
         Initializes an instance of the Subtensor class.
@@ -167,6 +180,12 @@ class Subtensor(SubtensorMixin):
             archive_endpoints: Similar to fallback_endpoints, but specifically only archive nodes. Will be used in cases
                 where you are requesting a block that is too old for your current (presumably lite) node. Defaults to
                 `None`
+            query_cache: Cache of the storage, constant, runtime API and block hash reads, scoped to the block they
+                are made at. Disabled by default. See :class:`bittensor.core.query_cache.QueryCache`.
+            rpc_recording: Recording to capture the RPC traffic of the session into, to replay it later. Fallback and
+                archive endpoints are not used while recording.
+            rpc_replay: Replay of a recorded session, answering the RPC requests instead of the network. See
+                :class:`bittensor.core.rpc_replay.RpcReplay`.
 
         Raises:
             Any exceptions raised during the setup, configuration, or connection process.
@@ -183,12 +202,21 @@ class Subtensor(SubtensorMixin):
             f"Connecting to network: [blue]{self.network}[/blue], "
             f"chain_endpoint: [blue]{self.chain_endpoint}[/blue]> ..."
         )
-        self.substrate = self._get_substrate(
+        self._substrate_args = dict(
             fallback_endpoints=fallback_endpoints,
             retry_forever=retry_forever,
             _mock=_mock,
             archive_endpoints=archive_endpoints,
+            rpc_recording=rpc_recording,
+            rpc_replay=rpc_replay,
         )
+        self.substrate = self._get_substrate(**self._substrate_args)
+        self.query_cache = query_cache
+        self._block_hub: Optional[BlockHub] = None
+        if query_cache is not None:
+            self.substrate = CachedSubstrate(self.substrate, query_cache)
+        # Cached per instance, a cache on the method would be shared by all instances and keep them alive.
+        self._get_block_hash = lru_cache(maxsize=128)(self._get_block_hash)
         if self.log_verbose:
             logging.info(
                 f"Connected to {self.network} network and {self.chain_endpoint}."
@@ -201,15 +229,33 @@ class Subtensor(SubtensorMixin):
         self.close()
 
     def close(self):
-        """Closes the websocket connection."""
+        """Closes the websocket connection, and the block header subscription if open."""
+        if self._block_hub is not None:
+            self._block_hub.close()
+            self._block_hub = None
         self.substrate.close()
 
+    @property
+    def block_hub(self) -> BlockHub:
+        """
+        The block header subscription shared by all the listeners of this instance, opened on its own connection.
+
+        See :class:`bittensor.core.block_hub.BlockHub`.
+        """
+        if self._block_hub is None:
+            self._block_hub = BlockHub(
+                lambda: self._get_substrate(**self._substrate_args)
+            )
+        return self._block_hub
+
     def _get_substrate(
         self,
         fallback_endpoints: Optional[list[str]] = None,
         retry_forever: bool = False,
         _mock: bool = False,
         archive_endpoints: Optional[list[str]] = None,
+        rpc_recording: Optional[RpcRecording] = None,
+        rpc_replay: Optional[RpcReplay] = None,
     ) -> Union[SubstrateInterface, RetrySyncSubstrate]:
         """Creates the Substrate instance based on provided arguments.
 
@@ -221,10 +267,24 @@ class Subtensor(SubtensorMixin):
             archive_endpoints: Similar to fallback_endpoints, but specifically only archive nodes. Will be used in cases
                 where you are requesting a block that is too old for your current (presumably lite) node. Defaults to
                 `None`
+            rpc_recording: Recording to capture the RPC traffic into. Defaults to `None`.
+            rpc_replay: Replay answering the RPC requests instead of the network. Defaults to `None`.
 
         Returns:
             the instance of the SubstrateInterface or RetrySyncSubstrate class.
         """
+        if rpc_replay is not None or rpc_recording is not None:
+            substrate_args = dict(
+                url=self.chain_endpoint,
+                ss58_format=SS58_FORMAT,
+                type_registry=TYPE_REGISTRY,
+                use_remote_preset=True,
+                chain_name="Bittensor",
+                _mock=_mock,
+            )
+            if rpc_replay is not None:
+                return ReplaySubstrateInterface(rpc_replay, **substrate_args)
+            return RecordingSubstrateInterface(rpc_recording, **substrate_args)
         if fallback_endpoints or retry_forever or archive_endpoints:
             return RetrySyncSubstrate(
                 url=self.chain_endpoint,
@@ -790,7 +850,6 @@ class Subtensor(SubtensorMixin):
         """
         return self.substrate.get_block_number(None)
 
-    @lru_cache(maxsize=128)
     def _get_block_hash(self, block_id: int):
         return self.substrate.get_block_hash(block_id)
 
@@ -1415,6 +1474,7 @@ class Subtensor(SubtensorMixin):
         field_indices: Optional[Union[list[SelectiveMetagraphIndex], list[int]]] = None,
         block: Optional[int] = None,
         mechid: int = 0,
+        columnar: bool = False,
     ) -> Optional[MetagraphInfo]:
         """
         Retrieves full or partial metagraph information for the specified subnet mechanism (netuid, mechid).
@@ -1425,6 +1485,8 @@ class Subtensor(SubtensorMixin):
                 If not provided, all available fields will be returned.
             block: The block number at which to query the data.
             mechid: Subnet mechanism unique identifier.
+            columnar: If True then returns a ColumnarMetagraphInfo, keeping the per-UID vectors as numpy arrays which
+                are only converted to Balance objects and ss58 addresses on access.
 
         Returns:
             MetagraphInfo object with the requested subnet mechanism data, None if the subnet mechanism does not exist.
@@ -1477,13 +1539,15 @@ class Subtensor(SubtensorMixin):
             )
             return None
 
-        return MetagraphInfo.from_dict(query.value)
+        info_class = ColumnarMetagraphInfo if columnar else MetagraphInfo
+        return info_class.from_dict(query.value)
 
     # TODO: update parameters order in SDKv10
     def get_all_metagraphs_info(
         self,
         block: Optional[int] = None,
         all_mechanisms: bool = False,
+        columnar: bool = False,
     ) -> Optional[list[MetagraphInfo]]:
         """
         Retrieves a list of MetagraphInfo objects for all subnets
@@ -1491,6 +1555,8 @@ class Subtensor(SubtensorMixin):
         Parameters:
             block: The blockchain block number for the query.
             all_mechanisms: If True then returns all mechanisms, otherwise only those with index 0 for all subnets.
+            columnar: If True then returns ColumnarMetagraphInfo objects, keeping the per-UID vectors as numpy arrays
+                which are only converted to Balance objects and ss58 addresses on access.
 
         Returns:
             List of MetagraphInfo objects for all existing subnets.
@@ -1508,7 +1574,8 @@ class Subtensor(SubtensorMixin):
         if query is None or not hasattr(query, "value"):
             return None
 
-        return MetagraphInfo.list_from_dicts(query.value)
+        info_class = ColumnarMetagraphInfo if columnar else MetagraphInfo
+        return info_class.list_from_dicts(query.value)
 
     def get_netuids_for_hotkey(
         self, hotkey_ss58: str, block: Optional[int] = None
@@ -3111,7 +3178,7 @@ class Subtensor(SubtensorMixin):
     def wait_for_block(self, block: Optional[int] = None):
         """
         Waits until a specific block is reached on the chain. If no block is specified,
-        waits for the next block.
+        waits for the next block. Waits on the subscription of :attr:`block_hub`, shared with the other listeners.
 
         Args:
             block (Optional[int]): The block number to wait for. If None, waits for the next block.
@@ -3126,25 +3193,13 @@ class Subtensor(SubtensorMixin):
             subtensor.wait_for_block() # Waits for the next block
             subtensor.wait_for_block(block=1234) # Waits for a specific block
         """
-
-        def handler(block_data: dict):
-            logging.debug(
-                f"reached block {block_data['header']['number']}. Waiting for block {target_block}"
-            )
-            if block_data["header"]["number"] >= target_block:
-                return True
-            return None
-
-        current_block = self.substrate.get_block()
-        current_block_hash = current_block.get("header", {}).get("hash")
         if block is not None:
             target_block = block
         else:
-            target_block = current_block["header"]["number"] + 1
+            target_block = self.substrate.get_block()["header"]["number"] + 1
 
-        self.substrate.get_block_handler(
-            current_block_hash, header_only=True, subscription_handler=handler
-        )
+        logging.debug(f"Waiting for block {target_block}")
+        self.block_hub.wait_for_block(target_block)
         return True
 
     # TODO: update order in SDKv10
@@ -3458,6 +3513,8 @@ class Subtensor(SubtensorMixin):
         wait_for_inclusion: bool = True,
         wait_for_finalization: bool = False,
         period: Optional[int] = DEFAULT_PERIOD,
+        batch: bool = False,
+        atomic: bool = True,
     ) -> bool:
         """
         Adds stakes to multiple neurons identified by their hotkey SS58 addresses.
@@ -3473,6 +3530,10 @@ class Subtensor(SubtensorMixin):
             period (Optional[int]): The number of blocks during which the transaction will remain valid after it's
                 submitted. If the transaction is not included in a block within that number of blocks, it will expire
                 and be rejected. You can think of it as an expiration date for the transaction.
+            batch (bool): If set, submits all the stakes as a single ``Utility`` batch extrinsic, signed once and waited
+                for once, instead of one extrinsic per hotkey. Defaults to ``False``.
+            atomic (bool): Only used with ``batch``. If set, no stake is added if any of them fails. Otherwise, each stake
+                succeeds or fails on its own. Defaults to ``True``.
 
         Returns:
             bool: ``True`` if the staking is successful for all specified neurons, False otherwise.
@@ -3489,6 +3550,8 @@ class Subtensor(SubtensorMixin):
             wait_for_inclusion=wait_for_inclusion,
             wait_for_finalization=wait_for_finalization,
             period=period,
+            batch=batch,
+            atomic=atomic,
         )
 
     def burned_register(
@@ -4374,6 +4437,62 @@ class Subtensor(SubtensorMixin):
 
             return success, message
 
+    def set_weights_batch(
+        self,
+        wallet: "Wallet",
+        weights: dict[tuple[int, int], tuple[UIDs, Weights]],
+        version_key: int = version_as_int,
+        wait_for_inclusion: bool = False,
+        wait_for_finalization: bool = False,
+        block_time: float = 12.0,
+        period: Optional[int] = DEFAULT_PERIOD,
+        commit_reveal_version: int = 4,
+    ) -> dict[tuple[int, int], tuple[bool, str]]:
+        """
+        Sets the weights of several subnets and subnet mechanisms at once, with a single batch extrinsic.
+
+        Unlike calling :func:`set_weights` per subnet, the registration, commit-reveal and rate limit checks of all the
+            targets are fetched in a single query, and all the weights are submitted in a single extrinsic, waited for
+            once. Weights are committed on the subnets with commit-reveal enabled, and set directly on the others. Targets
+            the hotkey is not registered on, or whose weights rate limit has not elapsed yet, are skipped. Failed targets
+            are not retried.
+
+        Parameters:
+            wallet: The wallet associated with the neuron setting the weights.
+            weights: The ``(uids, weights)`` to set per ``(netuid, mechid)`` target.
+            version_key: Version key for compatibility with the network.
+            wait_for_inclusion: Waits for the transaction to be included in a block.
+            wait_for_finalization: Waits for the transaction to be finalized on the blockchain.
+            block_time: The number of seconds for block duration.
+            period: The number of blocks during which the transaction will remain valid after it's submitted. If the
+                transaction is not included in a block within that number of blocks, it will expire and be rejected. You
+                can think of it as an expiration date for the transaction.
+            commit_reveal_version: The version of the commit-reveal in the chain.
+
+        Returns:
+            dict[tuple[int, int], tuple[bool, str]]: Per ``(netuid, mechid)`` target, `True` if its weights were set, or
+                committed, `False` otherwise, and a message describing the success or the error.
+
+        Example::
+
+            results = subtensor.set_weights_batch(
+                wallet,
+                weights={(1, 0): (uids_1, weights_1), (1, 1): (uids_1, weights_1b), (2, 0): (uids_2, weights_2)},
+                wait_for_inclusion=True,
+            )
+        """
+        return set_mechanism_weights_batch_extrinsic(
+            subtensor=self,
+            wallet=wallet,
+            weights=weights,
+            version_key=version_key,
+            block_time=block_time,
+            commit_reveal_version=commit_reveal_version,
+            period=period,
+            wait_for_inclusion=wait_for_inclusion,
+            wait_for_finalization=wait_for_finalization,
+        )
+
     def serve_axon(
         self,
         netuid: int,
@@ -4797,6 +4916,8 @@ class Subtensor(SubtensorMixin):
         wait_for_finalization: bool = False,
         period: Optional[int] = DEFAULT_PERIOD,
         unstake_all: bool = False,
+        batch: bool = False,
+        atomic: bool = True,
     ) -> bool:
         """
         Performs batch unstaking from multiple hotkey accounts, allowing a neuron to reduce its staked amounts
@@ -4815,6 +4936,10 @@ class Subtensor(SubtensorMixin):
                 submitted. If the transaction is not included in a block within that number of blocks, it will expire
                 and be rejected. You can think of it as an expiration date for the transaction.
             unstake_all: If `True`, unstakes all tokens, and `amounts` is ignored. Default is `False`.
+            batch: If set, submits all the unstakes as a single ``Utility`` batch extrinsic, signed once and waited
+                for once, instead of one extrinsic per hotkey. Defaults to ``False``.
+            atomic: Only used with ``batch``. If set, no stake is removed if any of them fails. Otherwise, each
+                unstake succeeds or fails on its own. Defaults to ``True``.
 
         Returns:
             bool: ``True`` if the batch unstaking is successful, False otherwise.
@@ -4832,4 +4957,6 @@ class Subtensor(SubtensorMixin):
             wait_for_finalization=wait_for_finalization,
             period=period,
             unstake_all=unstake_all,
+            batch=batch,
+            atomic=atomic,
         )
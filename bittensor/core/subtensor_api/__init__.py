@@ -16,6 +16,7 @@ from .wallets import Wallets as _Wallets
 
 if TYPE_CHECKING:
     from bittensor.core.config import Config
+    from bittensor.core.query_cache import QueryCache
 
 
 class SubtensorApi:
@@ -34,6 +35,8 @@ class SubtensorApi:
         websocket_shutdown_timer: Amount of time, in seconds, to wait after the last response from the chain to close
             the connection. Only applicable to AsyncSubtensor. If `None` is passed to this, the automatic shutdown
             process is disabled.
+        query_cache: Cache of the storage, constant, runtime API and block hash reads, scoped to the block they are
+            made at. Defaults to `None`, which disables it.
 
     Example:
         # sync version
@@ -82,6 +85,7 @@ class SubtensorApi:
         mock: bool = False,
         archive_endpoints: Optional[list[str]] = None,
         websocket_shutdown_timer: Optional[float] = 5.0,
+        query_cache: Optional["QueryCache"] = None,
     ):
         self.network = network
         self._fallback_endpoints = fallback_endpoints
@@ -92,6 +96,7 @@ class SubtensorApi:
         self.log_verbose = log_verbose
         self.is_async = async_subtensor
         self._config = config
+        self._query_cache = query_cache
 
         # assigned only for async instance
         self.initialize = None
@@ -107,6 +112,7 @@ class SubtensorApi:
         self.config = self._subtensor.config
         self.setup_config = self._subtensor.setup_config
         self.help = self._subtensor.help
+        self.query_cache = self._subtensor.query_cache
 
         self.determine_block_hash = self._subtensor.determine_block_hash
         self.encode_params = self._subtensor.encode_params
@@ -130,6 +136,7 @@ class SubtensorApi:
                 _mock=self._mock,
                 archive_endpoints=self._archive_endpoints,
                 websocket_shutdown_timer=self._ws_shutdown_timer,
+                query_cache=self._query_cache,
             )
             self.initialize = _subtensor.initialize
             return _subtensor
@@ -142,6 +149,7 @@ class SubtensorApi:
                 retry_forever=self._retry_forever,
                 _mock=self._mock,
                 archive_endpoints=self._archive_endpoints,
+                query_cache=self._query_cache,
             )
 
     def _determine_chain_endpoint(self) -> str:
@@ -197,6 +205,11 @@ class SubtensorApi:
         """Returns current chain block number."""
         return self._subtensor.block
 
+    @property
+    def block_hub(self):
+        """Returns the block header subscription shared by the listeners of the subtensor."""
+        return self._subtensor.block_hub
+
     @property
     def chain(self):
         """Property of interaction with chain methods."""
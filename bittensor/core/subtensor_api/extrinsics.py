@@ -26,6 +26,7 @@ class Extrinsics:
         self.set_children = subtensor.set_children
         self.set_subnet_identity = subtensor.set_subnet_identity
         self.set_weights = subtensor.set_weights
+        self.set_weights_batch = subtensor.set_weights_batch
         self.serve_axon = subtensor.serve_axon
         self.start_call = subtensor.start_call
         self.swap_stake = subtensor.swap_stake
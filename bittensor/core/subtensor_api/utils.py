@@ -169,6 +169,7 @@ def add_legacy_methods(subtensor: "SubtensorApi"):
     subtensor.set_reveal_commitment = subtensor._subtensor.set_reveal_commitment
     subtensor.set_subnet_identity = subtensor._subtensor.set_subnet_identity
     subtensor.set_weights = subtensor._subtensor.set_weights
+    subtensor.set_weights_batch = subtensor._subtensor.set_weights_batch
     subtensor.setup_config = subtensor._subtensor.setup_config
     subtensor.sign_and_send_extrinsic = subtensor._subtensor.sign_and_send_extrinsic
     subtensor.start_call = subtensor._subtensor.start_call
@@ -1,17 +1,22 @@
 import base64
+import dataclasses
+import hashlib
 import json
 import sys
 import warnings
-from typing import cast, Any, ClassVar, Optional, Union
+import weakref
+from typing import cast, Any, Callable, ClassVar, Optional, Union
 
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    PrivateAttr,
     field_validator,
     model_validator,
 )
 
+from bittensor.core.tensor import Tensor
 from bittensor.utils import get_hash
 from bittensor.utils.btlogging import logging
 
@@ -253,6 +258,139 @@ class TerminalInfo(BaseModel):
     _extract_status_code = field_validator("status_code", mode="before")(cast_int)
 
 
+# Header name prefixes of the terminal information and of the required input placeholders.
+_AXON_HEADER_PREFIX = "bt_header_axon_"
+_DENDRITE_HEADER_PREFIX = "bt_header_dendrite_"
+_INPUT_OBJ_HEADER_PREFIX = "bt_header_input_obj_"
+
+# Encodings of the placeholders of the JSON types required inputs dump to, and the constructors they decode to.
+_PLACEHOLDER_TYPES: dict[str, Callable[[], Any]] = {
+    base64.b64encode(json.dumps(type_()).encode()).decode("utf-8"): type_
+    for type_ in (dict, list, str, int, float, bool)
+}
+
+
+class _HeaderCodec:
+    """
+    The header layout of a Synapse class, computed once per class: its required input fields, the header names of its
+    terminal information and inputs, and the placeholder encodings of its required inputs.
+    """
+
+    def __init__(self, synapse_class: type["Synapse"]):
+        fields = synapse_class.model_fields
+        # Classes serializing differently from their attributes keep being dumped to build their headers.
+        self.dumps_model = (
+            synapse_class.model_dump is not Synapse.model_dump
+            or bool(synapse_class.__pydantic_decorators__.model_serializers)
+            or bool(synapse_class.model_computed_fields)
+        )
+        self.serialized_fields = {
+            field
+            for decorator in synapse_class.__pydantic_decorators__.field_serializers.values()
+            for field in decorator.info.fields
+        }
+        required = synapse_class.model_json_schema().get("required", [])
+        self.required_fields = [
+            field
+            for field, info in fields.items()
+            if field in required
+            and field not in ("name", "timeout")
+            and not info.exclude
+        ]
+        self.terminal_headers = {
+            prefix: [(field, f"{prefix}{field}") for field in TerminalInfo.model_fields]
+            for prefix in (_AXON_HEADER_PREFIX, _DENDRITE_HEADER_PREFIX)
+        }
+        # header name -> (terminal, field), terminal being None for input placeholders
+        self.header_fields: dict[str, tuple[Optional[str], str]] = {
+            header: (terminal, field)
+            for terminal, prefix in (
+                ("axon", _AXON_HEADER_PREFIX),
+                ("dendrite", _DENDRITE_HEADER_PREFIX),
+            )
+            for field, header in self.terminal_headers[prefix]
+        }
+        self.header_fields.update(
+            {f"{_INPUT_OBJ_HEADER_PREFIX}{field}": (None, field) for field in fields}
+        )
+        # (field, dumped type) -> placeholder header value
+        self._placeholders: dict[tuple[str, type], str] = {}
+
+    def encode_terminal(self, prefix: str, terminal: "TerminalInfo") -> dict[str, str]:
+        """Returns the headers of the axon or dendrite terminal information."""
+        if type(terminal) is TerminalInfo:
+            items = (
+                (header, getattr(terminal, field))
+                for field, header in self.terminal_headers[prefix]
+            )
+        else:
+            items = (
+                (f"{prefix}{field}", value)
+                for field, value in terminal.model_dump().items()
+            )
+        return {header: str(value) for header, value in items if value is not None}
+
+    def encode_inputs(self, synapse: "Synapse") -> dict[str, str]:
+        """Returns the placeholder headers of the required inputs of the synapse."""
+        instance_fields = synapse.model_dump() if self.dumps_model else None
+        headers = {}
+        for field in self.required_fields:
+            if instance_fields is not None:
+                value = instance_fields.get(field)
+            elif field in self.serialized_fields:
+                value = synapse.model_dump(include={field}).get(field)
+            else:
+                value = getattr(synapse, field)
+                if isinstance(value, BaseModel) or (
+                    dataclasses.is_dataclass(value) and not isinstance(value, type)
+                ):
+                    # Dumped as dicts
+                    value = {}
+            if value is None:
+                continue
+            key = (field, value.__class__)
+            placeholder = self._placeholders.get(key)
+            if placeholder is None:
+                try:
+                    # create an empty (dummy) instance of type(value) to pass pydantic validation on the axon side
+                    serialized_value = json.dumps(value.__class__.__call__())
+                except TypeError as e:
+                    raise ValueError(
+                        f"Error serializing {field} with value {value}. Objects must be json serializable."
+                    ) from e
+                placeholder = base64.b64encode(serialized_value.encode()).decode(
+                    "utf-8"
+                )
+                self._placeholders[key] = placeholder
+            headers[f"{_INPUT_OBJ_HEADER_PREFIX}{field}"] = placeholder
+        return headers
+
+
+def _split_header(key: str) -> Optional[tuple[Optional[str], str]]:
+    """Returns the terminal, ``None`` for input placeholders, and field name of a header, if it is one."""
+    for terminal, prefix in (
+        ("axon", _AXON_HEADER_PREFIX),
+        ("dendrite", _DENDRITE_HEADER_PREFIX),
+        (None, _INPUT_OBJ_HEADER_PREFIX),
+    ):
+        if key.startswith(prefix):
+            return terminal, key[len(prefix) :]
+    return None
+
+
+_header_codecs: "weakref.WeakKeyDictionary[type, _HeaderCodec]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _header_codec(synapse_class: type["Synapse"]) -> _HeaderCodec:
+    """Returns the header codec of a Synapse class, building it on first use."""
+    codec = _header_codecs.get(synapse_class)
+    if codec is None:
+        codec = _header_codecs[synapse_class] = _HeaderCodec(synapse_class)
+    return codec
+
+
 class Synapse(BaseModel):
     """
     Represents a Synapse in the Bittensor network, serving as a communication schema between neurons (nodes).
@@ -298,7 +436,9 @@ class Synapse(BaseModel):
         Ensures data integrity and security by computing hashes of transmitted data. Provides users with a
         mechanism to verify data integrity and detect any tampering during transmission.
         It is recommended that names of fields in `required_hash_fields` are listed in the order they are
-        defined in the class.
+        defined in the class. Setting `body_hash_from_bytes` hashes the fields from their serialized bytes instead
+        of the string representation of their dumped values, which is faster for large fields but yields a different
+        digest, so both ends must use the same Synapse class definition.
 
     6. Serialization and Deserialization Methods:
         Facilitates the conversion of Synapse objects to and from a format suitable for network transmission.
@@ -352,6 +492,8 @@ class Synapse(BaseModel):
         axon (:func:`TerminalInfo`): Information about the axon terminal.
         computed_body_hash (str): Computed hash of the request body.
         required_hash_fields (list[str]): Fields required to compute the body hash.
+        body_hash_from_bytes (bool): Whether the body hash fields are hashed from their serialized bytes, instead of
+            the string representation of their dumped values. Defaults to ``False``, the digest of previous versions.
 
     Methods:
         deserialize: Custom deserialization logic for subclasses.
@@ -368,6 +510,12 @@ class Synapse(BaseModel):
 
     model_config = ConfigDict(validate_assignment=True)
 
+    # Whether the synapse was received through the binary transport, so that it is answered the same way.
+    _binary_transport: bool = PrivateAttr(default=False)
+
+    # field -> (hashed value, hash) of the required hash fields holding immutable values
+    _field_hashes: dict[str, tuple[Any, str]] = PrivateAttr(default_factory=dict)
+
     def deserialize(self) -> "Synapse":
         """
         Deserializes the Synapse object.
@@ -483,6 +631,8 @@ class Synapse(BaseModel):
 
     required_hash_fields: ClassVar[tuple[str, ...]] = ()
 
+    body_hash_from_bytes: ClassVar[bool] = False
+
     _extract_total_size = field_validator("total_size", mode="before")(cast_int)
 
     _extract_header_size = field_validator("header_size", mode="before")(cast_int)
@@ -501,6 +651,8 @@ class Synapse(BaseModel):
                 "body_hash property is read-only and cannot be overridden."
             )
         super().__setattr__(name, value)
+        # Invalidate the cached hash of the field
+        self._field_hashes.pop(name, None)
 
     def get_total_size(self) -> int:
         """
@@ -615,51 +767,21 @@ class Synapse(BaseModel):
             dict: A dictionary containing key-value pairs representing the Synapse's properties, suitable for HTTP
             communication.
         """
+        codec = _header_codec(self.__class__)
+
         # Initializing headers with 'name' and 'timeout'
         headers = {"name": self.name, "timeout": str(self.timeout)}
 
         # Adding headers for 'axon' and 'dendrite' if they are not None
         if self.axon:
-            headers.update(
-                {
-                    f"bt_header_axon_{k}": str(v)
-                    for k, v in self.axon.model_dump().items()
-                    if v is not None
-                }
-            )
+            headers.update(codec.encode_terminal(_AXON_HEADER_PREFIX, self.axon))
         if self.dendrite:
             headers.update(
-                {
-                    f"bt_header_dendrite_{k}": str(v)
-                    for k, v in self.dendrite.model_dump().items()
-                    if v is not None
-                }
+                codec.encode_terminal(_DENDRITE_HEADER_PREFIX, self.dendrite)
             )
 
-        # Getting the fields of the instance
-        instance_fields = self.model_dump()
-
-        # Iterating over the fields of the instance
-        for field, value in instance_fields.items():
-            # If the object is not optional, serializing it, encoding it, and adding it to the headers
-            required = self.get_required_fields()
-
-            # Skipping the field if it's already in the headers or its value is None
-            if field in headers or value is None:
-                continue
-
-            elif required and field in required:
-                try:
-                    # create an empty (dummy) instance of type(value) to pass pydantic validation on the axon side
-                    serialized_value = json.dumps(value.__class__.__call__())
-                    encoded_value = base64.b64encode(serialized_value.encode()).decode(
-                        "utf-8"
-                    )
-                    headers[f"bt_header_input_obj_{field}"] = encoded_value
-                except TypeError as e:
-                    raise ValueError(
-                        f"Error serializing {field} with value {value}. Objects must be json serializable."
-                    ) from e
+        # Adding the placeholders of the required inputs, so that the axon can validate the synapse from its headers
+        headers.update(codec.encode_inputs(self))
 
         # Adding the size of the headers and the total size to the headers
         headers["header_size"] = str(sys.getsizeof(headers))
@@ -680,8 +802,12 @@ class Synapse(BaseModel):
         Process:
 
         1. Iterates over each required field as specified in ``required_hash_fields``.
-        2. Concatenates the string representation of these fields.
-        3. Applies SHA3-256 hashing to the concatenated string to produce a unique fingerprint of the data.
+        2. Hashes each field, from the string representation of its dumped value or, if ``body_hash_from_bytes`` is
+        set, from its serialized bytes.
+        3. Applies SHA3-256 hashing to the concatenated field hashes to produce a unique fingerprint of the data.
+
+        The hashes of the fields holding strings, bytes, numbers or tensors are cached until the fields are set again.
+        Fields holding mutable values, such as lists, dicts or models, are hashed on every call.
 
         Example::
 
@@ -693,10 +819,7 @@ class Synapse(BaseModel):
             str: The SHA3-256 hash as a hexadecimal string, providing a fingerprint of the Synapse instance's data for
                 integrity checks.
         """
-        hashes = []
-
-        hash_fields_field = self.model_fields.get("required_hash_fields")
-        instance_fields = None
+        hash_fields_field = self.__class__.model_fields.get("required_hash_fields")
         if hash_fields_field:
             warnings.warn(
                 "The 'required_hash_fields' field handling deprecated and will be removed. "
@@ -706,11 +829,12 @@ class Synapse(BaseModel):
             required_hash_fields = hash_fields_field.default
 
             if required_hash_fields:
-                instance_fields = self.model_dump()
                 # Preserve backward compatibility in which fields will added in .model_dump() order
                 # instead of the order one from `self.required_hash_fields`
                 required_hash_fields = [
-                    field for field in instance_fields if field in required_hash_fields
+                    field
+                    for field in self.model_dump()
+                    if field in required_hash_fields
                 ]
 
                 # Hack to cache the required hash fields names
@@ -719,12 +843,34 @@ class Synapse(BaseModel):
         else:
             required_hash_fields = self.__class__.required_hash_fields
 
-        if required_hash_fields:
-            instance_fields = instance_fields or self.model_dump()
-            for field in required_hash_fields:
-                hashes.append(get_hash(str(instance_fields[field])))
+        return get_hash(
+            "".join(self._field_hash(field) for field in required_hash_fields or ())
+        )
+
+    def _field_hash(self, field: str) -> str:
+        """Returns the SHA3-256 hash of a body hash field, cached while the field holds the same immutable value."""
+        value = getattr(self, field)
+        cached = self._field_hashes.get(field)
+        # Checked by identity, copies of the synapse sharing the cache
+        if cached is not None and cached[0] is value:
+            return cached[1]
+
+        if not self.body_hash_from_bytes:
+            field_hash = get_hash(str(self.model_dump(include={field})[field]))
+        elif isinstance(value, (str, bytes)) and (
+            field not in _header_codec(self.__class__).serialized_fields
+        ):
+            field_hash = hashlib.sha3_256(
+                value.encode("utf-8") if isinstance(value, str) else value
+            ).hexdigest()
+        else:
+            field_hash = hashlib.sha3_256(
+                self.model_dump_json(include={field}).encode("utf-8")
+            ).hexdigest()
 
-        return get_hash("".join(hashes))
+        if value is None or isinstance(value, (str, bytes, int, float, Tensor)):
+            self._field_hashes[field] = (value, field_hash)
+        return field_hash
 
     @classmethod
     def parse_headers_to_inputs(cls, headers: dict) -> dict:
@@ -768,48 +914,26 @@ class Synapse(BaseModel):
             "dendrite": {},
         }
 
+        header_fields = _header_codec(cls).header_fields
+
         # Iterate over each item in the headers
         for key, value in headers.items():
-            # Handle 'axon' headers
-            if "bt_header_axon_" in key:
-                try:
-                    new_key = key.split("bt_header_axon_")[1]
-                    axon_dict = cast(dict, inputs_dict["axon"])
-                    axon_dict[new_key] = value
-                except Exception as e:
-                    logging.error(f"Error while parsing 'axon' header {key}: {str(e)}")
-                    continue
-            # Handle 'dendrite' headers
-            elif "bt_header_dendrite_" in key:
-                try:
-                    new_key = key.split("bt_header_dendrite_")[1]
-                    dendrite_dict = cast(dict, inputs_dict["dendrite"])
-                    dendrite_dict[new_key] = value
-                except Exception as e:
-                    logging.error(f"Error while parsing 'dendrite' header {key}: {e}")
-                    continue
-            # Handle 'input_obj' headers
-            elif "bt_header_input_obj" in key:
-                try:
-                    new_key = key.split("bt_header_input_obj_")[1]
-                    # Skip if the key already exists in the dictionary
-                    if new_key in inputs_dict:
-                        continue
-                    # Decode and load the serialized object
-                    inputs_dict[new_key] = json.loads(
-                        base64.b64decode(value.encode()).decode("utf-8")
-                    )
-                except json.JSONDecodeError as e:
-                    logging.error(
-                        f"Error while json decoding 'input_obj' header {key}: {e}"
-                    )
-                    continue
-                except Exception as e:
-                    logging.error(f"Error while parsing 'input_obj' header {key}: {e}")
+            known = header_fields.get(key)
+            if known is None:
+                # Headers of fields the class does not declare, ignored when constructing it
+                known = _split_header(key)
+                if known is None:
+                    # setting this to warning fills up logs unnecessarily
+                    logging.trace(f"Unexpected header key encountered: {key}")
                     continue
-            else:
-                # setting this to warning fills up logs unnecessarily
-                logging.trace(f"Unexpected header key encountered: {key}")
+
+            terminal, new_key = known
+            # Handle 'axon' and 'dendrite' headers
+            if terminal is not None:
+                cast(dict, inputs_dict[terminal])[new_key] = value
+            # Handle 'input_obj' headers, skipping them if the key already exists in the dictionary
+            elif new_key not in inputs_dict:
+                cls._parse_input_obj_header(inputs_dict, key, new_key, value)
 
         # Assign the remaining known headers directly
         inputs_dict["timeout"] = headers.get("timeout", None)
@@ -820,6 +944,23 @@ class Synapse(BaseModel):
 
         return inputs_dict
 
+    @staticmethod
+    def _parse_input_obj_header(inputs_dict: dict, key: str, new_key: str, value: str):
+        """Decodes the ``input_obj`` header ``key`` into ``inputs_dict[new_key]``, logging the decoding errors."""
+        placeholder_type = _PLACEHOLDER_TYPES.get(value)
+        if placeholder_type is not None:
+            inputs_dict[new_key] = placeholder_type()
+            return
+        try:
+            # Decode and load the serialized object
+            inputs_dict[new_key] = json.loads(
+                base64.b64decode(value.encode()).decode("utf-8")
+            )
+        except json.JSONDecodeError as e:
+            logging.error(f"Error while json decoding 'input_obj' header {key}: {e}")
+        except Exception as e:
+            logging.error(f"Error while parsing 'input_obj' header {key}: {e}")
+
     @classmethod
     def from_headers(cls, headers: dict) -> "Synapse":
         """
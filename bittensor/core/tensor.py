@@ -1,10 +1,19 @@
 import base64
-from typing import Optional, Union
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Union
 
 import msgpack
 import msgpack_numpy
 import numpy as np
-from pydantic import ConfigDict, BaseModel, Field, field_validator
+from pydantic import (
+    ConfigDict,
+    BaseModel,
+    Field,
+    PrivateAttr,
+    field_serializer,
+    field_validator,
+)
 
 from bittensor.utils.registration import torch, use_torch
 
@@ -54,6 +63,24 @@ class DTypes(dict):
 
 dtypes = DTypes()
 
+# Set while the tensors holding their array are dumped without serializing it, see `elide_buffers`.
+_elide_buffers: ContextVar[bool] = ContextVar("_elide_buffers", default=False)
+
+
+@contextmanager
+def elide_buffers() -> Iterator[None]:
+    """
+    Dumps the tensors holding their array with a ``None`` buffer within the context, instead of serializing the array.
+
+    Used by the binary synapse transport, which sends the arrays apart from the JSON body, to build headers and
+    hashes without serializing them.
+    """
+    token = _elide_buffers.set(True)
+    try:
+        yield
+    finally:
+        _elide_buffers.reset(token)
+
 
 def cast_dtype(raw: Union[None, np.dtype, "torch.dtype", str]) -> Optional[str]:
     """
@@ -131,10 +158,16 @@ class Tensor(BaseModel):
         buffer (Optional[str]): Tensor buffer data.
         dtype (str): Tensor data type.
         shape (list[int]): Tensor shape.
+
+    Tensors created with :func:`wrap`, or received through the binary synapse transport, hold their array instead of a
+    buffer. Their ``buffer`` is ``None``, and is only serialized when the tensor is sent as JSON.
     """
 
     model_config = ConfigDict(validate_assignment=True)
 
+    # The tensor data, when not serialized into `buffer`.
+    _array: Optional["np.ndarray"] = PrivateAttr(default=None)
+
     def tensor(self) -> Union[np.ndarray, "torch.Tensor"]:
         return self.deserialize()
 
@@ -157,10 +190,16 @@ class Tensor(BaseModel):
             Exception: If the deserialization process encounters an error.
         """
         shape = tuple(self.shape)
-        buffer_bytes = base64.b64decode(self.buffer.encode("utf-8"))
-        numpy_object = msgpack.unpackb(
-            buffer_bytes, object_hook=msgpack_numpy.decode
-        ).copy()
+        if self._array is not None:
+            # Read-only views of a received body are copied for torch, which requires writable arrays.
+            numpy_object = self._array
+            if use_torch() and not numpy_object.flags.writeable:
+                numpy_object = numpy_object.copy()
+        else:
+            buffer_bytes = base64.b64decode(self.buffer.encode("utf-8"))
+            numpy_object = msgpack.unpackb(
+                buffer_bytes, object_hook=msgpack_numpy.decode
+            ).copy()
         if use_torch():
             torch_object = torch.as_tensor(numpy_object)
             # Reshape does not work for (0) or [0]
@@ -171,7 +210,21 @@ class Tensor(BaseModel):
             # Reshape does not work for (0) or [0]
             if not (len(shape) == 1 and shape[0] == 0):
                 numpy_object = numpy_object.reshape(shape)
-            return numpy_object.astype(dtypes[self.dtype])
+            return numpy_object.astype(dtypes[self.dtype], copy=self._array is None)
+
+    def raw_array(self) -> "np.ndarray":
+        """
+        Returns the tensor data as an array of the serialized shape and data type, without casting or copying it.
+
+        Returns:
+            np.ndarray: The tensor data. It is read-only unless the tensor was created with :func:`wrap`.
+        """
+        if self._array is not None:
+            return self._array
+        return msgpack.unpackb(
+            base64.b64decode(self.buffer.encode("utf-8")),
+            object_hook=msgpack_numpy.decode,
+        )
 
     @staticmethod
     def serialize(tensor_: Union["np.ndarray", "torch.Tensor"]) -> "Tensor":
@@ -197,6 +250,30 @@ class Tensor(BaseModel):
         ).decode("utf-8")
         return Tensor(buffer=data_buffer, shape=shape, dtype=dtype)
 
+    @staticmethod
+    def wrap(tensor_: Union["np.ndarray", "torch.Tensor"]) -> "Tensor":
+        """
+        Wraps the given tensor without serializing it, for synapses sent through the binary transport.
+
+        The tensor is serialized into the ``buffer`` format only if it is sent as JSON. It must not be modified while
+        the wrapping Tensor is in use.
+
+        Args:
+            tensor_ (np.array or torch.Tensor): The tensor to wrap.
+
+        Returns:
+            :func:`Tensor`: The wrapping tensor.
+        """
+        dtype = str(tensor_.dtype)
+        shape = list(tensor_.shape)
+        if len(shape) == 0:
+            shape = [0]
+        wrapped = Tensor(shape=shape, dtype=dtype)
+        wrapped._array = (
+            tensor_.cpu().detach().numpy() if use_torch() else np.asarray(tensor_)
+        )
+        return wrapped
+
     # Represents the tensor buffer data.
     buffer: Optional[str] = Field(
         default=None,
@@ -225,6 +302,15 @@ class Tensor(BaseModel):
         repr=True,
     )
 
+    @field_serializer("buffer")
+    def _serialize_buffer(self, buffer: Optional[str]) -> Optional[str]:
+        # Serialized on demand for tensors holding their array
+        if buffer is None and self._array is not None and not _elide_buffers.get():
+            return base64.b64encode(
+                msgpack.packb(self._array, default=msgpack_numpy.encode)
+            ).decode("utf-8")
+        return buffer
+
     # Extract the represented shape of the tensor.
     _extract_shape = field_validator("shape", mode="before")(cast_shape)
 
@@ -1,8 +1,20 @@
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Optional
 
 ALLOWED_DELTA = 4_000_000_000  # Delta of 4 seconds for nonce validation
 NANOSECONDS_IN_SECOND = 1_000_000_000
 
+# Default bounds of the axon nonce store.
+NONCE_STORE_MAX_SIZE = 100_000  # Maximum number of tracked dendrite endpoints
+NONCE_STORE_MAX_TIMEOUT = (
+    3_600  # Largest synapse timeout, in seconds, honored by the nonce freshness window
+)
+
 
 def allowed_nonce_window_ns(
     current_time_ns: int, synapse_timeout: Optional[float] = None
@@ -41,3 +53,234 @@ def calculate_diff_seconds(
     diff_seconds = (current_time - synapse_nonce) / NANOSECONDS_IN_SECOND
     allowed_delta_seconds = (ALLOWED_DELTA + synapse_timeout_ns) / NANOSECONDS_IN_SECOND
     return diff_seconds, allowed_delta_seconds
+
+
+class NonceStore(ABC):
+    """
+    Stores the last nonce accepted from each dendrite endpoint (``"{hotkey}:{uuid}"``) to protect an axon from
+    replayed requests.
+
+    Entries expire once they are older than the widest nonce freshness window, ``ALLOWED_DELTA + max_timeout``. By
+    then, the freshness check of :func:`allowed_nonce_window_ns` rejects any replay of the expired nonce on its own,
+    whatever dendrite version the request claims, provided the synapse timeout used for that check is capped at
+    ``max_timeout``. Besides expiry, the least recently updated entries are evicted once more than ``max_size``
+    endpoints are tracked.
+
+    Args:
+        max_size (int): Maximum number of tracked endpoints.
+        max_timeout (float): Largest synapse timeout, in seconds, honored by the nonce freshness window.
+    """
+
+    def __init__(
+        self,
+        max_size: int = NONCE_STORE_MAX_SIZE,
+        max_timeout: float = NONCE_STORE_MAX_TIMEOUT,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be a positive integer.")
+        self.max_size = max_size
+        self.max_timeout = max_timeout
+        self.ttl_ns = ALLOWED_DELTA + int(max_timeout * NANOSECONDS_IN_SECOND)
+        self.expired = 0
+        self.evicted = 0
+
+    def window_timeout(self, synapse_timeout: Optional[float]) -> float:
+        """Returns the synapse timeout to use for the nonce freshness window, capped at ``max_timeout``."""
+        return min(synapse_timeout or 0, self.max_timeout)
+
+    @abstractmethod
+    def get(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        """Returns the last accepted nonce of the endpoint ``key``, or ``default`` if unknown or expired."""
+
+    @abstractmethod
+    def update_if_newer(self, key: str, nonce: int) -> bool:
+        """
+        Atomically stores ``nonce`` for the endpoint ``key`` if it is greater than the stored one.
+
+        Returns:
+            bool: ``True`` if the nonce was stored, ``False`` if a newer or equal nonce was already accepted.
+        """
+
+    @abstractmethod
+    def clear(self):
+        """Removes every entry."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Returns the number of tracked endpoints."""
+
+    @property
+    def metrics(self) -> dict[str, int]:
+        """Returns the store size and the number of expired and evicted entries."""
+        return {"size": len(self), "expired": self.expired, "evicted": self.evicted}
+
+    def __getitem__(self, key: str) -> int:
+        nonce = self.get(key)
+        if nonce is None:
+            raise KeyError(key)
+        return nonce
+
+    def __setitem__(self, key: str, nonce: int):
+        self.update_if_newer(key, nonce)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+
+class MemoryNonceStore(NonceStore):
+    """An in-process :class:`NonceStore`, kept in least recently updated order."""
+
+    def __init__(
+        self,
+        max_size: int = NONCE_STORE_MAX_SIZE,
+        max_timeout: float = NONCE_STORE_MAX_TIMEOUT,
+    ):
+        super().__init__(max_size=max_size, max_timeout=max_timeout)
+        # endpoint key -> (nonce, time stored in ns)
+        self._entries: OrderedDict[str, tuple[int, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _prune(self, now_ns: int):
+        expire_before = now_ns - self.ttl_ns
+        while self._entries:
+            _, stored_at = next(iter(self._entries.values()))
+            if stored_at >= expire_before:
+                break
+            self._entries.popitem(last=False)
+            self.expired += 1
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evicted += 1
+
+    def get(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] < time.time_ns() - self.ttl_ns:
+                return default
+            return entry[0]
+
+    def update_if_newer(self, key: str, nonce: int) -> bool:
+        now_ns = time.time_ns()
+        with self._lock:
+            self._prune(now_ns)
+            entry = self._entries.get(key)
+            if entry is not None and nonce <= entry[0]:
+                return False
+            self._entries[key] = (nonce, now_ns)
+            self._entries.move_to_end(key)
+            self._prune(now_ns)
+            return True
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteNonceStore(NonceStore):
+    """
+    A :class:`NonceStore` kept in a SQLite database, so that several axon worker processes serving the same hotkey
+    share replay protection.
+
+    Expired and excess entries are pruned every ``prune_interval`` updates.
+
+    Args:
+        path (str): Path of the database file, shared by all the processes.
+        max_size (int): Maximum number of tracked endpoints.
+        max_timeout (float): Largest synapse timeout, in seconds, honored by the nonce freshness window.
+        prune_interval (int): Number of updates between two prunings.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int = NONCE_STORE_MAX_SIZE,
+        max_timeout: float = NONCE_STORE_MAX_TIMEOUT,
+        prune_interval: int = 1_000,
+    ):
+        super().__init__(max_size=max_size, max_timeout=max_timeout)
+        self.path = path
+        self.prune_interval = prune_interval
+        self._updates = 0
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self._db: Optional[sqlite3.Connection] = None
+        self._connect()
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS nonces "
+            "(key TEXT PRIMARY KEY, nonce INTEGER NOT NULL, stored_at INTEGER NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS nonces_stored_at ON nonces (stored_at)"
+        )
+
+    def _connect(self):
+        """Opens the database connection of the current process, as connections must not be used across a fork."""
+        if self._pid == os.getpid():
+            return
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            self.path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._pid = os.getpid()
+
+    def prune(self):
+        """Removes the expired entries, then the least recently updated ones in excess of ``max_size``."""
+        self._connect()
+        with self._lock:
+            self.expired += self._db.execute(
+                "DELETE FROM nonces WHERE stored_at < ?",
+                (time.time_ns() - self.ttl_ns,),
+            ).rowcount
+            self.evicted += self._db.execute(
+                "DELETE FROM nonces WHERE key IN "
+                "(SELECT key FROM nonces ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_size,),
+            ).rowcount
+
+    def get(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        self._connect()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT nonce FROM nonces WHERE key = ? AND stored_at >= ?",
+                (key, time.time_ns() - self.ttl_ns),
+            ).fetchone()
+        return default if row is None else row[0]
+
+    def update_if_newer(self, key: str, nonce: int) -> bool:
+        now_ns = time.time_ns()
+        self._connect()
+        with self._lock:
+            # An expired entry is replaced regardless of its nonce, as in the in-memory store.
+            stored = self._db.execute(
+                "INSERT INTO nonces (key, nonce, stored_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET nonce = excluded.nonce, stored_at = excluded.stored_at "
+                "WHERE excluded.nonce > nonces.nonce OR nonces.stored_at < ?",
+                (key, nonce, now_ns, now_ns - self.ttl_ns),
+            ).rowcount
+            self._updates += 1
+            should_prune = self._updates % self.prune_interval == 0
+        if should_prune:
+            self.prune()
+        return stored > 0
+
+    def clear(self):
+        self._connect()
+        with self._lock:
+            self._db.execute("DELETE FROM nonces")
+
+    def close(self):
+        """Closes the database connection of the current process."""
+        with self._lock:
+            if self._db is not None and self._pid == os.getpid():
+                self._db.close()
+            self._db, self._pid = None, None
+
+    def __len__(self) -> int:
+        self._connect()
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM nonces").fetchone()[0]
@@ -447,7 +447,7 @@ async def _solve_for_difficulty_fast(
     """
     if not num_processes:
         # get the number of allowed processes for this process
-        num_processes = min(1, get_cpu_count())
+        num_processes = get_cpu_count()
 
     if update_interval is None:
         update_interval = 50_000
@@ -137,6 +137,181 @@ def _seal_meets_difficulty(seal: bytes, difficulty: int, limit: int) -> bool:
     return product < limit
 
 
+POW_BATCH_SIZE = 8192
+"""Number of nonces hashed together by the batched CPU solver. Batches of this size keep the working set in cache."""
+
+_SHA256_K = numpy.array(
+    [
+        0x428A2F98, 0x71374491, 0xB5C0FBCF, 0xE9B5DBA5, 0x3956C25B, 0x59F111F1, 0x923F82A4, 0xAB1C5ED5,
+        0xD807AA98, 0x12835B01, 0x243185BE, 0x550C7DC3, 0x72BE5D74, 0x80DEB1FE, 0x9BDC06A7, 0xC19BF174,
+        0xE49B69C1, 0xEFBE4786, 0x0FC19DC6, 0x240CA1CC, 0x2DE92C6F, 0x4A7484AA, 0x5CB0A9DC, 0x76F988DA,
+        0x983E5152, 0xA831C66D, 0xB00327C8, 0xBF597FC7, 0xC6E00BF3, 0xD5A79147, 0x06CA6351, 0x14292967,
+        0x27B70A85, 0x2E1B2138, 0x4D2C6DFC, 0x53380D13, 0x650A7354, 0x766A0ABB, 0x81C2C92E, 0x92722C85,
+        0xA2BFE8A1, 0xA81A664B, 0xC24B8B70, 0xC76C51A3, 0xD192E819, 0xD6990624, 0xF40E3585, 0x106AA070,
+        0x19A4C116, 0x1E376C08, 0x2748774C, 0x34B0BCB5, 0x391C0CB3, 0x4ED8AA4A, 0x5B9CCA4F, 0x682E6FF3,
+        0x748F82EE, 0x78A5636F, 0x84C87814, 0x8CC70208, 0x90BEFFFA, 0xA4506CEB, 0xBEF9A3F7, 0xC67178F2,
+    ],
+    dtype=numpy.uint32,
+)  # fmt: skip
+_SHA256_H = numpy.array(
+    [0x6A09E667, 0xBB67AE85, 0x3C6EF372, 0xA54FF53A, 0x510E527F, 0x9B05688C, 0x1F83D9AB, 0x5BE0CD19],
+    dtype=numpy.uint32,
+)  # fmt: skip
+_KECCAK_RC = [
+    0x0000000000000001, 0x0000000000008082, 0x800000000000808A, 0x8000000080008000, 0x000000000000808B,
+    0x0000000080000001, 0x8000000080008081, 0x8000000000008009, 0x000000000000008A, 0x0000000000000088,
+    0x0000000080008009, 0x000000008000000A, 0x000000008000808B, 0x800000000000008B, 0x8000000000008089,
+    0x8000000000008003, 0x8000000000008002, 0x8000000000000080, 0x000000000000800A, 0x800000008000000A,
+    0x8000000080008081, 0x8000000000008080, 0x0000000080000001, 0x8000000080008008,
+]  # fmt: skip
+# Rotation offset of each Keccak lane, indexed by x + 5 * y
+_KECCAK_RHO = [
+    0, 1, 62, 28, 27, 36, 44, 6, 55, 20, 3, 10, 43, 25, 39, 41, 45, 15, 21, 8, 18, 2, 61, 56, 14,
+]  # fmt: skip
+# Destination of each Keccak lane in the pi step, indexed by x + 5 * y
+_KECCAK_PI = [y + 5 * ((2 * x + 3 * y) % 5) for y in range(5) for x in range(5)]
+
+
+def _rotr32(x, n: int):
+    return (x >> numpy.uint32(n)) | (x << numpy.uint32(32 - n))
+
+
+def _sha256_pre_seals(
+    block_and_hotkey_hash_bytes: bytes, nonces: numpy.ndarray
+) -> numpy.ndarray:
+    """
+    SHA-256 digests of the 40-byte pre-seals ``nonce (u64 little endian) + block_and_hotkey_hash_bytes`` of a batch of
+    nonces, as an ``(n, 8)`` array of big endian words.
+
+    The pre-seal fits a single SHA-256 block in which only the first two words depend on the nonce. The 14 others,
+    and the part of the message schedule derived from them only, are computed once for the whole batch.
+    """
+    nonce_words = nonces.astype("<u8").view(">u4").reshape(-1, 2).astype(numpy.uint32)
+    w = [nonce_words[:, 0], nonce_words[:, 1]]
+    w += [
+        numpy.uint32(word)
+        for word in numpy.frombuffer(block_and_hotkey_hash_bytes[:32], dtype=">u4")
+    ]
+    # Padding bit, then the message length in bits
+    w += [numpy.uint32(0x80000000)] + [numpy.uint32(0)] * 4 + [numpy.uint32(320)]
+    with numpy.errstate(over="ignore"):
+        for t in range(16, 64):
+            s0 = (
+                _rotr32(w[t - 15], 7)
+                ^ _rotr32(w[t - 15], 18)
+                ^ (w[t - 15] >> numpy.uint32(3))
+            )
+            s1 = (
+                _rotr32(w[t - 2], 17)
+                ^ _rotr32(w[t - 2], 19)
+                ^ (w[t - 2] >> numpy.uint32(10))
+            )
+            w.append(w[t - 16] + s0 + w[t - 7] + s1)
+
+        a, b, c, d, e, f, g, h = _SHA256_H
+        for t in range(64):
+            t1 = (
+                h
+                + (_rotr32(e, 6) ^ _rotr32(e, 11) ^ _rotr32(e, 25))
+                + ((e & f) ^ (~e & g))
+                + _SHA256_K[t]
+                + w[t]
+            )
+            t2 = (_rotr32(a, 2) ^ _rotr32(a, 13) ^ _rotr32(a, 22)) + (
+                (a & b) ^ (a & c) ^ (b & c)
+            )
+            h, g, f, e, d, c, b, a = g, f, e, d + t1, c, b, a, t1 + t2
+
+        return numpy.stack(
+            [
+                numpy.broadcast_to(word + initial, nonces.shape)
+                for word, initial in zip((a, b, c, d, e, f, g, h), _SHA256_H)
+            ],
+            axis=1,
+        ).astype(">u4")
+
+
+def _keccak256_digests(digests: numpy.ndarray) -> numpy.ndarray:
+    """
+    Keccak-256 hashes of a batch of 32-byte messages, given and returned as ``(n, 32)`` uint8 arrays.
+
+    Each of the 25 lanes of the Keccak state is a uint64 array over the batch, and every step of the permutation writes
+    into preallocated arrays, so that the cost per round does not depend on Python object creation.
+    """
+    n = digests.shape[0]
+    xor, and_, or_, invert = (
+        numpy.bitwise_xor,
+        numpy.bitwise_and,
+        numpy.bitwise_or,
+        numpy.invert,
+    )
+    lshift, rshift = numpy.left_shift, numpy.right_shift
+
+    a = [numpy.zeros(n, numpy.uint64) for _ in range(25)]
+    message = numpy.ascontiguousarray(digests).view("<u8")
+    for i in range(4):
+        a[i][:] = message[:, i]
+    # Keccak padding of a 32-byte message in a 136-byte rate
+    a[4][:] = 0x01
+    a[16][:] = 0x8000000000000000
+
+    b = [numpy.empty(n, numpy.uint64) for _ in range(25)]
+    c = [numpy.empty(n, numpy.uint64) for _ in range(5)]
+    d = [numpy.empty(n, numpy.uint64) for _ in range(5)]
+    tmp = numpy.empty(n, numpy.uint64)
+    one, sixty_three = numpy.uint64(1), numpy.uint64(63)
+    rho = [(numpy.uint64(r), numpy.uint64(64 - r)) for r in _KECCAK_RHO]
+
+    for round_constant in _KECCAK_RC:
+        # theta
+        for x in range(5):
+            xor(a[x], a[x + 5], out=c[x])
+            for y in range(10, 25, 5):
+                xor(c[x], a[x + y], out=c[x])
+        for x in range(5):
+            lshift(c[(x + 1) % 5], one, out=tmp)
+            rshift(c[(x + 1) % 5], sixty_three, out=d[x])
+            or_(d[x], tmp, out=d[x])
+            xor(d[x], c[(x - 1) % 5], out=d[x])
+        # rho and pi
+        for i in range(25):
+            xor(a[i], d[i % 5], out=a[i])
+            destination = b[_KECCAK_PI[i]]
+            if _KECCAK_RHO[i]:
+                lshift(a[i], rho[i][0], out=tmp)
+                rshift(a[i], rho[i][1], out=destination)
+                or_(destination, tmp, out=destination)
+            else:
+                destination[:] = a[i]
+        # chi
+        for y in range(0, 25, 5):
+            for x in range(5):
+                invert(b[y + (x + 1) % 5], out=tmp)
+                and_(tmp, b[y + (x + 2) % 5], out=tmp)
+                xor(b[y + x], tmp, out=a[y + x])
+        # iota
+        xor(a[0], numpy.uint64(round_constant), out=a[0])
+
+    return numpy.ascontiguousarray(numpy.stack(a[:4], axis=1)).view(numpy.uint8)
+
+
+def _create_seal_hashes(
+    block_and_hotkey_hash_bytes: bytes, nonces: numpy.ndarray
+) -> numpy.ndarray:
+    """
+    Batched :func:`_create_seal_hash`: returns the seals of every nonce of ``nonces`` as an ``(n, 32)`` uint8 array.
+
+    Args:
+        block_and_hotkey_hash_bytes (bytes): The combined hash bytes of the block and hotkey.
+        nonces (numpy.ndarray): The uint64 nonces to hash.
+
+    Returns:
+        The seal hashes, one row per nonce.
+    """
+    pre_seal_hashes = _sha256_pre_seals(block_and_hotkey_hash_bytes, nonces)
+    return _keccak256_digests(pre_seal_hashes.view(numpy.uint8).reshape(-1, 32))
+
+
 @dataclass
 class POWSolution:
     """A solution to the registration PoW problem."""
@@ -286,7 +461,7 @@ class Solver(_SolverBase):
                 self.newBlockEvent.clear()
 
             # Do a block of nonces
-            solution = _solve_for_nonce_block(
+            solution = _solve_for_nonce_block_batched(
                 nonce_start,
                 nonce_end,
                 block_and_hotkey_hash_bytes,
@@ -436,6 +611,39 @@ def _solve_for_nonce_block(
     return None
 
 
+def _solve_for_nonce_block_batched(
+    nonce_start: int,
+    nonce_end: int,
+    block_and_hotkey_hash_bytes: bytes,
+    difficulty: int,
+    limit: int,
+    block_number: int,
+    batch_size: int = POW_BATCH_SIZE,
+) -> Optional["POWSolution"]:
+    """
+    Tries to solve the POW for a block of nonces (nonce_start, nonce_end), hashing ``batch_size`` nonces at a time with
+    :func:`_create_seal_hashes`. Nonces wrap around at 2**64.
+
+    Seals are first filtered on their 64 most significant bits, and only the few candidates left are checked against
+    the exact difficulty, so the result is the same as :func:`_solve_for_nonce_block`'s.
+    """
+    # seal * difficulty < limit  <=>  seal <= (limit - 1) // difficulty
+    max_top_bits = ((limit - 1) // difficulty) >> 192 if difficulty > 0 else 2**64 - 1
+    for batch_start in range(nonce_start, nonce_end, batch_size):
+        nonces = numpy.arange(
+            min(batch_size, nonce_end - batch_start), dtype=numpy.uint64
+        )
+        nonces += numpy.uint64(batch_start % 2**64)
+        seals = _create_seal_hashes(block_and_hotkey_hash_bytes, nonces)
+        top_bits = seals[:, :8].copy().view(">u8").reshape(-1)
+        for index in numpy.flatnonzero(top_bits <= max_top_bits):
+            seal = seals[index].tobytes()
+            if _seal_meets_difficulty(seal, difficulty, limit):
+                return POWSolution(int(nonces[index]), block_number, difficulty, seal)
+
+    return None
+
+
 def _registration_diff_unpack(packed_diff: "mp.Array") -> int:
     """Unpacks the packed two 32-bit integers into one 64-bit integer. Little endian."""
     return int(packed_diff[0] << 32 | packed_diff[1])
@@ -496,7 +704,7 @@ def get_cpu_count() -> int:
         return len(os.sched_getaffinity(0))
     except AttributeError:
         # macOS does not have sched_getaffinity
-        return os.cpu_count()
+        return os.cpu_count() or 1
 
 
 @dataclass
@@ -628,7 +836,7 @@ def _solve_for_difficulty_fast(
     """
     if num_processes is None:
         # get the number of allowed processes for this process
-        num_processes = min(1, get_cpu_count())
+        num_processes = get_cpu_count()
 
     if update_interval is None:
         update_interval = 50_000
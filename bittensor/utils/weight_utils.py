@@ -2,6 +2,7 @@
 
 import hashlib
 import typing
+from itertools import chain
 from typing import Union, Optional
 
 import numpy as np
@@ -164,6 +165,290 @@ def convert_bond_uids_and_vals_to_tensor(
     return row_bonds
 
 
+def flatten_uids_and_vals(
+    data: list[list[tuple[int, int]]],
+) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.float64]]:
+    """Flattens per-neuron ``(uid, value)`` pairs into COO (row, column, value) arrays.
+
+    Args:
+        data (list[list[tuple[int, int]]]): The raw weights or bonds of every neuron, as returned by the chain.
+
+    Returns:
+        rows (np.int64): Row index (position of the neuron in ``data``) of every entry.
+        cols (np.int64): Destination uid of every entry.
+        vals (np.float64): Raw chain value of every entry.
+    """
+    counts = np.fromiter((len(item) for item in data), dtype=np.int64, count=len(data))
+    pairs = np.fromiter(
+        chain.from_iterable(chain.from_iterable(data)),
+        dtype=np.float64,
+        count=2 * int(counts.sum()),
+    ).reshape(-1, 2)
+    rows = np.repeat(np.arange(len(data), dtype=np.int64), counts)
+    return rows, pairs[:, 0].astype(np.int64), pairs[:, 1]
+
+
+def _coo_to_matrix(
+    shape: tuple[int, int],
+    rows: NDArray[np.int64],
+    cols: NDArray[np.int64],
+    vals: NDArray[np.float64],
+    dtype: type,
+    normalize: bool,
+) -> Union[NDArray, "torch.Tensor"]:
+    """Scatters COO entries into a dense matrix, optionally normalizing every row to sum to 1."""
+    matrix = np.zeros(shape, dtype=dtype)
+    matrix[rows, cols] = vals
+    if normalize:
+        row_sums = matrix.sum(axis=1, keepdims=True)
+        np.divide(matrix, row_sums, out=matrix, where=row_sums > 0)
+    return torch.from_numpy(matrix) if use_torch() else matrix
+
+
+# Metagraph uses this function.
+def convert_weight_uids_and_vals_to_matrix(
+    n: int, data: list[list[tuple[int, int]]]
+) -> Union[NDArray[np.float32], "torch.FloatTensor"]:
+    """Converts the weights of every neuron from chain representation into a row-normalized ``len(data) x n`` matrix.
+
+    Batched equivalent of calling :func:`convert_weight_uids_and_vals_to_tensor` for every row and stacking the results.
+
+    Args:
+        n (int): number of neurons on network.
+        data (list[list[tuple[int, int]]]): ``(uid, weight)`` pairs set by every neuron.
+
+    Returns:
+        weights (np.float32 or torch.FloatTensor): Converted weights matrix.
+    """
+    rows, cols, vals = flatten_uids_and_vals(data)
+    return _coo_to_matrix((len(data), n), rows, cols, vals, np.float32, True)
+
+
+# Metagraph uses this function.
+def convert_root_weight_uids_and_vals_to_matrix(
+    n: int, data: list[list[tuple[int, int]]], subnets: list[int]
+) -> Union[NDArray[np.float32], "torch.FloatTensor"]:
+    """Converts the root weights of every neuron from chain representation into a row-normalized ``len(data) x n``
+    matrix, with columns ordered as ``subnets``.
+
+    Batched equivalent of calling :func:`convert_root_weight_uids_and_vals_to_tensor` for every row and stacking the
+    results.
+
+    Args:
+        n (int): number of subnets on network.
+        data (list[list[tuple[int, int]]]): ``(netuid, weight)`` pairs set by every root neuron.
+        subnets (list[int]): list of subnets on the network.
+
+    Returns:
+        weights (np.float32 or torch.FloatTensor): Converted root weights matrix.
+    """
+    rows, netuids, vals = flatten_uids_and_vals(data)
+    subnets_ = np.asarray(subnets, dtype=np.int64)
+    lookup = np.full(
+        max(int(subnets_.max(initial=-1)), int(netuids.max(initial=-1))) + 1,
+        -1,
+        dtype=np.int64,
+    )
+    lookup[subnets_[::-1]] = np.arange(len(subnets_) - 1, -1, -1, dtype=np.int64)
+    cols = lookup[netuids]
+    known = cols >= 0
+    if not known.all():
+        logging.warning(
+            f"Incorrect Subnet uids {sorted(set(netuids[~known].tolist()))} in Subnets {subnets}. The subnet is "
+            f"unavailable at the moment."
+        )
+    return _coo_to_matrix(
+        (len(data), n), rows[known], cols[known], vals[known], np.float32, True
+    )
+
+
+# Metagraph uses this function.
+def convert_bond_uids_and_vals_to_matrix(
+    n: int, data: list[list[tuple[int, int]]], dtype: type = np.int64
+) -> Union[NDArray, "torch.Tensor"]:
+    """Converts the bonds of every neuron from chain representation into a ``len(data) x n`` matrix.
+
+    Batched equivalent of calling :func:`convert_bond_uids_and_vals_to_tensor` for every row and stacking the results.
+
+    Args:
+        n (int): number of neurons on network.
+        data (list[list[tuple[int, int]]]): ``(uid, bond)`` pairs held by every neuron.
+        dtype (type): numpy dtype of the resulting matrix.
+
+    Returns:
+        bonds (np.ndarray or torch.Tensor): Converted bonds matrix.
+    """
+    rows, cols, vals = flatten_uids_and_vals(data)
+    return _coo_to_matrix(
+        (len(data), n), rows, cols, vals.astype(np.int64), dtype, False
+    )
+
+
+class CSRMatrix:
+    """Compressed sparse row matrix backed by plain numpy index arrays.
+
+    Used by the metagraph to hold weights and bonds when most entries are zero. Only the non-zero entries are stored;
+    a dense view is materialized on demand with :meth:`to_dense`.
+
+    Attributes:
+        indptr (np.int64): Row pointer array of length ``shape[0] + 1``. Row ``i`` occupies
+            ``indices[indptr[i]:indptr[i + 1]]``.
+        indices (np.int64): Column index of every stored entry.
+        data (np.ndarray): Value of every stored entry.
+        shape (tuple[int, int]): Shape of the dense matrix.
+    """
+
+    __slots__ = ("indptr", "indices", "data", "shape")
+
+    def __init__(
+        self,
+        indptr: NDArray[np.int64],
+        indices: NDArray[np.int64],
+        data: NDArray,
+        shape: tuple[int, int],
+    ):
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.shape = (int(shape[0]), int(shape[1]))
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __repr__(self) -> str:
+        return f"CSRMatrix(shape={self.shape}, nnz={self.nnz}, dtype={self.dtype})"
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored entries."""
+        return len(self.data)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.data.dtype
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the index and value arrays, in bytes."""
+        return self.indptr.nbytes + self.indices.nbytes + self.data.nbytes
+
+    @classmethod
+    def from_coo(
+        cls,
+        shape: tuple[int, int],
+        rows: NDArray[np.int64],
+        cols: NDArray[np.int64],
+        vals: NDArray,
+        dtype: type = np.float32,
+    ) -> "CSRMatrix":
+        """Builds a CSR matrix from COO entries. Duplicated ``(row, col)`` entries keep the last value, and zeros are
+        dropped."""
+        n_rows, n_cols = shape
+        if n_cols < 0:
+            raise ValueError(f"negative dimensions are not allowed: {shape}")
+        if len(cols) and (cols.max() >= n_cols or cols.min() < -n_cols):
+            raise IndexError(f"column index out of bounds for shape {shape}")
+        cols = np.where(cols < 0, cols + n_cols, cols)
+        order = np.lexsort((cols, rows))
+        rows, cols, vals = rows[order], cols[order], vals[order]
+        # `lexsort` is stable, so the last of equal (row, col) entries is the one written last.
+        keep = np.ones(len(rows), dtype=bool)
+        keep[:-1] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+        keep &= vals != 0
+        rows, cols, vals = rows[keep], cols[keep], vals[keep]
+        indptr = np.zeros(n_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n_rows), out=indptr[1:])
+        return cls(indptr, cols.astype(np.int64), vals.astype(dtype), shape)
+
+    @classmethod
+    def from_dense(cls, matrix: Union[NDArray, "torch.Tensor"]) -> "CSRMatrix":
+        """Builds a CSR matrix from a dense 2D numpy array or torch tensor."""
+        matrix = np.asarray(
+            matrix.detach().cpu() if hasattr(matrix, "detach") else matrix
+        )
+        if matrix.ndim != 2:
+            matrix = matrix.reshape(0, 0)
+        rows, cols = np.nonzero(matrix)
+        return cls.from_coo(
+            matrix.shape, rows, cols, matrix[rows, cols], dtype=matrix.dtype
+        )
+
+    def row(self, i: int) -> NDArray:
+        """Returns row ``i`` as a dense numpy array."""
+        start, stop = self.indptr[i], self.indptr[i + 1]
+        dense_row = np.zeros(self.shape[1], dtype=self.dtype)
+        dense_row[self.indices[start:stop]] = self.data[start:stop]
+        return dense_row
+
+    def to_dense(self) -> Union[NDArray, "torch.Tensor"]:
+        """Materializes the dense matrix, as a torch tensor if ``use_torch()`` is enabled."""
+        matrix = np.zeros(self.shape, dtype=self.dtype)
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        matrix[rows, self.indices] = self.data
+        return torch.from_numpy(matrix) if use_torch() else matrix
+
+    def state_dict(self) -> dict:
+        """Returns the CSR components, suitable for pickling or ``torch.save``."""
+        return {
+            "indptr": self.indptr,
+            "indices": self.indices,
+            "data": self.data,
+            "shape": self.shape,
+        }
+
+    @classmethod
+    def from_state_dict(cls, state: dict) -> "CSRMatrix":
+        """Restores a matrix from :meth:`state_dict` output without copying. Torch tensors are viewed as numpy
+        arrays."""
+        return cls(
+            *(np.asarray(state[key]) for key in ("indptr", "indices", "data")),
+            shape=tuple(state["shape"]),
+        )
+
+
+# Metagraph uses this function.
+def convert_weight_uids_and_vals_to_csr(
+    n: int, data: list[list[tuple[int, int]]]
+) -> CSRMatrix:
+    """Sparse counterpart of :func:`convert_weight_uids_and_vals_to_matrix`: returns the row-normalized weights of every
+    neuron as a ``len(data) x n`` :class:`CSRMatrix`.
+
+    Args:
+        n (int): number of neurons on network.
+        data (list[list[tuple[int, int]]]): ``(uid, weight)`` pairs set by every neuron.
+
+    Returns:
+        weights (CSRMatrix): Converted float32 weights matrix.
+    """
+    rows, cols, vals = flatten_uids_and_vals(data)
+    matrix = CSRMatrix.from_coo((len(data), n), rows, cols, vals, dtype=np.float32)
+    row_ids = np.repeat(np.arange(len(data)), np.diff(matrix.indptr))
+    row_sums = np.bincount(row_ids, weights=matrix.data, minlength=len(data))
+    matrix.data /= row_sums[row_ids].astype(np.float32)
+    return matrix
+
+
+# Metagraph uses this function.
+def convert_bond_uids_and_vals_to_csr(
+    n: int, data: list[list[tuple[int, int]]], dtype: type = np.int64
+) -> CSRMatrix:
+    """Sparse counterpart of :func:`convert_bond_uids_and_vals_to_matrix`: returns the bonds of every neuron as a
+    ``len(data) x n`` :class:`CSRMatrix`.
+
+    Args:
+        n (int): number of neurons on network.
+        data (list[list[tuple[int, int]]]): ``(uid, bond)`` pairs held by every neuron.
+        dtype (type): numpy dtype of the stored values.
+
+    Returns:
+        bonds (CSRMatrix): Converted bonds matrix.
+    """
+    rows, cols, vals = flatten_uids_and_vals(data)
+    return CSRMatrix.from_coo(
+        (len(data), n), rows, cols, vals.astype(np.int64), dtype=dtype
+    )
+
+
 # This is used by the community via `bittensor.api.extrinsics.set_weights.set_weights_extrinsic`
 def convert_weights_and_uids_for_emit(
     uids: Union[NDArray[np.int64], "torch.LongTensor"],
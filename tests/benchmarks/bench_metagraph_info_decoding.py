@@ -0,0 +1,42 @@
+"""
+Decode time and retained memory of an all-subnets snapshot, as `MetagraphInfo` and `ColumnarMetagraphInfo` objects.
+
+Run with::
+
+    python -m tests.benchmarks.bench_metagraph_info_decoding
+"""
+
+import time
+import tracemalloc
+
+from bittensor.core.chain_data.metagraph_info import (
+    ColumnarMetagraphInfo,
+    MetagraphInfo,
+)
+from tests.unit_tests.chain_data.test_metagraph_info import decoded_metagraph_info
+
+
+def measure(info_class, snapshot: list[dict]) -> tuple[float, int]:
+    """Returns the decode time in seconds and the memory retained by the decoded objects in bytes."""
+    copies = [dict(decoded) for decoded in snapshot]
+    tracemalloc.start()
+    start = time.perf_counter()
+    infos = info_class.list_from_dicts(copies)
+    elapsed = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del infos
+    return elapsed, retained
+
+
+def main(subnets: int = 128, uids: int = 256):
+    snapshot = [decoded_metagraph_info(netuid, uids) for netuid in range(subnets)]
+    print(f"{subnets} subnets x {uids} uids")
+    print(f"{'class':<24}{'decode (s)':>12}{'memory (MiB)':>14}")
+    for info_class in (MetagraphInfo, ColumnarMetagraphInfo):
+        elapsed, retained = measure(info_class, snapshot)
+        print(f"{info_class.__name__:<24}{elapsed:>12.3f}{retained / 2**20:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Hash rate of the CPU proof-of-work solvers, per core and across all the cores available to the process.
+
+Run with::
+
+    python -m tests.benchmarks.bench_pow_solver
+"""
+
+import multiprocessing
+import os
+import time
+
+from bittensor.utils.registration.pow import (
+    _solve_for_nonce_block,
+    _solve_for_nonce_block_batched,
+    get_cpu_count,
+)
+
+# Unreachable difficulty, so that every nonce of the block is hashed.
+DIFFICULTY = 2**200
+LIMIT = 2**256 - 1
+
+
+def hash_rate(solve, nonces: int, nonce_start: int = 0) -> float:
+    """Returns the number of nonces hashed per second by ``solve``."""
+    block_and_hotkey_hash_bytes = os.urandom(32)
+    start = time.perf_counter()
+    solve(
+        nonce_start,
+        nonce_start + nonces,
+        block_and_hotkey_hash_bytes,
+        DIFFICULTY,
+        LIMIT,
+        0,
+    )
+    return nonces / (time.perf_counter() - start)
+
+
+def _batched_hash_rate(nonce_start: int) -> float:
+    return hash_rate(_solve_for_nonce_block_batched, 2**18, nonce_start)
+
+
+def main():
+    print(f"{'solver':<36}{'hashes/s':>14}")
+    print(
+        f"{'_solve_for_nonce_block':<36}{hash_rate(_solve_for_nonce_block, 2**15):>14,.0f}"
+    )
+    print(f"{'_solve_for_nonce_block_batched':<36}{_batched_hash_rate(0):>14,.0f}")
+
+    processes = get_cpu_count()
+    with multiprocessing.Pool(processes) as pool:
+        rates = pool.map(_batched_hash_rate, [i * 2**18 for i in range(processes)])
+    label = f"batched x {processes} processes"
+    print(f"{label:<36}{sum(rates):>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Metagraph sync and query fan-out times, replayed offline from a recorded session with an artificial latency.
+
+Record the session once, against a node::
+
+    python -m tests.benchmarks.bench_rpc_replay record finney /tmp/finney.json.gz
+
+Then replay it, as many times as needed, without one::
+
+    python -m tests.benchmarks.bench_rpc_replay replay /tmp/finney.json.gz
+"""
+
+import asyncio
+import sys
+import time
+
+from bittensor.core.async_subtensor import AsyncSubtensor
+from bittensor.core.rpc_replay import RpcRecording, RpcReplay
+
+NETUID = 1
+LATENCIES = (0.0, 0.01, 0.05, 0.1)
+
+
+async def workload(subtensor: AsyncSubtensor) -> dict[str, float]:
+    """Runs the benchmarked reads, returning the time each took in seconds."""
+    timings = {}
+    start = time.perf_counter()
+    await subtensor.metagraph(NETUID)
+    timings["metagraph"] = time.perf_counter() - start
+
+    # Pinned to a block, so that the replayed reads match the recorded ones
+    block_hash = await subtensor.get_block_hash()
+    start = time.perf_counter()
+    netuids = await subtensor.get_subnets(block_hash=block_hash)
+    await asyncio.gather(
+        *(
+            subtensor.get_subnet_hyperparameters(netuid, block_hash=block_hash)
+            for netuid in netuids
+        )
+    )
+    timings[f"fan-out x{len(netuids)}"] = time.perf_counter() - start
+    return timings
+
+
+async def record(network: str, path: str):
+    recording = RpcRecording()
+    async with AsyncSubtensor(network, rpc_recording=recording) as subtensor:
+        await workload(subtensor)
+    recording.save(path)
+    print(f"Recorded {len(recording)} responses to {path}")
+
+
+async def replay(path: str):
+    recording = RpcRecording.load(path)
+    print(f"{'latency (s)':<14}{'read':<16}{'time (s)':>10}")
+    for latency in LATENCIES:
+        replay_ = RpcReplay(recording, latency=latency)
+        async with AsyncSubtensor("finney", rpc_replay=replay_) as subtensor:
+            for read, elapsed in (await workload(subtensor)).items():
+                print(f"{latency:<14}{read:<16}{elapsed:>10.3f}")
+
+
+def main(mode: str, *args: str):
+    asyncio.run(record(*args) if mode == "record" else replay(*args))
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
@@ -0,0 +1,61 @@
+"""
+Decode throughput of `from_scale_encoding_using_type_string` with and without the shared `ScaleDecoderCache`.
+
+Run with::
+
+    python -m tests.benchmarks.bench_scale_decoding
+"""
+
+import os
+import timeit
+
+from scalecodec.base import RuntimeConfiguration, ScaleBytes
+from scalecodec.type_registry import load_type_registry_preset
+
+from bittensor.core.chain_data.utils import from_scale_encoding_using_type_string
+
+
+def uncached_decode(data: bytes, type_string: str):
+    """The decode path used before the cache: a fresh registry update on every call."""
+    runtime_config = RuntimeConfiguration()
+    runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+    return runtime_config.create_scale_object(
+        type_string, data=ScaleBytes(data)
+    ).decode()
+
+
+def compact_length(n: int) -> bytes:
+    return (
+        (n << 2).to_bytes(1, "little")
+        if n < 64
+        else ((n << 2) | 1).to_bytes(2, "little")
+    )
+
+
+def main(number: int = 50):
+    cases = {
+        "Vec<AccountId>": lambda n: compact_length(n) + os.urandom(32 * n),
+        "Vec<(AccountId, Compact<u64>)>": lambda n: compact_length(n)
+        + b"".join(os.urandom(32) + b"\x04" for _ in range(n)),
+    }
+    print(f"{'type':<34}{'items':>6}{'uncached/s':>14}{'cached/s':>14}{'speedup':>10}")
+    for type_string, make in cases.items():
+        for items in (16, 256):
+            data = make(items)
+            assert uncached_decode(data, type_string) == (
+                from_scale_encoding_using_type_string(data, type_string)
+            )
+            before = number / timeit.timeit(
+                lambda: uncached_decode(data, type_string), number=number
+            )
+            after = number / timeit.timeit(
+                lambda: from_scale_encoding_using_type_string(data, type_string),
+                number=number,
+            )
+            print(
+                f"{type_string:<34}{items:>6}{before:>14.1f}{after:>14.1f}{after / before:>9.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Request signature verification throughput, on the event loop and off it, with the largest event loop stall it caused.
+
+Run with::
+
+    python -m tests.benchmarks.bench_signature_verify
+"""
+
+import asyncio
+import time
+
+from bittensor_wallet import Keypair
+
+from bittensor.core.crypto_pool import CryptoPool
+
+REQUESTS = 2_000
+WORKERS = 2
+
+
+async def measure(pool: CryptoPool, requests: list[tuple[str, str, str]]):
+    """Verifies the requests concurrently, returning their throughput and the largest event loop stall, in seconds."""
+    stall = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal stall
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(0)
+            stall = max(stall, time.perf_counter() - start)
+
+    ticking = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    results = await asyncio.gather(*(pool.verify(*request) for request in requests))
+    elapsed = time.perf_counter() - start
+    done = True
+    await ticking
+    assert all(results)
+    return len(requests) / elapsed, stall
+
+
+async def run():
+    signers = [Keypair.create_from_uri(f"//Signer{index}") for index in range(16)]
+    requests = []
+    for index in range(REQUESTS):
+        signer = signers[index % len(signers)]
+        message = f"{time.time_ns()}.{signer.ss58_address}.{index}"
+        requests.append(
+            (signer.ss58_address, message, f"0x{signer.sign(message).hex()}")
+        )
+
+    pools = {
+        "on the loop": CryptoPool(),
+        f"{WORKERS} threads": CryptoPool(max_workers=WORKERS),
+        f"{WORKERS} processes": CryptoPool(max_workers=WORKERS, processes=True),
+    }
+    print(
+        f"{'verify':<16}{'requests/s':>12}{'max stall (ms)':>16}{'mean latency (ms)':>20}"
+    )
+    for name, pool in pools.items():
+        # Warms the workers and keypair caches up
+        await measure(pool, requests[: len(signers) * WORKERS])
+        throughput, stall = await measure(pool, requests)
+        latency = pool.metrics["verify_latency_mean"]
+        print(
+            f"{name:<16}{throughput:>12.0f}{stall * 1e3:>16.2f}{latency * 1e3:>20.2f}"
+        )
+        pool.shutdown()
+
+
+def main():
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
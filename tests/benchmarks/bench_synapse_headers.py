@@ -0,0 +1,69 @@
+"""
+Synapse header encoding (``to_headers``) and decoding (``from_headers``) times, per call.
+
+Run with::
+
+    python -m tests.benchmarks.bench_synapse_headers
+"""
+
+import timeit
+from typing import Optional
+
+import numpy as np
+
+from bittensor.core.synapse import Synapse, TerminalInfo
+from bittensor.core.tensor import Tensor
+
+NUMBER = 2_000
+
+
+class TextSynapse(Synapse):
+    prompt: str
+    completion: Optional[str] = None
+
+
+class TensorSynapse(Synapse):
+    scores: list[float]
+    inputs: Optional[Tensor] = None
+    outputs: Optional[Tensor] = None
+
+
+def terminals() -> dict:
+    return {
+        "axon": TerminalInfo(ip="192.0.2.1", port=8091, hotkey="5" * 48),
+        "dendrite": TerminalInfo(
+            ip="192.0.2.2",
+            version=900,
+            nonce=1,
+            uuid="00000000-0000-0000-0000-000000000000",
+            hotkey="5" * 48,
+            signature="0x" + "0" * 128,
+        ),
+    }
+
+
+def synapses() -> dict[str, Synapse]:
+    return {
+        "Synapse": Synapse(**terminals()),
+        "TextSynapse": TextSynapse(prompt="x" * 1_000, **terminals()),
+        "TensorSynapse": TensorSynapse(
+            inputs=Tensor.serialize(np.zeros(10_000, dtype=np.float32)),
+            scores=[0.0] * 256,
+            **terminals(),
+        ),
+    }
+
+
+def main():
+    print(f"{'synapse':<16}{'to_headers (us)':>18}{'from_headers (us)':>20}")
+    for name, synapse in synapses().items():
+        headers = synapse.to_headers()
+        encode = timeit.timeit(synapse.to_headers, number=NUMBER) / NUMBER
+        decode = (
+            timeit.timeit(lambda: synapse.from_headers(headers), number=NUMBER) / NUMBER
+        )
+        print(f"{name:<16}{encode * 1e6:>18.1f}{decode * 1e6:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Encoding, hashing and decoding times of a synapse carrying tensors, through the JSON and binary transports.
+
+Run with::
+
+    python -m tests.benchmarks.bench_tensor_transport
+"""
+
+import json
+import time
+from typing import Optional
+
+import numpy as np
+
+from bittensor.core.binary_transport import (
+    binary_body_hash,
+    decode_synapse,
+    encode_synapse,
+)
+from bittensor.core.synapse import Synapse
+from bittensor.core.tensor import Tensor
+
+SIZES = (1_000, 100_000, 10_000_000)
+ROUNDS = 5
+
+
+class TensorSynapse(Synapse):
+    inputs: Optional[Tensor] = None
+
+    required_hash_fields = ("inputs",)
+
+
+def json_round_trip(array: np.ndarray) -> int:
+    synapse = TensorSynapse(inputs=Tensor.serialize(array))
+    body = json.dumps(synapse.model_dump()).encode()
+    synapse.body_hash
+    received = TensorSynapse(**json.loads(body))
+    received.body_hash
+    received.inputs.deserialize()
+    return len(body)
+
+
+def binary_round_trip(array: np.ndarray) -> int:
+    synapse = TensorSynapse(inputs=Tensor.wrap(array))
+    body = encode_synapse(synapse)
+    binary_body_hash(synapse)
+    received = decode_synapse(TensorSynapse, body)
+    binary_body_hash(received)
+    received.inputs.deserialize()
+    return len(body)
+
+
+def main():
+    print(f"{'elements':>12}{'transport':>12}{'body (B)':>14}{'time (ms)':>12}")
+    for size in SIZES:
+        array = np.random.default_rng(0).standard_normal(size, dtype=np.float32)
+        for name, round_trip in (
+            ("json", json_round_trip),
+            ("binary", binary_round_trip),
+        ):
+            round_trip(array)
+            start = time.perf_counter()
+            for _ in range(ROUNDS):
+                length = round_trip(array)
+            elapsed = (time.perf_counter() - start) / ROUNDS
+            print(f"{size:>12}{name:>12}{length:>14}{elapsed * 1000:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 import pytest
 
+from bittensor.core.async_subtensor import AsyncSubtensor
 from bittensor.core.chain_data import AxonInfo, NeuronInfo
+from bittensor.core.rpc_replay import RpcRecording, RpcReplay
 from bittensor.core.subtensor import Subtensor
 from bittensor.utils.balance import Balance
 from tests.helpers.helpers import FakeWebsocket
@@ -160,3 +162,27 @@ async def test_archive_node_retry(mocker):
     current_block = subtensor.substrate.get_block_number()
     old_block = current_block - 1000
     assert isinstance((subtensor.substrate.get_block(block_number=old_block)), dict)
+
+
+@pytest.mark.asyncio
+async def test_recorded_session_replays(mocker, tmp_path):
+    recording = RpcRecording()
+    mocker.patch(
+        "async_substrate_interface.sync_substrate.connect",
+        mocker.Mock(return_value=FakeWebsocket(seed="metagraph")),
+    )
+    # Not a mock instance, to record the connection initialization too
+    recorded = Subtensor("unknown", rpc_recording=recording).metagraph(1)
+    path = str(tmp_path / "metagraph.json.gz")
+    recording.save(path)
+    mocker.stopall()
+
+    replay = RpcReplay(RpcRecording.load(path))
+    replayed = Subtensor("unknown", rpc_replay=replay).metagraph(1)
+    async with AsyncSubtensor("unknown", rpc_replay=replay) as async_subtensor:
+        async_replayed = await async_subtensor.metagraph(1)
+
+    for metagraph in (replayed, async_replayed):
+        assert metagraph.n == recorded.n == 1024
+        assert metagraph.block == recorded.block
+        assert metagraph.hotkeys == recorded.hotkeys
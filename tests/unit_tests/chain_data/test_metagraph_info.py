@@ -1,4 +1,113 @@
-from bittensor.core.chain_data.metagraph_info import process_nested, _chr_str
+import copy
+
+import numpy as np
+import pytest
+
+from bittensor.core.chain_data.metagraph_info import (
+    ColumnarMetagraphInfo,
+    MetagraphInfo,
+    process_nested,
+    _chr_str,
+)
+from bittensor.core.chain_data.utils import decode_account_id
+
+
+def decoded_metagraph_info(netuid: int = 3, n: int = 4) -> dict:
+    """Returns a decoded selective mechagraph of ``n`` neurons, as returned by the runtime call."""
+    decoded = dict.fromkeys(
+        [
+            "network_registered_at", "block", "tempo", "last_step", "blocks_since_last_step", "subnet_emission",
+            "alpha_in", "alpha_out", "tao_in", "alpha_out_emission", "alpha_in_emission", "tao_in_emission",
+            "pending_alpha_emission", "pending_root_emission", "subnet_volume", "rho", "kappa", "min_allowed_weights",
+            "max_weights_limit", "weights_version", "weights_rate_limit", "activity_cutoff", "max_validators",
+            "num_uids", "max_uids", "burn", "difficulty", "registration_allowed", "pow_registration_allowed",
+            "immunity_period", "min_difficulty", "max_difficulty", "min_burn", "max_burn", "adjustment_alpha",
+            "adjustment_interval", "target_regs_per_interval", "max_regs_per_block", "serving_rate_limit",
+            "commit_reveal_weights_enabled", "commit_reveal_period", "liquid_alpha_enabled", "alpha_high",
+            "alpha_low", "bonds_moving_avg",
+        ],
+        1,
+    )  # fmt: skip
+    accounts = [tuple((uid + i) % 256 for i in range(32)) for uid in range(n)]
+    decoded.update(
+        netuid=netuid,
+        name=None,
+        symbol=None,
+        identity=None,
+        identities=None,
+        owner_hotkey=None,
+        owner_coldkey=None,
+        moving_price=None,
+        validators=None,
+        hotkeys=accounts,
+        coldkeys=[(account,) for account in reversed(accounts)],
+        axons=[{}] * n,
+        active=[uid % 2 == 0 for uid in range(n)],
+        validator_permit=[uid == 0 for uid in range(n)],
+        pruning_score=[uid * 1000 % 65536 for uid in range(n)],
+        last_update=[100 + uid for uid in range(n)],
+        emission=[uid * 10**9 for uid in range(n)],
+        dividends=[uid * 2000 % 65536 for uid in range(n)],
+        incentives=[uid * 3000 % 65536 for uid in range(n)],
+        consensus=[uid * 4000 % 65536 for uid in range(n)],
+        trust=[uid * 5000 % 65536 for uid in range(n)],
+        rank=[uid * 6000 % 65536 for uid in range(n)],
+        block_at_registration=[uid for uid in range(n)],
+        alpha_stake=[uid * 10**9 + 7 for uid in range(n)],
+        tao_stake=[uid * 10**10 + 3 for uid in range(n)],
+        total_stake=[uid * 10**11 for uid in range(n)],
+        tao_dividends_per_hotkey=[(accounts[uid], uid) for uid in range(n)],
+        alpha_dividends_per_hotkey=[(accounts[uid], 2 * uid) for uid in range(n)],
+    )
+    return decoded
+
+
+def test_columnar_metagraph_info_matches_metagraph_info():
+    """Tests that the columnar views hold the same values as the regular MetagraphInfo lists."""
+    regular = MetagraphInfo.from_dict(decoded_metagraph_info())
+    columnar = ColumnarMetagraphInfo.from_dict(decoded_metagraph_info())
+
+    assert isinstance(columnar, MetagraphInfo)
+    for field in (
+        "hotkeys", "coldkeys", "active", "validator_permit", "pruning_score", "last_update", "emission", "dividends",
+        "incentives", "consensus", "trust", "rank", "block_at_registration", "alpha_stake", "tao_stake",
+        "total_stake", "tao_dividends_per_hotkey", "alpha_dividends_per_hotkey",
+    ):  # fmt: skip
+        assert list(getattr(columnar, field)) == getattr(regular, field), field
+    assert [b.netuid for b in columnar.alpha_stake] == [3] * 4
+    assert columnar.emission[1:3] == regular.emission[1:3]
+    assert columnar.name == regular.name and columnar.burn == regular.burn
+
+
+def test_columnar_metagraph_info_leaves_decoded_data_untouched():
+    """Tests that the same decoded data can be decoded again after a columnar decoding."""
+    decoded = decoded_metagraph_info()
+    original = copy.deepcopy(decoded)
+
+    columnar = ColumnarMetagraphInfo.from_dict(decoded)
+
+    assert decoded == original
+    assert MetagraphInfo.from_dict(decoded).hotkeys == list(columnar.hotkeys)
+
+
+def test_columnar_metagraph_info_vectorized_access():
+    """Tests the whole-column accessors and the account id lookups, which decode no other item."""
+    columnar = ColumnarMetagraphInfo.from_dict(decoded_metagraph_info())
+    hotkey = decode_account_id(tuple(range(2, 34)))
+
+    np.testing.assert_array_equal(columnar.total_stake.tao, [0, 100, 200, 300])
+    np.testing.assert_array_equal(
+        columnar.total_stake.rao, [0, 10**11, 2 * 10**11, 3 * 10**11]
+    )
+    np.testing.assert_allclose(
+        columnar.trust.floats, [uid * 5000 / 65535 for uid in range(4)]
+    )
+    assert columnar.hotkeys.index(hotkey) == 2
+    assert hotkey in columnar.hotkeys
+    assert columnar.coldkeys[1] == hotkey
+    assert "not an address" not in columnar.hotkeys
+    with pytest.raises(ValueError):
+        columnar.hotkeys.index(hotkey, 3)
 
 
 def test_process_nested():
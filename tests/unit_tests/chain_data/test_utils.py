@@ -101,3 +101,25 @@ from bittensor.core.chain_data import utils
 )
 def test_decode_metadata(metadata, response):
     assert utils.decode_metadata(metadata) == response
+
+
+def test_from_scale_encoding_using_type_string_reuses_decoder_cache(mocker):
+    """Tests that decoding builds the runtime configuration once and reuses it across calls."""
+    utils.scale_decoder_cache.clear()
+    load_preset = mocker.spy(utils, "load_type_registry_preset")
+    account_ids = [bytes(range(i, i + 32)) for i in range(3)]
+    encoded = bytes([len(account_ids) << 2]) + b"".join(account_ids)
+
+    first = utils.from_scale_encoding_using_type_string(encoded, "Vec<AccountId>")
+    second = utils.from_scale_encoding_using_type_string(
+        list(encoded), "Vec<AccountId>"
+    )
+
+    assert first == second == [f"0x{account_id.hex()}" for account_id in account_ids]
+    load_preset.assert_called_once_with("legacy")
+
+
+def test_scale_decoder_cache_unknown_type():
+    """Tests that an unknown type string raises NotImplementedError."""
+    with pytest.raises(NotImplementedError):
+        utils.scale_decoder_cache.decoder_class("NotARealType")
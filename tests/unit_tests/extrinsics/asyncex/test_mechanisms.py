@@ -310,3 +310,52 @@ async def test_mechanism_sub_weights_extrinsic(mocker, subtensor, fake_wallet):
         wait_for_finalization=True,
     )
     assert result == mocked_sign_and_send_extrinsic.return_value
+
+
+@pytest.mark.asyncio
+async def test_set_mechanism_weights_batch_extrinsic(mocker, fake_wallet):
+    """Verify that async `set_mechanism_weights_batch_extrinsic` submits the eligible targets in one batch."""
+    # Preps
+    fake_wallet.hotkey.ss58_address = "hotkey"
+    mocker.patch.object(mechanism, "unlock_key", return_value=mocker.Mock(success=True))
+
+    async def compose_call(**kwargs):
+        return kwargs
+
+    fake_subtensor = mocker.AsyncMock(
+        **{
+            "substrate.compose_call.side_effect": compose_call,
+            "substrate.query_multi.return_value": [
+                (None, 100),
+                (None, 3),
+                (None, False),
+                (None, 10),
+                (None, 360),
+                (None, 1),
+                (None, [0, 0, 0, 50]),
+                (None, [0, 0, 0, 95]),
+            ],
+        }
+    )
+
+    # Call
+    results = await mechanism.set_mechanism_weights_batch_extrinsic(
+        subtensor=fake_subtensor,
+        wallet=fake_wallet,
+        weights={(1, 0): ([0, 1], [0.5, 0.5]), (1, 1): ([0], [1.0])},
+        wait_for_inclusion=False,
+        wait_for_finalization=False,
+    )
+
+    # Asserts
+    assert results == {
+        (1, 0): (True, "Not waiting for finalization or inclusion."),
+        (1, 1): (False, "No attempt made. Perhaps it is too soon to commit weights!"),
+    }
+    fake_subtensor.substrate.query_multi.assert_awaited_once()
+    fake_subtensor.substrate.submit_extrinsic.assert_awaited_once()
+    batch_call = fake_subtensor.substrate.compose_call.call_args.kwargs
+    assert batch_call["call_function"] == "force_batch"
+    assert [
+        call["call_params"]["mecid"] for call in batch_call["call_params"]["calls"]
+    ] == [0]
@@ -0,0 +1,50 @@
+import pytest
+from async_substrate_interface.errors import SubstrateRequestException
+
+from bittensor.core.extrinsics.asyncex import pipeline
+
+
+@pytest.mark.asyncio
+async def test_async_extrinsic_pipeline(mocker):
+    """Verify that extrinsics are submitted with local nonces and waited for concurrently."""
+
+    # Preps
+    async def awaitable(value):
+        return value
+
+    async def submit_extrinsic(extrinsic, wait_for_inclusion, wait_for_finalization):
+        if extrinsic["nonce"] == 6:
+            raise SubstrateRequestException("Invalid Transaction: Future")
+        return mocker.Mock(
+            extrinsic_hash=f"0x0{extrinsic['nonce']}",
+            block_hash="block_hash",
+            is_success=awaitable(True),
+        )
+
+    fake_substrate = mocker.AsyncMock(
+        **{
+            "rpc_request.return_value": {"result": 5},
+            "create_signed_extrinsic.side_effect": lambda **kwargs: kwargs,
+            "submit_extrinsic.side_effect": submit_extrinsic,
+        }
+    )
+    fake_wallet = mocker.Mock(**{"coldkey.ss58_address": "coldkey"})
+    extrinsic_pipeline = pipeline.AsyncExtrinsicPipeline(
+        mocker.Mock(substrate=fake_substrate)
+    )
+
+    # Call
+    for call in ("call1", "call2", "call3"):
+        await extrinsic_pipeline.submit(call, fake_wallet)
+    outcomes = await extrinsic_pipeline.wait()
+
+    # Asserts
+    fake_substrate.rpc_request.assert_awaited_once_with(
+        "account_nextIndex", ["coldkey"]
+    )
+    assert [outcome.nonce for outcome in outcomes] == [5, 6, 7]
+    assert [outcome.success for outcome in outcomes] == [True, False, True]
+    assert outcomes[0].extrinsic_hash == "0x05"
+    assert "Future" in outcomes[1].message
+    assert "coldkey" not in extrinsic_pipeline.nonces
+    assert await extrinsic_pipeline.wait() == []
@@ -178,3 +178,51 @@ async def test_unstake_multiple_extrinsic(fake_wallet, mocker):
         use_nonce=True,
         period=None,
     )
+
+
+@pytest.mark.asyncio
+async def test_unstake_multiple_extrinsic_batch_failure(fake_wallet, mocker):
+    """Verify that a failed atomic batch fails every unstake without querying the post-state."""
+
+    # Preps
+    async def awaitable(value):
+        return value
+
+    fake_substrate = mocker.AsyncMock(
+        **{
+            "compose_call.side_effect": lambda **kwargs: kwargs,
+            "submit_extrinsic.return_value": mocker.Mock(
+                is_success=awaitable(False),
+                error_message=awaitable(
+                    {"type": "Module", "name": "NotEnoughStake", "docs": ["..."]}
+                ),
+            ),
+        }
+    )
+    fake_subtensor = mocker.AsyncMock(
+        **{
+            "get_balance.return_value": Balance(10.0),
+            "substrate": fake_substrate,
+        }
+    )
+    mocker.patch.object(
+        unstaking, "get_old_stakes", return_value=[Balance(1.1), Balance(0.3)]
+    )
+    fake_wallet.coldkeypub.ss58_address = "coldkey"
+
+    # Call
+    result = await unstaking.unstake_multiple_extrinsic(
+        subtensor=fake_subtensor,
+        wallet=fake_wallet,
+        hotkey_ss58s=["hotkey1", "hotkey2"],
+        netuids=[1, 2],
+        amounts=[Balance.from_tao(1.0), Balance.from_tao(0.2)],
+        batch=True,
+    )
+
+    # Asserts
+    assert result is False
+    fake_subtensor.sign_and_send_extrinsic.assert_not_called()
+    fake_substrate.submit_extrinsic.assert_awaited_once()
+    assert fake_substrate.compose_call.call_args.kwargs["call_function"] == "batch_all"
+    fake_substrate.query_multi.assert_not_called()
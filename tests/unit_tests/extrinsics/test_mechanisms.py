@@ -304,3 +304,98 @@ def test_mechanism_sub_weights_extrinsic(mocker, subtensor, fake_wallet):
         wait_for_finalization=True,
     )
     assert result == mocked_sign_and_send_extrinsic.return_value
+
+
+def test_set_mechanism_weights_batch_extrinsic(mocker, fake_wallet):
+    """Verify that `set_mechanism_weights_batch_extrinsic` prefetches eligibility with one `query_multi` and submits
+    the eligible targets in one `Utility.force_batch` extrinsic."""
+    # Preps
+    fake_wallet.hotkey.ss58_address = "hotkey"
+    mocker.patch.object(mechanism, "unlock_key", return_value=mocker.Mock(success=True))
+    mocker.patch.object(mechanism, "get_encrypted_commit", return_value=(b"commit", 42))
+    fake_subtensor = mocker.Mock(
+        **{
+            "substrate.compose_call.side_effect": lambda **kwargs: kwargs,
+            "substrate.submit_extrinsic.return_value": mocker.Mock(
+                is_success=True,
+                triggered_events=[
+                    {"event": {"module_id": "Utility", "event_id": "ItemCompleted"}},
+                    {
+                        "event": {
+                            "module_id": "Utility",
+                            "event_id": "ItemFailed",
+                            "attributes": {"error": {"BadOrigin": None}},
+                        }
+                    },
+                ],
+            ),
+            "substrate.query_multi.return_value": [
+                (None, 100),
+                # netuid 1: uid, commit-reveal, rate limit, tempo, reveal period
+                (None, 0),
+                (None, False),
+                (None, 10),
+                (None, 360),
+                (None, 1),
+                # netuid 2
+                (None, 1),
+                (None, True),
+                (None, 10),
+                (None, 360),
+                (None, 1),
+                # netuid 3
+                (None, None),
+                (None, False),
+                (None, 10),
+                (None, 360),
+                (None, 1),
+                # LastUpdate of (1, 0), (1, 1), (2, 0) and (3, 0)
+                (None, [50]),
+                (None, [95]),
+                (None, [0, 20]),
+                (None, []),
+            ],
+        }
+    )
+
+    # Call
+    results = mechanism.set_mechanism_weights_batch_extrinsic(
+        subtensor=fake_subtensor,
+        wallet=fake_wallet,
+        weights={
+            (1, 0): ([0, 1], [0.5, 0.5]),
+            (1, 1): ([0], [1.0]),
+            (2, 0): ([0, 1], [0.2, 0.8]),
+            (3, 0): ([0], [1.0]),
+        },
+    )
+
+    # Asserts
+    assert list(results) == [(1, 0), (1, 1), (2, 0), (3, 0)]
+    assert results[(1, 0)] == (True, "")
+    assert results[(1, 1)] == (
+        False,
+        "No attempt made. Perhaps it is too soon to commit weights!",
+    )
+    assert results[(2, 0)][0] is False
+    assert "BadOrigin" in results[(2, 0)][1]
+    assert results[(3, 0)] == (False, "Hotkey hotkey not registered in subnet 3")
+    fake_subtensor.substrate.query_multi.assert_called_once()
+    fake_subtensor.substrate.submit_extrinsic.assert_called_once()
+    fake_subtensor.substrate.get_account_next_index.assert_called_once_with("hotkey")
+
+    batch_call = fake_subtensor.substrate.compose_call.call_args.kwargs
+    assert batch_call["call_function"] == "force_batch"
+    calls = batch_call["call_params"]["calls"]
+    assert [call["call_function"] for call in calls] == [
+        "set_mechanism_weights",
+        "commit_timelocked_mechanism_weights",
+    ]
+    assert calls[0]["call_params"]["dests"] == [0, 1]
+    assert calls[1]["call_params"] == {
+        "netuid": 2,
+        "mecid": 0,
+        "commit": b"commit",
+        "reveal_round": 42,
+        "commit_reveal_version": 4,
+    }
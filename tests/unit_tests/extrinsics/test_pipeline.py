@@ -0,0 +1,101 @@
+from async_substrate_interface.errors import SubstrateRequestException
+
+from bittensor.core.extrinsics import pipeline
+
+
+def test_extrinsic_pipeline_submits_back_to_back_and_waits(mocker):
+    """Verify that extrinsics are submitted with local nonces, then waited for together."""
+    # Preps
+    blocks = {
+        100: [],
+        101: [mocker.Mock(extrinsic_hash=None), mocker.Mock(extrinsic_hash=b"\x01")],
+        102: [mocker.Mock(extrinsic_hash=b"\x02")],
+    }
+    fake_substrate = mocker.Mock(
+        **{
+            "rpc_request.side_effect": [{"result": 7}, {"result": 8}],
+            "get_block_number.side_effect": lambda block_hash: 100
+            if block_hash is None
+            else 102,
+            "create_signed_extrinsic.side_effect": lambda **kwargs: kwargs,
+            "submit_extrinsic.side_effect": [
+                SubstrateRequestException("Invalid Transaction: Stale"),
+                mocker.Mock(extrinsic_hash="0x01"),
+                mocker.Mock(extrinsic_hash="0x02"),
+            ],
+            "get_block_hash.side_effect": lambda block_number: f"hash{block_number}",
+            "get_block.side_effect": lambda block_hash: {
+                "extrinsics": blocks[int(block_hash[4:])]
+            },
+        }
+    )
+    receipts = {
+        "0x01": mocker.Mock(is_success=True),
+        "0x02": mocker.Mock(
+            is_success=False,
+            error_message={"type": "Module", "name": "Failure", "docs": ["..."]},
+        ),
+    }
+    mocker.patch.object(
+        pipeline,
+        "ExtrinsicReceipt",
+        side_effect=lambda **kwargs: receipts[kwargs["extrinsic_hash"]],
+    )
+    mocked_sleep = mocker.patch.object(pipeline.time, "sleep")
+    fake_wallet = mocker.Mock(**{"hotkey.ss58_address": "hotkey"})
+    extrinsic_pipeline = pipeline.ExtrinsicPipeline(
+        mocker.Mock(substrate=fake_substrate)
+    )
+
+    # Call
+    indexes = [
+        extrinsic_pipeline.submit("call1", fake_wallet, sign_with="hotkey"),
+        extrinsic_pipeline.submit("call2", fake_wallet, sign_with="hotkey"),
+    ]
+    outcomes = extrinsic_pipeline.wait()
+
+    # Asserts
+    assert indexes == [0, 1]
+    assert [
+        call.kwargs["nonce"]
+        for call in fake_substrate.create_signed_extrinsic.call_args_list
+    ] == [7, 8, 9]
+    assert outcomes[0] == pipeline.ExtrinsicOutcome(True, "", 8, "0x01", "hash101")
+    assert outcomes[1].success is False
+    assert "Failure" in outcomes[1].message
+    assert (outcomes[1].nonce, outcomes[1].block_hash) == (9, "hash102")
+    assert fake_substrate.rpc_request.call_count == 2
+    mocked_sleep.assert_not_called()
+
+
+def test_extrinsic_pipeline_expired_extrinsic_resets_nonce(mocker):
+    """Verify that an extrinsic not included within its era fails and resyncs the account nonce."""
+    # Preps
+    fake_substrate = mocker.Mock(
+        **{
+            "rpc_request.return_value": {"result": 3},
+            "get_block_number.side_effect": lambda block_hash: 100
+            if block_hash is None
+            else 105,
+            "submit_extrinsic.return_value": mocker.Mock(extrinsic_hash="0x01"),
+            "get_block.return_value": {"extrinsics": []},
+        }
+    )
+    fake_wallet = mocker.Mock(**{"coldkey.ss58_address": "coldkey"})
+    extrinsic_pipeline = pipeline.ExtrinsicPipeline(
+        mocker.Mock(substrate=fake_substrate)
+    )
+
+    # Call
+    extrinsic_pipeline.submit("call", fake_wallet, period=4)
+    assert "coldkey" in extrinsic_pipeline.nonces
+    outcomes = extrinsic_pipeline.wait()
+
+    # Asserts
+    assert outcomes == [
+        pipeline.ExtrinsicOutcome(
+            False, "Extrinsic was not included before its era expired.", 3, "0x01"
+        )
+    ]
+    assert "coldkey" not in extrinsic_pipeline.nonces
+    assert fake_substrate.get_block.call_count == 6
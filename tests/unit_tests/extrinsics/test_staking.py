@@ -194,3 +194,60 @@ def test_set_auto_stake_extrinsic(
 
     assert success is res_success
     assert message == res_message
+
+
+def test_add_stake_multiple_extrinsic_batch(mocker):
+    """Verify that batch `add_stake_multiple_extrinsic` submits one `Utility.batch_all` extrinsic."""
+    # Preps
+    fake_subtensor = mocker.Mock(
+        **{
+            "get_balance.return_value": Balance(10.0),
+            "substrate.compose_call.side_effect": lambda **kwargs: kwargs,
+            "substrate.submit_extrinsic.return_value": mocker.Mock(is_success=True),
+            "substrate.query_multi.return_value": [
+                (None, {"data": {"free": 4_000_000_000}}),
+                (None, {"bits": 2**64}),
+                (None, 1_000_000_000),
+                (None, {"bits": 2**64}),
+                (None, {"bits": 2**64}),
+                (None, 2_000_000_000),
+                (None, {"bits": 2**65}),
+            ],
+        }
+    )
+    mocker.patch.object(
+        staking, "get_old_stakes", return_value=[Balance(1.1), Balance(0.3)]
+    )
+    fake_wallet_ = mocker.Mock(**{"coldkeypub.ss58_address": "coldkey"})
+
+    # Call
+    result = staking.add_stake_multiple_extrinsic(
+        subtensor=fake_subtensor,
+        wallet=fake_wallet_,
+        hotkey_ss58s=["hotkey1", "hotkey2"],
+        netuids=[1, 2],
+        amounts=[Balance.from_tao(1.1), Balance.from_tao(2.2)],
+        wait_for_inclusion=True,
+        wait_for_finalization=True,
+        batch=True,
+    )
+
+    # Asserts
+    assert result is True
+    fake_subtensor.sign_and_send_extrinsic.assert_not_called()
+    fake_subtensor.get_stake.assert_not_called()
+    fake_subtensor.substrate.submit_extrinsic.assert_called_once()
+    fake_subtensor.substrate.query_multi.assert_called_once()
+
+    batch_call = fake_subtensor.substrate.compose_call.call_args.kwargs
+    assert batch_call["call_module"] == "Utility"
+    assert batch_call["call_function"] == "batch_all"
+    assert [
+        (call["call_function"], call["call_params"]["hotkey"])
+        for call in batch_call["call_params"]["calls"]
+    ] == [("add_stake", "hotkey1"), ("add_stake", "hotkey2")]
+    assert batch_call["call_params"]["calls"][1]["call_params"] == {
+        "hotkey": "hotkey2",
+        "amount_staked": 2199999333,
+        "netuid": 2,
+    }
@@ -172,3 +172,63 @@ def test_unstake_multiple_extrinsic(fake_wallet, mocker):
         use_nonce=True,
         period=None,
     )
+
+
+def test_unstake_multiple_extrinsic_batch_reports_failed_calls(fake_wallet, mocker):
+    """Verify that non-atomic batch `unstake_multiple_extrinsic` reports each call result from the events."""
+    # Preps
+    events = [
+        {"event": {"module_id": "Utility", "event_id": "ItemCompleted"}},
+        {
+            "event": {
+                "module_id": "Utility",
+                "event_id": "ItemFailed",
+                "attributes": {
+                    "error": {"Module": {"index": 7, "error": "0x05000000"}}
+                },
+            }
+        },
+        {"event": {"module_id": "Utility", "event_id": "BatchCompletedWithErrors"}},
+    ]
+    module_error = mocker.Mock(docs=["Not enough stake."])
+    module_error.name = "NotEnoughStakeToWithdraw"
+    fake_subtensor = mocker.Mock(
+        **{
+            "get_balance.return_value": Balance(10.0),
+            "substrate.compose_call.side_effect": lambda **kwargs: kwargs,
+            "substrate.submit_extrinsic.return_value": mocker.Mock(
+                is_success=True, triggered_events=events
+            ),
+            "substrate.init_runtime.return_value.metadata.get_module_error.return_value": module_error,
+            "substrate.query_multi.return_value": [(None, None)] * 7,
+        }
+    )
+    mocker.patch.object(
+        unstaking, "get_old_stakes", return_value=[Balance(1.1), Balance(0.3)]
+    )
+    mocked_error = mocker.patch.object(unstaking.logging, "error")
+    fake_wallet.coldkeypub.ss58_address = "coldkey"
+
+    # Call
+    result = unstaking.unstake_multiple_extrinsic(
+        subtensor=fake_subtensor,
+        wallet=fake_wallet,
+        hotkey_ss58s=["hotkey1", "hotkey2"],
+        netuids=[1, 2],
+        amounts=[Balance.from_tao(1.0), Balance.from_tao(0.2)],
+        batch=True,
+        atomic=False,
+    )
+
+    # Asserts
+    assert result is True
+    fake_subtensor.sign_and_send_extrinsic.assert_not_called()
+    batch_call = fake_subtensor.substrate.compose_call.call_args.kwargs
+    assert batch_call["call_function"] == "force_batch"
+    assert len(batch_call["call_params"]["calls"]) == 2
+    fake_subtensor.substrate.init_runtime.return_value.metadata.get_module_error.assert_called_once_with(
+        module_index=7, error_index=5
+    )
+    mocked_error.assert_called_once()
+    assert "hotkey2" in mocked_error.call_args.args[0]
+    assert "NotEnoughStakeToWithdraw" in mocked_error.call_args.args[0]
@@ -29,3 +29,33 @@ def test_old_stake(subtensor, mocker):
     result = utils.get_old_stakes(wallet, hotkey_ss58s, netuids, all_stakes)
 
     assert result == [expected_stake, Balance.from_tao(0)]
+
+
+def test_get_batch_call_results():
+    events = [
+        {"event": {"module_id": "Balances", "event_id": "Withdraw"}},
+        {"event": {"module_id": "Utility", "event_id": "ItemCompleted"}},
+        {
+            "event": {
+                "module_id": "Utility",
+                "event_id": "ItemFailed",
+                "attributes": {"error": {"BadOrigin": None}},
+            }
+        },
+        {"event": {"module_id": "Utility", "event_id": "ItemCompleted"}},
+        {"event": {"module_id": "Utility", "event_id": "BatchCompletedWithErrors"}},
+    ]
+
+    results = utils.get_batch_call_results(events)
+
+    assert [success for success, _ in results] == [True, False, True]
+    assert "BadOrigin" in results[1][1]
+
+
+def test_stake_from_alpha_shares():
+    stake = utils.stake_from_alpha_shares(
+        {"bits": 2**64}, 3_000_000_000, {"bits": 2**65}, netuid=2
+    )
+
+    assert stake == Balance.from_rao(1_500_000_000).set_unit(2)
+    assert utils.stake_from_alpha_shares(None, None, None, netuid=2).rao == 0
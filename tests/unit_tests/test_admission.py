@@ -0,0 +1,116 @@
+import asyncio
+import time
+
+import pytest
+
+from bittensor.core.admission import (
+    AdmissionScheduler,
+    QueueFullError,
+    RequestExpiredError,
+)
+
+
+async def _wait_until_queued(scheduler: AdmissionScheduler, count: int):
+    while scheduler.queued < count:
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_admits_in_priority_order():
+    scheduler = AdmissionScheduler(max_concurrency=1, max_queue_size=10)
+    admitted = []
+
+    async def request(priority):
+        async with scheduler.slot(priority):
+            admitted.append(priority)
+
+    await scheduler.acquire(0)
+    tasks = []
+    for priority in (1, 3, 2, 3):
+        tasks.append(asyncio.create_task(request(priority)))
+        await _wait_until_queued(scheduler, len(tasks))
+    scheduler.release()
+    await asyncio.gather(*tasks)
+
+    assert admitted == [3, 3, 2, 1]
+    assert scheduler.metrics == {
+        "running": 0,
+        "queued": 0,
+        "admitted": 5,
+        "shed": 0,
+        "expired": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_admits_up_to_max_concurrency_without_queueing():
+    scheduler = AdmissionScheduler(max_concurrency=2, max_queue_size=0)
+
+    await scheduler.acquire(0)
+    await scheduler.acquire(0)
+    with pytest.raises(QueueFullError):
+        await scheduler.acquire(0)
+
+    assert scheduler.running == 2
+
+
+@pytest.mark.asyncio
+async def test_sheds_lowest_priority_when_queue_is_full():
+    scheduler = AdmissionScheduler(max_concurrency=1, max_queue_size=1)
+    await scheduler.acquire(0)
+    low = asyncio.create_task(scheduler.acquire(1))
+    await _wait_until_queued(scheduler, 1)
+
+    # Not higher than the lowest waiter: shed itself.
+    with pytest.raises(QueueFullError):
+        await scheduler.acquire(1)
+
+    # Higher than the lowest waiter: takes its place.
+    high = asyncio.create_task(scheduler.acquire(2))
+    with pytest.raises(QueueFullError):
+        await low
+    scheduler.release()
+    await high
+
+    assert scheduler.shed == 2
+    assert scheduler.running == 1
+
+
+@pytest.mark.asyncio
+async def test_drops_expired_requests():
+    scheduler = AdmissionScheduler(max_concurrency=1, max_queue_size=10)
+
+    with pytest.raises(RequestExpiredError):
+        await scheduler.acquire(0, deadline=time.time() - 1)
+
+    await scheduler.acquire(0)
+    with pytest.raises(RequestExpiredError):
+        await scheduler.acquire(0, deadline=time.time() + 0.01)
+
+    assert scheduler.expired == 2
+    assert scheduler.queued == 0
+    scheduler.release()
+    assert scheduler.running == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_slot():
+    scheduler = AdmissionScheduler(max_concurrency=1, max_queue_size=10)
+    await scheduler.acquire(0)
+    waiter = asyncio.create_task(scheduler.acquire(0))
+    await _wait_until_queued(scheduler, 1)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    scheduler.release()
+
+    assert scheduler.running == 0
+
+
+@pytest.mark.parametrize(
+    "max_concurrency, max_queue_size", [(0, 1), (1, -1)], ids=["concurrency", "queue"]
+)
+def test_invalid_limits(max_concurrency, max_queue_size):
+    with pytest.raises(ValueError):
+        AdmissionScheduler(max_concurrency, max_queue_size)
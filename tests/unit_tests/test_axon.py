@@ -1,6 +1,8 @@
 import asyncio
 import contextlib
+import os
 import re
+import socket
 import threading
 import time
 from dataclasses import dataclass
@@ -11,24 +13,38 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import aiohttp
 import fastapi
 import netaddr
+import numpy as np
 import pydantic
 import pytest
 import uvicorn
 from fastapi.testclient import TestClient
 from starlette.requests import Request
 
-from bittensor.core.axon import Axon, AxonMiddleware, FastAPIThreadedServer
-from bittensor.core.errors import RunException
+from bittensor.core.admission import AdmissionScheduler
+from bittensor.core.axon import V_7_2_0, Axon, AxonMiddleware, FastAPIThreadedServer
+from bittensor.core.binary_transport import (
+    BINARY_CONTENT_TYPE,
+    binary_body_hash,
+    decode_synapse,
+    encode_synapse,
+)
+from bittensor.core.crypto_pool import CryptoPool
+from bittensor.core.dendrite import Dendrite
+from bittensor.core.errors import PriorityException, RunException
 from bittensor.core.settings import version_as_int
 from bittensor.core.stream import StreamingSynapse
-from bittensor.core.synapse import Synapse
+from bittensor.core.synapse import Synapse, TerminalInfo
+from bittensor.core.tensor import Tensor
 from bittensor.core.threadpool import PriorityThreadPoolExecutor
 from bittensor.utils.axon_utils import (
     allowed_nonce_window_ns,
     calculate_diff_seconds,
     ALLOWED_DELTA,
     NANOSECONDS_IN_SECOND,
+    MemoryNonceStore,
+    SQLiteNonceStore,
 )
+from tests.helpers import get_mock_wallet
 
 
 def test_attach_initial(mock_get_external_ip):
@@ -76,6 +92,23 @@ def test_attach_initial(mock_get_external_ip):
         server.attach(forward_fn, blacklist_fn, priority_fn, wrong_verify_fn)
 
 
+def test_admission_scheduler_config(mock_get_external_ip):
+    assert Axon().admission_scheduler is None
+
+    axon = Axon(max_concurrent_requests=4, max_queued_requests=8)
+
+    assert axon.admission_scheduler.max_concurrency == 4
+    assert axon.admission_scheduler.max_queue_size == 8
+
+
+def test_axon_workers_config(mock_get_external_ip):
+    assert Axon()._config.axon.workers == 1
+    assert Axon(workers=4)._config.axon.workers == 4
+
+    with pytest.raises(AssertionError):
+        Axon(workers=-1)
+
+
 def test_attach(mock_get_external_ip):
     # Create a mock AxonServer instance
     server = Axon()
@@ -188,6 +221,7 @@ class AxonMock:
         self.forward_fns = {}
         self.verify_fns = {}
         self.thread_pool = PriorityThreadPoolExecutor(max_workers=1)
+        self.admission_scheduler = None
 
 
 class SynapseMock(Synapse):
@@ -260,6 +294,22 @@ async def test_priority_pass(middleware):
     assert synapse.axon.status_code != 408
 
 
+@pytest.mark.asyncio
+async def test_admit_sheds_with_503(middleware):
+    middleware.axon.admission_scheduler = AdmissionScheduler(
+        max_concurrency=1, max_queue_size=0
+    )
+    running, shed = SynapseMock(), SynapseMock()
+
+    async with middleware.admit(running, 1.0, time.time()):
+        with pytest.raises(PriorityException):
+            async with middleware.admit(shed, 1.0, time.time()):
+                pass
+
+    assert shed.axon.status_code == 503
+    assert middleware.axon.admission_scheduler.metrics["running"] == 0
+
+
 @pytest.mark.parametrize(
     "body, expected",
     [
@@ -285,6 +335,10 @@ async def test_verify_body_integrity_happy_path(
 
     # Assert
     assert result == expected, "The parsed body should match the expected dictionary."
+    assert (
+        mock_request.state.synapse
+        is axon_instance.forward_class_types["test_endpoint"].return_value
+    ), "The verified synapse should be cached on the request state."
 
 
 @pytest.mark.parametrize(
@@ -477,6 +531,7 @@ class TestAxonMiddleware(IsolatedAsyncioTestCase):
             "request_name": Synapse,
         }
         self.mock_axon.wallet.hotkey.sign.return_value = bytes.fromhex("aabbccdd")
+        self.mock_axon.crypto_pool = CryptoPool()
         # Create an instance of AxonMiddleware
         self.axon_middleware = AxonMiddleware(self.mock_app, self.mock_axon)
         return self.axon_middleware
@@ -659,6 +714,88 @@ class TestAxonHTTPAPIResponses:
         assert response.status_code == 409
         assert response.json() == {"message": error_message}
 
+    async def test_synapse__body_parsed_once(
+        self, http_client, axon, custom_synapse_cls, no_verify_axon
+    ):
+        verified_synapses, forwarded_synapses = [], []
+        verify_body_integrity = axon.verify_body_integrity
+
+        async def spy_verify_body_integrity(request: Request):
+            body = await verify_body_integrity(request)
+            verified_synapses.append(request.state.synapse)
+            return body
+
+        async def forward_fn(synapse: custom_synapse_cls):
+            forwarded_synapses.append(synapse)
+            return synapse
+
+        axon.verify_body_integrity = spy_verify_body_integrity
+        axon.attach(forward_fn)
+
+        response = http_client.post_synapse(custom_synapse_cls())
+        assert response.status_code == 200
+        assert len(forwarded_synapses) == 1
+        assert forwarded_synapses[0] is verified_synapses[0]
+
+    async def test_synapse__binary_transport(self, http_client, axon, no_verify_axon):
+        class TensorSynapse(Synapse):
+            inputs: Optional[Tensor] = None
+            outputs: Optional[Tensor] = None
+
+            required_hash_fields = ("inputs",)
+
+        async def forward_fn(synapse: TensorSynapse):
+            synapse.outputs = Tensor.wrap(synapse.inputs.deserialize() * 2)
+            return synapse
+
+        axon.attach(forward_fn)
+        request_synapse = TensorSynapse(inputs=Tensor.wrap(np.arange(4.0)))
+
+        response = http_client.post(
+            "/TensorSynapse",
+            content=encode_synapse(request_synapse),
+            headers={
+                "computed_body_hash": binary_body_hash(request_synapse),
+                "content-type": BINARY_CONTENT_TYPE,
+            },
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == BINARY_CONTENT_TYPE
+        response_synapse = decode_synapse(TensorSynapse, response.content)
+        assert response_synapse.outputs.deserialize().tolist() == [0, 2, 4, 6]
+        assert response.headers["computed_body_hash"] == binary_body_hash(
+            response_synapse
+        )
+
+        tampered = request_synapse.model_copy(
+            update={"inputs": Tensor.wrap(np.ones(4))}
+        )
+        response = http_client.post(
+            "/TensorSynapse",
+            content=encode_synapse(tampered),
+            headers={
+                "computed_body_hash": binary_body_hash(request_synapse),
+                "content-type": BINARY_CONTENT_TYPE,
+            },
+        )
+        assert response.status_code == 500
+
+    async def test_synapse__admission_scheduled(
+        self, http_client, axon, custom_synapse_cls, no_verify_axon
+    ):
+        async def forward_fn(synapse: custom_synapse_cls):
+            return synapse
+
+        axon.attach(forward_fn)
+        axon.admission_scheduler = AdmissionScheduler(
+            max_concurrency=1, max_queue_size=1
+        )
+
+        response = http_client.post_synapse(custom_synapse_cls())
+        assert response.status_code == 200
+        assert axon.admission_scheduler.metrics["admitted"] == 1
+        assert axon.admission_scheduler.metrics["running"] == 0
+
     async def test_synapse__internal_error(
         self, http_client, axon, custom_synapse_cls, no_verify_axon
     ):
@@ -826,3 +963,235 @@ async def test_threaded_fastapi():
 
         with pytest.raises(aiohttp.ClientConnectorError):
             await session.get("/")
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def nonce_store_factory(request, tmp_path):
+    stores = []
+
+    def factory(**kwargs):
+        if request.param == "memory":
+            store = MemoryNonceStore(**kwargs)
+        else:
+            store = SQLiteNonceStore(str(tmp_path / "nonces.db"), **kwargs)
+        stores.append(store)
+        return store
+
+    yield factory
+    for store in stores:
+        if isinstance(store, SQLiteNonceStore):
+            store.close()
+
+
+def test_nonce_store_update_if_newer(nonce_store_factory):
+    store = nonce_store_factory()
+
+    assert store.update_if_newer("hot:uuid", 10)
+    assert not store.update_if_newer("hot:uuid", 10)
+    assert not store.update_if_newer("hot:uuid", 5)
+    assert store.update_if_newer("hot:uuid", 11)
+
+    assert store.get("hot:uuid") == store["hot:uuid"] == 11
+    assert store.get("other:uuid") is None
+    assert "hot:uuid" in store
+    assert len(store) == 1
+
+
+def test_nonce_store_expires_entries(nonce_store_factory, monkeypatch):
+    store = nonce_store_factory(max_timeout=10)
+    now_ns = time.time_ns()
+    monkeypatch.setattr("bittensor.utils.axon_utils.time.time_ns", lambda: now_ns)
+    store.update_if_newer("hot:uuid", 10)
+
+    monkeypatch.setattr(
+        "bittensor.utils.axon_utils.time.time_ns",
+        lambda: now_ns + store.ttl_ns + 1,
+    )
+
+    assert store.get("hot:uuid") is None
+    # An expired entry no longer blocks lower nonces; the freshness window rejects those instead.
+    assert store.update_if_newer("hot:uuid", 5)
+    assert store.window_timeout(60) == 10
+
+
+def test_nonce_store_evicts_least_recently_updated(nonce_store_factory):
+    store = nonce_store_factory(max_size=2)
+    if isinstance(store, SQLiteNonceStore):
+        store.prune_interval = 1
+
+    for i, key in enumerate(["a", "b", "a", "c"]):
+        store.update_if_newer(key, i + 1)
+
+    assert store.get("b") is None
+    assert store.get("a") == 3
+    assert store.get("c") == 4
+    assert store.metrics == {"size": 2, "expired": 0, "evicted": 1}
+
+
+def test_sqlite_nonce_store_is_shared(tmp_path):
+    path = str(tmp_path / "nonces.db")
+    first, second = SQLiteNonceStore(path), SQLiteNonceStore(path)
+
+    assert first.update_if_newer("hot:uuid", 10)
+    assert not second.update_if_newer("hot:uuid", 10)
+    assert second.get("hot:uuid") == 10
+
+    first.close()
+    second.close()
+
+
+def test_sqlite_nonce_store_reconnects_after_fork(tmp_path, monkeypatch):
+    store = SQLiteNonceStore(str(tmp_path / "nonces.db"))
+    store.update_if_newer("hot:uuid", 10)
+    parent_db = store._db
+
+    monkeypatch.setattr("bittensor.utils.axon_utils.os.getpid", lambda: store._pid + 1)
+
+    assert store.get("hot:uuid") == 10
+    assert store._db is not parent_db
+    store.close()
+    parent_db.close()
+
+
+@pytest.mark.asyncio
+async def test_default_verify_rejects_replayed_nonce(mock_get_external_ip):
+    dendrite_wallet = get_mock_wallet()
+    axon = Axon(wallet=get_mock_wallet())
+    synapse = Synapse(
+        dendrite=TerminalInfo(
+            hotkey=dendrite_wallet.hotkey.ss58_address,
+            nonce=time.time_ns(),
+            uuid="uuid",
+            version=version_as_int,
+        )
+    )
+    message = (
+        f"{synapse.dendrite.nonce}.{synapse.dendrite.hotkey}."
+        f"{axon.wallet.hotkey.ss58_address}.{synapse.dendrite.uuid}.{synapse.computed_body_hash}"
+    )
+    synapse.dendrite.signature = f"0x{dendrite_wallet.hotkey.sign(message).hex()}"
+
+    await axon.default_verify(synapse)
+
+    assert axon.nonces.metrics["size"] == 1
+    with pytest.raises(Exception, match="Nonce is too old"):
+        await axon.default_verify(synapse)
+
+
+@pytest.mark.asyncio
+async def test_default_verify_rejects_evicted_nonce_with_downgraded_version(
+    mock_get_external_ip, monkeypatch
+):
+    dendrite_wallet = get_mock_wallet()
+    axon = Axon(wallet=get_mock_wallet(), nonce_store=MemoryNonceStore(max_size=1))
+    synapse = Synapse(
+        dendrite=TerminalInfo(
+            hotkey=dendrite_wallet.hotkey.ss58_address,
+            nonce=time.time_ns(),
+            uuid="uuid",
+            version=version_as_int,
+        )
+    )
+    message = (
+        f"{synapse.dendrite.nonce}.{synapse.dendrite.hotkey}."
+        f"{axon.wallet.hotkey.ss58_address}.{synapse.dendrite.uuid}.{synapse.computed_body_hash}"
+    )
+    synapse.dendrite.signature = f"0x{dendrite_wallet.hotkey.sign(message).hex()}"
+    await axon.default_verify(synapse)
+
+    # Another endpoint evicts the entry, and the nonce leaves the freshness window
+    axon.nonces.update_if_newer("other:uuid", 1)
+    assert axon.nonces.get(f"{synapse.dendrite.hotkey}:uuid") is None
+    later_ns = (
+        time.time_ns() + ALLOWED_DELTA + int(synapse.timeout * NANOSECONDS_IN_SECOND)
+    )
+    monkeypatch.setattr("bittensor.core.axon.time.time_ns", lambda: later_ns)
+
+    # The dendrite version is not signed, so the replay may claim a version older than v7.2
+    synapse.dendrite.version = V_7_2_0 - 1000
+    with pytest.raises(Exception, match="Nonce is too old"):
+        await axon.default_verify(synapse)
+
+
+@pytest.mark.asyncio
+async def test_default_verify_on_crypto_workers(mock_get_external_ip):
+    dendrite_wallet = get_mock_wallet()
+    axon = Axon(wallet=get_mock_wallet(), crypto_workers=1)
+    synapse = Synapse(
+        dendrite=TerminalInfo(
+            hotkey=dendrite_wallet.hotkey.ss58_address,
+            nonce=time.time_ns(),
+            uuid="uuid",
+            version=version_as_int,
+            signature="0x" + "00" * 64,
+        )
+    )
+
+    try:
+        with pytest.raises(Exception, match="Signature mismatch"):
+            await axon.default_verify(synapse)
+    finally:
+        axon.stop()
+
+    assert axon._config.axon.crypto_workers == 1
+    assert axon.crypto_pool.metrics["verified"] == 1
+    assert axon.crypto_pool.metrics["invalid"] == 1
+    assert axon.crypto_pool.keypair_cache.metrics["hits"] == 1
+    assert axon.nonces.metrics["size"] == 0
+
+
+class WorkerPidSynapse(Synapse):
+    pid: Optional[int] = None
+
+
+def worker_pid_forward(synapse: WorkerPidSynapse) -> WorkerPidSynapse:
+    synapse.pid = os.getpid()
+    return synapse
+
+
+@pytest.mark.parametrize("crypto_processes", [False, True])
+def test_axon_workers_serve_and_drain(mock_get_external_ip, crypto_processes):
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    # Worker processes are daemonic, and verify signatures in threads instead of a process pool
+    axon = Axon(
+        wallet=get_mock_wallet(),
+        ip="127.0.0.1",
+        external_ip="127.0.0.1",
+        port=port,
+        workers=2,
+        crypto_workers=1 if crypto_processes else 0,
+        crypto_processes=crypto_processes,
+    )
+    axon.fast_config.host = "127.0.0.1"
+    axon.attach(worker_pid_forward)
+    axon.start()
+    processes = list(axon._worker_processes)
+
+    async def query():
+        dendrite = Dendrite(get_mock_wallet())
+        async with dendrite:
+            for _ in range(100):
+                response = await dendrite.call(
+                    axon.info(), WorkerPidSynapse(), timeout=2, deserialize=False
+                )
+                if response.is_success:
+                    return response
+                await asyncio.sleep(0.1)
+
+    try:
+        response = asyncio.run(query())
+
+        assert response is not None and response.is_success
+        assert response.pid in {process.pid for process in processes}
+        assert isinstance(axon.nonces, SQLiteNonceStore)
+        assert len(axon.nonces) == 1
+        nonces_dir = os.path.dirname(axon.nonces.path)
+    finally:
+        axon.stop()
+
+    assert not any(process.is_alive() for process in processes)
+    assert axon._worker_processes == []
+    assert not os.path.exists(nonces_dir)
+    assert isinstance(axon.nonces, MemoryNonceStore)
@@ -0,0 +1,80 @@
+from typing import Optional
+
+import numpy as np
+import pytest
+
+from bittensor.core.binary_transport import (
+    binary_body_hash,
+    decode_synapse,
+    encode_synapse,
+    tensor_fields,
+)
+from bittensor.core.synapse import Synapse
+from bittensor.core.tensor import Tensor
+
+
+class TensorSynapse(Synapse):
+    inputs: Optional[Tensor] = None
+    outputs: list[Tensor] = []
+    named: dict[str, Tensor] = {}
+    step: int = 0
+
+    required_hash_fields = ("inputs", "step")
+
+
+@pytest.fixture
+def synapse():
+    return TensorSynapse(
+        inputs=Tensor.wrap(np.arange(6, dtype=np.float32).reshape(2, 3)),
+        outputs=[
+            Tensor.serialize(np.array(True)),
+            Tensor.wrap(np.arange(5, dtype=np.int16)[::2]),
+        ],
+        named={"weights": Tensor.wrap(np.ones(3, dtype=np.float64))},
+        step=7,
+    )
+
+
+def test_encode_decode_round_trip(synapse):
+    """Every tensor of the decoded synapse is a read-only view of the body."""
+    body = encode_synapse(synapse)
+    decoded = decode_synapse(TensorSynapse, body)
+
+    assert tensor_fields(synapse) == ["inputs", "outputs", "named"]
+    assert decoded.step == 7
+    assert decoded._binary_transport
+    assert decoded.inputs.buffer is None
+    assert decoded.inputs.deserialize().tolist() == [[0, 1, 2], [3, 4, 5]]
+    assert decoded.outputs[0].deserialize().tolist() is True
+    assert decoded.outputs[1].deserialize().tolist() == [0, 2, 4]
+    assert decoded.named["weights"].deserialize().tolist() == [1, 1, 1]
+    for tensor in (decoded.inputs, *decoded.outputs, decoded.named["weights"]):
+        assert np.shares_memory(tensor.raw_array(), np.frombuffer(body, np.uint8))
+        assert not tensor.raw_array().flags.writeable
+        assert tensor.raw_array().ctypes.data % 8 == 0
+
+
+def test_decoded_synapse_dumps_as_json(synapse):
+    """A decoded synapse can be sent on through the JSON transport."""
+    decoded = decode_synapse(TensorSynapse, encode_synapse(synapse))
+
+    assert decoded.model_dump() == synapse.model_dump()
+
+
+def test_binary_body_hash(synapse):
+    """The hash is the same on both sides, and covers the tensor data."""
+    decoded = decode_synapse(TensorSynapse, encode_synapse(synapse))
+    tampered = synapse.model_copy(
+        update={"inputs": Tensor.wrap(np.zeros((2, 3), dtype=np.float32))}
+    )
+
+    assert binary_body_hash(decoded) == binary_body_hash(synapse)
+    assert binary_body_hash(tampered) != binary_body_hash(synapse)
+    assert binary_body_hash(Synapse()) == Synapse().body_hash
+
+
+def test_decode_rejects_mismatched_frames(synapse):
+    body = encode_synapse(synapse)
+
+    with pytest.raises(ValueError):
+        decode_synapse(Synapse, body)
@@ -0,0 +1,199 @@
+import asyncio
+import contextlib
+import threading
+import time
+
+import pytest
+
+from bittensor.core.block_hub import AsyncBlockHub, BlockHub
+
+
+class FakeAsyncSubstrate:
+    """Produces a header per event loop iteration to each subscription, from block 1."""
+
+    def __init__(self):
+        self.subscriptions = 0
+
+    async def get_chain_head(self):
+        return "0xhead"
+
+    async def get_block_handler(self, block_hash, header_only, subscription_handler):
+        self.subscriptions += 1
+        number = 0
+        while True:
+            number += 1
+            await asyncio.sleep(0)
+            if await subscription_handler({"header": {"number": number}}):
+                return
+
+
+class FakeSubstrate:
+    """Produces a header per call of ``produce`` to the subscription."""
+
+    def __init__(self):
+        self.subscriptions = 0
+        self.closed = False
+        self.next_header = threading.Semaphore(0)
+
+    def get_chain_head(self):
+        return "0xhead"
+
+    def get_block_handler(self, block_hash, header_only, subscription_handler):
+        self.subscriptions += 1
+        number = 0
+        while True:
+            self.next_header.acquire()
+            if self.closed:
+                raise ConnectionError("closed")
+            number += 1
+            if subscription_handler({"header": {"number": number}}):
+                return
+
+    def produce(self, headers: int):
+        self.next_header.release(headers)
+
+    def close(self):
+        self.closed = True
+        self.next_header.release()
+
+
+class SharedSubstrate:
+    """Produces a new header per call of the subscription handler, and counts the concurrent uses of the connection."""
+
+    def __init__(self):
+        self.block = 0
+        self.uses = 0
+        self.overlapping_uses = 0
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def _use(self):
+        with self._lock:
+            self.uses += 1
+            if self.uses > 1:
+                self.overlapping_uses += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.uses -= 1
+
+    def get_chain_head(self):
+        with self._use():
+            return "0xhead"
+
+    def get_block_handler(self, block_hash, header_only, subscription_handler):
+        while True:
+            with self._use():
+                self.block += 1
+                if subscription_handler({"header": {"number": self.block}}):
+                    # Unsubscribes on the same connection
+                    time.sleep(0.01)
+                    return
+
+    def close(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_async_hub_fans_out_a_single_subscription():
+    substrate = FakeAsyncSubstrate()
+    hub = AsyncBlockHub(substrate)
+    called = []
+
+    def listener(header):
+        called.append(header["number"])
+
+    hub.add_listener(listener)
+
+    async def iterate():
+        numbers = []
+        async for header in hub.headers():
+            numbers.append(header["number"])
+            if len(numbers) == 3:
+                return numbers
+
+    numbers, header = await asyncio.gather(iterate(), hub.wait_for_block(5))
+
+    assert header["number"] == 5
+    assert numbers == [1, 2, 3]
+    assert called[:5] == [1, 2, 3, 4, 5]
+    assert (await hub.at_block(2))["number"] >= 5
+    assert substrate.subscriptions == 1
+
+    hub.remove_listener(listener)
+    await asyncio.sleep(0.01)
+    assert not hub.running
+    assert hub.listeners == 0
+
+    await hub.wait_for_block(1)
+    assert substrate.subscriptions == 2
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_async_hub_times_out():
+    hub = AsyncBlockHub(FakeAsyncSubstrate())
+
+    with pytest.raises(asyncio.TimeoutError):
+        await hub.wait_for_block(10**9, timeout=0.01)
+
+    await hub.close()
+    assert not hub.running
+
+
+@pytest.mark.asyncio
+async def test_async_hub_close_ends_iterations():
+    hub = AsyncBlockHub(FakeAsyncSubstrate())
+    numbers = []
+
+    async def iterate():
+        async for header in hub.headers():
+            numbers.append(header["number"])
+
+    iteration = asyncio.create_task(iterate())
+    while not numbers:
+        await asyncio.sleep(0)
+    await hub.close()
+
+    await asyncio.wait_for(iteration, timeout=1)
+    assert not hub.running
+    assert hub.listeners == 0
+
+
+def test_hub_fans_out_on_its_own_connection():
+    substrate = FakeSubstrate()
+    hub = BlockHub(lambda: substrate)
+    called = []
+    hub.add_listener(lambda header: called.append(header["number"]))
+    waiter = hub.at_block(2)
+
+    substrate.produce(2)
+    assert waiter.result(timeout=5)["number"] == 2
+
+    headers = hub.headers(timeout=5)
+    substrate.produce(1)
+    assert next(headers)["number"] == 3
+    headers.close()
+    assert called == [1, 2, 3]
+    assert substrate.subscriptions == 1
+
+    with pytest.raises(TimeoutError):
+        hub.wait_for_block(10, timeout=0.01)
+    assert hub.listeners == 1
+
+    hub.close()
+    assert substrate.closed
+    with pytest.raises(RuntimeError):
+        hub.at_block(10)
+
+
+def test_hub_does_not_share_the_connection_between_subscriptions():
+    substrate = SharedSubstrate()
+    hub = BlockHub(lambda: substrate)
+
+    for _ in range(5):
+        hub.wait_for_block(substrate.block + 1, timeout=5)
+
+    hub.close()
+    assert substrate.overlapping_uses == 0
@@ -0,0 +1,98 @@
+import threading
+from concurrent.futures import BrokenExecutor, ThreadPoolExecutor
+
+import pytest
+from bittensor_wallet import Keypair
+
+from bittensor.core.crypto_pool import CryptoPool, KeypairCache
+
+
+@pytest.fixture
+def keypair():
+    return Keypair.create_from_uri("//Alice")
+
+
+def test_keypair_cache_evicts_least_recently_used():
+    addresses = [Keypair.create_from_uri(f"//{name}").ss58_address for name in "ABC"]
+    cache = KeypairCache(max_size=2)
+
+    first = cache.get(addresses[0])
+    cache.get(addresses[1])
+    assert cache.get(addresses[0]) is first
+    cache.get(addresses[2])
+
+    assert list(cache._keypairs) == [addresses[0], addresses[2]]
+    assert cache.metrics == {"size": 2, "hits": 1, "misses": 3, "evicted": 1}
+    with pytest.raises(ValueError):
+        cache.get("not an address")
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_verify_and_sign_on_worker_threads(keypair):
+    pool = CryptoPool(max_workers=1)
+    threads = []
+
+    class Signer:
+        def sign(self, message):
+            threads.append(threading.current_thread().name)
+            return keypair.sign(message)
+
+    try:
+        signature = await pool.sign(Signer(), "message")
+        assert await pool.verify(keypair.ss58_address, "message", signature)
+        assert not await pool.verify(
+            keypair.ss58_address, "other", f"0x{signature.hex()}"
+        )
+    finally:
+        pool.shutdown()
+
+    assert threads[0].startswith("bittensor-crypto")
+    metrics = pool.metrics
+    assert {key: metrics[key] for key in ("pending", "verified", "signed")} == {
+        "pending": 0,
+        "verified": 2,
+        "signed": 1,
+    }
+    assert metrics["invalid"] == 1
+    assert 0 < metrics["verify_latency_mean"] <= metrics["verify_latency_max"]
+    assert pool.keypair_cache.metrics["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_full_queue_runs_inline(keypair):
+    pool = CryptoPool(max_workers=1, max_queue_size=0)
+    pool.pending = 1
+
+    signature = await pool.sign(keypair, "message")
+
+    assert keypair.verify("message", signature)
+    assert pool._threads is None
+    assert pool.metrics["inline"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_submission_releases_its_place(keypair):
+    pool = CryptoPool(max_workers=1)
+    signature = f"0x{keypair.sign('message').hex()}"
+    assert await pool.verify(keypair.ss58_address, "message", signature)
+
+    # Shut down concurrently with the submission
+    pool._threads.shutdown()
+    with pytest.raises(RuntimeError):
+        await pool.verify(keypair.ss58_address, "message", signature)
+    assert pool.pending == 0
+
+    # Broken, as a process pool is by a worker that died
+    pool._threads = ThreadPoolExecutor(max_workers=1)
+    pool._threads._broken = "A worker died"
+    with pytest.raises(BrokenExecutor):
+        await pool.verify(keypair.ss58_address, "message", signature)
+    assert pool.pending == 0
+    assert pool._threads is None
+
+    try:
+        assert await pool.verify(keypair.ss58_address, "message", signature)
+    finally:
+        pool.shutdown()
+    assert pool.pending == 0
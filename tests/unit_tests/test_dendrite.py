@@ -1,18 +1,31 @@
 import asyncio
+import dataclasses
+import json
 import typing
 from unittest.mock import MagicMock, Mock
 
 import aiohttp
+import numpy as np
 from bittensor_wallet.mock import get_mock_wallet
 import pytest
 
 from bittensor.core.axon import Axon
+from bittensor.core.binary_transport import (
+    BINARY_CONTENT_TYPE,
+    binary_body_hash,
+    decode_synapse,
+    encode_synapse,
+)
 from bittensor.core.dendrite import (
     DENDRITE_ERROR_MAPPING,
     DENDRITE_DEFAULT_ERROR,
+    AxonStats,
+    ConnectorConfig,
     Dendrite,
+    SynapseRecord,
 )
 from bittensor.core.synapse import TerminalInfo
+from bittensor.core.tensor import Tensor
 from tests.helpers import get_mock_wallet
 from bittensor.core.synapse import Synapse
 from bittensor.core.chain_data import AxonInfo
@@ -334,6 +347,32 @@ async def test_dendrite__call__handles_http_error_response(
     assert synapse.axon.status_message == synapse.dendrite.status_message == message
 
 
+@pytest.mark.asyncio
+async def test_dendrite__call__propagates_cancellation(
+    axon_info, setup_dendrite, mock_aio_response
+):
+    """Tests that cancelling a call, e.g. by the caller's timeout, is not turned into a response."""
+
+    async def never_respond(url, **kwargs):
+        await asyncio.sleep(10)
+
+    mock_aio_response.post(
+        "http://127.0.0.1:666/SynapseDummy", callback=never_respond, repeat=True
+    )
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(
+            setup_dendrite.call(axon_info, synapse=SynapseDummy(input=1)), 0.2
+        )
+    task = asyncio.ensure_future(
+        setup_dendrite.call(axon_info, synapse=SynapseDummy(input=1))
+    )
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
 @pytest.mark.parametrize(
     "exception, expected_status_code, expected_message, synapse_timeout, synapse_ip, synapse_port, request_name",
     [
@@ -404,3 +443,272 @@ def test_process_error_message(
     # Assert
     assert result.dendrite.status_code == expected_status_code
     assert expected_message in result.dendrite.status_message
+
+
+def test_broadcast_payload_matches_per_axon_request(setup_dendrite, axon_info):
+    payload = setup_dendrite._prepare_broadcast_payload(SynapseDummy(input=1), 12)
+    synapse = setup_dendrite.preprocess_synapse_for_request(
+        axon_info, SynapseDummy(input=1), 12, body_hash=payload.body_hash
+    )
+    expected_headers = synapse.to_headers()
+
+    headers = payload.headers_for(synapse)
+    body = json.loads(payload.body_for(synapse))
+    expected_body = synapse.model_dump()
+
+    # Size metrics are informational and measured once on the shared template.
+    for size_field in ("header_size", "total_size"):
+        headers.pop(size_field)
+        expected_headers.pop(size_field)
+        body.pop(size_field)
+        expected_body.pop(size_field)
+    assert body == expected_body
+    assert headers == expected_headers
+    assert payload.body_hash == synapse.body_hash
+
+
+def test_broadcast_payload_skips_custom_serialization(setup_dendrite):
+    class CustomHeadersSynapse(SynapseDummy):
+        def to_headers(self) -> dict:
+            return {**super().to_headers(), "custom": "1"}
+
+    assert (
+        setup_dendrite._prepare_broadcast_payload(CustomHeadersSynapse(input=1), 12)
+        is None
+    )
+
+
+class TensorSynapse(Synapse):
+    inputs: typing.Optional[Tensor] = None
+    outputs: typing.Optional[Tensor] = None
+
+    required_hash_fields = ("inputs",)
+
+
+@pytest.mark.asyncio
+async def test_dendrite__call__binary_transport(
+    axon_info, mock_get_external_ip, mock_aio_response
+):
+    dendrite_obj = Dendrite(get_mock_wallet(), binary_transport=True)
+    input_synapse = TensorSynapse(inputs=Tensor.wrap(np.arange(3.0)))
+    response_synapse = TensorSynapse(
+        inputs=input_synapse.inputs,
+        outputs=Tensor.wrap(np.arange(3.0) * 2),
+        axon=TerminalInfo(status_code=200, status_message="Success"),
+    )
+    mock_aio_response.post(
+        "http://127.0.0.1:666/TensorSynapse",
+        body=encode_synapse(response_synapse),
+        content_type=BINARY_CONTENT_TYPE,
+    )
+
+    synapse = await dendrite_obj.call(
+        axon_info, synapse=input_synapse, deserialize=False
+    )
+
+    ((request,),) = mock_aio_response.requests.values()
+    request_synapse = decode_synapse(TensorSynapse, request.kwargs["data"])
+    body_hash = binary_body_hash(request_synapse)
+    assert request.kwargs["headers"]["Content-Type"] == BINARY_CONTENT_TYPE
+    assert request.kwargs["headers"]["computed_body_hash"] == body_hash
+    terminal = request_synapse.dendrite
+    assert dendrite_obj.keypair.verify(
+        f"{terminal.nonce}.{terminal.hotkey}.{axon_info.hotkey}.{terminal.uuid}.{body_hash}",
+        terminal.signature,
+    )
+    assert synapse.dendrite.status_code == 200
+    assert synapse.outputs.deserialize().tolist() == [0, 2, 4]
+
+
+def test_binary_transport_is_opt_in(setup_dendrite, mock_get_external_ip):
+    synapse = TensorSynapse(inputs=Tensor.wrap(np.arange(3.0)))
+
+    assert not setup_dendrite._uses_binary_transport(synapse)
+    dendrite_obj = Dendrite(get_mock_wallet(), binary_transport=True)
+    assert dendrite_obj._uses_binary_transport(synapse)
+    assert not dendrite_obj._uses_binary_transport(SynapseDummy(input=1))
+
+
+@pytest.mark.asyncio
+async def test_forward_broadcast_signs_each_axon(
+    setup_dendrite, axon_info, mock_aio_response
+):
+    axons = [
+        dataclasses.replace(axon_info, port=666 + i, hotkey=f"hot{i}") for i in range(3)
+    ]
+    for axon in axons:
+        mock_aio_response.post(
+            f"http://127.0.0.1:{axon.port}/SynapseDummy",
+            body=SynapseDummy(input=1, output=2).model_dump_json(),
+        )
+
+    responses = await setup_dendrite.forward(
+        axons, SynapseDummy(input=1), deserialize=False
+    )
+
+    assert [response.output for response in responses] == [2, 2, 2]
+    requests = list(mock_aio_response.requests.values())
+    assert len(requests) == len(axons)
+    for axon, (request,) in zip(axons, requests):
+        headers = request.kwargs["headers"]
+        body = json.loads(request.kwargs["data"])
+        assert body["input"] == 1
+        assert body["axon"]["hotkey"] == headers["bt_header_axon_hotkey"] == axon.hotkey
+        assert body["dendrite"]["signature"] == headers["bt_header_dendrite_signature"]
+        message = (
+            f"{headers['bt_header_dendrite_nonce']}.{headers['bt_header_dendrite_hotkey']}."
+            f"{axon.hotkey}.{headers['bt_header_dendrite_uuid']}.{headers['computed_body_hash']}"
+        )
+        assert setup_dendrite.keypair.verify(
+            message, headers["bt_header_dendrite_signature"]
+        )
+
+
+def _success_response(synapse: Synapse) -> Synapse:
+    synapse.dendrite = TerminalInfo(status_code=200)
+    return synapse
+
+
+@pytest.mark.asyncio
+async def test_forward_max_concurrency(setup_dendrite, axon_info):
+    in_flight, peak = 0, 0
+
+    async def call(target_axon, synapse, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _success_response(synapse)
+
+    setup_dendrite.call = call
+    axons = [dataclasses.replace(axon_info, port=666 + i) for i in range(10)]
+
+    responses = await setup_dendrite.forward(
+        axons, SynapseDummy(input=1), max_concurrency=3
+    )
+
+    assert len(responses) == 10
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("run_async", [True, False])
+async def test_forward_quorum_cancels_outstanding(setup_dendrite, axon_info, run_async):
+    async def call(target_axon, synapse, deserialize, **kwargs):
+        assert deserialize is False
+        if target_axon.port >= 668:
+            await asyncio.sleep(10)
+        return _success_response(synapse)
+
+    setup_dendrite.call = call
+    axons = [
+        dataclasses.replace(axon_info, port=666 + i, hotkey=f"hot{i}") for i in range(5)
+    ]
+
+    responses = await asyncio.wait_for(
+        setup_dendrite.forward(
+            axons, SynapseDummy(input=1), quorum=2, run_async=run_async
+        ),
+        timeout=1,
+    )
+
+    assert [response.dendrite.status_code for response in responses] == [
+        200,
+        200,
+        499,
+        499,
+        499,
+    ]
+    assert [response.axon.hotkey for response in responses[2:]] == [
+        axon.hotkey for axon in axons[2:]
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_concurrency": 0},
+        {"quorum": 0},
+        {"quorum": 1, "streaming": True},
+    ],
+)
+async def test_forward_invalid_options(setup_dendrite, axon_info, kwargs):
+    with pytest.raises(ValueError):
+        await setup_dendrite.forward(axon_info, SynapseDummy(input=1), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_session_uses_connector_config(mock_get_external_ip):
+    dendrite = Dendrite(
+        get_mock_wallet(),
+        connector_config=ConnectorConfig(limit=7, limit_per_host=2),
+    )
+
+    session = await dendrite.session
+
+    assert session.connector.limit == 7
+    assert session.connector.limit_per_host == 2
+    await dendrite.aclose_session()
+
+
+@pytest.mark.asyncio
+async def test_synapse_history_disabled_by_default(
+    axon_info, setup_dendrite, mock_aio_response
+):
+    mock_aio_response.post(
+        "http://127.0.0.1:666/SynapseDummy",
+        body=SynapseDummy(input=1, output=2).model_dump_json(),
+    )
+
+    await setup_dendrite.call(axon_info, synapse=SynapseDummy(input=1))
+
+    assert len(setup_dendrite.synapse_history) == 0
+    assert setup_dendrite.get_axon_stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_synapse_history_is_bounded_and_aggregated(
+    axon_info, mock_get_external_ip, mock_aio_response
+):
+    dendrite = Dendrite(get_mock_wallet(), history_size=2)
+    url = "http://127.0.0.1:666/SynapseDummy"
+    success = SynapseDummy(
+        input=1, axon=TerminalInfo(status_code=200, process_time=0.1)
+    ).model_dump_json()
+    mock_aio_response.post(url, body=success)
+    mock_aio_response.post(url, status=500, payload={"message": "Boom"})
+    mock_aio_response.post(url, body=success)
+
+    for _ in range(3):
+        await dendrite.call(axon_info, synapse=SynapseDummy(input=1))
+
+    assert len(dendrite.synapse_history) == 2
+    assert [record.status_code for record in dendrite.synapse_history] == [500, 200]
+    assert dendrite.synapse_history[-1].name == "SynapseDummy"
+    assert dendrite.synapse_history[-1].axon_hotkey == axon_info.hotkey
+
+    stats = dendrite.get_axon_stats(axon_info.hotkey)
+    assert stats.requests == 3
+    assert stats.successes == 2
+    assert stats.status_codes == {200: 2, 500: 1}
+    assert stats.mean_process_time is not None
+    assert dendrite.get_axon_stats() == {axon_info.hotkey: stats}
+
+    dendrite.clear_history()
+    assert len(dendrite.synapse_history) == 0
+    assert dendrite.get_axon_stats(axon_info.hotkey).requests == 0
+
+
+def test_axon_stats_add():
+    stats = AxonStats()
+    stats.add(SynapseRecord("S", "hot", 200, 0.5, 10, 5))
+    stats.add(SynapseRecord("S", "hot", 408, None, 10, 5))
+    stats.add(SynapseRecord("S", "hot", 200, 1.5, 10, 5))
+
+    assert stats.requests == 3
+    assert stats.success_rate == pytest.approx(2 / 3)
+    assert stats.mean_process_time == 1.0
+    assert stats.max_process_time == 1.5
+    assert stats.status_codes == {200: 2, 408: 1}
@@ -7,8 +7,10 @@ import numpy as np
 import pytest
 
 from bittensor.core import settings
-from bittensor.core.metagraph import Metagraph
+from bittensor.core.chain_data import AxonInfo
+from bittensor.core.metagraph import AsyncMetagraph, ColumnarSnapshot, Metagraph
 from bittensor.core.subtensor import Subtensor
+from bittensor.utils.weight_utils import CSRMatrix
 
 
 @pytest.fixture
@@ -96,7 +98,9 @@ def test_process_weights_or_bonds(mock_environment):
     assert weights.shape[1] == len(
         neurons
     )  # Number of columns should be equal to number of neurons
-    # TODO: Add more checks to ensure the weights have been processed correctly
+    assert np.allclose(weights.sum(axis=1), 1.0)
+    assert np.allclose(weights[0, :5], np.array([0.1, 1.1, 2.1, 3.1, 4.1]) / 10.5)
+    assert np.all(weights[:, 5:] == 0)
 
     # Test bonds processing
     bonds = metagraph._process_weights_or_bonds(
@@ -108,8 +112,8 @@ def test_process_weights_or_bonds(mock_environment):
     assert bonds.shape[1] == len(
         neurons
     )  # Number of columns should be equal to number of neurons
-
-    # TODO: Add more checks to ensure the bonds have been processed correctly
+    assert bonds.dtype == np.float32
+    assert np.array_equal(bonds[0, :5], np.array([0, 1, 2, 3, 4], dtype=np.float32))
 
 
 # Mocking the bittensor.Subtensor class for testing purposes
@@ -261,3 +265,336 @@ def test_copy(mock_environment):
         metagraph.neurons, copied_metagraph.neurons
     ):
         assert original_neuron is copied_neuron
+
+
+def _mock_neuron(uid, offset=0.0, weights=None):
+    return Mock(
+        uid=uid,
+        trust=uid + offset + 0.5,
+        consensus=uid + offset + 0.1,
+        incentive=uid + offset + 0.2,
+        dividends=uid + offset + 0.3,
+        rank=uid + offset + 0.4,
+        emission=uid + offset + 0.5,
+        active=uid,
+        last_update=uid,
+        validator_permit=uid % 2 == 0,
+        validator_trust=uid + offset + 0.6,
+        axon_info=f"axon_info_{uid}_{offset}",
+        weights=weights if weights is not None else [(j, j + 1) for j in range(5)],
+        bonds=[(j, j + 2) for j in range(5)],
+    )
+
+
+@pytest.fixture
+def incremental_metagraph(mocker):
+    neurons = [_mock_neuron(i) for i in range(10)]
+    metagraph = Metagraph(1, sync=False)
+    metagraph.neurons = neurons
+    metagraph._set_metagraph_attributes(block=100)
+    metagraph.weights = metagraph._process_weights_or_bonds(
+        [n.weights for n in neurons], "weights"
+    )
+    metagraph.bonds = metagraph._process_weights_or_bonds(
+        [n.bonds for n in neurons], "bonds"
+    )
+    metagraph.lite = False
+    mocker.patch.object(metagraph, "_get_all_stakes_from_chain")
+    mocker.patch.object(metagraph, "_apply_extra_info")
+    return metagraph, neurons
+
+
+def test_sync_incremental_patches_changed_neurons(
+    incremental_metagraph, mock_subtensor, mocker
+):
+    """Tests that an incremental sync only rewrites the rows of neurons that changed."""
+    metagraph, neurons = incremental_metagraph
+    trust, weights = metagraph.trust, metagraph.weights
+    new_neurons = list(neurons)
+    new_neurons[3] = _mock_neuron(3, offset=10.0, weights=[(7, 1)])
+    mock_subtensor.get_current_block.return_value = 101
+    mock_subtensor.neurons.return_value = new_neurons
+    set_attributes = mocker.spy(metagraph, "_set_metagraph_attributes")
+    # Loaded from a snapshot saved by an older version
+    metagraph.version = np.array([0], dtype=np.int64)
+
+    metagraph.sync(block=101, lite=False, subtensor=mock_subtensor, incremental=True)
+
+    set_attributes.assert_not_called()
+    assert metagraph.block.item() == 101
+    assert metagraph.version.item() == settings.version_as_int
+    assert metagraph.trust is trust
+    assert metagraph.weights is weights
+    assert metagraph.trust[3] == np.float32(13.5)
+    assert metagraph.trust[4] == np.float32(4.5)
+    assert metagraph.axons[3] == "axon_info_3_10.0"
+    np.testing.assert_array_equal(metagraph.weights[3], np.eye(10)[7])
+    np.testing.assert_array_equal(
+        metagraph.weights[4],
+        metagraph._weights_or_bonds_row(neurons[4].weights, "weights"),
+    )
+
+
+def test_sync_incremental_falls_back_when_n_changes(
+    incremental_metagraph, mock_subtensor, mocker
+):
+    """Tests that an incremental sync performs a full sync when the number of neurons changes."""
+    metagraph, neurons = incremental_metagraph
+    mock_subtensor.get_current_block.return_value = 101
+    mock_subtensor.neurons.return_value = neurons + [_mock_neuron(10)]
+    patch_attributes = mocker.spy(metagraph, "_patch_metagraph_attributes")
+
+    metagraph.sync(block=101, lite=False, subtensor=mock_subtensor, incremental=True)
+
+    patch_attributes.assert_not_called()
+    assert metagraph.n.item() == 11
+    assert metagraph.weights.shape == (11, 11)
+
+
+def test_process_weights_or_bonds_sparse(mock_environment):
+    """Tests that a sparse metagraph stores weights and bonds as CSR matrices with matching dense views."""
+    _, neurons = mock_environment
+    dense = Metagraph(1, sync=False)
+    sparse = Metagraph(1, sync=False, sparse=True)
+    for metagraph in (dense, sparse):
+        metagraph.neurons = neurons
+        metagraph.weights = metagraph._process_weights_or_bonds(
+            [n.weights for n in neurons], "weights"
+        )
+        metagraph.bonds = metagraph._process_weights_or_bonds(
+            [n.bonds for n in neurons], "bonds"
+        )
+
+    assert isinstance(sparse.weights, CSRMatrix)
+    assert isinstance(sparse.bonds, CSRMatrix)
+    assert sparse.weights.nnz == 50
+    assert np.allclose(sparse.W, dense.W)
+    assert np.array_equal(sparse.B, dense.B)
+
+
+def test_save_and_load_sparse(mock_environment, tmp_path):
+    """Tests that sparse weights survive save/load_from_path and load into a dense metagraph."""
+    _, neurons = mock_environment
+    for neuron in neurons:
+        neuron.axon_info = None
+    metagraph = Metagraph(1, sync=False, sparse=True)
+    metagraph.neurons = neurons
+    metagraph._set_metagraph_attributes(block=5)
+    metagraph.weights = metagraph._process_weights_or_bonds(
+        [n.weights for n in neurons], "weights"
+    )
+    metagraph.bonds = metagraph._process_weights_or_bonds(
+        [n.bonds for n in neurons], "bonds"
+    )
+    metagraph.neurons = []
+    metagraph.save(root_dir=[str(tmp_path)])
+    save_dir = str(tmp_path / f"network-{metagraph.network}" / "netuid-1")
+
+    sparse_loaded = Metagraph(1, sync=False, sparse=True).load_from_path(save_dir)
+    dense_loaded = Metagraph(1, sync=False).load_from_path(save_dir)
+
+    assert isinstance(sparse_loaded.weights, CSRMatrix)
+    assert np.array_equal(sparse_loaded.W, metagraph.W)
+    assert isinstance(dense_loaded.weights, np.ndarray)
+    assert np.array_equal(dense_loaded.weights, metagraph.W)
+    assert np.array_equal(dense_loaded.bonds, metagraph.B)
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+def test_save_and_load_columnar(mock_environment, tmp_path, sparse):
+    """Tests that a columnar snapshot round-trips through save/load_from_path using memory-mapped arrays."""
+    _, neurons = mock_environment
+    for neuron in neurons:
+        neuron.axon_info = AxonInfo(
+            version=1,
+            ip=f"10.0.0.{neuron.uid}",
+            port=8091,
+            ip_type=4,
+            hotkey=f"hotkey_{neuron.uid}",
+            coldkey=f"coldkey_{neuron.uid}",
+        )
+    metagraph = Metagraph(1, sync=False, sparse=sparse)
+    metagraph.neurons = neurons
+    metagraph._set_metagraph_attributes(block=7)
+    metagraph.weights = metagraph._process_weights_or_bonds(
+        [n.weights for n in neurons], "weights"
+    )
+    metagraph.bonds = metagraph._process_weights_or_bonds(
+        [n.bonds for n in neurons], "bonds"
+    )
+    metagraph.save(root_dir=[str(tmp_path)], columnar=True)
+    save_dir = tmp_path / f"network-{metagraph.network}" / "netuid-1"
+
+    snapshot = ColumnarSnapshot(str(save_dir / "block-7"))
+    loaded = Metagraph(1, sync=False).load_from_path(str(save_dir))
+
+    assert snapshot.block == 7
+    assert snapshot.n == 10
+    assert snapshot.hotkeys == metagraph.hotkeys
+    assert isinstance(snapshot["trust"], np.memmap)
+    assert loaded.block.item() == 7
+    assert isinstance(loaded.trust, np.memmap)
+    assert np.array_equal(loaded.trust, metagraph.trust)
+    assert np.array_equal(loaded.validator_permit, metagraph.validator_permit)
+    assert np.allclose(loaded.weights, metagraph.W)
+    assert np.array_equal(loaded.bonds, metagraph.B)
+    assert loaded.axons == metagraph.axons
+    assert loaded.neurons == []
+
+
+def _mock_metagraph_info(n: int = 3, block: int = 200):
+    """Returns a selective mechagraph response of ``n`` neurons for subnet 1."""
+    return Mock(
+        block=block,
+        hotkeys=[f"hotkey_{uid}" for uid in range(n)],
+        coldkeys=[f"coldkey_{uid}" for uid in range(n)],
+        axons=[
+            {
+                "version": 1,
+                "ip": 167772160 + uid,
+                "port": 8091,
+                "ip_type": 4,
+                "protocol": 4,
+                "placeholder1": 0,
+                "placeholder2": 0,
+            }
+            for uid in range(n)
+        ],
+        active=[True] * n,
+        validator_permit=[uid == 0 for uid in range(n)],
+        pruning_score=[uid / 65535 for uid in range(n)],
+        last_update=[block - uid for uid in range(n)],
+        emission=[Balance.from_rao(uid * 10**9, 1) for uid in range(n)],
+        dividends=[uid * 0.1 for uid in range(n)],
+        incentives=[uid * 0.2 for uid in range(n)],
+        consensus=[uid * 0.3 for uid in range(n)],
+        trust=[uid * 0.4 for uid in range(n)],
+        rank=[uid * 0.5 for uid in range(n)],
+        alpha_stake=[Balance.from_tao(uid, 1) for uid in range(n)],
+        tao_stake=[Balance.from_tao(uid * 2) for uid in range(n)],
+        total_stake=[Balance.from_tao(uid * 3, 1) for uid in range(n)],
+        tao_dividends_per_hotkey=[],
+        alpha_dividends_per_hotkey=[],
+    )
+
+
+def _selective_storage(n: int = 3):
+    return [
+        (Mock(storage_function="ValidatorTrust"), [65535] + [0] * (n - 1)),
+        (Mock(storage_function="MechanismCountCurrent"), 2),
+        (Mock(storage_function="MechanismEmissionSplit"), [1, 3]),
+    ]
+
+
+@pytest.mark.parametrize("lite", [True, False])
+def test_sync_selective(mock_subtensor, lite):
+    """Tests that a selective sync builds the metagraph from the mechagraph and one storage batch."""
+    mock_subtensor.get_metagraph_info.return_value = _mock_metagraph_info()
+    mock_subtensor.determine_block_hash.return_value = "0x200"
+    mock_subtensor.substrate = Mock()
+    mock_subtensor.substrate.create_storage_key.side_effect = (
+        lambda pallet, storage_function, params, block_hash: Mock(
+            storage_function=storage_function, params=params
+        )
+    )
+    storage = _selective_storage()
+    if not lite:
+        storage += [
+            (Mock(storage_function="Weights", params=[1, 0]), [(1, 65535)]),
+            (Mock(storage_function="Weights", params=[1, 1]), []),
+            (Mock(storage_function="Bonds", params=[1, 0]), [(2, 65535)]),
+            (Mock(storage_function="Bonds", params=[1, 1]), []),
+        ]
+    mock_subtensor.substrate.query_multi.return_value = storage
+    metagraph = Metagraph(1, sync=False)
+
+    metagraph.sync(lite=lite, subtensor=mock_subtensor, selective=True)
+
+    mock_subtensor.get_metagraph_info.assert_called_once_with(
+        netuid=1, mechid=0, block=None
+    )
+    mock_subtensor.substrate.query_multi.assert_called_once()
+    mock_subtensor.get_current_block.assert_not_called()
+    mock_subtensor.neurons.assert_not_called()
+    mock_subtensor.neurons_lite.assert_not_called()
+    mock_subtensor.query_runtime_api.assert_not_called()
+    assert metagraph.block.item() == 200
+    assert metagraph.n.item() == 3
+    assert metagraph.hotkeys == ["hotkey_0", "hotkey_1", "hotkey_2"]
+    assert [axon.ip for axon in metagraph.axons] == ["10.0.0.0", "10.0.0.1", "10.0.0.2"]
+    np.testing.assert_allclose(metagraph.trust, [0.0, 0.4, 0.8])
+    np.testing.assert_allclose(metagraph.emission, [0.0, 1.0, 2.0])
+    np.testing.assert_allclose(metagraph.validator_trust, [1.0, 0.0, 0.0])
+    np.testing.assert_allclose(metagraph.S, [0.0, 3.0, 6.0])
+    np.testing.assert_allclose(metagraph.AS, [0.0, 1.0, 2.0])
+    assert metagraph.neurons[2].pruning_score == 2
+    assert metagraph.mechanism_count == 2
+    assert metagraph.emissions_split == [25, 75]
+    mock_subtensor.determine_block_hash.assert_called_once_with(200)
+    mock_subtensor.weights.assert_not_called()
+    mock_subtensor.bonds.assert_not_called()
+    keys = mock_subtensor.substrate.query_multi.call_args.args[0]
+    assert len(keys) == (3 if lite else 3 + 2 * 3)
+    assert mock_subtensor.substrate.query_multi.call_args.kwargs == {
+        "block_hash": "0x200"
+    }
+    if not lite:
+        np.testing.assert_array_equal(metagraph.W[0], [0, 1, 0])
+        np.testing.assert_array_equal(metagraph.B[0], [0, 0, 65535])
+
+
+@pytest.mark.asyncio
+async def test_async_sync_selective(mocker):
+    """Tests that an async selective sync queries the mechagraph and the storage batch at the same block hash."""
+    subtensor = mocker.AsyncMock(
+        chain_endpoint=settings.FINNEY_ENTRYPOINT, network="finney"
+    )
+    subtensor.substrate.get_chain_head.return_value = "0xhead"
+    subtensor.get_metagraph_info.return_value = _mock_metagraph_info()
+    subtensor.substrate.query_multi.return_value = _selective_storage()
+    metagraph = AsyncMetagraph(1, sync=False, subtensor=subtensor)
+
+    await metagraph.sync(subtensor=subtensor, selective=True)
+
+    subtensor.get_metagraph_info.assert_awaited_once_with(
+        netuid=1, mechid=0, block_hash="0xhead"
+    )
+    assert subtensor.substrate.query_multi.await_args.kwargs["block_hash"] == "0xhead"
+    subtensor.get_current_block.assert_not_awaited()
+    subtensor.neurons_lite.assert_not_awaited()
+    assert metagraph.block.item() == 200
+    assert metagraph.hotkeys == ["hotkey_0", "hotkey_1", "hotkey_2"]
+    assert metagraph.mechanism_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_sync_queries_concurrently(mocker):
+    """Tests that the independent queries of an async sync are awaited concurrently."""
+    subtensor = mocker.AsyncMock(
+        chain_endpoint=settings.FINNEY_ENTRYPOINT, network="finney"
+    )
+    subtensor.get_current_block.return_value = 100
+    in_flight, peak = 0, 0
+
+    def query(result):
+        async def side_effect(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return result
+
+        return side_effect
+
+    subtensor.neurons_lite.side_effect = query([])
+    subtensor.query_runtime_api.side_effect = query(None)
+    subtensor.get_metagraph_info.side_effect = query(None)
+    subtensor.get_mechanism_count.side_effect = query(1)
+    subtensor.get_mechanism_emission_split.side_effect = query(None)
+    metagraph = AsyncMetagraph(1, sync=False, subtensor=subtensor)
+
+    await metagraph.sync(subtensor=subtensor)
+
+    subtensor.get_current_block.assert_awaited_once()
+    assert peak == 5
@@ -0,0 +1,169 @@
+import pytest
+
+from bittensor.core.async_subtensor import AsyncSubtensor
+from bittensor.core.extrinsics.asyncex.start_call import start_call_extrinsic
+from bittensor.core.query_cache import (
+    AsyncCachedSubstrate,
+    CachedSubstrate,
+    QueryCache,
+)
+from bittensor.core.subtensor import Subtensor
+
+
+def test_query_cache_serves_reads_at_a_block(mocker):
+    """Reads at a block hash are fetched once, whatever the head."""
+    substrate = mocker.Mock()
+    cache = QueryCache()
+    cached = CachedSubstrate(substrate, cache)
+
+    first = cached.query("SubtensorModule", "Tempo", [1], block_hash="0x01")
+    cache.observe_head(100)
+    second = cached.query("SubtensorModule", "Tempo", [1], block_hash="0x01")
+    cached.query("SubtensorModule", "Tempo", [2], block_hash="0x01")
+
+    assert first is second
+    assert substrate.query.call_count == 2
+    assert cache.metrics == {
+        "size": 2,
+        "hits": 1,
+        "misses": 2,
+        "evicted": 0,
+        "expired": 0,
+    }
+
+
+def test_query_cache_expires_head_reads(mocker):
+    """Reads at the chain head expire once the head advanced by `latest_ttl_blocks` blocks."""
+    substrate = mocker.Mock()
+    substrate.get_block_number.side_effect = [10, 11, 12]
+    cache = QueryCache(latest_ttl_blocks=2)
+    cached = CachedSubstrate(substrate, cache)
+
+    cached.get_block_number()
+    cached.runtime_call("SubnetInfoRuntimeApi", "get_subnet_info", [1])
+    cached.get_block_number()
+    cached.runtime_call("SubnetInfoRuntimeApi", "get_subnet_info", [1])
+    cached.get_block_number()
+    cached.runtime_call("SubnetInfoRuntimeApi", "get_subnet_info", [1])
+
+    assert substrate.runtime_call.call_count == 2
+    assert cache.hits == 1
+    assert cache.expired == 1
+
+
+def test_query_cache_expires_head_reads_after_block_time(mocker):
+    """Reads at the chain head expire after `latest_ttl_blocks` block times, without a new head."""
+    substrate = mocker.Mock()
+    cache = QueryCache(block_time=0)
+    cached = CachedSubstrate(substrate, cache)
+
+    cached.get_constant("SubtensorModule", "ExistentialDeposit")
+    cached.get_constant("SubtensorModule", "ExistentialDeposit")
+
+    assert substrate.get_constant.call_count == 2
+
+
+def test_query_cache_evicts_least_recently_used(mocker):
+    """The cache holds at most `max_size` reads."""
+    substrate = mocker.Mock()
+    cache = QueryCache(max_size=2)
+    cached = CachedSubstrate(substrate, cache)
+
+    for block_id in (1, 2, 1, 3, 1):
+        cached.get_block_hash(block_id)
+
+    assert [call.args for call in substrate.get_block_hash.call_args_list] == [
+        (1,),
+        (2,),
+        (3,),
+    ]
+    assert len(cache) == 2
+    assert cache.evicted == 1
+
+
+def test_query_cache_bypasses_uncacheable_reads(mocker):
+    """Subscriptions and unhashable params are not cached."""
+    substrate = mocker.Mock()
+    cache = QueryCache()
+    cached = CachedSubstrate(substrate, cache)
+    handler = mocker.Mock()
+
+    for _ in range(2):
+        cached.query("System", "Number", subscription_handler=handler)
+        cached.query("System", "Account", [{1, 2}], block_hash="0x01")
+
+    assert substrate.query.call_count == 4
+    assert len(cache) == 0
+    assert cached.rpc_request is substrate.rpc_request
+
+
+def test_query_cache_rejects_invalid_bounds():
+    with pytest.raises(ValueError):
+        QueryCache(max_size=0)
+    with pytest.raises(ValueError):
+        QueryCache(latest_ttl_blocks=0)
+
+
+@pytest.mark.asyncio
+async def test_async_cached_substrate(mocker):
+    """The async proxy shares the cache semantics."""
+    substrate = mocker.AsyncMock()
+    cache = QueryCache()
+    cached = AsyncCachedSubstrate(substrate, cache)
+
+    for _ in range(2):
+        await cached.query("SubtensorModule", "Tempo", [1], block_hash="0x01")
+        await cached.get_block_number("0x01")
+
+    substrate.query.assert_awaited_once_with("SubtensorModule", "Tempo", [1], "0x01")
+    substrate.get_block_number.assert_awaited_once_with("0x01")
+    assert cache.hits == 2
+
+
+def test_subtensor_query_cache(mock_substrate):
+    """Subtensor reads through the cache it is given, and caches block hashes per instance."""
+    cache = QueryCache()
+    subtensor = Subtensor(query_cache=cache)
+    other = Subtensor()
+
+    assert subtensor.query_cache is cache
+    assert isinstance(subtensor.substrate, CachedSubstrate)
+    assert other.query_cache is None
+    assert subtensor._get_block_hash is not other._get_block_hash
+
+
+def test_async_subtensor_query_cache(mocker):
+    mocker.patch(
+        "bittensor.core.async_subtensor.AsyncSubstrateInterface", autospec=True
+    )
+    cache = QueryCache()
+    subtensor = AsyncSubtensor(query_cache=cache)
+
+    assert subtensor.query_cache is cache
+    assert isinstance(subtensor.substrate, AsyncCachedSubstrate)
+
+
+@pytest.mark.asyncio
+async def test_async_subtensor_query_cache_runs_extrinsics(mocker):
+    """Extrinsics entering the substrate context run on a subtensor reading through a cache."""
+    mocker.patch(
+        "bittensor.core.async_subtensor.AsyncSubstrateInterface", autospec=True
+    )
+    subtensor = AsyncSubtensor(query_cache=QueryCache())
+    substrate = subtensor.substrate.substrate
+    mocker.patch.object(subtensor, "sign_and_send_extrinsic", return_value=(True, ""))
+    wallet = mocker.Mock()
+    wallet.unlock_coldkey.return_value = None
+
+    success, _ = await start_call_extrinsic(
+        subtensor=subtensor, wallet=wallet, netuid=1
+    )
+
+    assert success is True
+    substrate.__aenter__.assert_awaited_once()
+    substrate.__aexit__.assert_awaited_once()
+    substrate.compose_call.assert_awaited_once_with(
+        call_module="SubtensorModule",
+        call_function="start_call",
+        call_params={"netuid": 1},
+    )
@@ -0,0 +1,105 @@
+import asyncio
+import json
+
+import pytest
+
+from bittensor.core.rpc_replay import (
+    RecordingAsyncSubstrateInterface,
+    ReplayAsyncSubstrateInterface,
+    RpcRecording,
+    RpcReplay,
+)
+
+
+@pytest.fixture
+def recording():
+    recording = RpcRecording()
+    exchanges = [
+        ({"method": "chain_getHead", "params": []}, {"result": "0x01"}),
+        ({"method": "chain_getHead", "params": []}, {"result": "0x02"}),
+        (
+            {"method": "author_submitAndWatchExtrinsic", "params": ["0xaa"]},
+            {"result": "sub"},
+        ),
+    ]
+    for id_, (request, response) in enumerate(exchanges):
+        recording.request({**request, "id": str(id_)})
+        recording.receive({"jsonrpc": "2.0", **response, "id": str(id_)})
+    recording.receive(
+        {
+            "jsonrpc": "2.0",
+            "method": "author_extrinsicUpdate",
+            "params": {"subscription": "sub", "result": {"inBlock": "0x02"}},
+        }
+    )
+    return recording
+
+
+def test_recording_save_and_load(recording, tmp_path):
+    """A recording round-trips through its compressed file."""
+    path = str(tmp_path / "session.json.gz")
+    recording.save(path)
+    loaded = RpcRecording.load(path)
+
+    assert len(loaded) == 3
+    assert loaded.responses == recording.responses
+    assert loaded.notifications == {
+        "sub": [
+            {
+                "method": "author_extrinsicUpdate",
+                "params": {"subscription": "sub", "result": {"inBlock": "0x02"}},
+            }
+        ]
+    }
+
+
+def test_replay_responds_in_recorded_order(recording):
+    """Responses are served in order, the last one repeating, with the recorded subscription notifications."""
+    replay = RpcReplay(recording)
+
+    heads = [
+        replay.respond({"id": id_, "method": "chain_getHead", "params": []})[0]
+        for id_ in range(3)
+    ]
+    submitted = replay.respond(
+        {"id": 3, "method": "author_submitAndWatchExtrinsic", "params": ["0xbb"]}
+    )
+    (missing,) = replay.respond({"id": 4, "method": "system_chain", "params": []})
+
+    assert [head["result"] for head in heads] == ["0x01", "0x02", "0x02"]
+    assert [head["id"] for head in heads] == [0, 1, 2]
+    assert submitted[0] == {"jsonrpc": "2.0", "result": "sub", "id": 3}
+    assert submitted[1]["params"]["result"] == {"inBlock": "0x02"}
+    assert missing["error"]["message"] == "No recorded response to system_chain []."
+
+
+@pytest.mark.asyncio
+async def test_async_replay_applies_latency(recording):
+    """Async replayed responses are retrievable once the latency has elapsed."""
+    substrate = ReplayAsyncSubstrateInterface(
+        RpcReplay(recording, latency=0.05), url="ws://replay"
+    )
+
+    async with substrate.ws as ws:
+        item_id = await ws.send({"method": "chain_getHead", "params": []})
+        assert await ws.retrieve(item_id) is None
+        await asyncio.sleep(0.05)
+        assert (await ws.retrieve(item_id))["result"] == "0x01"
+
+
+@pytest.mark.asyncio
+async def test_async_recording(mocker):
+    """The async interface records the requests it sends and the messages it retrieves."""
+    recording = RpcRecording()
+    substrate = RecordingAsyncSubstrateInterface(recording, url="ws://recorded")
+    inner = mocker.patch.object(substrate.ws, "_ws", autospec=True)
+    inner.send.return_value = "1"
+    inner.retrieve.return_value = {"jsonrpc": "2.0", "id": "1", "result": "0x01"}
+
+    async with substrate.ws as ws:
+        item_id = await ws.send({"method": "chain_getHead", "params": []})
+        await ws.retrieve(item_id)
+
+    assert recording.responses == {
+        "chain_getHead": {json.dumps([]): [{"result": "0x01"}]}
+    }
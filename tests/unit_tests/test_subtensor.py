@@ -2937,10 +2937,40 @@ def test_add_stake_multiple_success(mocker, fake_wallet, subtensor):
         wait_for_inclusion=True,
         wait_for_finalization=False,
         period=DEFAULT_PERIOD,
+        batch=False,
+        atomic=True,
     )
     assert result == mock_add_stake_multiple_extrinsic.return_value
 
 
+def test_set_weights_batch(mocker, fake_wallet, subtensor):
+    """Test set_weights_batch sets the weights of all the targets with one batch extrinsic."""
+    # Prep
+    weights = {(1, 0): ([0, 1], [0.5, 0.5]), (2, 1): ([0], [1.0])}
+    mocked_batch_extrinsic = mocker.patch.object(
+        subtensor_module, "set_mechanism_weights_batch_extrinsic"
+    )
+
+    # Call
+    result = subtensor.set_weights_batch(
+        wallet=fake_wallet, weights=weights, wait_for_inclusion=True
+    )
+
+    # Assertions
+    mocked_batch_extrinsic.assert_called_once_with(
+        subtensor=subtensor,
+        wallet=fake_wallet,
+        weights=weights,
+        version_key=subtensor_module.version_as_int,
+        block_time=12.0,
+        commit_reveal_version=4,
+        period=DEFAULT_PERIOD,
+        wait_for_inclusion=True,
+        wait_for_finalization=False,
+    )
+    assert result == mocked_batch_extrinsic.return_value
+
+
 def test_unstake_success(mocker, subtensor, fake_wallet):
     """Test unstake operation is successful."""
     # Preps
@@ -3137,6 +3167,8 @@ def test_unstake_multiple_success(mocker, subtensor, fake_wallet):
         wait_for_finalization=False,
         period=DEFAULT_PERIOD,
         unstake_all=False,
+        batch=False,
+        atomic=True,
     )
     assert result == mock_unstake_multiple_extrinsic.return_value
 
@@ -1,10 +1,13 @@
 import base64
+import hashlib
 import json
 from typing import Optional, ClassVar
 
+import pydantic
 import pytest
 
-from bittensor.core.synapse import Synapse
+from bittensor.core.synapse import Synapse, TerminalInfo
+from bittensor.utils import get_hash
 
 
 def test_parse_headers_to_inputs():
@@ -161,6 +164,56 @@ def test_custom_synapse():
     assert next_synapse.g is None
 
 
+def test_header_codec_placeholders():
+    """Required inputs are carried as placeholders of the JSON type they dump to, and decode to fresh objects."""
+
+    class Nested(pydantic.BaseModel):
+        value: int = 0
+
+    class Test(Synapse):
+        nested: Nested
+        text: str
+        flag: bool
+        mapping: dict[str, int]
+        excluded: list[int] = pydantic.Field(exclude=True)
+        serialized: int
+
+        @pydantic.field_serializer("serialized")
+        def _serialize(self, value: int) -> str:
+            return str(value)
+
+    synapse = Test(
+        nested=Nested(value=1),
+        text="a",
+        flag=True,
+        mapping={"a": 1},
+        excluded=[1],
+        serialized=1,
+        axon=TerminalInfo(ip="127.0.0.1", port=8091),
+    )
+    headers = synapse.to_headers()
+
+    assert {
+        key: json.loads(base64.b64decode(value))
+        for key, value in headers.items()
+        if key.startswith("bt_header_input_obj_")
+    } == {
+        "bt_header_input_obj_nested": {},
+        "bt_header_input_obj_text": "",
+        "bt_header_input_obj_flag": False,
+        "bt_header_input_obj_mapping": {},
+        "bt_header_input_obj_serialized": "",
+    }
+    assert headers["bt_header_axon_ip"] == "127.0.0.1"
+    assert headers["bt_header_axon_port"] == "8091"
+
+    first = Test.parse_headers_to_inputs(headers)
+    second = Test.parse_headers_to_inputs({**headers, "bt_header_axon_extra": "1"})
+    assert first["mapping"] == {} and first["mapping"] is not second["mapping"]
+    assert first["axon"] == {"ip": "127.0.0.1", "port": "8091"}
+    assert second["axon"]["extra"] == "1"
+
+
 def test_body_hash_override():
     # Create a Synapse instance
     synapse_instance = Synapse()
@@ -250,3 +303,45 @@ def test_synapse_body_hash(synapse_cls):
     # Different hashed values should result in different body hashes
     synapse_different = synapse_cls(a=1, b=2)
     assert synapse_instance.body_hash != synapse_different.body_hash
+
+
+class CachedHashSynapse(Synapse):
+    text: str = ""
+    items: list[str] = []
+    required_hash_fields: ClassVar[tuple[str, ...]] = ("text", "items")
+
+
+def test_synapse_body_hash_cache(mocker):
+    """Immutable field hashes are cached until the field is set, mutable ones are recomputed."""
+    synapse = CachedHashSynapse(text="x" * 1000, items=["a"])
+    expected = synapse.body_hash
+    model_dump = mocker.spy(CachedHashSynapse, "model_dump")
+
+    assert synapse.body_hash == expected
+    assert [call.kwargs["include"] for call in model_dump.call_args_list] == [{"items"}]
+
+    synapse.items.append("b")
+    assert (
+        synapse.body_hash
+        == CachedHashSynapse(text="x" * 1000, items=["a", "b"]).body_hash
+    )
+
+    synapse.text = "y"
+    copy = synapse.model_copy(update={"text": "z"})
+    assert synapse.body_hash == CachedHashSynapse(text="y", items=["a", "b"]).body_hash
+    assert copy.body_hash == CachedHashSynapse(text="z", items=["a", "b"]).body_hash
+
+
+def test_synapse_body_hash_from_bytes():
+    """Fields are hashed from their serialized bytes, strings from their UTF-8 encoding."""
+
+    class BytesHashSynapse(CachedHashSynapse):
+        body_hash_from_bytes: ClassVar[bool] = True
+
+    synapse = BytesHashSynapse(text="é", items=["a"])
+
+    assert synapse.body_hash == get_hash(
+        hashlib.sha3_256("é".encode()).hexdigest()
+        + hashlib.sha3_256(b'{"items":["a"]}').hexdigest()
+    )
+    assert synapse.body_hash != CachedHashSynapse(text="é", items=["a"]).body_hash
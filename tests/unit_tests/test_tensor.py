@@ -226,3 +226,33 @@ def test_serialize_all_types_equality_torch(force_legacy_torch_compatible_api):
 
     torchtensor = torch.randn([100], dtype=torch.float32) < 0.5
     assert torch.all(Tensor.serialize(torchtensor).tensor() == torchtensor)
+
+
+def test_wrap():
+    """Wrapped tensors keep their array, and serialize it only when dumped."""
+    array = np.arange(6, dtype=np.float32).reshape(2, 3)
+    wrapped = Tensor.wrap(array)
+
+    assert wrapped.buffer is None
+    assert wrapped.raw_array() is array
+    assert np.shares_memory(wrapped.deserialize(), array)
+    assert wrapped.model_dump() == Tensor.serialize(array).model_dump()
+    assert np.all(Tensor(**wrapped.model_dump()).deserialize() == array)
+
+
+def test_wrap_elide_buffers():
+    from bittensor.core.tensor import elide_buffers
+
+    wrapped = Tensor.wrap(np.zeros(3))
+    with elide_buffers():
+        assert wrapped.model_dump()["buffer"] is None
+    assert wrapped.model_dump()["buffer"] is not None
+
+
+def test_wrap_torch(force_legacy_torch_compatible_api):
+    torchtensor = torch.randn([2, 3], dtype=torch.float32)
+    wrapped = Tensor.wrap(torchtensor)
+
+    assert wrapped.dtype == "torch.float32"
+    assert torch.all(wrapped.deserialize() == torchtensor)
+    assert torch.all(Tensor(**wrapped.model_dump()).deserialize() == torchtensor)
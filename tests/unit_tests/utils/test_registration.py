@@ -1,6 +1,8 @@
+import numpy
 import pytest
 
 from bittensor.utils.registration import LazyLoadedTorch
+from bittensor.utils.registration import pow as pow_utils
 
 
 class MockBittensorLogging:
@@ -45,3 +47,40 @@ def test_lazy_loaded_torch__no_torch(monkeypatch, mock_bittensor_logging):
     # Check if the error message is logged correctly
     assert len(mock_bittensor_logging.messages) == 1
     assert "This command requires torch." in mock_bittensor_logging.messages[0]
+
+
+def test_create_seal_hashes_matches_create_seal_hash():
+    block_and_hotkey_hash_bytes = bytes(range(32))
+    nonces = numpy.array([0, 1, 255, 2**32, 2**63 + 7, 2**64 - 1], dtype=numpy.uint64)
+
+    seals = pow_utils._create_seal_hashes(block_and_hotkey_hash_bytes, nonces)
+
+    assert seals.shape == (len(nonces), 32)
+    for nonce, seal in zip(nonces, seals):
+        assert seal.tobytes() == pow_utils._create_seal_hash(
+            block_and_hotkey_hash_bytes, int(nonce)
+        )
+
+
+@pytest.mark.parametrize("difficulty", [1, 100, 1000, 10**9])
+def test_solve_for_nonce_block_batched_matches_solve_for_nonce_block(difficulty):
+    block_and_hotkey_hash_bytes = bytes(range(32, 64))
+    args = (0, 5000, block_and_hotkey_hash_bytes, difficulty, 2**256 - 1, 10)
+
+    expected = pow_utils._solve_for_nonce_block(*args)
+    solution = pow_utils._solve_for_nonce_block_batched(*args, batch_size=1000)
+
+    assert solution == expected
+    if difficulty == 10**9:
+        assert solution is None
+
+
+def test_solve_for_nonce_block_batched_wraps_nonces():
+    block_and_hotkey_hash_bytes = bytes(range(32))
+    # Difficulty 1 is met by the first nonce of the block, which wraps around to 0 after 2**64 - 1.
+    solution = pow_utils._solve_for_nonce_block_batched(
+        2**64, 2**64 + 10, block_and_hotkey_hash_bytes, 1, 2**256 - 1, 10
+    )
+
+    assert solution.nonce == 0
+    assert solution.seal == pow_utils._create_seal_hash(block_and_hotkey_hash_bytes, 0)
@@ -516,6 +516,155 @@ def test_error_cases(test_id, n, uids, bonds, exception):
         weight_utils.convert_bond_uids_and_vals_to_tensor(n, uids, bonds)
 
 
+@pytest.fixture
+def raw_weights_data():
+    rng = np.random.default_rng(0)
+    data = [
+        [
+            (int(uid), int(value))
+            for uid, value in zip(
+                rng.choice(16, size=rng.integers(0, 16), replace=False),
+                rng.integers(0, 65535, size=16),
+            )
+        ]
+        for _ in range(12)
+    ]
+    data.append([(3, 0), (5, 0)])  # all zero row
+    return data
+
+
+def test_convert_weight_uids_and_vals_to_matrix(raw_weights_data):
+    # Act
+    result = weight_utils.convert_weight_uids_and_vals_to_matrix(16, raw_weights_data)
+
+    # Assert
+    expected = np.stack(
+        [
+            weight_utils.convert_weight_uids_and_vals_to_tensor(
+                16, [u for u, _ in item], [v for _, v in item]
+            )
+            for item in raw_weights_data
+        ]
+    )
+    assert result.dtype == np.float32
+    assert np.allclose(result, expected)
+
+
+def test_convert_weight_uids_and_vals_to_matrix_torch(
+    raw_weights_data, force_legacy_torch_compatible_api
+):
+    # Act
+    result = weight_utils.convert_weight_uids_and_vals_to_matrix(16, raw_weights_data)
+
+    # Assert
+    expected = torch.stack(
+        [
+            weight_utils.convert_weight_uids_and_vals_to_tensor(
+                16, [u for u, _ in item], [v for _, v in item]
+            )
+            for item in raw_weights_data
+        ]
+    )
+    assert isinstance(result, torch.Tensor)
+    assert result.dtype == torch.float32
+    assert torch.allclose(result, expected)
+
+
+def test_convert_bond_uids_and_vals_to_matrix(raw_weights_data):
+    # Act
+    result = weight_utils.convert_bond_uids_and_vals_to_matrix(16, raw_weights_data)
+
+    # Assert
+    expected = np.stack(
+        [
+            weight_utils.convert_bond_uids_and_vals_to_tensor(
+                16, [u for u, _ in item], [v for _, v in item]
+            )
+            for item in raw_weights_data
+        ]
+    )
+    assert result.dtype == np.int64
+    assert np.array_equal(result, expected)
+
+
+def test_convert_bond_uids_and_vals_to_matrix_error_cases():
+    # Act / Assert
+    with pytest.raises(IndexError):
+        weight_utils.convert_bond_uids_and_vals_to_matrix(5, [[(1, 10), (6, 30)]])
+
+
+def test_convert_root_weight_uids_and_vals_to_matrix(caplog):
+    # Prep
+    data = [[(0, 15), (7, 5), (2, 80)], [], [(9, 100), (2, 100)]]
+    subnets = [0, 2, 7]
+
+    # Act
+    with caplog.at_level(logging.WARNING):
+        result = weight_utils.convert_root_weight_uids_and_vals_to_matrix(
+            3, data, subnets
+        )
+
+    # Assert
+    expected = np.array([[0.15, 0.8, 0.05], [0.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+    assert np.allclose(result, expected)
+    assert any(
+        "The subnet is unavailable at the moment." in record.message
+        for record in caplog.records
+    )
+
+
+def test_convert_uids_and_vals_to_csr(raw_weights_data):
+    # Act
+    weights = weight_utils.convert_weight_uids_and_vals_to_csr(16, raw_weights_data)
+    bonds = weight_utils.convert_bond_uids_and_vals_to_csr(16, raw_weights_data)
+
+    # Assert
+    assert weights.shape == bonds.shape == (len(raw_weights_data), 16)
+    assert weights.nnz == np.count_nonzero(weights.to_dense())
+    assert np.allclose(
+        weights.to_dense(),
+        weight_utils.convert_weight_uids_and_vals_to_matrix(16, raw_weights_data),
+    )
+    assert np.array_equal(
+        bonds.to_dense(),
+        weight_utils.convert_bond_uids_and_vals_to_matrix(16, raw_weights_data),
+    )
+    assert np.allclose(weights.row(0), weights.to_dense()[0])
+
+
+def test_csr_matrix_from_coo_duplicates_and_zeros():
+    # Act
+    matrix = weight_utils.CSRMatrix.from_coo(
+        (2, 4),
+        rows=np.array([1, 0, 1, 0]),
+        cols=np.array([2, 3, 2, 1]),
+        vals=np.array([5.0, 0.0, 7.0, 1.0]),
+    )
+
+    # Assert
+    assert matrix.nnz == 2
+    assert np.array_equal(
+        matrix.to_dense(), np.array([[0, 1, 0, 0], [0, 0, 7, 0]], dtype=np.float32)
+    )
+    with pytest.raises(IndexError):
+        weight_utils.CSRMatrix.from_coo(
+            (1, 2), np.array([0]), np.array([2]), np.array([1.0])
+        )
+
+
+def test_csr_matrix_state_dict_roundtrip():
+    # Prep
+    dense = np.array([[0, 0.5, 0.5], [0, 0, 0], [1, 0, 0]], dtype=np.float32)
+
+    # Act
+    matrix = weight_utils.CSRMatrix.from_dense(dense)
+    restored = weight_utils.CSRMatrix.from_state_dict(matrix.state_dict())
+
+    # Assert
+    assert restored.shape == (3, 3)
+    assert np.array_equal(restored.to_dense(), dense)
+
+
 def test_process_weights_for_netuid(mocker):
     """Test the process_weights_for_netuid function."""
     # Prep